@@ -10,7 +10,7 @@ from sqlalchemy import Column, Integer, String, create_engine, bindparam
 from sqlalchemy.orm import Session
 
 Base = declarative_base()
-engine = None
+engine = fast_engine = None
 
 
 class Customer(Base):
@@ -25,8 +25,13 @@ Profiler.init("bulk_inserts", num=100000)
 
 @Profiler.setup
 def setup_database(dburl, echo, num):
-    global engine
+    global engine, fast_engine
     engine = create_engine(dburl, echo=echo)
+    if engine.dialect.driver == 'psycopg2':
+        fast_engine = create_engine(
+            dburl, echo=echo, executemany_mode='values')
+    else:
+        fast_engine = engine
     Base.metadata.drop_all(engine)
     Base.metadata.create_all(engine)
 
@@ -119,6 +124,35 @@ def test_core_insert(n):
         ])
 
 
+@Profiler.profile
+def test_core_insert_fast_executemany(n):
+    """A single Core INSERT construct, using psycopg2 execute_values()."""
+    conn = fast_engine.connect()
+    conn.execute(
+        Customer.__table__.insert(),
+        [
+            dict(
+                name='customer name %d' % i,
+                description='customer description %d' % i
+            )
+            for i in range(n)
+        ])
+
+
+@Profiler.profile
+def test_bulk_insert_mappings_fast_executemany(n):
+    """ORM "bulk" INSERT of dictionaries, using psycopg2 execute_values()."""
+    session = Session(bind=fast_engine)
+    session.bulk_insert_mappings(Customer, [
+        dict(
+            name='customer name %d' % i,
+            description='customer description %d' % i
+        )
+        for i in range(n)
+    ])
+    session.commit()
+
+
 @Profiler.profile
 def test_dbapi_raw(n):
     """The DBAPI's API inserting rows in bulk."""
@@ -315,6 +315,105 @@ str_to_date(PyObject *self, PyObject *arg)
     return PyDate_FromDate(year, month, day);
 }
 
+static PyObject *
+boolean_to_int(PyObject *self, PyObject *arg)
+{
+    if (arg == Py_None)
+        Py_RETURN_NONE;
+
+#if PY_MAJOR_VERSION >= 3
+    return PyNumber_Long(arg);
+#else
+    return PyNumber_Int(arg);
+#endif
+}
+
+static PyObject *
+format_to_str(const char *str)
+{
+#if PY_MAJOR_VERSION >= 3
+    return PyUnicode_FromString(str);
+#else
+    return PyString_FromString(str);
+#endif
+}
+
+static PyObject *
+datetime_to_str(PyObject *self, PyObject *arg)
+{
+    char buf[64];
+
+    if (arg == Py_None)
+        Py_RETURN_NONE;
+
+    if (PyDateTime_Check(arg)) {
+        PyOS_snprintf(buf, sizeof(buf),
+                      "%04d-%02d-%02d %02d:%02d:%02d.%06d",
+                      PyDateTime_GET_YEAR(arg),
+                      PyDateTime_GET_MONTH(arg),
+                      PyDateTime_GET_DAY(arg),
+                      PyDateTime_DATE_GET_HOUR(arg),
+                      PyDateTime_DATE_GET_MINUTE(arg),
+                      PyDateTime_DATE_GET_SECOND(arg),
+                      PyDateTime_DATE_GET_MICROSECOND(arg));
+    } else if (PyDate_Check(arg)) {
+        PyOS_snprintf(buf, sizeof(buf),
+                      "%04d-%02d-%02d 00:00:00.000000",
+                      PyDateTime_GET_YEAR(arg),
+                      PyDateTime_GET_MONTH(arg),
+                      PyDateTime_GET_DAY(arg));
+    } else {
+        PyErr_SetString(PyExc_TypeError,
+                        "SQLite DateTime type only accepts Python "
+                        "datetime and date objects as input.");
+        return NULL;
+    }
+    return format_to_str(buf);
+}
+
+static PyObject *
+date_to_str(PyObject *self, PyObject *arg)
+{
+    char buf[32];
+
+    if (arg == Py_None)
+        Py_RETURN_NONE;
+
+    if (!PyDate_Check(arg)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "SQLite Date type only accepts Python "
+                        "date objects as input.");
+        return NULL;
+    }
+    PyOS_snprintf(buf, sizeof(buf), "%04d-%02d-%02d",
+                  PyDateTime_GET_YEAR(arg),
+                  PyDateTime_GET_MONTH(arg),
+                  PyDateTime_GET_DAY(arg));
+    return format_to_str(buf);
+}
+
+static PyObject *
+time_to_str(PyObject *self, PyObject *arg)
+{
+    char buf[32];
+
+    if (arg == Py_None)
+        Py_RETURN_NONE;
+
+    if (!PyTime_Check(arg)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "SQLite Time type only accepts Python "
+                        "time objects as input.");
+        return NULL;
+    }
+    PyOS_snprintf(buf, sizeof(buf), "%02d:%02d:%02d.%06d",
+                  PyDateTime_TIME_GET_HOUR(arg),
+                  PyDateTime_TIME_GET_MINUTE(arg),
+                  PyDateTime_TIME_GET_SECOND(arg),
+                  PyDateTime_TIME_GET_MICROSECOND(arg));
+    return format_to_str(buf);
+}
+
 
 /***********
  * Structs *
@@ -332,6 +431,12 @@ typedef struct {
     PyObject *format;
 } DecimalResultProcessor;
 
+typedef struct {
+    PyObject_HEAD
+    PyObject *encoding;
+    PyObject *errors;
+} UnicodeBindProcessor;
+
 
 
 /**************************
@@ -509,6 +614,138 @@ static PyTypeObject UnicodeResultProcessorType = {
     0,                                          /* tp_new */
 };
 
+/************************
+ * UnicodeBindProcessor *
+ ************************/
+
+static int
+UnicodeBindProcessor_init(UnicodeBindProcessor *self, PyObject *args,
+                          PyObject *kwds)
+{
+    PyObject *encoding, *errors = NULL;
+    static char *kwlist[] = {"encoding", "errors", NULL};
+
+#if PY_MAJOR_VERSION >= 3
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "U|U:__init__", kwlist,
+                                     &encoding, &errors))
+        return -1;
+#else
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "S|S:__init__", kwlist,
+                                     &encoding, &errors))
+        return -1;
+#endif
+
+#if PY_MAJOR_VERSION >= 3
+    encoding = PyUnicode_AsASCIIString(encoding);
+    if (encoding == NULL)
+        return -1;
+#else
+    Py_INCREF(encoding);
+#endif
+    self->encoding = encoding;
+
+    if (errors) {
+#if PY_MAJOR_VERSION >= 3
+        errors = PyUnicode_AsASCIIString(errors);
+        if (errors == NULL)
+            return -1;
+#else
+        Py_INCREF(errors);
+#endif
+    } else {
+#if PY_MAJOR_VERSION >= 3
+        errors = PyBytes_FromString("strict");
+#else
+        errors = PyString_FromString("strict");
+#endif
+        if (errors == NULL)
+            return -1;
+    }
+    self->errors = errors;
+
+    return 0;
+}
+
+static PyObject *
+UnicodeBindProcessor_process(UnicodeBindProcessor *self, PyObject *value)
+{
+    const char *encoding, *errors;
+
+    if (!PyUnicode_Check(value)) {
+        Py_INCREF(value);
+        return value;
+    }
+
+#if PY_MAJOR_VERSION >= 3
+    encoding = PyBytes_AS_STRING(self->encoding);
+    errors = PyBytes_AS_STRING(self->errors);
+#else
+    encoding = PyString_AS_STRING(self->encoding);
+    errors = PyString_AS_STRING(self->errors);
+#endif
+
+    return PyUnicode_AsEncodedString(value, encoding, errors);
+}
+
+static void
+UnicodeBindProcessor_dealloc(UnicodeBindProcessor *self)
+{
+    Py_XDECREF(self->encoding);
+    Py_XDECREF(self->errors);
+#if PY_MAJOR_VERSION >= 3
+    Py_TYPE(self)->tp_free((PyObject*)self);
+#else
+    self->ob_type->tp_free((PyObject*)self);
+#endif
+}
+
+static PyMethodDef UnicodeBindProcessor_methods[] = {
+    {"process", (PyCFunction)UnicodeBindProcessor_process, METH_O,
+     "The value processor itself."},
+    {NULL}  /* Sentinel */
+};
+
+static PyTypeObject UnicodeBindProcessorType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "sqlalchemy.cprocessors.UnicodeBindProcessor",          /* tp_name */
+    sizeof(UnicodeBindProcessor),               /* tp_basicsize */
+    0,                                          /* tp_itemsize */
+    (destructor)UnicodeBindProcessor_dealloc,   /* tp_dealloc */
+    0,                                          /* tp_print */
+    0,                                          /* tp_getattr */
+    0,                                          /* tp_setattr */
+    0,                                          /* tp_compare */
+    0,                                          /* tp_repr */
+    0,                                          /* tp_as_number */
+    0,                                          /* tp_as_sequence */
+    0,                                          /* tp_as_mapping */
+    0,                                          /* tp_hash  */
+    0,                                          /* tp_call */
+    0,                                          /* tp_str */
+    0,                                          /* tp_getattro */
+    0,                                          /* tp_setattro */
+    0,                                          /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE,   /* tp_flags */
+    "UnicodeBindProcessor objects",             /* tp_doc */
+    0,                                          /* tp_traverse */
+    0,                                          /* tp_clear */
+    0,                                          /* tp_richcompare */
+    0,                                          /* tp_weaklistoffset */
+    0,                                          /* tp_iter */
+    0,                                          /* tp_iternext */
+    UnicodeBindProcessor_methods,               /* tp_methods */
+    0,                                          /* tp_members */
+    0,                                          /* tp_getset */
+    0,                                          /* tp_base */
+    0,                                          /* tp_dict */
+    0,                                          /* tp_descr_get */
+    0,                                          /* tp_descr_set */
+    0,                                          /* tp_dictoffset */
+    (initproc)UnicodeBindProcessor_init,        /* tp_init */
+    0,                                          /* tp_alloc */
+    0,                                          /* tp_new */
+};
+
 /**************************
  * DecimalResultProcessor *
  **************************/
@@ -639,6 +876,15 @@ static PyMethodDef module_methods[] = {
      "Convert an ISO string to a datetime.time object."},
     {"str_to_date", str_to_date, METH_O,
      "Convert an ISO string to a datetime.date object."},
+    {"boolean_to_int", boolean_to_int, METH_O,
+     "Convert a boolean to an integer."},
+    {"datetime_to_str", datetime_to_str, METH_O,
+     "Convert a datetime.datetime or datetime.date object to an "
+     "ISO string."},
+    {"date_to_str", date_to_str, METH_O,
+     "Convert a datetime.date object to an ISO string."},
+    {"time_to_str", time_to_str, METH_O,
+     "Convert a datetime.time object to an ISO string."},
     {NULL, NULL, 0, NULL}        /* Sentinel */
 };
 
@@ -682,6 +928,10 @@ initcprocessors(void)
     if (PyType_Ready(&DecimalResultProcessorType) < 0)
         INITERROR;
 
+    UnicodeBindProcessorType.tp_new = PyType_GenericNew;
+    if (PyType_Ready(&UnicodeBindProcessorType) < 0)
+        INITERROR;
+
 #if PY_MAJOR_VERSION >= 3
     m = PyModule_Create(&module_def);
 #else
@@ -700,6 +950,10 @@ initcprocessors(void)
     PyModule_AddObject(m, "DecimalResultProcessor",
                        (PyObject *)&DecimalResultProcessorType);
 
+    Py_INCREF(&UnicodeBindProcessorType);
+    PyModule_AddObject(m, "UnicodeBindProcessor",
+                       (PyObject *)&UnicodeBindProcessorType);
+
 #if PY_MAJOR_VERSION >= 3
     return m;
 #endif
@@ -175,9 +175,157 @@ distill_params(PyObject *self, PyObject *args)
 	}
 }
 
+/*
+	Look up key in a parameter dictionary.  Return 1 and set *value to
+	a new reference if present, 0 if not present, or -1 on error.
+ */
+static int
+param_lookup(PyObject *params, PyObject *key, PyObject **value)
+{
+	int present;
+
+	if (PyDict_CheckExact(params)) {
+		*value = PyDict_GetItem(params, key);
+		if (*value == NULL) {
+			return 0;
+		}
+		Py_INCREF(*value);
+		return 1;
+	}
+
+	present = PySequence_Contains(params, key);
+	if (present <= 0) {
+		return present;
+	}
+	*value = PyObject_GetItem(params, key);
+	if (*value == NULL) {
+		return -1;
+	}
+	return 1;
+}
+
+/*
+	Given the list of (bindparam, key, name) tuples of a SQLCompiler,
+	return a dictionary of bind names and values, taken from the given
+	parameter dictionary by key or name, else from the bound parameter
+	itself (or its replacement in the "resolved" dictionary).
+
+	Returns None if "check" is true and a required parameter is not
+	present; the caller then raises the appropriate error.
+ */
+static PyObject *
+construct_params(PyObject *self, PyObject *args)
+{
+	PyObject *bind_plan, *params, *resolved;
+	PyObject *pd, *entry, *bindparam, *key, *name;
+	PyObject *value, *value_param, *callable;
+	Py_ssize_t i, size;
+	int check, found, flag;
+
+	if (!PyArg_ParseTuple(args, "O!OOi:_construct_params",
+				&PyList_Type, &bind_plan, &params, &resolved, &check)) {
+		return NULL;
+	}
+
+	if (params != Py_None && PyObject_Not(params)) {
+		params = Py_None;
+	}
+	if (resolved != Py_None && PyObject_Not(resolved)) {
+		resolved = Py_None;
+	}
+	if (resolved != Py_None && !PyDict_Check(resolved)) {
+		PyErr_SetString(PyExc_TypeError,
+				"resolved parameters must be a dictionary");
+		return NULL;
+	}
+
+	pd = PyDict_New();
+	if (pd == NULL) {
+		return NULL;
+	}
+
+	size = PyList_GET_SIZE(bind_plan);
+	for (i = 0; i < size; i++) {
+		entry = PyList_GET_ITEM(bind_plan, i);
+		if (!PyTuple_Check(entry) || PyTuple_GET_SIZE(entry) != 3) {
+			PyErr_SetString(PyExc_TypeError,
+					"bind plan entries must be 3-tuples");
+			goto error;
+		}
+		bindparam = PyTuple_GET_ITEM(entry, 0);
+		key = PyTuple_GET_ITEM(entry, 1);
+		name = PyTuple_GET_ITEM(entry, 2);
+
+		found = 0;
+		if (params != Py_None) {
+			found = param_lookup(params, key, &value);
+			if (found == 0) {
+				found = param_lookup(params, name, &value);
+			}
+			if (found < 0) {
+				goto error;
+			}
+		}
+
+		if (!found) {
+			if (check) {
+				value = PyObject_GetAttrString(bindparam, "required");
+				if (value == NULL) {
+					goto error;
+				}
+				flag = PyObject_IsTrue(value);
+				Py_DECREF(value);
+				if (flag < 0) {
+					goto error;
+				}
+				else if (flag) {
+					Py_DECREF(pd);
+					Py_RETURN_NONE;
+				}
+			}
+
+			value_param = NULL;
+			if (resolved != Py_None) {
+				value_param = PyDict_GetItem(resolved, bindparam);
+			}
+			if (value_param == NULL) {
+				value_param = bindparam;
+			}
+
+			callable = PyObject_GetAttrString(value_param, "callable");
+			if (callable == NULL) {
+				goto error;
+			}
+			flag = PyObject_IsTrue(callable);
+			Py_DECREF(callable);
+			if (flag < 0) {
+				goto error;
+			}
+			value = PyObject_GetAttrString(value_param,
+					flag ? "effective_value" : "value");
+			if (value == NULL) {
+				goto error;
+			}
+		}
+
+		flag = PyDict_SetItem(pd, name, value);
+		Py_DECREF(value);
+		if (flag < 0) {
+			goto error;
+		}
+	}
+	return pd;
+
+error:
+	Py_DECREF(pd);
+	return NULL;
+}
+
 static PyMethodDef module_methods[] = {
     {"_distill_params", distill_params, METH_VARARGS,
      "Distill an execute() parameter structure."},
+    {"_construct_params", construct_params, METH_VARARGS,
+     "Construct the bind parameter dictionary of a compiled statement."},
     {NULL, NULL, 0, NULL}        /* Sentinel */
 };
 
@@ -199,7 +199,8 @@ class MSExecutionContext_pyodbc(MSExecutionContext):
                 len(self.parameters[0]):
             self._embedded_scope_identity = True
 
-            self.statement += "; select scope_identity()"
+            self.statement = self.compiled._dbapi_statement(
+                "; select scope_identity()")
 
     def post_exec(self):
         if self._embedded_scope_identity:
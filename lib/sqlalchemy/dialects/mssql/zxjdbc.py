@@ -30,7 +30,8 @@ class MSExecutionContext_zxjdbc(MSExecutionContext):
         # embed it
         if self._select_lastrowid and self.dialect.use_scope_identity:
             self._embedded_scope_identity = True
-            self.statement += "; SELECT scope_identity()"
+            self.statement = self.compiled._dbapi_statement(
+                "; SELECT scope_identity()")
 
     def post_exec(self):
         if self._embedded_scope_identity:
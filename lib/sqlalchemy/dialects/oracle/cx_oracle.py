@@ -182,6 +182,19 @@ unconditionally by SQLAlchemy, and the linkage to a live cursor is broken.
 To disable this processing, pass ``auto_convert_lobs=False`` to
 :func:`.create_engine()`.
 
+Streaming Results
+-----------------
+
+cx_Oracle fetches rows from the server in groups of ``arraysize`` rows
+at a time, and does not buffer the full result of a statement.  The
+``stream_results=True`` execution option, which is also set by
+:meth:`.Query.yield_per`, is accepted by this dialect, and results in
+rows being fetched from the cursor in batches using
+:class:`.BufferedRowResultProxy`; results which include LOB columns
+continue to be fully buffered as described above.
+
+.. versionadded:: 1.0.0
+
 Two Phase Transaction Support
 -----------------------------
 
@@ -532,12 +545,16 @@ class OracleExecutionContext_cx_oracle(OracleExecutionContext):
                         self.out_parameters[name]
 
     def create_cursor(self):
-        c = self._dbapi_connection.cursor()
+        c = super(OracleExecutionContext_cx_oracle, self).create_cursor()
         if self.dialect.arraysize:
             c.arraysize = self.dialect.arraysize
 
         return c
 
+    def create_server_side_cursor(self):
+        # cx_Oracle cursors fetch "arraysize" rows at a time
+        return self._dbapi_connection.cursor()
+
     def get_result_proxy(self):
         if hasattr(self, 'out_parameters') and self.compiled.returning:
             returning_params = dict(
@@ -554,7 +571,10 @@ class OracleExecutionContext_cx_oracle(OracleExecutionContext):
                     result = _result.BufferedColumnResultProxy(self)
 
         if result is None:
-            result = _result.ResultProxy(self)
+            if self._is_server_side:
+                result = _result.BufferedRowResultProxy(self)
+            else:
+                result = _result.ResultProxy(self)
 
         if hasattr(self, 'out_parameters'):
             if self.compiled_parameters is not None and \
@@ -638,6 +658,8 @@ class OracleDialect_cx_oracle(OracleDialect):
 
     driver = "cx_oracle"
 
+    supports_server_side_cursors = True
+
     colspecs = colspecs = {
         sqltypes.Numeric: _OracleNumeric,
         # generic type, assume datetime.date is desired
@@ -1755,29 +1755,33 @@ class PGExecutionContext(default.DefaultExecutionContext):
                 # key column. for non-primary-key SERIAL, the ID just
                 # generates server side.
 
-                try:
-                    seq_name = column._postgresql_seq_name
-                except AttributeError:
-                    tab = column.table.name
-                    col = column.name
-                    tab = tab[0:29 + max(0, (29 - len(col)))]
-                    col = col[0:29 + max(0, (29 - len(tab)))]
-                    name = "%s_%s_seq" % (tab, col)
-                    column._postgresql_seq_name = seq_name = name
-
-                sch = column.table.schema
-                if sch is not None:
-                    exc = "select nextval('\"%s\".\"%s\"')" % \
-                        (sch, seq_name)
-                else:
-                    exc = "select nextval('\"%s\"')" % \
-                        (seq_name, )
-
-                return self._execute_scalar(exc, column.type)
+                return self._execute_scalar(
+                    "select %s" % _serial_nextval(column), column.type)
 
         return super(PGExecutionContext, self).get_insert_default(column)
 
 
+def _serial_nextval(column):
+    """Return a nextval() expression for the sequence implicitly
+    created for a SERIAL column."""
+
+    try:
+        seq_name = column._postgresql_seq_name
+    except AttributeError:
+        tab = column.table.name
+        col = column.name
+        tab = tab[0:29 + max(0, (29 - len(col)))]
+        col = col[0:29 + max(0, (29 - len(tab)))]
+        name = "%s_%s_seq" % (tab, col)
+        column._postgresql_seq_name = seq_name = name
+
+    sch = column.table.schema
+    if sch is not None:
+        return "nextval('\"%s\".\"%s\"')" % (sch, seq_name)
+    else:
+        return "nextval('\"%s\"')" % (seq_name, )
+
+
 class PGDialect(default.DefaultDialect):
     name = 'postgresql'
     supports_alter = True
@@ -1796,6 +1800,7 @@ class PGDialect(default.DefaultDialect):
     supports_default_values = True
     supports_empty_insert = False
     supports_multivalues_insert = True
+    supports_update_from_select = True
     default_paramstyle = 'pyformat'
     ischema_names = ischema_names
     colspecs = colspecs
@@ -1862,6 +1867,21 @@ class PGDialect(default.DefaultDialect):
         else:
             return None
 
+    def _autoincrement_prefetch_sql(self, column):
+        if column.server_default is not None:
+            return None
+        elif column.default is None or (
+                column.default.is_sequence and column.default.optional):
+            nextval = _serial_nextval(column)
+        elif column.default.is_sequence:
+            nextval = "nextval('%s')" % \
+                self.identifier_preparer.format_sequence(column.default)
+        else:
+            return None
+
+        return "select %s from generate_series(1, %%d)" % \
+            nextval.replace('%', '%%')
+
     _isolation_lookup = set(['SERIALIZABLE', 'READ UNCOMMITTED',
                              'READ COMMITTED', 'REPEATABLE READ'])
 
@@ -2084,6 +2104,108 @@ class PGDialect(default.DefaultDialect):
             raise exc.NoSuchTableError(table_name)
         return table_oid
 
+    def _get_multi_table_oids(self, connection, schema, table_names, **kw):
+        """Fetch (table_name, oid) pairs for many tables at once, using
+        the same criteria as :meth:`.get_table_oid`.
+
+        """
+        if table_names is None:
+            table_names = self.get_table_names(
+                connection, schema, info_cache=kw.get('info_cache'))
+        if not table_names:
+            return []
+
+        if schema is not None:
+            schema_where_clause = "n.nspname = :schema"
+        else:
+            schema_where_clause = "pg_catalog.pg_table_is_visible(c.oid)"
+
+        binds = [
+            sql.bindparam(
+                'table_name_%d' % idx, util.text_type(name),
+                type_=sqltypes.Unicode)
+            for idx, name in enumerate(table_names)
+        ]
+        query = """
+            SELECT c.relname, c.oid
+            FROM pg_catalog.pg_class c
+            LEFT JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+            WHERE (%s)
+            AND c.relname IN (%s) AND c.relkind in ('r', 'v', 'm', 'f')
+        """ % (
+            schema_where_clause,
+            ", ".join(":%s" % bind.key for bind in binds)
+        )
+        s = sql.text(query).bindparams(*binds)
+        s = s.columns(relname=sqltypes.Unicode, oid=sqltypes.Integer)
+        if schema is not None:
+            s = s.bindparams(sql.bindparam(
+                'schema', util.text_type(schema), type_=sqltypes.Unicode))
+        return connection.execute(s).fetchall()
+
+    def get_schema_fingerprint(self, connection, schema=None, **kw):
+        if self.server_version_info < (9, 0):
+            # string_agg() is new in 9.0
+            return None
+
+        # a checksum over the identity and row version (xmin) of the
+        # catalog rows describing the schema's relations, columns,
+        # defaults, constraints and types; DDL against any of these
+        # produces new or updated rows
+        if schema is not None:
+            namespace_clause = "n.nspname = :schema"
+        else:
+            namespace_clause = "n.nspname = ANY(current_schemas(false))"
+
+        FINGERPRINT_SQL = """
+            SELECT md5(string_agg(x, ',' ORDER BY x)) FROM (
+                SELECT 'c' || c.oid || ':' || c.xmin AS x
+                FROM pg_catalog.pg_class c
+                JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+                WHERE %(ns)s
+              UNION ALL
+                SELECT 'a' || a.attrelid || '.' || a.attnum || ':' || a.xmin
+                FROM pg_catalog.pg_attribute a
+                JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+                JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+                WHERE %(ns)s
+              UNION ALL
+                SELECT 'd' || d.oid || ':' || d.xmin
+                FROM pg_catalog.pg_attrdef d
+                JOIN pg_catalog.pg_class c ON c.oid = d.adrelid
+                JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+                WHERE %(ns)s
+              UNION ALL
+                SELECT 'r' || r.oid || ':' || r.xmin
+                FROM pg_catalog.pg_constraint r
+                JOIN pg_catalog.pg_namespace n ON n.oid = r.connamespace
+                WHERE %(ns)s
+              UNION ALL
+                SELECT 't' || t.oid || ':' || t.xmin
+                FROM pg_catalog.pg_type t
+                JOIN pg_catalog.pg_namespace n ON n.oid = t.typnamespace
+                WHERE %(ns)s
+              UNION ALL
+                SELECT 'e' || e.oid || ':' || e.xmin
+                FROM pg_catalog.pg_enum e
+                JOIN pg_catalog.pg_type t ON t.oid = e.enumtypid
+                JOIN pg_catalog.pg_namespace n ON n.oid = t.typnamespace
+                WHERE %(ns)s
+            ) AS catalog_rows
+        """ % {'ns': namespace_clause}
+
+        s = sql.text(FINGERPRINT_SQL)
+        if schema is not None:
+            s = s.bindparams(sql.bindparam(
+                'schema', util.text_type(schema), type_=sqltypes.Unicode))
+        return connection.execute(s).scalar()
+
+    def _multi_oid_criteria(self, tables):
+        # oids are integers as returned by the database, so are
+        # rendered inline rather than as a (possibly long) series of
+        # bound parameters
+        return ", ".join("%d" % oid for name, oid in tables)
+
     @reflection.cache
     def get_schema_names(self, connection, **kw):
         s = """
@@ -2385,7 +2507,6 @@ class PGDialect(default.DefaultDialect):
     @reflection.cache
     def get_foreign_keys(self, connection, table_name, schema=None,
                          postgresql_ignore_search_path=False, **kw):
-        preparer = self.identifier_preparer
         table_oid = self.get_table_oid(connection, table_name, schema,
                                        info_cache=kw.get('info_cache'))
 
@@ -2403,6 +2524,21 @@ class PGDialect(default.DefaultDialect):
                 n.oid = c.relnamespace
           ORDER BY 1
         """
+        t = sql.text(FK_SQL, typemap={
+            'conname': sqltypes.Unicode,
+            'condef': sqltypes.Unicode})
+        c = connection.execute(t, table=table_oid)
+        return [
+            self._get_foreign_key_info(
+                conname, condef, conschema, schema,
+                postgresql_ignore_search_path)
+            for conname, condef, conschema in c.fetchall()
+        ]
+
+    def _get_foreign_key_info(self, conname, condef, conschema, schema,
+                              postgresql_ignore_search_path):
+        preparer = self.identifier_preparer
+
         # http://www.postgresql.org/docs/9.0/static/sql-createtable.html
         FK_REGEX = re.compile(
             r'FOREIGN KEY \((.*?)\) REFERENCES (?:(.*?)\.)?(.*?)\((.*?)\)'
@@ -2415,63 +2551,56 @@ class PGDialect(default.DefaultDialect):
             r'[\s]?(INITIALLY (DEFERRED|IMMEDIATE)+)?'
         )
 
-        t = sql.text(FK_SQL, typemap={
-            'conname': sqltypes.Unicode,
-            'condef': sqltypes.Unicode})
-        c = connection.execute(t, table=table_oid)
-        fkeys = []
-        for conname, condef, conschema in c.fetchall():
-            m = re.search(FK_REGEX, condef).groups()
-
-            constrained_columns, referred_schema, \
-                referred_table, referred_columns, \
-                _, match, _, onupdate, _, ondelete, \
-                deferrable, _, initially = m
-
-            if deferrable is not None:
-                deferrable = True if deferrable == 'DEFERRABLE' else False
-            constrained_columns = [preparer._unquote_identifier(x)
-                                   for x in re.split(
-                                       r'\s*,\s*', constrained_columns)]
-
-            if postgresql_ignore_search_path:
-                # when ignoring search path, we use the actual schema
-                # provided it isn't the "default" schema
-                if conschema != self.default_schema_name:
-                    referred_schema = conschema
-                else:
-                    referred_schema = schema
-            elif referred_schema:
-                # referred_schema is the schema that we regexp'ed from
-                # pg_get_constraintdef().  If the schema is in the search
-                # path, pg_get_constraintdef() will give us None.
-                referred_schema = \
-                    preparer._unquote_identifier(referred_schema)
-            elif schema is not None and schema == conschema:
-                # If the actual schema matches the schema of the table
-                # we're reflecting, then we will use that.
-                referred_schema = schema
+        m = re.search(FK_REGEX, condef).groups()
 
-            referred_table = preparer._unquote_identifier(referred_table)
-            referred_columns = [preparer._unquote_identifier(x)
-                                for x in
-                                re.split(r'\s*,\s', referred_columns)]
-            fkey_d = {
-                'name': conname,
-                'constrained_columns': constrained_columns,
-                'referred_schema': referred_schema,
-                'referred_table': referred_table,
-                'referred_columns': referred_columns,
-                'options': {
-                    'onupdate': onupdate,
-                    'ondelete': ondelete,
-                    'deferrable': deferrable,
-                    'initially': initially,
-                    'match': match
-                }
+        constrained_columns, referred_schema, \
+            referred_table, referred_columns, \
+            _, match, _, onupdate, _, ondelete, \
+            deferrable, _, initially = m
+
+        if deferrable is not None:
+            deferrable = True if deferrable == 'DEFERRABLE' else False
+        constrained_columns = [preparer._unquote_identifier(x)
+                               for x in re.split(
+                                   r'\s*,\s*', constrained_columns)]
+
+        if postgresql_ignore_search_path:
+            # when ignoring search path, we use the actual schema
+            # provided it isn't the "default" schema
+            if conschema != self.default_schema_name:
+                referred_schema = conschema
+            else:
+                referred_schema = schema
+        elif referred_schema:
+            # referred_schema is the schema that we regexp'ed from
+            # pg_get_constraintdef().  If the schema is in the search
+            # path, pg_get_constraintdef() will give us None.
+            referred_schema = \
+                preparer._unquote_identifier(referred_schema)
+        elif schema is not None and schema == conschema:
+            # If the actual schema matches the schema of the table
+            # we're reflecting, then we will use that.
+            referred_schema = schema
+
+        referred_table = preparer._unquote_identifier(referred_table)
+        referred_columns = [preparer._unquote_identifier(x)
+                            for x in
+                            re.split(r'\s*,\s', referred_columns)]
+        fkey_d = {
+            'name': conname,
+            'constrained_columns': constrained_columns,
+            'referred_schema': referred_schema,
+            'referred_table': referred_table,
+            'referred_columns': referred_columns,
+            'options': {
+                'onupdate': onupdate,
+                'ondelete': ondelete,
+                'deferrable': deferrable,
+                'initially': initially,
+                'match': match
             }
-            fkeys.append(fkey_d)
-        return fkeys
+        }
+        return fkey_d
 
     def _pg_index_any(self, col, compare_to):
         if self.server_version_info < (8, 1):
@@ -2530,11 +2659,13 @@ class PGDialect(default.DefaultDialect):
 
         t = sql.text(IDX_SQL, typemap={'attname': sqltypes.Unicode})
         c = connection.execute(t, table_oid=table_oid)
+        return self._get_indexes_from_rows(c.fetchall())
 
+    def _get_indexes_from_rows(self, rows):
         indexes = defaultdict(lambda: defaultdict(dict))
 
         sv_idx_name = None
-        for row in c.fetchall():
+        for row in rows:
             idx_name, unique, expr, prd, col, col_num, conrelid, idx_key = row
 
             if expr:
@@ -2598,12 +2729,14 @@ class PGDialect(default.DefaultDialect):
 
         t = sql.text(UNIQUE_SQL, typemap={'col_name': sqltypes.Unicode})
         c = connection.execute(t, table_oid=table_oid)
+        return self._get_uniques_from_rows(c.fetchall())
 
+    def _get_uniques_from_rows(self, rows):
         uniques = defaultdict(lambda: defaultdict(dict))
-        for row in c.fetchall():
-            uc = uniques[row.name]
-            uc["key"] = row.key
-            uc["cols"][row.col_num] = row.col_name
+        for name, key, col_num, col_name in rows:
+            uc = uniques[name]
+            uc["key"] = key
+            uc["cols"][col_num] = col_name
 
         return [
             {'name': name,
@@ -2611,6 +2744,227 @@ class PGDialect(default.DefaultDialect):
             for name, uc in uniques.items()
         ]
 
+    def _group_multi_rows(self, tables, rows):
+        # rows are of the form (table oid, <single-table columns>)
+        name_by_oid = dict((oid, name) for name, oid in tables)
+        grouped = dict((name, []) for name, oid in tables)
+        for row in rows:
+            grouped[name_by_oid[row[0]]].append(tuple(row[1:]))
+        return grouped
+
+    def get_multi_columns(
+            self, connection, schema=None, table_names=None, **kw):
+        tables = self._get_multi_table_oids(
+            connection, schema, table_names, **kw)
+        if not tables:
+            return {}
+
+        SQL_COLS = """
+            SELECT a.attrelid as table_oid, a.attname,
+              pg_catalog.format_type(a.atttypid, a.atttypmod),
+              (SELECT pg_catalog.pg_get_expr(d.adbin, d.adrelid)
+                FROM pg_catalog.pg_attrdef d
+               WHERE d.adrelid = a.attrelid AND d.adnum = a.attnum
+               AND a.atthasdef)
+              AS DEFAULT,
+              a.attnotnull
+            FROM pg_catalog.pg_attribute a
+            WHERE a.attrelid IN (%s)
+            AND a.attnum > 0 AND NOT a.attisdropped
+            ORDER BY a.attrelid, a.attnum
+        """ % self._multi_oid_criteria(tables)
+        s = sql.text(SQL_COLS,
+                     typemap={
+                         'attname': sqltypes.Unicode,
+                         'default': sqltypes.Unicode}
+                     )
+        c = connection.execute(s)
+
+        # domains and enums are loaded once for all tables
+        domains = self._load_domains(connection)
+        enums = dict(
+            (
+                "%s.%s" % (rec['schema'], rec['name'])
+                if not rec['visible'] else rec['name'], rec) for rec in
+            self._load_enums(connection, schema='*')
+        )
+
+        return dict(
+            (table_name, [
+                self._get_column_info(
+                    name, format_type, default, notnull,
+                    domains, enums, schema)
+                for name, format_type, default, notnull in rows
+            ])
+            for table_name, rows in
+            self._group_multi_rows(tables, c.fetchall()).items()
+        )
+
+    def get_multi_pk_constraint(
+            self, connection, schema=None, table_names=None, **kw):
+        if self.server_version_info < (8, 4):
+            return super(PGDialect, self).get_multi_pk_constraint(
+                connection, schema=schema, table_names=table_names, **kw)
+
+        tables = self._get_multi_table_oids(
+            connection, schema, table_names, **kw)
+        if not tables:
+            return {}
+        oid_criteria = self._multi_oid_criteria(tables)
+
+        PK_SQL = """
+            SELECT k.indrelid, a.attname
+            FROM pg_attribute a JOIN (
+                SELECT ix.indrelid,
+                       unnest(ix.indkey) attnum,
+                       generate_subscripts(ix.indkey, 1) ord
+                FROM pg_index ix
+                WHERE ix.indrelid IN (%s) AND ix.indisprimary
+                ) k ON a.attrelid=k.indrelid AND a.attnum=k.attnum
+            ORDER BY k.indrelid, k.ord
+        """ % oid_criteria
+        t = sql.text(PK_SQL, typemap={'attname': sqltypes.Unicode})
+        cols = self._group_multi_rows(
+            tables, connection.execute(t).fetchall())
+
+        PK_CONS_SQL = """
+        SELECT r.conrelid, r.conname
+           FROM  pg_catalog.pg_constraint r
+           WHERE r.conrelid IN (%s) AND r.contype = 'p'
+           ORDER BY 1, 2
+        """ % oid_criteria
+        t = sql.text(PK_CONS_SQL, typemap={'conname': sqltypes.Unicode})
+        names = self._group_multi_rows(
+            tables, connection.execute(t).fetchall())
+
+        return dict(
+            (table_name, {
+                'constrained_columns': [
+                    attname for attname, in cols[table_name]],
+                'name': names[table_name][0][0]
+                if names[table_name] else None
+            })
+            for table_name, oid in tables
+        )
+
+    def get_multi_foreign_keys(
+            self, connection, schema=None, table_names=None,
+            postgresql_ignore_search_path=False, **kw):
+        tables = self._get_multi_table_oids(
+            connection, schema, table_names, **kw)
+        if not tables:
+            return {}
+
+        FK_SQL = """
+          SELECT r.conrelid, r.conname,
+                pg_catalog.pg_get_constraintdef(r.oid, true) as condef,
+                n.nspname as conschema
+          FROM  pg_catalog.pg_constraint r,
+                pg_namespace n,
+                pg_class c
+
+          WHERE r.conrelid IN (%s) AND
+                r.contype = 'f' AND
+                c.oid = confrelid AND
+                n.oid = c.relnamespace
+          ORDER BY 1, 2
+        """ % self._multi_oid_criteria(tables)
+        t = sql.text(FK_SQL, typemap={
+            'conname': sqltypes.Unicode,
+            'condef': sqltypes.Unicode})
+        c = connection.execute(t)
+
+        return dict(
+            (table_name, [
+                self._get_foreign_key_info(
+                    conname, condef, conschema, schema,
+                    postgresql_ignore_search_path)
+                for conname, condef, conschema in rows
+            ])
+            for table_name, rows in
+            self._group_multi_rows(tables, c.fetchall()).items()
+        )
+
+    def get_multi_indexes(
+            self, connection, schema=None, table_names=None, **kw):
+        tables = self._get_multi_table_oids(
+            connection, schema, table_names, **kw)
+        if not tables:
+            return {}
+
+        IDX_SQL = """
+          SELECT
+              t.oid as table_oid,
+              i.relname as relname,
+              ix.indisunique, ix.indexprs, ix.indpred,
+              a.attname, a.attnum, c.conrelid, ix.indkey%s
+          FROM
+              pg_class t
+                    join pg_index ix on t.oid = ix.indrelid
+                    join pg_class i on i.oid = ix.indexrelid
+                    left outer join
+                        pg_attribute a
+                        on t.oid = a.attrelid and %s
+                    left outer join
+                        pg_constraint c
+                        on (ix.indrelid = c.conrelid and
+                            ix.indexrelid = c.conindid and
+                            c.contype in ('p', 'u', 'x'))
+          WHERE
+              t.relkind IN ('r', 'v', 'f', 'm')
+              and t.oid IN (%s)
+              and ix.indisprimary = 'f'
+          ORDER BY
+              t.relname,
+              i.relname
+        """ % (
+            "::varchar" if self.server_version_info >= (8, 3) else "",
+            self._pg_index_any("a.attnum", "ix.indkey"),
+            self._multi_oid_criteria(tables)
+        )
+
+        t = sql.text(IDX_SQL, typemap={'attname': sqltypes.Unicode})
+        c = connection.execute(t)
+
+        return dict(
+            (table_name, self._get_indexes_from_rows(rows))
+            for table_name, rows in
+            self._group_multi_rows(tables, c.fetchall()).items()
+        )
+
+    def get_multi_unique_constraints(
+            self, connection, schema=None, table_names=None, **kw):
+        tables = self._get_multi_table_oids(
+            connection, schema, table_names, **kw)
+        if not tables:
+            return {}
+
+        UNIQUE_SQL = """
+            SELECT
+                cons.conrelid as table_oid,
+                cons.conname as name,
+                cons.conkey as key,
+                a.attnum as col_num,
+                a.attname as col_name
+            FROM
+                pg_catalog.pg_constraint cons
+                join pg_attribute a
+                  on cons.conrelid = a.attrelid AND
+                    a.attnum = ANY(cons.conkey)
+            WHERE
+                cons.conrelid IN (%s) AND
+                cons.contype = 'u'
+        """ % self._multi_oid_criteria(tables)
+
+        t = sql.text(UNIQUE_SQL, typemap={'col_name': sqltypes.Unicode})
+        c = connection.execute(t)
+
+        return dict(
+            (table_name, self._get_uniques_from_rows(rows))
+            for table_name, rows in
+            self._group_multi_rows(tables, c.fetchall()).items()
+        )
+
     def _load_enums(self, connection, schema=None):
         schema = schema or self.default_schema_name
         if not self.supports_native_enum:
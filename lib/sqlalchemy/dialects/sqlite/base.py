@@ -392,6 +392,8 @@ class DATETIME(_DateTimeMixin, sqltypes.DateTime):
         datetime_datetime = datetime.datetime
         datetime_date = datetime.date
         format = self._storage_format
+        if format == DATETIME._storage_format:
+            return processors.datetime_to_str
 
         def process(value):
             if value is None:
@@ -467,6 +469,8 @@ class DATE(_DateTimeMixin, sqltypes.Date):
     def bind_processor(self, dialect):
         datetime_date = datetime.date
         format = self._storage_format
+        if format == DATE._storage_format:
+            return processors.date_to_str
 
         def process(value):
             if value is None:
@@ -538,6 +542,8 @@ class TIME(_DateTimeMixin, sqltypes.Time):
     def bind_processor(self, dialect):
         datetime_time = datetime.time
         format = self._storage_format
+        if format == TIME._storage_format:
+            return processors.time_to_str
 
         def process(value):
             if value is None:
@@ -785,6 +791,10 @@ class SQLiteExecutionContext(default.DefaultExecutionContext):
     def _preserve_raw_colnames(self):
         return self.execution_options.get("sqlite_raw_colnames", False)
 
+    @property
+    def _result_metadata_variant(self):
+        return self._preserve_raw_colnames
+
     def _translate_colname(self, colname):
         # adjust for dotted column names.  SQLite
         # in the case of UNION may store col names as
@@ -827,6 +837,7 @@ class SQLiteDialect(default.DefaultDialect):
     ]
 
     _broken_fk_pragma_quotes = False
+    _supports_pragma_functions = False
 
     def __init__(self, isolation_level=None, native_datetime=False, **kwargs):
         default.DefaultDialect.__init__(self, **kwargs)
@@ -850,6 +861,10 @@ class SQLiteDialect(default.DefaultDialect):
             # as well as http://www.sqlite.org/src/info/600482d161
             self._broken_fk_pragma_quotes = (
                 self.dbapi.sqlite_version_info < (3, 6, 14))
+            # table-valued PRAGMA functions, e.g. pragma_table_info(),
+            # allow reflection of many tables within one statement
+            self._supports_pragma_functions = (
+                self.dbapi.sqlite_version_info >= (3, 16, 0))
 
     _isolation_lookup = {
         'READ UNCOMMITTED': 1,
@@ -974,7 +989,9 @@ class SQLiteDialect(default.DefaultDialect):
     def get_columns(self, connection, table_name, schema=None, **kw):
         info = self._get_table_pragma(
             connection, "table_info", table_name, schema=schema)
+        return self._get_columns_from_pragma(info)
 
+    def _get_columns_from_pragma(self, info):
         columns = []
         for row in info:
             (name, type_, nullable, default, primary_key) = (
@@ -1055,6 +1072,9 @@ class SQLiteDialect(default.DefaultDialect):
     @reflection.cache
     def get_pk_constraint(self, connection, table_name, schema=None, **kw):
         cols = self.get_columns(connection, table_name, schema, **kw)
+        return self._get_pk_from_columns(cols)
+
+    def _get_pk_from_columns(self, cols):
         pkeys = []
         for col in cols:
             if col['primary_key']:
@@ -1069,7 +1089,10 @@ class SQLiteDialect(default.DefaultDialect):
             connection, "foreign_key_list",
             table_name, schema=schema
         )
+        table_data = self._get_table_sql(connection, table_name, schema=schema)
+        return self._get_fks_from_pragma(table_name, pragma_fks, table_data)
 
+    def _get_fks_from_pragma(self, table_name, pragma_fks, table_data):
         fks = {}
 
         for row in pragma_fks:
@@ -1114,7 +1137,6 @@ class SQLiteDialect(default.DefaultDialect):
             ) for fk in fks.values()
         )
 
-        table_data = self._get_table_sql(connection, table_name, schema=schema)
         if table_data is None:
             # system tables, etc.
             return []
@@ -1175,17 +1197,21 @@ class SQLiteDialect(default.DefaultDialect):
     def get_unique_constraints(self, connection, table_name,
                                schema=None, **kw):
 
+        indexes = self.get_indexes(
+            connection, table_name, schema=schema,
+            include_auto_indexes=True, **kw)
+        table_data = self._get_table_sql(
+            connection, table_name, schema=schema, **kw)
+        return self._get_uniques_from_sql(indexes, table_data)
+
+    def _get_uniques_from_sql(self, indexes, table_data):
         auto_index_by_sig = {}
-        for idx in self.get_indexes(
-                connection, table_name, schema=schema,
-                include_auto_indexes=True, **kw):
+        for idx in indexes:
             if not idx['name'].startswith("sqlite_autoindex"):
                 continue
             sig = tuple(idx['column_names'])
             auto_index_by_sig[sig] = idx
 
-        table_data = self._get_table_sql(
-            connection, table_name, schema=schema, **kw)
         if not table_data:
             return []
 
@@ -1247,6 +1273,187 @@ class SQLiteDialect(default.DefaultDialect):
                 idx['column_names'].append(row[2])
         return indexes
 
+    def get_schema_fingerprint(self, connection, schema=None, **kw):
+        # schema_version is incremented by SQLite upon each change to
+        # the schema; temporary tables are visible when no schema is given
+        quote = self.identifier_preparer.quote_identifier
+        if schema is not None:
+            schemas = [schema]
+        else:
+            schemas = ["main", "temp"]
+        return tuple(
+            connection.execute(
+                "PRAGMA %s.schema_version" % quote(name)).scalar()
+            for name in schemas
+        )
+
+    def get_multi_columns(
+            self, connection, schema=None, table_names=None, **kw):
+        if not self._supports_pragma_functions:
+            return super(SQLiteDialect, self).get_multi_columns(
+                connection, schema=schema, table_names=table_names, **kw)
+
+        return dict(
+            (name, self._get_columns_from_pragma(info))
+            for name, info in self._filter_multi(
+                connection, schema, table_names,
+                self._get_multi_table_pragma(
+                    connection, "table_info", schema, **kw), **kw)
+        )
+
+    def get_multi_pk_constraint(
+            self, connection, schema=None, table_names=None, **kw):
+        if not self._supports_pragma_functions:
+            return super(SQLiteDialect, self).get_multi_pk_constraint(
+                connection, schema=schema, table_names=table_names, **kw)
+
+        return dict(
+            (name, self._get_pk_from_columns(cols))
+            for name, cols in self.get_multi_columns(
+                connection, schema=schema, table_names=table_names,
+                **kw).items()
+        )
+
+    def get_multi_foreign_keys(
+            self, connection, schema=None, table_names=None, **kw):
+        if not self._supports_pragma_functions:
+            return super(SQLiteDialect, self).get_multi_foreign_keys(
+                connection, schema=schema, table_names=table_names, **kw)
+
+        table_sql = self._get_multi_table_sql(connection, schema, **kw)
+        return dict(
+            (name, self._get_fks_from_pragma(
+                name, pragma_fks, table_sql.get(name)))
+            for name, pragma_fks in self._filter_multi(
+                connection, schema, table_names,
+                self._get_multi_table_pragma(
+                    connection, "foreign_key_list", schema, **kw), **kw)
+        )
+
+    def get_multi_indexes(
+            self, connection, schema=None, table_names=None, **kw):
+        if not self._supports_pragma_functions:
+            return super(SQLiteDialect, self).get_multi_indexes(
+                connection, schema=schema, table_names=table_names, **kw)
+
+        include_auto_indexes = kw.pop('include_auto_indexes', False)
+        multi = {}
+        for name, rows in self._filter_multi(
+                connection, schema, table_names,
+                self._get_multi_index_info(connection, schema, **kw), **kw):
+            indexes = multi[name] = []
+            for idx_name, unique, columns in rows:
+                if (not include_auto_indexes and
+                        idx_name.startswith('sqlite_autoindex')):
+                    continue
+                indexes.append(dict(
+                    name=idx_name, column_names=list(columns),
+                    unique=unique))
+        return multi
+
+    def get_multi_unique_constraints(
+            self, connection, schema=None, table_names=None, **kw):
+        if not self._supports_pragma_functions:
+            return super(SQLiteDialect, self).get_multi_unique_constraints(
+                connection, schema=schema, table_names=table_names, **kw)
+
+        indexes = self.get_multi_indexes(
+            connection, schema=schema, table_names=table_names,
+            include_auto_indexes=True, **kw)
+        table_sql = self._get_multi_table_sql(connection, schema, **kw)
+        return dict(
+            (name, self._get_uniques_from_sql(
+                table_indexes, table_sql.get(name)))
+            for name, table_indexes in indexes.items()
+        )
+
+    def _filter_multi(
+            self, connection, schema, table_names, rows_by_name, **kw):
+        if table_names is None:
+            table_names = self.get_table_names(
+                connection, schema, info_cache=kw.get('info_cache'))
+        table_names = set(table_names)
+        return [
+            (name, rows) for name, rows in rows_by_name
+            if name in table_names
+        ]
+
+    def _multi_pragma_sql(self, schema):
+        if schema is not None:
+            return (
+                "%s.sqlite_master" %
+                self.identifier_preparer.quote_identifier(schema),
+                ", :schema"
+            )
+        else:
+            # as with the single-table PRAGMA, temporary tables are
+            # included when no schema is given
+            return (
+                "(SELECT name, type FROM sqlite_master UNION "
+                "SELECT name, type FROM sqlite_temp_master)",
+                ""
+            )
+
+    def _group_multi_rows(self, rows):
+        # group rows of the form (table name, <pragma columns>) by
+        # table; tables for which the PRAGMA returns no rows are
+        # present in the LEFT OUTER JOIN with NULL for each column
+        grouped = util.OrderedDict()
+        for row in rows:
+            entries = grouped.setdefault(row[0], [])
+            if row[1] is not None:
+                entries.append(tuple(row[1:]))
+        return list(grouped.items())
+
+    @reflection.cache
+    def _get_multi_table_pragma(self, connection, pragma, schema=None, **kw):
+        master, schema_arg = self._multi_pragma_sql(schema)
+        s = ("SELECT m.name, p.* FROM %s AS m "
+             "LEFT OUTER JOIN pragma_%s(m.name%s) AS p "
+             "WHERE m.type IN ('table', 'view') "
+             "ORDER BY m.name") % (master, pragma, schema_arg)
+        rs = connection.execute(sql.text(s), schema=schema)
+        return self._group_multi_rows(rs)
+
+    @reflection.cache
+    def _get_multi_index_info(self, connection, schema=None, **kw):
+        master, schema_arg = self._multi_pragma_sql(schema)
+        s = ("SELECT m.name, il.name, il.\"unique\", ii.seqno, ii.name "
+             "FROM %s AS m "
+             "LEFT OUTER JOIN pragma_index_list(m.name%s) AS il "
+             "LEFT OUTER JOIN pragma_index_info(il.name%s) AS ii "
+             "WHERE m.type IN ('table', 'view') "
+             "ORDER BY m.name, il.seq, ii.seqno") % (
+            master, schema_arg, schema_arg)
+        rs = connection.execute(sql.text(s), schema=schema)
+
+        multi = []
+        for name, rows in self._group_multi_rows(rs):
+            indexes = util.OrderedDict()
+            for idx_name, unique, seqno, col_name in rows:
+                columns = indexes.setdefault(idx_name, (unique, []))[1]
+                if seqno is not None:
+                    columns.append(col_name)
+            multi.append((
+                name,
+                [(idx_name, unique, columns)
+                 for idx_name, (unique, columns) in indexes.items()]
+            ))
+        return multi
+
+    @reflection.cache
+    def _get_multi_table_sql(self, connection, schema=None, **kw):
+        if schema is not None:
+            master = self._multi_pragma_sql(schema)[0]
+        else:
+            master = ("(SELECT * FROM sqlite_master UNION ALL "
+                      "SELECT * FROM sqlite_temp_master)")
+        s = "SELECT name, sql FROM %s WHERE type = 'table'" % master
+        table_sql = {}
+        for name, table_data in connection.execute(s):
+            table_sql.setdefault(name, table_data)
+        return table_sql
+
     @reflection.cache
     def _get_table_sql(self, connection, table_name, schema=None, **kw):
         try:
@@ -198,6 +198,18 @@ require unicode, however, so that non-``unicode`` values passed inadvertently
 will emit a warning.  Pysqlite will emit an error if a non-``unicode`` string
 is passed containing non-ASCII characters.
 
+Streaming Results
+-----------------
+
+The pysqlite cursor produces rows from the database as they are fetched,
+and does not buffer the full result of a statement.  The
+``stream_results=True`` execution option, which is also set by
+:meth:`.Query.yield_per`, is accepted by this dialect, and results in
+rows being fetched from the cursor in batches using
+:class:`.BufferedRowResultProxy`.
+
+.. versionadded:: 1.0.0
+
 .. _pysqlite_serializable:
 
 Serializable isolation / Savepoints / Transactional DDL
@@ -264,7 +276,8 @@ by adding the desired locking mode to our ``"BEGIN"``::
 
 """
 
-from sqlalchemy.dialects.sqlite.base import SQLiteDialect, DATETIME, DATE
+from sqlalchemy.dialects.sqlite.base import SQLiteDialect, \
+    SQLiteExecutionContext, DATETIME, DATE
 from sqlalchemy import exc, pool
 from sqlalchemy import types as sqltypes
 from sqlalchemy import util
@@ -300,8 +313,16 @@ class _SQLite_pysqliteDate(DATE):
             return DATE.result_processor(self, dialect, coltype)
 
 
+class SQLiteExecutionContext_pysqlite(SQLiteExecutionContext):
+    def create_server_side_cursor(self):
+        # pysqlite cursors fetch rows from the database as requested
+        return self._dbapi_connection.cursor()
+
+
 class SQLiteDialect_pysqlite(SQLiteDialect):
     default_paramstyle = 'qmark'
+    execution_ctx_cls = SQLiteExecutionContext_pysqlite
+    supports_server_side_cursors = True
 
     colspecs = util.update_copy(
         SQLiteDialect.colspecs,
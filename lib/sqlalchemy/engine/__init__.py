@@ -76,6 +76,7 @@ from .result import (
     BufferedColumnResultProxy,
     BufferedColumnRow,
     BufferedRowResultProxy,
+    ColumnChunk,
     FullyBufferedResultProxy,
     ResultProxy,
     RowProxy,
@@ -353,6 +354,12 @@ def create_engine(*args, **kwargs):
         this is configurable with the MySQLDB connection itself and the
         server configuration as well).
 
+    :param pool_pre_ping=False: boolean, if True will enable the connection
+        pool "pre-ping" feature that tests connections for liveness upon
+        each checkout.  See :paramref:`.Pool.pre_ping`.
+
+        .. versionadded:: 1.0.0
+
     :param pool_reset_on_return='rollback': set the "reset on return"
         behavior of the pool, which is whether ``rollback()``,
         ``commit()``, or nothing is called upon connections
@@ -365,6 +372,21 @@ def create_engine(*args, **kwargs):
         up on getting a connection from the pool. This is only used
         with :class:`~sqlalchemy.pool.QueuePool`.
 
+    :param pool_use_lifo=False: use LIFO (last-in-first-out) when retrieving
+        connections from :class:`.QueuePool` instead of FIFO
+        (first-in-first-out). Using LIFO, a server-side timeout scheme can
+        reduce the number of connections used during non-peak periods of
+        use.   When planning for server-side timeouts, ensure that a recycle or
+        pre-ping strategy is in use to gracefully handle stale connections.
+
+        .. versionadded:: 1.0.0
+
+        .. seealso::
+
+            :ref:`pool_use_lifo`
+
+            :ref:`pool_disconnects`
+
     :param strategy='plain': selects alternate engine implementations.
         Currently available are:
 
@@ -274,8 +274,44 @@ class Connection(Connectable):
         :param stream_results: Available on: Connection, statement.
           Indicate to the dialect that results should be
           "streamed" and not pre-buffered, if possible.  This is a limitation
-          of many DBAPIs.  The flag is currently understood only by the
-          psycopg2 dialect.
+          of many DBAPIs.  The flag is understood by dialects which set
+          ``supports_server_side_cursors``, currently the psycopg2,
+          mysqldb, pymysql, pysqlite and cx_oracle dialects; rows are then
+          fetched from the cursor in batches using
+          :class:`.BufferedRowResultProxy`.  Other dialects ignore it.
+
+          .. versionchanged:: 1.0.0 the ``stream_results`` option is
+             accepted by dialects other than psycopg2.
+
+        :param max_row_buffer: Available on: Connection, statement.
+          When results are streamed, the largest number of rows fetched
+          from the cursor at once by :class:`.BufferedRowResultProxy`;
+          defaults to 1000.  Set by :meth:`.Query.yield_per`.
+
+          .. versionadded:: 1.0.0
+
+        :param initial_row_buffer: Available on: Connection, statement.
+          When results are streamed, the number of rows fetched from the
+          cursor initially; the buffer then grows up to
+          ``max_row_buffer``.  Defaults to 1.
+
+          .. versionadded:: 1.0.0
+
+        :param row_buffer_bytes: Available on: Connection, statement.
+          When results are streamed, size each fetch from the cursor so
+          that the buffered rows approximately occupy this many bytes,
+          based on the measured size of the rows fetched so far, rather
+          than growing the buffer along a fixed schedule.
+
+          .. versionadded:: 1.0.0
+
+        :param columnar: Available on: Connection, statement.
+          Sets the type of sequence used for each column by
+          :meth:`.ResultProxy.fetchcolumns` and
+          :meth:`.ResultProxy.iter_columns`; one of ``True`` or ``'array'``
+          (the default), ``'list'`` or ``'numpy'``.
+
+          .. versionadded:: 1.0.0
 
         """
         c = self._clone()
@@ -989,15 +1025,38 @@ class Connection(Connectable):
             keys = []
 
         dialect = self.dialect
+        extracted_params = None
         if 'compiled_cache' in self._execution_options:
-            key = dialect, elem, tuple(sorted(keys)), len(distilled_params) > 1
-            if key in self._execution_options['compiled_cache']:
-                compiled_sql = self._execution_options['compiled_cache'][key]
+            compiled_cache = self._execution_options['compiled_cache']
+            elem_cache_key = elem._generate_cache_key()
+            if elem_cache_key is not None:
+                # key on the structure of the statement, so that
+                # newly constructed but otherwise identical statements
+                # make use of the same compiled form
+                cache_key, extracted_params = elem_cache_key
+                key = dialect, cache_key, tuple(sorted(keys)), \
+                    len(distilled_params) > 1
+            else:
+                key = dialect, elem, tuple(sorted(keys)), \
+                    len(distilled_params) > 1
+
+            if key in compiled_cache:
+                compiled_sql = compiled_cache[key]
             else:
                 compiled_sql = elem.compile(
                     dialect=dialect, column_keys=keys,
                     inline=len(distilled_params) > 1)
-                self._execution_options['compiled_cache'][key] = compiled_sql
+                if extracted_params is not None:
+                    if compiled_sql.literal_binds_rendered:
+                        # bound values were rendered inline; the
+                        # compiled form is specific to this statement
+                        key = dialect, elem, tuple(sorted(keys)), \
+                            len(distilled_params) > 1
+                        extracted_params = None
+                    else:
+                        compiled_sql._set_cache_key_bindparams(
+                            extracted_params)
+                compiled_cache[key] = compiled_sql
         else:
             compiled_sql = elem.compile(
                 dialect=dialect, column_keys=keys,
@@ -1008,7 +1067,7 @@ class Connection(Connectable):
             dialect.execution_ctx_cls._init_compiled,
             compiled_sql,
             distilled_params,
-            compiled_sql, distilled_params
+            compiled_sql, distilled_params, elem, extracted_params
         )
         if self._has_events or self.engine._has_events:
             self.dispatch.after_execute(self,
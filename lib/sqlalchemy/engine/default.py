@@ -27,6 +27,11 @@ AUTOCOMMIT_REGEXP = re.compile(
     r'\s*(?:UPDATE|INSERT|CREATE|DELETE|DROP|ALTER)',
     re.I | re.UNICODE)
 
+# When we're handed literal SQL, ensure it's a SELECT query
+SERVER_SIDE_CURSOR_RE = re.compile(
+    r'\s*SELECT',
+    re.I | re.UNICODE)
+
 
 class DefaultDialect(interfaces.Dialect):
     """Default implementation of Dialect"""
@@ -100,6 +105,13 @@ class DefaultDialect(interfaces.Dialect):
     # thanks to MySQL, sigh
     max_index_name_length = None
 
+    # largest number of bound parameters to be placed in a
+    # single IN expression by operations which batch
+    # rows by primary key, such as the "selectin" loader.
+    # Oracle limits IN to 1000 elements, SQLite to 999 bound
+    # parameters per statement.
+    max_in_list_size = 500
+
     supports_sane_rowcount = True
     supports_sane_multi_rowcount = True
     dbapi_type_map = {}
@@ -109,6 +121,27 @@ class DefaultDialect(interfaces.Dialect):
     supports_empty_insert = True
     supports_multivalues_insert = False
 
+    # largest number of autoincrement primary key values the unit of
+    # work generates ahead of a single batch of INSERT statements;
+    # see _autoincrement_prefetch_sql().
+    max_autoincrement_prefetch_rows = 1000
+
+    # whether UPDATE..FROM against a UNION of SELECTs is supported,
+    # allowing the unit of work to UPDATE versioned rows in batches
+    # when executemany() doesn't report a usable rowcount.
+    supports_update_from_select = False
+
+    # largest number of rows UPDATEd by a single such statement.
+    max_update_from_select_rows = 500
+
+    # whether the "stream_results" execution option is honored, by
+    # way of a cursor which doesn't buffer the full result.
+    supports_server_side_cursors = False
+
+    # stream the results of all SELECT statements, for those dialects
+    # which accept the ``server_side_cursors`` argument.
+    server_side_cursors = False
+
     server_version_info = None
 
     construct_arguments = None
@@ -366,6 +399,65 @@ class DefaultDialect(interfaces.Dialect):
                                   schema=schema, **kw)
         }
 
+    def get_schema_fingerprint(self, connection, schema=None, **kw):
+        return None
+
+    def _default_multi_reflect(
+            self, single_tbl_method, connection, schema, table_names, kw):
+        if table_names is None:
+            table_names = self.get_table_names(
+                connection, schema, info_cache=kw.get('info_cache'))
+
+        result = {}
+        for table_name in table_names:
+            try:
+                result[table_name] = single_tbl_method(
+                    connection, table_name, schema, **kw)
+            except exc.NoSuchTableError:
+                pass
+        return result
+
+    def get_multi_columns(
+            self, connection, schema=None, table_names=None, **kw):
+        # as with Inspector.reflecttable(), a table without columns
+        # is one that wasn't found
+        return dict(
+            (table_name, columns) for table_name, columns in
+            self._default_multi_reflect(
+                self.get_columns, connection, schema, table_names, kw
+            ).items()
+            if columns
+        )
+
+    def get_multi_pk_constraint(
+            self, connection, schema=None, table_names=None, **kw):
+        return self._default_multi_reflect(
+            self.get_pk_constraint, connection, schema, table_names, kw)
+
+    def get_multi_foreign_keys(
+            self, connection, schema=None, table_names=None, **kw):
+        return self._default_multi_reflect(
+            self.get_foreign_keys, connection, schema, table_names, kw)
+
+    def get_multi_indexes(
+            self, connection, schema=None, table_names=None, **kw):
+        return self._default_multi_reflect(
+            self.get_indexes, connection, schema, table_names, kw)
+
+    def get_multi_unique_constraints(
+            self, connection, schema=None, table_names=None, **kw):
+        return self._default_multi_reflect(
+            self.get_unique_constraints, connection, schema, table_names, kw)
+
+    def _autoincrement_prefetch_sql(self, column):
+        """Return a SQL string which, given a row count interpolated
+        with the ``%`` operator, returns that many rows of newly
+        generated values for the given autoincrement primary key column,
+        or None if the dialect can't generate them ahead of an INSERT.
+
+        """
+        return None
+
     def validate_identifier(self, ident):
         if len(ident) > self.max_identifier_length:
             raise exc.IdentifierError(
@@ -417,6 +509,26 @@ class DefaultDialect(interfaces.Dialect):
     def do_close(self, dbapi_connection):
         dbapi_connection.close()
 
+    @util.memoized_property
+    def _dialect_specific_select_one(self):
+        return str(expression.select([1]).compile(dialect=self))
+
+    def do_ping(self, dbapi_connection):
+        cursor = None
+        try:
+            cursor = dbapi_connection.cursor()
+            try:
+                cursor.execute(self._dialect_specific_select_one)
+            finally:
+                cursor.close()
+        except self.dbapi.Error as err:
+            if self.is_disconnect(err, dbapi_connection, cursor):
+                return False
+            else:
+                raise
+        else:
+            return True
+
     def create_xid(self):
         """Create a random two-phase transaction ID.
 
@@ -464,13 +576,22 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
     result_map = None
     compiled = None
     statement = None
+    invoked_statement = None
     _is_implicit_returning = False
     _is_explicit_returning = False
+    _is_server_side = False
+    returned_defaults = None
 
     # a hook for SQLite's translation of
     # result column names
     _translate_colname = None
 
+    # state besides the Compiled and cursor.description which
+    # determines the ResultMetaData of a result, such as that which
+    # affects _translate_colname(); a ResultMetaData memoized on the
+    # Compiled is only reused when this matches.
+    _result_metadata_variant = None
+
     @classmethod
     def _init_ddl(cls, dialect, connection, dbapi_connection, compiled_ddl):
         """Initialize execution context for a DDLElement construct."""
@@ -488,11 +609,11 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
             self.execution_options = dict(self.execution_options)
             self.execution_options.update(connection._execution_options)
 
+        self.unicode_statement = compiled._unicode_string
         if not dialect.supports_unicode_statements:
-            self.unicode_statement = util.text_type(compiled)
-            self.statement = dialect._encoder(self.unicode_statement)[0]
+            self.statement = compiled._dbapi_statement()
         else:
-            self.statement = self.unicode_statement = util.text_type(compiled)
+            self.statement = self.unicode_statement
 
         self.cursor = self.create_cursor()
         self.compiled_parameters = []
@@ -506,7 +627,8 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
 
     @classmethod
     def _init_compiled(cls, dialect, connection, dbapi_connection,
-                       compiled, parameters):
+                       compiled, parameters, invoked_statement=None,
+                       extracted_parameters=None):
         """Initialize execution context for a Compiled construct."""
 
         self = cls.__new__(cls)
@@ -519,94 +641,109 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         if not compiled.can_execute:
             raise exc.ArgumentError("Not an executable clause")
 
-        self.execution_options = compiled.statement._execution_options.union(
-            connection._execution_options)
+        # the statement that was passed to execute() may differ from
+        # compiled.statement when the compiled form was retrieved from
+        # the compiled cache using the statement's structural cache key
+        if invoked_statement is None:
+            invoked_statement = compiled.statement
+        self.invoked_statement = invoked_statement
+
+        # the immutabledict of the statement is used as is when
+        # there are no connection-level options to merge into it
+        self.execution_options = invoked_statement._execution_options
+        if connection._execution_options:
+            self.execution_options = self.execution_options.union(
+                connection._execution_options)
 
         # compiled clauseelement.  process bind params, process table defaults,
         # track collections used by ResultProxy to target and process results
 
         self.result_map = compiled.result_map
 
-        self.unicode_statement = util.text_type(compiled)
+        self.unicode_statement = compiled._unicode_string
         if not dialect.supports_unicode_statements:
-            self.statement = self.unicode_statement.encode(
-                self.dialect.encoding)
+            self.statement = compiled._dbapi_statement()
         else:
             self.statement = self.unicode_statement
 
-        self.isinsert = compiled.isinsert
-        self.isupdate = compiled.isupdate
-        self.isdelete = compiled.isdelete
-
         if not parameters:
-            self.compiled_parameters = [compiled.construct_params()]
+            self.compiled_parameters = [
+                compiled.construct_params(
+                    extracted_parameters=extracted_parameters)]
         else:
             self.compiled_parameters = \
-                [compiled.construct_params(m, _group_number=grp) for
+                [compiled.construct_params(
+                    m, _group_number=grp,
+                    extracted_parameters=extracted_parameters) for
                  grp, m in enumerate(parameters)]
 
             self.executemany = len(parameters) > 1
 
         self.cursor = self.create_cursor()
 
-        if self.isinsert or self.isupdate or self.isdelete:
-            self.is_crud = True
-            self._is_explicit_returning = bool(compiled.statement._returning)
-            self._is_implicit_returning = bool(
-                compiled.returning and not compiled.statement._returning)
-
-            if not self.isdelete:
-                if self.compiled.prefetch:
-                    if self.executemany:
-                        self._process_executemany_defaults()
-                    else:
-                        self._process_executesingle_defaults()
-
-        processors = compiled._bind_processors
+        # SELECT and other non-DML statements keep the class-level
+        # defaults for the crud flags and skip the returning / default
+        # handling entirely
+        if compiled.isinsert or compiled.isupdate or compiled.isdelete:
+            self._init_compiled_crud()
 
         # Convert the dictionary of bind parameter values
         # into a dict or list to be sent to the DBAPI's
         # execute() or executemany() method.
         parameters = []
         if dialect.positional:
+            getter, processors = compiled._positional_bind_plan
             for compiled_params in self.compiled_parameters:
-                param = []
-                for key in self.compiled.positiontup:
-                    if key in processors:
-                        param.append(processors[key](compiled_params[key]))
-                    else:
-                        param.append(compiled_params[key])
+                if processors:
+                    param = list(getter(compiled_params))
+                    for idx, processor in processors:
+                        param[idx] = processor(param[idx])
+                else:
+                    param = getter(compiled_params)
                 parameters.append(dialect.execute_sequence_format(param))
-        else:
-            encode = not dialect.supports_unicode_statements
+        elif not dialect.supports_unicode_statements:
+            processors = compiled._bind_processors
             for compiled_params in self.compiled_parameters:
-
-                if encode:
-                    param = dict(
-                        (
-                            dialect._encoder(key)[0],
-                            processors[key](compiled_params[key])
-                            if key in processors
-                            else compiled_params[key]
-                        )
-                        for key in compiled_params
+                parameters.append(dict(
+                    (
+                        dialect._encoder(key)[0],
+                        processors[key](compiled_params[key])
+                        if key in processors
+                        else compiled_params[key]
                     )
-                else:
-                    param = dict(
-                        (
-                            key,
-                            processors[key](compiled_params[key])
-                            if key in processors
-                            else compiled_params[key]
-                        )
-                        for key in compiled_params
-                    )
-
+                    for key in compiled_params
+                ))
+        else:
+            processors = compiled._keyword_bind_plan
+            for compiled_params in self.compiled_parameters:
+                param = compiled_params.copy()
+                for key, processor in processors:
+                    param[key] = processor(param[key])
                 parameters.append(param)
         self.parameters = dialect.execute_sequence_format(parameters)
 
         return self
 
+    def _init_compiled_crud(self):
+        """Set up crud flags, RETURNING state and pre-executed defaults
+        for a compiled INSERT, UPDATE or DELETE."""
+
+        compiled = self.compiled
+        self.isinsert = compiled.isinsert
+        self.isupdate = compiled.isupdate
+        self.isdelete = compiled.isdelete
+        self.is_crud = True
+        self._is_explicit_returning = bool(compiled.statement._returning)
+        self._is_implicit_returning = bool(
+            compiled.returning and not compiled.statement._returning)
+
+        if not self.isdelete:
+            if compiled.prefetch:
+                if self.executemany:
+                    self._process_executemany_defaults()
+                else:
+                    self._process_executesingle_defaults()
+
     @classmethod
     def _init_statement(cls, dialect, connection, dbapi_connection,
                         statement, parameters):
@@ -736,7 +873,40 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         return AUTOCOMMIT_REGEXP.match(statement)
 
     def create_cursor(self):
-        return self._dbapi_connection.cursor()
+        # the plain cursor is the common case; only consult
+        # _use_server_side_cursor() when streaming could be in effect
+        if not self.dialect.supports_server_side_cursors or (
+                not self.dialect.server_side_cursors and
+                'stream_results' not in self.execution_options):
+            return self._dbapi_connection.cursor()
+        elif self._use_server_side_cursor():
+            self._is_server_side = True
+            return self.create_server_side_cursor()
+        else:
+            return self._dbapi_connection.cursor()
+
+    def _use_server_side_cursor(self):
+        if self.dialect.server_side_cursors:
+            return self.execution_options.get('stream_results', True) and (
+                (self.compiled and isinstance(self.compiled.statement,
+                                              expression.Selectable)
+                 or
+                 (
+                    (not self.compiled or
+                     isinstance(self.compiled.statement,
+                                expression.TextClause))
+                    and self.statement and SERVER_SIDE_CURSOR_RE.match(
+                        self.statement))
+                 )
+            )
+        else:
+            return self.execution_options.get('stream_results', False)
+
+    def create_server_side_cursor(self):
+        """Return a new cursor which doesn't buffer the full result,
+        for dialects which set ``supports_server_side_cursors``."""
+
+        raise NotImplementedError()
 
     def pre_exec(self):
         pass
@@ -786,7 +956,10 @@ class DefaultExecutionContext(interfaces.ExecutionContext):
         pass
 
     def get_result_proxy(self):
-        return result.ResultProxy(self)
+        if self._is_server_side:
+            return result.BufferedRowResultProxy(self)
+        else:
+            return result.ResultProxy(self)
 
     @property
     def rowcount(self):
@@ -80,6 +80,33 @@ class Dialect(object):
     max_identifier_length
       The maximum length of identifier names.
 
+    max_in_list_size
+      The maximum number of bound parameters which operations that
+      batch rows by primary key, such as the "selectin" eager loader
+      and the DELETE statements emitted by the ORM unit of work,
+      will place in a single IN expression.
+
+    max_autoincrement_prefetch_rows
+      The maximum number of autoincrement primary key values the ORM
+      unit of work generates ahead of a single batch of INSERT
+      statements, for dialects which can generate them in advance.
+
+    supports_update_from_select
+      ``True`` if an UPDATE may be emitted with a FROM clause against
+      a UNION of SELECT statements.  The ORM unit of work uses this to
+      UPDATE rows of versioned mappers in batches, while checking the
+      number of rows matched, when ``supports_sane_multi_rowcount``
+      is ``False``.
+
+    max_update_from_select_rows
+      The maximum number of rows the unit of work will UPDATE in a
+      single UPDATE..FROM statement.
+
+    supports_server_side_cursors
+      ``True`` if the dialect honors the ``stream_results`` execution
+      option, delivering rows from a cursor which doesn't buffer the
+      full result; see :meth:`.ExecutionContext.create_cursor`.
+
     supports_unicode_statements
       Indicate whether the DB-API can receive SQL statements as Python
       unicode strings
@@ -387,6 +414,90 @@ class Dialect(object):
 
         raise NotImplementedError()
 
+    def get_schema_fingerprint(self, connection, schema=None, **kw):
+        """Return a value which changes whenever the structure of the
+        tables in `schema` changes, or None if not supported.
+
+        The value is used to validate a :class:`.ReflectionCache`, so
+        should be cheap to compute, e.g. a catalog version number or a
+        checksum taken over the system catalog.
+
+        .. versionadded:: 1.0.0
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_columns(
+            self, connection, schema=None, table_names=None, **kw):
+        """Return information about columns in many tables in `schema`.
+
+        Returns a dictionary mapping table names to lists of column
+        dictionaries, as returned by :meth:`.Dialect.get_columns`.  If
+        `table_names` is given, only those tables are included; tables
+        which don't exist are omitted from the result.  Other
+        ``get_multi_*()`` methods may return empty entries for such tables.
+
+        :class:`.DefaultDialect` provides an implementation which calls
+        :meth:`.Dialect.get_columns` for each table; dialects may instead
+        retrieve the information for all tables using a single query.
+        The remaining ``get_multi_*()`` methods follow the same contract
+        for their single-table counterparts.
+
+        .. versionadded:: 1.0.0
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_pk_constraint(
+            self, connection, schema=None, table_names=None, **kw):
+        """Return information about the primary key constraints of many
+        tables in `schema`, as a dictionary mapping table names to the
+        result of :meth:`.Dialect.get_pk_constraint`.
+
+        .. versionadded:: 1.0.0
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_foreign_keys(
+            self, connection, schema=None, table_names=None, **kw):
+        """Return information about the foreign keys of many tables in
+        `schema`, as a dictionary mapping table names to the result of
+        :meth:`.Dialect.get_foreign_keys`.
+
+        .. versionadded:: 1.0.0
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_indexes(
+            self, connection, schema=None, table_names=None, **kw):
+        """Return information about the indexes of many tables in
+        `schema`, as a dictionary mapping table names to the result of
+        :meth:`.Dialect.get_indexes`.
+
+        .. versionadded:: 1.0.0
+
+        """
+
+        raise NotImplementedError()
+
+    def get_multi_unique_constraints(
+            self, connection, schema=None, table_names=None, **kw):
+        """Return information about the unique constraints of many
+        tables in `schema`, as a dictionary mapping table names to the
+        result of :meth:`.Dialect.get_unique_constraints`.
+
+        .. versionadded:: 1.0.0
+
+        """
+
+        raise NotImplementedError()
+
     def normalize_name(self, name):
         """convert the given name to lowercase if it is detected as
         case insensitive.
@@ -510,6 +621,23 @@ class Dialect(object):
 
         raise NotImplementedError()
 
+    def do_ping(self, dbapi_connection):
+        """Test a DBAPI connection for liveness.
+
+        Called by the :class:`.Pool` upon checkout when the
+        :paramref:`.Pool.pre_ping` flag is set.  Returns ``True`` if the
+        connection is usable, or ``False`` if a disconnect situation was
+        detected; other errors are raised.
+
+        The default implementation emits the dialect's form of
+        ``SELECT 1`` on a new cursor.
+
+        .. versionadded:: 1.0.0
+
+        """
+
+        raise NotImplementedError()
+
     def create_xid(self):
         """Create a two-phase transaction ID.
 
@@ -833,6 +961,23 @@ class ExecutionContext(object):
         Some dialects may wish to change the behavior of
         connection.cursor(), such as postgresql which may return a PG
         "server side" cursor.
+
+        When the dialect sets ``supports_server_side_cursors`` and the
+        ``stream_results`` execution option is in effect, the default
+        implementation calls upon :meth:`.create_server_side_cursor`,
+        and the rows of the result are subsequently fetched in batches
+        by a :class:`.BufferedRowResultProxy`.
+        """
+
+        raise NotImplementedError()
+
+    def create_server_side_cursor(self):
+        """Return a new cursor which delivers rows without buffering
+        the full result, such as a PG "named" cursor or a MySQLdb
+        ``SSCursor``.
+
+        .. versionadded:: 1.0.0
+
         """
 
         raise NotImplementedError()
@@ -33,6 +33,21 @@ from ..util import deprecated
 from ..util import topological
 from .. import inspection
 from .base import Connectable
+import os
+import tempfile
+
+
+def _cache_key(fn_name, args, kw):
+    return (
+        fn_name,
+        tuple(a for a in args if isinstance(a, util.string_types)),
+        tuple(sorted(
+            (k, v) for k, v in kw.items() if
+            isinstance(v,
+                       util.string_types + util.int_types + (float, )
+                       )
+        ))
+    )
 
 
 @util.decorator
@@ -40,15 +55,7 @@ def cache(fn, self, con, *args, **kw):
     info_cache = kw.get('info_cache', None)
     if info_cache is None:
         return fn(self, con, *args, **kw)
-    key = (
-        fn.__name__,
-        tuple(a for a in args if isinstance(a, util.string_types)),
-        tuple((k, v) for k, v in kw.items() if
-              isinstance(v,
-                         util.string_types + util.int_types + (float, )
-                         )
-              )
-    )
+    key = _cache_key(fn.__name__, args, kw)
     ret = info_cache.get(key)
     if ret is None:
         ret = fn(self, con, *args, **kw)
@@ -312,6 +319,25 @@ class Inspector(object):
                 info_cache=self.info_cache, **kw)
         return {}
 
+    def get_schema_fingerprint(self, schema=None):
+        """Return a value which changes whenever the structure of the
+        tables in `schema` changes, or None if the dialect can't produce
+        one.
+
+        The value is always fetched from the database, and is used by
+        :class:`.ReflectionCache` to determine whether previously
+        reflected information is still current.  It may be any picklable
+        value which compares by equality, e.g. a catalog version number or
+        a checksum.
+
+        :param schema: Optional, the schema to check.  For special quoting,
+         use :class:`.quoted_name`.
+
+        .. versionadded:: 1.0.0
+
+        """
+        return self.dialect.get_schema_fingerprint(self.bind, schema)
+
     def get_view_names(self, schema=None):
         """Return all view names in `schema`.
 
@@ -506,6 +532,156 @@ class Inspector(object):
         return self.dialect.get_unique_constraints(
             self.bind, table_name, schema, info_cache=self.info_cache, **kw)
 
+    def get_multi_columns(self, schema=None, table_names=None, **kw):
+        """Return information about columns in many tables at once.
+
+        Returns a dictionary mapping each table name in the given
+        `schema` to a list of column dictionaries, as returned by
+        :meth:`.Inspector.get_columns`.
+
+        :param schema: string schema name; if omitted, uses the default schema
+         of the database connection.  For special quoting,
+         use :class:`.quoted_name`.
+
+        :param table_names: optional sequence of table names to which
+         the results should be limited; if omitted, all tables in the
+         schema are included.
+
+        Dialects may implement this method using a single query against
+        the system catalog; the information returned for each table is
+        also cached by this :class:`.Inspector`, so that subsequent calls
+        to :meth:`.Inspector.get_columns` for those tables do not query
+        the database.
+
+        .. versionadded:: 1.0.0
+
+        """
+        multi = self._get_multi(
+            'get_multi_columns', 'get_columns', schema, table_names, kw)
+        for col_defs in multi.values():
+            for col_def in col_defs:
+                coltype = col_def['type']
+                if not isinstance(coltype, TypeEngine):
+                    col_def['type'] = coltype()
+        return multi
+
+    def get_multi_pk_constraint(self, schema=None, table_names=None, **kw):
+        """Return information about the primary key constraints of
+        many tables at once.
+
+        Returns a dictionary mapping each table name to a dictionary as
+        returned by :meth:`.Inspector.get_pk_constraint`.  Arguments and
+        caching behavior are as described at
+        :meth:`.Inspector.get_multi_columns`.
+
+        .. versionadded:: 1.0.0
+
+        """
+        return self._get_multi(
+            'get_multi_pk_constraint', 'get_pk_constraint',
+            schema, table_names, kw)
+
+    def get_multi_foreign_keys(self, schema=None, table_names=None, **kw):
+        """Return information about the foreign keys of many tables
+        at once.
+
+        Returns a dictionary mapping each table name to a list of
+        dictionaries as returned by :meth:`.Inspector.get_foreign_keys`.
+        Arguments and caching behavior are as described at
+        :meth:`.Inspector.get_multi_columns`.
+
+        .. versionadded:: 1.0.0
+
+        """
+        return self._get_multi(
+            'get_multi_foreign_keys', 'get_foreign_keys',
+            schema, table_names, kw)
+
+    def get_multi_indexes(self, schema=None, table_names=None, **kw):
+        """Return information about the indexes of many tables at once.
+
+        Returns a dictionary mapping each table name to a list of
+        dictionaries as returned by :meth:`.Inspector.get_indexes`.
+        Arguments and caching behavior are as described at
+        :meth:`.Inspector.get_multi_columns`.
+
+        .. versionadded:: 1.0.0
+
+        """
+        return self._get_multi(
+            'get_multi_indexes', 'get_indexes', schema, table_names, kw)
+
+    def get_multi_unique_constraints(
+            self, schema=None, table_names=None, **kw):
+        """Return information about the unique constraints of many
+        tables at once.
+
+        Returns a dictionary mapping each table name to a list of
+        dictionaries as returned by
+        :meth:`.Inspector.get_unique_constraints`.  Arguments and caching
+        behavior are as described at :meth:`.Inspector.get_multi_columns`.
+
+        .. versionadded:: 1.0.0
+
+        """
+        return self._get_multi(
+            'get_multi_unique_constraints', 'get_unique_constraints',
+            schema, table_names, kw)
+
+    def _get_multi(self, multi_name, single_name, schema, table_names, kw):
+        if table_names is not None:
+            # all tables present already, e.g. from a ReflectionCache
+            keys = [
+                _cache_key(single_name, (table_name, schema), kw)
+                for table_name in table_names
+            ]
+            if all(key in self.info_cache for key in keys):
+                return dict(
+                    (table_name, self.info_cache[key])
+                    for table_name, key in zip(table_names, keys)
+                )
+
+        multi = getattr(self.dialect, multi_name)(
+            self.bind, schema=schema, table_names=table_names,
+            info_cache=self.info_cache, **kw)
+
+        # store each table's result under the same key as that used
+        # by the @cache decorator for the single-table dialect method
+        for table_name, value in multi.items():
+            self.info_cache[
+                _cache_key(single_name, (table_name, schema), kw)] = value
+        return multi
+
+    def _prefetch_tables(self, schema, table_names, **kw):
+        """Populate the info_cache for the given tables, ahead of a
+        series of :meth:`.Inspector.reflecttable` calls.
+
+        The keyword arguments are those passed for each table
+        by :meth:`.Inspector.reflecttable`.
+
+        """
+        if util.py2k:
+            if isinstance(schema, str):
+                schema = schema.decode(self.dialect.encoding)
+            table_names = [
+                name.decode(self.dialect.encoding)
+                if isinstance(name, str) else name
+                for name in table_names
+            ]
+
+        for fn, fn_kw in (
+                (self.get_multi_columns, kw),
+                (self.get_multi_pk_constraint, kw),
+                (self.get_multi_foreign_keys, kw),
+                (self.get_multi_indexes, {}),
+                (self.get_multi_unique_constraints, {})):
+            try:
+                fn(schema, table_names, **fn_kw)
+            except NotImplementedError:
+                # optional dialect feature; reflecttable() will
+                # handle it per table as usual
+                pass
+
     def reflecttable(self, table, include_columns, exclude_columns=()):
         """Given a Table object, load its internal constructs based on
         introspection.
@@ -589,6 +765,9 @@ class Inspector(object):
         self, table, col_d, include_columns,
             exclude_columns, cols_by_orig_name):
 
+        # the dictionary may be modified by column_reflect listeners;
+        # copy it so that the version in the info_cache is unchanged
+        col_d = dict(col_d)
         orig_name = col_d['name']
 
         table.dispatch.column_reflect(self, table, col_d)
@@ -684,6 +863,7 @@ class Inspector(object):
                 sa_schema.Table(referred_table, table.metadata,
                                 autoload=True, schema=referred_schema,
                                 autoload_with=self.bind,
+                                _reflect_inspector=self,
                                 **reflection_options
                                 )
                 for column in referred_columns:
@@ -692,6 +872,7 @@ class Inspector(object):
             else:
                 sa_schema.Table(referred_table, table.metadata, autoload=True,
                                 autoload_with=self.bind,
+                                _reflect_inspector=self,
                                 **reflection_options
                                 )
                 for column in referred_columns:
@@ -786,3 +967,180 @@ class Inspector(object):
                     constrained_cols.append(constrained_col)
             table.append_constraint(
                 sa_schema.UniqueConstraint(*constrained_cols, name=conname))
+
+
+class ReflectionCache(object):
+    """Retains reflected schema information beyond the lifespan of
+    a single :class:`.Inspector`.
+
+    A :class:`.ReflectionCache` stores the contents of an
+    :attr:`.Inspector.info_cache` in serialized form, along with a
+    "fingerprint" of the database schema as of when it was reflected.
+    When passed to :meth:`.MetaData.reflect` or
+    :meth:`.AutomapBase.prepare`, the stored information is used in place
+    of querying the database's catalog, provided the fingerprint is
+    unchanged::
+
+        from sqlalchemy.engine.reflection import FileReflectionCache
+
+        cache = FileReflectionCache("/var/cache/myapp/schema.cache")
+        metadata.reflect(engine, reflection_cache=cache)
+
+    The fingerprint is obtained from
+    :meth:`.Inspector.get_schema_fingerprint`; currently, the Postgresql
+    and SQLite dialects provide one.  For other backends, or to use a
+    different strategy, a ``fingerprint`` callable may be passed,
+    which receives a :class:`.Connection` and a schema name and returns
+    a picklable value.   If no fingerprint is available, the cache isn't
+    used.
+
+    The base :class:`.ReflectionCache` stores entries in memory; subclasses
+    such as :class:`.FileReflectionCache` provide persistent storage by
+    overriding the :meth:`.ReflectionCache.get` and
+    :meth:`.ReflectionCache.set` methods.
+
+    .. versionadded:: 1.0.0
+
+    """
+
+    def __init__(self, fingerprint=None):
+        """Construct a new :class:`.ReflectionCache`.
+
+        :param fingerprint: optional callable, given a
+         :class:`.Connection` and schema name, which returns a value that
+         changes whenever the schema does.  Defaults to
+         :meth:`.Inspector.get_schema_fingerprint`.
+
+        """
+        self.fingerprint = fingerprint
+        self._entries = {}
+
+    def get(self, key):
+        """Return the serialized entry for the given key, or None."""
+
+        return self._entries.get(key)
+
+    def set(self, key, value):
+        """Store the serialized entry for the given key."""
+
+        self._entries[key] = value
+
+    def load(self, inspector, schema=None):
+        """Populate the info_cache of the given :class:`.Inspector` from
+        this cache, if a current entry is present.
+
+        Returns the schema's fingerprint as of now, to be passed
+        to :meth:`.ReflectionCache.save` once reflection is complete.
+
+        """
+        if self.fingerprint is not None:
+            fingerprint = self.fingerprint(inspector.bind, schema)
+        else:
+            fingerprint = inspector.get_schema_fingerprint(schema)
+        if fingerprint is None:
+            return None
+
+        data = self.get(self._key(inspector, schema))
+        if data is not None:
+            try:
+                stored_fingerprint, info_cache = util.pickle.loads(data)
+            except Exception as err:
+                util.warn("Could not load reflection cache entry: %s" % err)
+            else:
+                if stored_fingerprint == fingerprint:
+                    for key, value in info_cache.items():
+                        inspector.info_cache.setdefault(key, value)
+        return fingerprint
+
+    def save(self, inspector, fingerprint, schema=None):
+        """Store the info_cache of the given :class:`.Inspector`, as
+        reflected when the schema had the given fingerprint."""
+
+        if fingerprint is None:
+            return
+        try:
+            data = util.pickle.dumps(
+                (fingerprint, inspector.info_cache), -1)
+        except Exception as err:
+            util.warn("Could not serialize reflection cache entry: %s" % err)
+        else:
+            self.set(self._key(inspector, schema), data)
+
+    def _key(self, inspector, schema):
+        return (repr(inspector.engine.url), schema)
+
+
+class FileReflectionCache(ReflectionCache):
+    """A :class:`.ReflectionCache` which is persisted to a file.
+
+    The file is read when first needed, and rewritten each time an entry
+    is stored, so that other processes using the same file may make use
+    of it.  The file is replaced atomically where the platform allows,
+    retaining the permissions of the existing file; a new file is created
+    with permissions according to the process' umask.
+
+    .. warning::
+
+        The file is loaded using ``pickle``, so that a cache file written
+        by an untrusted party can execute arbitrary code.  The file and
+        its directory must not be writable by untrusted users.
+
+    .. versionadded:: 1.0.0
+
+    """
+
+    def __init__(self, path, fingerprint=None):
+        """Construct a new :class:`.FileReflectionCache`.
+
+        :param path: the path of the cache file, which need not exist yet.
+
+        :param fingerprint: see :class:`.ReflectionCache`.
+
+        """
+        super(FileReflectionCache, self).__init__(fingerprint=fingerprint)
+        self.path = path
+        self._entries = None
+
+    def _read(self):
+        try:
+            with open(self.path, 'rb') as file_:
+                return util.pickle.load(file_)
+        except (IOError, OSError):
+            return {}
+        except Exception as err:
+            util.warn(
+                "Could not read reflection cache file %s: %s" %
+                (self.path, err))
+            return {}
+
+    def _file_mode(self):
+        try:
+            return os.stat(self.path).st_mode & 0o777
+        except OSError:
+            umask = os.umask(0)
+            os.umask(umask)
+            return 0o666 & ~umask
+
+    def get(self, key):
+        if self._entries is None:
+            self._entries = self._read()
+        return self._entries.get(key)
+
+    def set(self, key, value):
+        # re-read, to retain entries stored by other processes
+        self._entries = self._read()
+        self._entries[key] = value
+
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(os.path.abspath(self.path)))
+        try:
+            with os.fdopen(fd, 'wb') as file_:
+                util.pickle.dump(self._entries, file_, -1)
+            # mkstemp() creates the file readable by its owner only
+            os.chmod(tmp_path, self._file_mode())
+            if util.win32 and os.path.exists(self.path):
+                os.remove(self.path)
+            os.rename(tmp_path, self.path)
+        except:
+            os.remove(tmp_path)
+            raise
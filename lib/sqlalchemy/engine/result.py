@@ -11,8 +11,10 @@ and :class:`.RowProxy."""
 
 from .. import exc, util
 from ..sql import expression, sqltypes
+import array
 import collections
 import operator
+import sys
 
 # This reconstructor is necessary so that pickles with the C extension or
 # without use the same Binary format.
@@ -182,6 +184,11 @@ except ImportError:
     pass
 
 
+# the elements of a cursor.description record which determine
+# the ResultMetaData; the column name and type code
+_description_key = operator.itemgetter(0, 1)
+
+
 class ResultMetaData(object):
     """Handle cursor.description, applying additional info from an execution
     context."""
@@ -268,6 +275,11 @@ class ResultMetaData(object):
         # high precedence keymap.
         keymap.update(primary_keymap)
 
+    def _copy(self):
+        md = self.__class__.__new__(self.__class__)
+        md.__dict__.update(self.__dict__)
+        return md
+
     @util.pending_deprecation("0.8", "sqlite dialect uses "
                               "_translate_colname() now")
     def _set_keymap_synonym(self, name, origname):
@@ -378,6 +390,86 @@ class ResultMetaData(object):
         self._echo = False
 
 
+_array_typecodes = dict((type_, 'l') for type_ in util.int_types)
+_array_typecodes[float] = 'd'
+
+
+def _column_array(values):
+    """Return a sequence of column values as an ``array.array`` if
+    they are all integers or all floats, else as a list."""
+
+    if values:
+        typecode = _array_typecodes.get(type(values[0]))
+        if typecode is not None:
+            try:
+                return array.array(typecode, values)
+            except (TypeError, OverflowError):
+                pass
+    return list(values)
+
+
+class ColumnChunk(object):
+    """A group of result rows delivered in columnar form.
+
+    Returned by :meth:`.ResultProxy.fetchcolumns` and
+    :meth:`.ResultProxy.iter_columns`.  Each column is a sequence
+    containing one value per row, with result processing already
+    applied; the type of sequence is determined by the ``columnar``
+    execution option (see :meth:`.ResultProxy.fetchcolumns`).
+
+    Columns are accessed in the same way as the elements of a
+    :class:`.RowProxy`, i.e. by integer position, by string name or by
+    :class:`.Column` object::
+
+        chunk = result.fetchcolumns(10000)
+        ids = chunk[users.c.id]
+        names = chunk['name']
+
+    Iterating the :class:`.ColumnChunk` produces each column in turn, so
+    that the columns may be unpacked::
+
+        ids, names = result.fetchcolumns()
+
+    .. versionadded:: 1.0.0
+
+    """
+
+    __slots__ = ('_metadata', 'columns', 'num_rows')
+
+    def __init__(self, metadata, columns, num_rows):
+        self._metadata = metadata
+        self.columns = columns
+        """The list of column sequences, in the order of :meth:`.keys`."""
+
+        self.num_rows = num_rows
+        """The number of rows represented by this chunk."""
+
+    def keys(self):
+        """Return the string names of the columns."""
+
+        return self._metadata.keys
+
+    def __len__(self):
+        return len(self.columns)
+
+    def __iter__(self):
+        return iter(self.columns)
+
+    def __getitem__(self, key):
+        if isinstance(key, util.int_types + (slice, )):
+            return self.columns[key]
+        getter = self._metadata._getter(key)
+        if getter is None:
+            raise exc.NoSuchColumnError(
+                "Could not locate column in row for column '%s'" %
+                expression._string_or_unprintable(key))
+        return getter(self.columns)
+
+    def __repr__(self):
+        return "ColumnChunk(%r, num_rows=%d)" % (
+            self._metadata.keys, self.num_rows)
+
+
 class ResultProxy(object):
     """Wraps a DB-API cursor object to provide easier access to row columns.
 
@@ -423,13 +515,21 @@ class ResultProxy(object):
     def _init_metadata(self):
         metadata = self._cursor_description()
         if metadata is not None:
-            if self.context.compiled and \
-                    'compiled_cache' in self.context.execution_options:
-                if self.context.compiled._cached_metadata:
-                    self._metadata = self.context.compiled._cached_metadata
+            compiled = self.context.compiled
+            if compiled:
+                # the ResultMetaData is memoized on the Compiled, for as
+                # long as the statement continues to produce the same
+                # column names and types in cursor.description.
+                key = (
+                    self.context._result_metadata_variant,
+                    tuple(map(_description_key, metadata))
+                )
+                cached = compiled._cached_metadata
+                if cached is not None and cached[0] == key:
+                    self._metadata = cached[1]
                 else:
-                    self._metadata = self.context.compiled._cached_metadata = \
-                        ResultMetaData(self, metadata)
+                    self._metadata = md = ResultMetaData(self, metadata)
+                    compiled._cached_metadata = (key, md)
             else:
                 self._metadata = ResultMetaData(self, metadata)
             if self._echo:
@@ -889,6 +989,142 @@ class ResultProxy(object):
         else:
             return None
 
+    @util.memoized_property
+    def _column_factory(self):
+        columnar = self.context.execution_options.get('columnar', True)
+        if columnar is True or columnar == 'array':
+            return _column_array
+        elif columnar == 'list':
+            return list
+        elif columnar == 'numpy':
+            try:
+                import numpy
+            except ImportError:
+                raise exc.InvalidRequestError(
+                    "The 'numpy' format for the 'columnar' execution "
+                    "option requires NumPy to be installed")
+
+            def ndarray(values):
+                values = _column_array(values)
+                if isinstance(values, array.array):
+                    return numpy.array(values)
+                else:
+                    return numpy.array(values, dtype=object)
+            return ndarray
+        else:
+            raise exc.ArgumentError(
+                "Invalid value for 'columnar' execution option: %r; "
+                "expected one of True, 'array', 'list', 'numpy'" %
+                (columnar, ))
+
+    def process_columns(self, rows, processors=None):
+        """Given a list of raw DBAPI rows, return a :class:`.ColumnChunk`.
+
+        Result processors are applied a column at a time.  This method
+        is used by :meth:`.fetchcolumns` and may be overridden by
+        subclasses.
+
+        """
+        metadata = self._metadata
+        factory = self._column_factory
+        if processors is None:
+            processors = metadata._processors
+
+        if rows:
+            columns = zip(*rows)
+        else:
+            columns = [() for key in metadata.keys]
+
+        return ColumnChunk(
+            metadata,
+            [
+                factory([processor(value) for value in column])
+                if processor is not None else factory(column)
+                for processor, column in zip(processors, columns)
+            ],
+            len(rows)
+        )
+
+    def fetchcolumns(self, size=None):
+        """Fetch rows in columnar form, returning a :class:`.ColumnChunk`.
+
+        Rather than constructing a :class:`.RowProxy` per row, the rows
+        are transposed into one sequence per column, and the result
+        processing of each column's type is applied to each column as a
+        whole.  This avoids most of the per-row overhead when fetching
+        large numbers of rows for numerical or analytical use.
+
+        If ``size`` is given, up to ``size`` rows are fetched, as with
+        :meth:`.fetchmany`, and the result remains open unless there are
+        no more rows, in which case an empty chunk is returned; otherwise
+        all remaining rows are fetched and the result is closed.  See
+        :meth:`.iter_columns` for a convenient way to fetch fixed-size
+        chunks, which in conjunction with the ``stream_results`` execution
+        option allows very large results to be processed within a bounded
+        amount of memory.
+
+        The type of sequence used for each column is set by the
+        ``columnar`` execution option, which may be set on the
+        :class:`.Connection` or statement:
+
+        * ``True`` or ``'array'`` (the default) - columns whose values are
+          all integers or all floats are delivered as ``array.array``
+          objects; other columns, including those containing NULL values,
+          are delivered as lists.
+
+        * ``'list'`` - all columns are delivered as lists.
+
+        * ``'numpy'`` - columns are delivered as NumPy arrays; integer and
+          float columns receive the corresponding native dtype and all
+          others use the ``object`` dtype.  NumPy must be installed.
+
+        E.g.::
+
+            result = conn.execution_options(columnar='numpy').execute(
+                select([measurements.c.sensor_id, measurements.c.value]))
+            sensor_ids, values = result.fetchcolumns()
+
+        .. versionadded:: 1.0.0
+
+        """
+
+        try:
+            if size is None:
+                rows = self._fetchall_impl()
+            else:
+                rows = self._fetchmany_impl(size)
+            if self._echo:
+                log = self.context.engine.logger.debug
+                for row in rows:
+                    log("Row %r", row)
+            chunk = self.process_columns(rows)
+            if size is None or not rows:
+                self.close()
+            return chunk
+        except Exception as e:
+            self.connection._handle_dbapi_exception(
+                e, None, None,
+                self.cursor, self.context)
+
+    def iter_columns(self, size):
+        """Return an iterator of :class:`.ColumnChunk` objects, each
+        containing up to ``size`` rows.
+
+        The result is closed once all rows are exhausted.  See
+        :meth:`.fetchcolumns` for details.
+
+        .. versionadded:: 1.0.0
+
+        """
+        while True:
+            chunk = self.fetchcolumns(size)
+            if chunk.num_rows:
+                yield chunk
+            if chunk.num_rows < size:
+                # a short chunk indicates no more rows remain
+                self.close()
+                break
+
 
 class BufferedRowResultProxy(ResultProxy):
     """A ResultProxy with row buffering behavior.
@@ -901,18 +1137,41 @@ class BufferedRowResultProxy(ResultProxy):
     server-side cursors).
 
     The pre-fetching behavior fetches only one row initially, and then
-    grows its buffer size by a fixed amount with each successive need
-    for additional rows up to a size of 100.
+    grows its buffer size with each successive need for additional rows,
+    up to a size of 1000.  The sizes are controlled by the following
+    execution options:
+
+    * ``initial_row_buffer`` - the number of rows fetched initially;
+      defaults to 1.
+
+    * ``max_row_buffer`` - the largest number of rows fetched at once;
+      defaults to 1000.  :meth:`.Query.yield_per` sets this option to
+      the number of rows it yields at a time.
+
+    * ``row_buffer_bytes`` - when present, the buffer size is no longer
+      grown along a fixed schedule; instead, after each fetch it is set
+      to the number of rows estimated to occupy this many bytes, based
+      on the in-memory size of the most recently fetched row, and
+      limited by ``max_row_buffer``.
+
+    .. versionchanged:: 1.0.0 Added the ``initial_row_buffer``,
+       ``max_row_buffer`` and ``row_buffer_bytes`` execution options.
+
     """
 
     def _init_metadata(self):
+        opts = self.context.execution_options
+        self._max_row_buffer = opts.get('max_row_buffer', 1000)
+        self._row_buffer_bytes = opts.get('row_buffer_bytes', None)
+        self._bufsize = min(
+            opts.get('initial_row_buffer', 1), self._max_row_buffer)
         self.__buffer_rows()
         super(BufferedRowResultProxy, self)._init_metadata()
 
     # this is a "growth chart" for the buffering of rows.
     # each successive __buffer_rows call will use the next
-    # value in the list for the buffer size until the max
-    # is reached
+    # value in the list for the buffer size; sizes not
+    # in the chart are doubled, until the max is reached
     size_growth = {
         1: 5,
         5: 10,
@@ -925,9 +1184,19 @@ class BufferedRowResultProxy(ResultProxy):
     }
 
     def __buffer_rows(self):
-        size = getattr(self, '_bufsize', 1)
+        size = self._bufsize
         self.__rowbuffer = collections.deque(self.cursor.fetchmany(size))
-        self._bufsize = self.size_growth.get(size, size)
+        if self._row_buffer_bytes is not None:
+            if self.__rowbuffer:
+                size = self._row_buffer_bytes // \
+                    self._row_size(self.__rowbuffer[-1]) or 1
+        else:
+            size = self.size_growth.get(size, size * 2)
+        self._bufsize = min(size, self._max_row_buffer)
+
+    @staticmethod
+    def _row_size(row):
+        return sys.getsizeof(row) + sum(sys.getsizeof(elem) for elem in row)
 
     def _fetchone_impl(self):
         if self.closed:
@@ -1026,7 +1295,9 @@ class BufferedColumnResultProxy(ResultProxy):
 
     def _init_metadata(self):
         super(BufferedColumnResultProxy, self)._init_metadata()
-        metadata = self._metadata
+        # the ResultMetaData may be shared with other results of
+        # the same Compiled; alter a copy of it.
+        metadata = self._metadata = self._metadata._copy()
         # orig_processors will be used to preprocess each row when they are
         # constructed.
         metadata._orig_processors = metadata._processors
@@ -1060,3 +1331,12 @@ class BufferedColumnResultProxy(ResultProxy):
                 break
             l.append(row)
         return l
+
+    def fetchcolumns(self, size=None):
+        # rows are fully processed as they are fetched.
+        if size is None:
+            rows = self.fetchall()
+        else:
+            rows = self.fetchmany(size)
+        return self.process_columns(
+            [tuple(row) for row in rows], self._metadata._processors)
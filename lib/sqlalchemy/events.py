@@ -367,6 +367,51 @@ class PoolEvents(event.Events):
 
         """
 
+    def exhausted(self, pool):
+        """Called when a checkout finds no connection available in the
+        pool and no overflow capacity remaining, and must wait for a
+        connection to be returned.
+
+        A checkout which then waits longer than the pool's ``timeout``
+        raises :class:`~sqlalchemy.exc.TimeoutError`; this event allows
+        pool starvation to be detected before that point.  It is
+        currently emitted only by :class:`.QueuePool`.
+
+        :param pool: the :class:`.Pool` which is exhausted.
+
+        .. versionadded:: 1.0.0
+
+        .. seealso::
+
+            :meth:`.PoolEvents.checkout_wait`
+
+            :meth:`.Pool.stats`
+
+        """
+
+    def checkout_wait(self, pool, wait_time):
+        """Called when a checkout which had to wait on an exhausted pool
+        has received a connection.
+
+        This event follows the :meth:`.PoolEvents.exhausted` event
+        for the same checkout, unless the wait timed out.  It is
+        currently emitted only by :class:`.QueuePool`.
+
+        :param pool: the :class:`.Pool` from which the connection was
+         checked out.
+
+        :param wait_time: the number of seconds spent waiting.
+
+        .. versionadded:: 1.0.0
+
+        .. seealso::
+
+            :meth:`.PoolEvents.exhausted`
+
+            :meth:`.Pool.stats`
+
+        """
+
     def invalidate(self, dbapi_connection, connection_record, exception):
         """Called when a DBAPI connection is to be "invalidated".
 
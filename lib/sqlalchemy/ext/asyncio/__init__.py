@@ -0,0 +1,70 @@
+# ext/asyncio/__init__.py
+# Copyright (C) 2005-2014 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+"""Provide an asyncio facade for the Core :class:`.Engine` and
+:class:`.Connection`.
+
+The :func:`.create_async_engine` function produces an :class:`.AsyncEngine`,
+whose :class:`.AsyncConnection` objects execute statements as coroutines::
+
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    engine = create_async_engine("sqlite://", pool_size=1, max_overflow=0)
+
+    async def main():
+        async with engine.connect() as conn:
+            async with conn.begin():
+                await conn.execute(
+                    users.insert(), [{"name": "ed"}, {"name": "wendy"}])
+
+            result = await conn.stream(users.select())
+            async for row in result:
+                print(row)
+
+        await engine.dispose()
+
+Statements are compiled and executed using the same dialect, compiler and
+:class:`.ExecutionContext` machinery as a regular :class:`.Connection`;
+only the calls to the DBAPI connection and cursor, as well as the checkout
+of connections from the pool, are awaited, using a driver module which
+exposes the DBAPI interface as coroutines.  Results are delivered through
+the existing :class:`.ResultProxy`, wrapped in an :class:`.AsyncResult`.
+
+The :mod:`sqlalchemy.ext.asyncio.sqlite` module supplies such a driver
+for SQLite, and is used by default for ``sqlite://`` URLs.  It runs
+the ``sqlite3`` module in-process and does not itself yield to the event
+loop; it is intended for testing and development.  Other drivers are
+passed to :func:`.create_async_engine` using the ``module`` argument.
+
+The following features of :class:`.Connection` are not available with
+the asyncio facade:
+
+* Dialect initialization queries normally emitted upon first connect
+  are not run; dialect attributes retain their default values.
+* SQL expression and sequence defaults which must be pre-executed
+  before an INSERT raise :class:`~sqlalchemy.exc.InvalidRequestError`.
+* Connection events, SAVEPOINTs and two-phase transactions.
+
+This extension requires Python 3.5 or greater, and is not installed
+on earlier Python versions.
+
+.. versionadded:: 1.0.0
+
+"""
+
+import sys
+
+if sys.version_info < (3, 5):
+    raise ImportError(
+        "sqlalchemy.ext.asyncio requires Python 3.5 or greater")
+
+from .engine import create_async_engine, AsyncEngine, AsyncConnection, \
+    AsyncTransaction
+from .result import AsyncResult
+from .pool import AsyncAdaptedQueuePool
+
+__all__ = ['create_async_engine', 'AsyncEngine', 'AsyncConnection',
+           'AsyncTransaction', 'AsyncResult', 'AsyncAdaptedQueuePool']
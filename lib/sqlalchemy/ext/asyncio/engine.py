@@ -0,0 +1,515 @@
+# ext/asyncio/engine.py
+# Copyright (C) 2005-2014 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""asyncio versions of :class:`.Engine`, :class:`.Connection` and
+:class:`.Transaction`."""
+
+from ... import exc, util
+from ...engine import create_engine, url as _url
+from ...engine.base import Connection
+from ...sql import util as sql_util
+from .pool import AsyncAdaptedQueuePool
+from .result import AsyncResult
+
+
+def create_async_engine(url, **kw):
+    """Create a new :class:`.AsyncEngine`.
+
+    Arguments are the same as those of :func:`.create_engine`, including
+    the pool arguments ``pool_size``, ``max_overflow``, ``pool_timeout``,
+    ``pool_recycle``, ``pool_use_lifo`` and ``pool_pre_ping``, which
+    configure an :class:`.AsyncAdaptedQueuePool`.
+
+    :param module: the asyncio driver module.  This is a module, or any
+     object, which provides the attributes of a DBAPI module as expected
+     by the dialect, e.g. ``paramstyle`` and the ``Error`` exception
+     hierarchy, with the exception that its ``connect()`` function as
+     well as the ``commit()``, ``rollback()`` and ``close()`` methods of
+     its connections, and the ``execute()``, ``executemany()``,
+     ``fetchone()``, ``fetchmany()``, ``fetchall()`` and ``close()``
+     methods of its cursors are coroutines.  Defaults to
+     :mod:`sqlalchemy.ext.asyncio.sqlite` for SQLite URLs, and is
+     required otherwise.
+
+    """
+
+    u = _url.make_url(url)
+    if kw.get('module') is None:
+        if u.get_backend_name() != 'sqlite':
+            raise exc.ArgumentError(
+                "No asyncio driver is known for database backend '%s'; "
+                "pass an asyncio driver module using the 'module' argument."
+                % u.get_backend_name())
+        from . import sqlite
+        kw['module'] = sqlite
+
+    poolclass = kw.setdefault('poolclass', AsyncAdaptedQueuePool)
+    if not issubclass(poolclass, AsyncAdaptedQueuePool):
+        raise exc.ArgumentError(
+            "poolclass must be a subclass of AsyncAdaptedQueuePool")
+
+    # the dialect's first-connect initialization emits queries
+    # synchronously, and isn't available here
+    kw['_initialize'] = False
+
+    return AsyncEngine(create_engine(u, **kw))
+
+
+class AsyncEngine(object):
+    """An asyncio facade for an :class:`.Engine`.
+
+    The :class:`.AsyncEngine` is produced by :func:`.create_async_engine`.
+    It refers to a regular :class:`.Engine`, available as
+    :attr:`.AsyncEngine.sync_engine`, which supplies the dialect,
+    execution options and logging, and whose pool is an
+    :class:`.AsyncAdaptedQueuePool`.
+
+    .. versionadded:: 1.0.0
+
+    """
+
+    def __init__(self, sync_engine):
+        if not isinstance(sync_engine.pool, AsyncAdaptedQueuePool):
+            raise exc.ArgumentError(
+                "The pool of an AsyncEngine must be an "
+                "AsyncAdaptedQueuePool")
+        self.sync_engine = sync_engine
+
+    sync_engine = None
+    """The :class:`.Engine` to which this :class:`.AsyncEngine` refers."""
+
+    @property
+    def dialect(self):
+        return self.sync_engine.dialect
+
+    @property
+    def pool(self):
+        return self.sync_engine.pool
+
+    @property
+    def url(self):
+        return self.sync_engine.url
+
+    def connect(self):
+        """Return a new :class:`.AsyncConnection`.
+
+        The connection is checked out from the pool when the
+        :class:`.AsyncConnection` is awaited or used as an asynchronous
+        context manager::
+
+            async with engine.connect() as conn:
+                result = await conn.execute(table.select())
+
+            conn = await engine.connect()
+            try:
+                result = await conn.execute(table.select())
+            finally:
+                await conn.close()
+
+        """
+
+        return AsyncConnection(self)
+
+    def begin(self):
+        """Return an asynchronous context manager delivering an
+        :class:`.AsyncConnection` with an :class:`.AsyncTransaction`
+        established, as with :meth:`.Engine.begin`::
+
+            async with engine.begin() as conn:
+                await conn.execute(table.insert(), {"data": "some data"})
+
+        """
+
+        return _AsyncEngineTransactionCtx(self)
+
+    async def dispose(self):
+        """Dispose of the connection pool, as with :meth:`.Engine.dispose`.
+
+        Connections which are checked in are closed; the pool is then
+        replaced with a new one.
+
+        """
+
+        sync_engine = self.sync_engine
+        await sync_engine.pool._async_dispose()
+        sync_engine.pool = sync_engine.pool.recreate()
+
+
+class _AsyncEngineTransactionCtx(object):
+    def __init__(self, engine):
+        self.engine = engine
+
+    async def __aenter__(self):
+        self.conn = await self.engine.connect()
+        self.transaction = self.conn.begin()
+        return self.conn
+
+    async def __aexit__(self, type_, value, traceback):
+        try:
+            await self.transaction.__aexit__(type_, value, traceback)
+        finally:
+            await self.conn.close()
+
+
+class _AsyncBridgeConnection(Connection):
+    """A :class:`.Connection` which produces :class:`.ExecutionContext`
+    objects on behalf of an :class:`.AsyncConnection`.
+
+    Statements passed to :meth:`.Connection.execute` are distilled and
+    compiled as usual, however :meth:`._execute_context` returns the
+    execution context after ``pre_exec()``, rather than invoking the
+    cursor; this is completed by :meth:`.AsyncConnection._execute_context`.
+
+    """
+
+    def _execute_context(self, dialect, constructor,
+                         statement, parameters,
+                         *args):
+        try:
+            context = constructor(dialect, self, self.connection, *args)
+        except Exception as e:
+            self._handle_dbapi_exception(
+                e,
+                util.text_type(statement), parameters,
+                None, None)
+
+        if context.compiled:
+            context.pre_exec()
+        return context
+
+    def _autorollback(self):
+        # the rollback must be awaited; AsyncConnection takes care of it
+        pass
+
+    def _rollback_impl(self):
+        # also reached via the _autorollback() of a branched Connection
+        pass
+
+
+class AsyncConnection(object):
+    """An asyncio facade for a :class:`.Connection`.
+
+    The :class:`.AsyncConnection` is produced by
+    :meth:`.AsyncEngine.connect`.  Statements are accepted in the same
+    forms as :meth:`.Connection.execute`.
+
+    .. versionadded:: 1.0.0
+
+    """
+
+    def __init__(self, async_engine):
+        self.engine = async_engine
+        self.sync_engine = async_engine.sync_engine
+        self._dbapi_connection = None
+        self._bridge = None
+        self._transaction = None
+        self._closed = False
+
+    async def start(self):
+        """Check out a connection from the pool.
+
+        This is called when the :class:`.AsyncConnection` is awaited or
+        entered as an asynchronous context manager.
+
+        """
+
+        if self._dbapi_connection is not None:
+            raise exc.InvalidRequestError(
+                "This AsyncConnection is already started")
+        elif self._closed:
+            raise exc.ResourceClosedError("This Connection is closed")
+
+        self._dbapi_connection = await self._checkout()
+        self._bridge = _AsyncBridgeConnection(
+            self.sync_engine, self._dbapi_connection, _has_events=False)
+        return self
+
+    async def _checkout(self):
+        dialect = self.sync_engine.dialect
+        try:
+            return await self.sync_engine.pool._async_checkout()
+        except dialect.dbapi.Error as e:
+            Connection._handle_dbapi_exception_noconnection(
+                e, dialect, self.sync_engine)
+
+    def __await__(self):
+        return self.start().__await__()
+
+    async def __aenter__(self):
+        if self._dbapi_connection is None:
+            await self.start()
+        return self
+
+    async def __aexit__(self, type_, value, traceback):
+        await self.close()
+
+    @property
+    def closed(self):
+        """Return True if this connection is closed."""
+
+        return self._closed
+
+    @property
+    def invalidated(self):
+        """Return True if this connection was invalidated."""
+
+        return self._bridge is not None and self._bridge.invalidated
+
+    @property
+    def dialect(self):
+        return self.sync_engine.dialect
+
+    @property
+    def info(self):
+        """Info dictionary associated with the underlying DBAPI connection,
+        as with :attr:`.Connection.info`."""
+
+        return self._ensure_started().info
+
+    def _ensure_started(self):
+        if self._closed:
+            raise exc.ResourceClosedError("This Connection is closed")
+        elif self._bridge is None:
+            raise exc.InvalidRequestError(
+                "This AsyncConnection has not been started; use "
+                "'await connection' or 'async with connection:'")
+        return self._bridge
+
+    def in_transaction(self):
+        """Return True if a transaction is in progress."""
+
+        return self._transaction is not None
+
+    def begin(self):
+        """Begin a transaction and return an :class:`.AsyncTransaction`.
+
+        The transaction may be used as an asynchronous context manager,
+        which commits upon successful exit and otherwise rolls back::
+
+            async with conn.begin():
+                await conn.execute(table.insert(), {"data": "some data"})
+
+        Outside of a transaction, statements are autocommitted in the
+        same way as with :class:`.Connection`.
+
+        """
+
+        self._ensure_started()
+        if self._transaction is not None:
+            raise exc.InvalidRequestError(
+                "A transaction is already begun on this AsyncConnection")
+        self._transaction = AsyncTransaction(self)
+        return self._transaction
+
+    def invalidate(self, exception=None):
+        """Invalidate the underlying DBAPI connection, as with
+        :meth:`.Connection.invalidate`.
+
+        A new DBAPI connection is checked out upon next use.
+
+        """
+
+        self._ensure_started().invalidate(exception)
+
+    async def execute(self, object_, *multiparams, **params):
+        """Execute a statement and return a buffered
+        :class:`.AsyncResult`.
+
+        All rows are received from the driver before this method
+        returns.
+
+        """
+
+        context = await self._prepare(object_, multiparams, params)
+        return await self._execute_context(context, False)
+
+    async def stream(self, object_, *multiparams, **params):
+        """Execute a statement and return a streaming
+        :class:`.AsyncResult`.
+
+        Rows are received from the driver as they are fetched from the
+        :class:`.AsyncResult`.  The result should be fully consumed or
+        closed before the connection is used for another statement.
+
+        """
+
+        context = await self._prepare(object_, multiparams, params)
+        return await self._execute_context(context, True)
+
+    async def scalar(self, object_, *multiparams, **params):
+        """Execute a statement and return the first column of its
+        first row."""
+
+        result = await self.execute(object_, *multiparams, **params)
+        return await result.scalar()
+
+    async def _prepare(self, object_, multiparams, params):
+        bridge = self._ensure_started()
+        if bridge.invalidated:
+            await self._revalidate()
+            bridge = self._bridge
+        return bridge.execute(object_, *multiparams, **params)
+
+    async def _revalidate(self):
+        if self._transaction is not None:
+            raise exc.InvalidRequestError(
+                "Can't reconnect until invalid "
+                "transaction is rolled back")
+        dbapi_connection, self._dbapi_connection = \
+            self._dbapi_connection, None
+        await self.sync_engine.pool._async_return(dbapi_connection)
+
+        self._dbapi_connection = await self._checkout()
+        self._bridge = _AsyncBridgeConnection(
+            self.sync_engine, self._dbapi_connection, _has_events=False)
+
+    async def _execute_context(self, context, stream):
+        bridge = self._bridge
+        cursor, statement, parameters = context.cursor, \
+            context.statement, \
+            context.parameters
+
+        if not context.executemany:
+            parameters = parameters[0]
+
+        if bridge._echo:
+            self.sync_engine.logger.info(statement)
+            self.sync_engine.logger.info(
+                "%r",
+                sql_util._repr_params(parameters, batches=10)
+            )
+
+        try:
+            if context.executemany:
+                await cursor._async_executemany(statement, parameters)
+            elif not parameters and context.no_parameters:
+                await cursor._async_execute(statement, stream=stream)
+            else:
+                await cursor._async_execute(
+                    statement, parameters, stream=stream)
+        except Exception as e:
+            await self._handle_dbapi_exception(
+                e, statement, parameters, cursor, context)
+
+        if context.compiled:
+            context.post_exec()
+
+        if context.is_crud:
+            result = context._setup_crud_result_proxy()
+        else:
+            result = context.get_result_proxy()
+            if result._metadata is None:
+                result.close(_autoclose_connection=False)
+
+        if context.should_autocommit and self._transaction is None:
+            await self._commit_impl()
+
+        return AsyncResult(result)
+
+    async def _handle_dbapi_exception(
+            self, e, statement, parameters, cursor, context):
+        try:
+            self._bridge._handle_dbapi_exception(
+                e, statement, parameters, cursor, context)
+        except Exception:
+            if self._transaction is None:
+                await self._rollback_impl()
+            raise
+
+    async def _commit_impl(self):
+        bridge = self._bridge
+        if bridge._echo:
+            self.sync_engine.logger.info("COMMIT")
+        try:
+            await self._dbapi_connection.driver_connection.commit()
+        except Exception as e:
+            bridge._handle_dbapi_exception(e, None, None, None, None)
+        finally:
+            self._transaction = None
+
+    async def _rollback_impl(self):
+        bridge = self._bridge
+        if bridge._still_open_and_connection_is_valid:
+            if bridge._echo:
+                self.sync_engine.logger.info("ROLLBACK")
+            try:
+                await self._dbapi_connection.driver_connection.rollback()
+            except Exception as e:
+                bridge._handle_dbapi_exception(e, None, None, None, None)
+            finally:
+                self._transaction = None
+        else:
+            self._transaction = None
+
+    async def close(self):
+        """Close this :class:`.AsyncConnection`, returning the DBAPI
+        connection to the pool.
+
+        Any transaction in progress is rolled back by the pool's
+        "reset on return" behavior.
+
+        """
+
+        if self._closed:
+            return
+        self._closed = True
+        if self._transaction is not None:
+            self._transaction.is_active = False
+            self._transaction = None
+
+        dbapi_connection = self._dbapi_connection
+        self._dbapi_connection = self._bridge = None
+        if dbapi_connection is not None:
+            await self.sync_engine.pool._async_return(dbapi_connection)
+
+
+class AsyncTransaction(object):
+    """An asyncio facade for a :class:`.Transaction`.
+
+    The :class:`.AsyncTransaction` is produced by
+    :meth:`.AsyncConnection.begin`.
+
+    .. versionadded:: 1.0.0
+
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.is_active = True
+
+    async def commit(self):
+        """Commit this :class:`.AsyncTransaction`."""
+
+        if not self.is_active:
+            raise exc.InvalidRequestError("This transaction is inactive")
+        try:
+            await self.connection._commit_impl()
+        finally:
+            self.is_active = False
+
+    async def rollback(self):
+        """Roll back this :class:`.AsyncTransaction`."""
+
+        if not self.is_active:
+            return
+        try:
+            await self.connection._rollback_impl()
+        finally:
+            self.is_active = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, type_, value, traceback):
+        if type_ is None and self.is_active:
+            try:
+                await self.commit()
+            except:
+                with util.safe_reraise():
+                    await self.rollback()
+        else:
+            await self.rollback()
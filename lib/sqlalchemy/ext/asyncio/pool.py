@@ -0,0 +1,453 @@
+# ext/asyncio/pool.py
+# Copyright (C) 2005-2014 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+"""Connection pooling for asyncio drivers.
+
+The :class:`.AsyncAdaptedQueuePool` hands out
+:class:`.AsyncAdaptedConnection` objects, which present a connection
+from an asyncio driver using the synchronous DBAPI interface expected by
+:class:`.Connection` and :class:`.ExecutionContext`; the operations which
+communicate with the database are provided separately as coroutines, and
+are invoked by :class:`.AsyncConnection`.
+
+"""
+
+import asyncio
+import collections
+import time
+
+from ... import exc, util
+from ...pool import Pool, QueuePool, reset_rollback, reset_commit
+
+
+class AsyncAdaptedCursor(object):
+    """Adapts an asyncio driver cursor to the DBAPI cursor interface.
+
+    Statements are executed using the ``_async_execute()`` and
+    ``_async_executemany()`` coroutines, after which the cursor's
+    ``description``, ``rowcount`` and ``lastrowid`` are available
+    as plain attributes.  Rows are buffered ahead of time, either
+    completely upon execution, or in the case of a streamed execution,
+    by calling ``_async_fill()`` before each fetch.  The ``fetchXXX()``
+    methods then return rows from this buffer without blocking.
+
+    """
+
+    arraysize = 1
+
+    def __init__(self, driver_cursor):
+        self._cursor = driver_cursor
+        self._rows = collections.deque()
+        self._pending = False
+        self.description = None
+        self.rowcount = -1
+        self.lastrowid = None
+
+    async def _async_execute(self, statement, parameters=None, stream=False):
+        if parameters is None:
+            await self._cursor.execute(statement)
+        else:
+            await self._cursor.execute(statement, parameters)
+        await self._async_executed(stream)
+
+    async def _async_executemany(self, statement, parameters):
+        await self._cursor.executemany(statement, parameters)
+        await self._async_executed(False)
+
+    async def _async_executed(self, stream):
+        cursor = self._cursor
+        self.description = cursor.description
+        self.rowcount = cursor.rowcount
+        self.lastrowid = getattr(cursor, 'lastrowid', None)
+
+        if self.description is not None:
+            if stream:
+                self._pending = True
+                return
+            self._rows.extend(await cursor.fetchall())
+        await cursor.close()
+
+    async def _async_fill(self, size=None):
+        """Buffer rows from a streamed execution such that at least
+        ``size`` rows, or all remaining rows if ``size`` is None,
+        are available to the ``fetchXXX()`` methods."""
+
+        if not self._pending:
+            return
+        if size is None:
+            rows = await self._cursor.fetchall()
+            self._pending = False
+        else:
+            needed = size - len(self._rows)
+            if needed <= 0:
+                return
+            rows = await self._cursor.fetchmany(needed)
+            if len(rows) < needed:
+                self._pending = False
+        self._rows.extend(rows)
+        if not self._pending:
+            await self._cursor.close()
+
+    async def _async_close(self):
+        self._rows.clear()
+        if self._pending:
+            self._pending = False
+            await self._cursor.close()
+
+    def execute(self, statement, parameters=None):
+        raise exc.InvalidRequestError(
+            "Statements can't be executed synchronously on an asyncio "
+            "connection.  Defaults which require a separate SQL "
+            "execution, such as sequences and SQL expression defaults "
+            "used for primary key columns, are not supported with "
+            "sqlalchemy.ext.asyncio.")
+
+    def executemany(self, statement, parameters):
+        self.execute(statement, parameters)
+
+    def fetchone(self):
+        if self._rows:
+            return self._rows.popleft()
+        else:
+            return None
+
+    def fetchmany(self, size=None):
+        if size is None:
+            size = self.arraysize
+        rows = self._rows
+        return [rows.popleft() for i in range(min(size, len(rows)))]
+
+    def fetchall(self):
+        rows = list(self._rows)
+        self._rows.clear()
+        return rows
+
+    def close(self):
+        # a streamed driver cursor which has not been exhausted
+        # is closed by _async_close()
+        self._rows.clear()
+
+
+class AsyncAdaptedConnection(object):
+    """Adapts an asyncio driver connection to the DBAPI connection
+    interface used by :class:`.Connection` and :class:`.ExecutionContext`.
+
+    Operations which communicate with the database, i.e. ``commit()``,
+    ``rollback()`` and ``close()``, are performed by
+    :class:`.AsyncConnection` and :class:`.AsyncAdaptedQueuePool` using
+    the :attr:`.driver_connection` directly, and raise if called on this
+    object.
+
+    """
+
+    def __init__(self, pool, driver_connection):
+        self._pool = pool
+        self.driver_connection = driver_connection
+        self.starttime = time.time()
+        self.is_valid = True
+        self.info = {}
+
+    driver_connection = None
+    """The connection object of the asyncio driver."""
+
+    def cursor(self):
+        return AsyncAdaptedCursor(self.driver_connection.cursor())
+
+    def invalidate(self, e=None):
+        """Mark this connection as invalid; it will be closed and
+        discarded when returned to the pool."""
+
+        if not self.is_valid:
+            return
+        self.is_valid = False
+        self._pool._stats.invalidations += 1
+        if e is not None:
+            self._pool.logger.info(
+                "Invalidate connection %r (reason: %s:%s)",
+                self.driver_connection, e.__class__.__name__, e)
+        else:
+            self._pool.logger.info(
+                "Invalidate connection %r", self.driver_connection)
+
+    def _await_required(self, *arg, **kw):
+        raise exc.InvalidRequestError(
+            "This operation must be awaited using the corresponding "
+            "AsyncConnection or AsyncTransaction method.")
+
+    commit = rollback = close = _await_required
+
+
+class AsyncAdaptedQueuePool(Pool):
+    """A :class:`.Pool` for asyncio drivers which limits the number of open
+    connections in the same way as :class:`.QueuePool`.
+
+    A checkout which finds the pool exhausted waits for a connection to be
+    returned without blocking the event loop, emitting the
+    :meth:`.PoolEvents.exhausted` and :meth:`.PoolEvents.checkout_wait`
+    events and raising :class:`~sqlalchemy.exc.TimeoutError` after
+    ``timeout`` seconds.  Connections are checked out and returned using
+    coroutines, by :class:`.AsyncEngine` and :class:`.AsyncConnection`;
+    :meth:`.Pool.connect` is not supported.
+
+    Per-connection pool events, i.e. :meth:`.PoolEvents.checkout`,
+    :meth:`.PoolEvents.checkin` and similar, are not emitted.
+
+    .. versionadded:: 1.0.0
+
+    """
+
+    def __init__(self, creator, pool_size=5, max_overflow=10, timeout=30,
+                 use_lifo=False, **kw):
+        """Construct an AsyncAdaptedQueuePool.
+
+        :param creator: a callable which returns an awaitable, resolving
+         to a connection of the asyncio driver.
+
+        The remaining arguments are the same as those of
+        :class:`.QueuePool`.
+
+        """
+        Pool.__init__(self, creator, **kw)
+        self._pool = collections.deque()
+        self._size = pool_size
+        self._overflow = 0 - pool_size
+        self._max_overflow = max_overflow
+        self._timeout = timeout
+        self._use_lifo = use_lifo
+        self._waiters = collections.deque()
+        self._stats.reset(self._overflow)
+
+    def _do_get(self):
+        raise exc.InvalidRequestError(
+            "%s can only be used with an AsyncEngine" %
+            self.__class__.__name__)
+
+    _do_return_conn = _do_get
+
+    async def _async_checkout(self):
+        conn = await self._async_get()
+        try:
+            if self._needs_reconnect(conn):
+                await self._async_reconnect(conn)
+            elif self._pre_ping and not await self._async_ping(conn):
+                await self._async_reconnect(conn)
+        except:
+            try:
+                if conn.driver_connection is not None:
+                    await self._async_close_connection(conn)
+            finally:
+                self._release_slot()
+            raise
+        self._stats.checkouts += 1
+        return conn
+
+    async def _async_return(self, conn):
+        self._stats.checkins += 1
+        if conn.is_valid:
+            try:
+                if self._reset_on_return is reset_rollback:
+                    await conn.driver_connection.rollback()
+                elif self._reset_on_return is reset_commit:
+                    await conn.driver_connection.commit()
+            except Exception as e:
+                self.logger.error(
+                    "Exception during reset or similar", exc_info=True)
+                conn.invalidate(e)
+
+        if conn.is_valid and self._put(conn):
+            return
+        try:
+            await self._async_close_connection(conn)
+        finally:
+            self._release_slot()
+
+    async def _async_get(self):
+        while True:
+            if self._pool:
+                if self._use_lifo:
+                    return self._pool.pop()
+                else:
+                    return self._pool.popleft()
+
+            if self._max_overflow == -1 or \
+                    self._overflow < self._max_overflow:
+                self._overflow += 1
+                if self._overflow > self._stats.overflow_high_water:
+                    self._stats.overflow_high_water = self._overflow
+                try:
+                    return AsyncAdaptedConnection(
+                        self, await self._creator())
+                except:
+                    with util.safe_reraise():
+                        self._release_slot()
+
+            conn = await self._async_wait()
+            if conn is not None:
+                return conn
+
+    async def _async_wait(self):
+        """Wait for a connection to be returned to an exhausted pool.
+
+        Returns the connection, or None if a connection was discarded,
+        making room for a new one to be created.
+
+        """
+        self._stats.exhausted += 1
+        if self.dispatch.exhausted:
+            self.dispatch.exhausted(self)
+
+        waiter = asyncio.Future()
+        self._waiters.append(waiter)
+        start = time.time()
+        try:
+            conn = await asyncio.wait_for(waiter, self._timeout)
+        except asyncio.TimeoutError:
+            self._stats.timeouts += 1
+            raise exc.TimeoutError(
+                "%s limit of size %d overflow %d reached, "
+                "connection timed out, timeout %d" %
+                (self.__class__.__name__, self.size(), self.overflow(),
+                 self._timeout))
+        except:
+            # cancelled after having been handed a connection
+            if waiter.done() and not waiter.cancelled() and \
+                    waiter.result() is not None and \
+                    not self._put(waiter.result()):
+                self._release_slot()
+            raise
+        finally:
+            try:
+                self._waiters.remove(waiter)
+            except ValueError:
+                pass
+
+        wait_time = time.time() - start
+        self._stats.record_wait(wait_time)
+        if self.dispatch.checkout_wait:
+            self.dispatch.checkout_wait(self, wait_time)
+        return conn
+
+    def _put(self, conn):
+        """Hand a connection to a waiting checkout, or return it to the
+        pool; returns False if the pool is full."""
+
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(conn)
+                return True
+        if self._size <= 0 or len(self._pool) < self._size:
+            self._pool.append(conn)
+            return True
+        return False
+
+    def _release_slot(self):
+        """Account for a connection which has been discarded, waking a
+        waiting checkout so that it may create a new one."""
+
+        self._overflow -= 1
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    def _needs_reconnect(self, conn):
+        if conn.driver_connection is None:
+            return True
+        elif self._recycle > -1 and \
+                time.time() - conn.starttime > self._recycle:
+            self.logger.info(
+                "Connection %r exceeded timeout; recycling",
+                conn.driver_connection)
+            return True
+        elif self._invalidate_time > conn.starttime:
+            self.logger.info(
+                "Connection %r invalidated due to pool invalidation; "
+                "recycling", conn.driver_connection)
+            return True
+        else:
+            return False
+
+    async def _async_reconnect(self, conn):
+        if conn.driver_connection is not None:
+            await self._async_close_connection(conn)
+        conn.driver_connection = await self._creator()
+        conn.starttime = time.time()
+        conn.is_valid = True
+        conn.info.clear()
+
+    async def _async_ping(self, conn):
+        cursor = conn.driver_connection.cursor()
+        try:
+            await cursor.execute(self._dialect._dialect_specific_select_one)
+            await cursor.close()
+        except self._dialect.dbapi.Error as e:
+            if self._dialect.is_disconnect(e, conn.driver_connection, None):
+                conn.invalidate(e)
+                self._invalidate(conn, e, _checkin=False)
+                return False
+            raise
+        return True
+
+    async def _async_close_connection(self, conn):
+        self.logger.debug("Closing connection %r", conn.driver_connection)
+        try:
+            await conn.driver_connection.close()
+        except Exception:
+            self.logger.error("Exception closing connection %r",
+                              conn.driver_connection, exc_info=True)
+        conn.driver_connection = None
+
+    async def _async_dispose(self):
+        while self._pool:
+            conn = self._pool.popleft()
+            self._overflow -= 1
+            await self._async_close_connection(conn)
+        self.logger.info("Pool disposed. %s", self.status())
+
+    def recreate(self):
+        self.logger.info("Pool recreating")
+        return self.__class__(self._creator, pool_size=self._size,
+                              max_overflow=self._max_overflow,
+                              timeout=self._timeout,
+                              use_lifo=self._use_lifo,
+                              recycle=self._recycle, echo=self.echo,
+                              logging_name=self._orig_logging_name,
+                              reset_on_return=self._reset_on_return,
+                              pre_ping=self._pre_ping,
+                              _dispatch=self.dispatch,
+                              _dialect=self._dialect)
+
+    def dispose(self):
+        raise exc.InvalidRequestError(
+            "Use AsyncEngine.dispose() to dispose of an %s" %
+            self.__class__.__name__)
+
+    def status(self):
+        return "Pool size: %d  Connections in pool: %d "\
+            "Current Overflow: %d Current Checked out "\
+            "connections: %d" % (self.size(),
+                                 self.checkedin(),
+                                 self.overflow(),
+                                 self.checkedout())
+
+    stats = QueuePool.stats
+
+    def reset_stats(self):
+        self._stats.reset(self._overflow)
+
+    def size(self):
+        return self._size
+
+    def checkedin(self):
+        return len(self._pool)
+
+    def overflow(self):
+        return self._overflow
+
+    def checkedout(self):
+        return self._size - len(self._pool) + self._overflow
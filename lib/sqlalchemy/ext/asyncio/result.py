@@ -0,0 +1,109 @@
+# ext/asyncio/result.py
+# Copyright (C) 2005-2014 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""asyncio wrapper for :class:`.ResultProxy`."""
+
+
+class AsyncResult(object):
+    """Wraps a :class:`.ResultProxy`, fetching rows using coroutines.
+
+    An :class:`.AsyncResult` is returned by :meth:`.AsyncConnection.execute`
+    and :meth:`.AsyncConnection.stream`.  In the former case, all rows
+    have already been received from the driver and fetching does not
+    communicate with the database; in the latter, each fetch first awaits
+    the driver for as many rows as are requested.  In both cases rows are
+    processed by the wrapped :class:`.ResultProxy` and are delivered as
+    :class:`.RowProxy` objects.
+
+    The result may also be iterated using ``async for``.
+
+    .. versionadded:: 1.0.0
+
+    """
+
+    def __init__(self, result):
+        self._result = result
+        self._cursor = result._saved_cursor
+
+    @property
+    def closed(self):
+        return self._result.closed
+
+    @property
+    def returns_rows(self):
+        return self._result.returns_rows
+
+    @property
+    def rowcount(self):
+        return self._result.rowcount
+
+    @property
+    def lastrowid(self):
+        return self._result.lastrowid
+
+    @property
+    def inserted_primary_key(self):
+        return self._result.inserted_primary_key
+
+    def keys(self):
+        """Return the current set of string keys for rows."""
+
+        return self._result.keys()
+
+    async def fetchone(self):
+        """Fetch one row, as with :meth:`.ResultProxy.fetchone`."""
+
+        await self._cursor._async_fill(1)
+        return self._result.fetchone()
+
+    async def fetchmany(self, size=None):
+        """Fetch many rows, as with :meth:`.ResultProxy.fetchmany`."""
+
+        await self._cursor._async_fill(
+            size if size is not None else self._cursor.arraysize)
+        return self._result.fetchmany(size)
+
+    async def fetchall(self):
+        """Fetch all rows, as with :meth:`.ResultProxy.fetchall`."""
+
+        await self._cursor._async_fill()
+        return self._result.fetchall()
+
+    async def first(self):
+        """Fetch the first row and then close the result set
+        unconditionally, as with :meth:`.ResultProxy.first`."""
+
+        await self._cursor._async_fill(1)
+        try:
+            return self._result.first()
+        finally:
+            await self._cursor._async_close()
+
+    async def scalar(self):
+        """Fetch the first column of the first row, and close the result
+        set, as with :meth:`.ResultProxy.scalar`."""
+
+        row = await self.first()
+        if row is not None:
+            return row[0]
+        else:
+            return None
+
+    async def close(self):
+        """Close this :class:`.AsyncResult`, releasing the driver cursor."""
+
+        self._result.close()
+        await self._cursor._async_close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        row = await self.fetchone()
+        if row is None:
+            raise StopAsyncIteration()
+        return row
@@ -0,0 +1,102 @@
+# ext/asyncio/sqlite.py
+# Copyright (C) 2005-2014 the SQLAlchemy authors and contributors
+# <see AUTHORS file>
+#
+# This module is part of SQLAlchemy and is released under
+# the MIT License: http://www.opensource.org/licenses/mit-license.php
+
+"""An asyncio driver for SQLite, based on the ``sqlite3`` module.
+
+This module presents ``sqlite3`` using the coroutine-based DBAPI
+interface expected by :func:`.create_async_engine`, and is used by
+default for ``sqlite://`` URLs.  As SQLite runs in-process, each
+operation is performed directly within the calling coroutine, without
+yielding to the event loop; the module is a stand-in intended for
+testing and development rather than for concurrent use.
+
+Note that as with the ``sqlite3`` module, each connection to a
+``:memory:`` database refers to a separate database; use
+``pool_size=1, max_overflow=0`` to share a single in-memory database.
+
+"""
+
+from sqlite3 import dbapi2 as sqlite
+
+paramstyle = sqlite.paramstyle
+apilevel = sqlite.apilevel
+threadsafety = sqlite.threadsafety
+version_info = getattr(sqlite, "version_info", (2, 6, 0))
+sqlite_version_info = sqlite.sqlite_version_info
+
+Binary = sqlite.Binary
+PARSE_DECLTYPES = sqlite.PARSE_DECLTYPES
+PARSE_COLNAMES = sqlite.PARSE_COLNAMES
+
+Warning = sqlite.Warning
+Error = sqlite.Error
+InterfaceError = sqlite.InterfaceError
+DatabaseError = sqlite.DatabaseError
+DataError = sqlite.DataError
+OperationalError = sqlite.OperationalError
+IntegrityError = sqlite.IntegrityError
+InternalError = sqlite.InternalError
+ProgrammingError = sqlite.ProgrammingError
+NotSupportedError = sqlite.NotSupportedError
+
+
+async def connect(*arg, **kw):
+    return Connection(sqlite.connect(*arg, **kw))
+
+
+class Connection(object):
+    def __init__(self, connection):
+        self._connection = connection
+
+    def cursor(self):
+        return Cursor(self._connection.cursor())
+
+    async def commit(self):
+        self._connection.commit()
+
+    async def rollback(self):
+        self._connection.rollback()
+
+    async def close(self):
+        self._connection.close()
+
+
+class Cursor(object):
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid
+
+    async def execute(self, operation, parameters=()):
+        self._cursor.execute(operation, parameters)
+
+    async def executemany(self, operation, seq_of_parameters):
+        self._cursor.executemany(operation, seq_of_parameters)
+
+    async def fetchone(self):
+        return self._cursor.fetchone()
+
+    async def fetchmany(self, size=None):
+        if size is None:
+            return self._cursor.fetchmany()
+        return self._cursor.fetchmany(size)
+
+    async def fetchall(self):
+        return self._cursor.fetchall()
+
+    async def close(self):
+        self._cursor.close()
@@ -111,6 +111,24 @@ explicit table declaration::
     User, Address, Order = Base.classes.user, Base.classes.address,\
         Base.classes.user_order
 
+Caching Reflected Tables
+========================
+
+Reflecting a large schema at startup can take a significant amount of
+time.  A :class:`.FileReflectionCache` may be passed to
+:meth:`.AutomapBase.prepare`, so that the reflected table information is
+saved to a file and loaded from there by subsequent processes, for as long
+as the schema's fingerprint remains unchanged::
+
+    from sqlalchemy.engine.reflection import FileReflectionCache
+
+    Base = automap_base()
+    Base.prepare(
+        engine, reflect=True,
+        reflection_cache=FileReflectionCache("/var/cache/myapp/schema.cache"))
+
+.. versionadded:: 1.0.0
+
 Specifying Classes Explcitly
 ============================
 
@@ -700,7 +718,8 @@ class AutomapBase(object):
             collection_class=list,
             name_for_scalar_relationship=name_for_scalar_relationship,
             name_for_collection_relationship=name_for_collection_relationship,
-            generate_relationship=generate_relationship):
+            generate_relationship=generate_relationship,
+            reflection_cache=None):
         """Extract mapped classes and relationships from the :class:`.MetaData` and
         perform mappings.
 
@@ -736,12 +755,21 @@ class AutomapBase(object):
          when a new :func:`.relationship` object is created that represents a
          collection.  Defaults to ``list``.
 
+        :param reflection_cache: optional :class:`.ReflectionCache`, passed
+         to :meth:`.MetaData.reflect` when
+         :paramref:`.AutomapBase.prepare.reflect` is True, so that table
+         information may be loaded from a cache, such as a file, rather
+         than the database.
+
+         .. versionadded:: 1.0.0
+
         """
         if reflect:
             cls.metadata.reflect(
                 engine,
                 extend_existing=True,
-                autoload_replace=False
+                autoload_replace=False,
+                reflection_cache=reflection_cache
             )
 
         table_to_map_config = dict(
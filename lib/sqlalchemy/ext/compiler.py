@@ -413,6 +413,11 @@ def compiles(class_, *specs):
                     lambda *arg, **kw: existing(*arg, **kw))
             setattr(class_, '_compiler_dispatcher', existing)
 
+            # a custom compilation may render state which isn't part
+            # of the structural cache key inherited from the base class
+            if '_cache_key' not in class_.__dict__:
+                setattr(class_, '_cache_key', _no_cache_key)
+
         if specs:
             for s in specs:
                 existing.specs[s] = fn
@@ -432,6 +437,12 @@ def deregister(class_):
         visitors._generate_dispatch(class_)
         # remove custom directive
         del class_._compiler_dispatcher
+        if class_.__dict__.get('_cache_key') is _no_cache_key:
+            del class_._cache_key
+
+
+def _no_cache_key(self, anon_map, bindparams):
+    raise NotImplementedError()
 
 
 class _dispatcher(object):
@@ -13,11 +13,54 @@ distribute queries and persistence operations across multiple databases.
 For a usage example, see the :ref:`examples_sharding` example included in
 the source distribution.
 
+.. _horizontal_shard_concurrent:
+
+Concurrent Shard Execution
+--------------------------
+
+By default, a query which spans several shards invokes its statement
+against each shard in turn.  When the :class:`.ShardedSession` is given an
+``executor``, such as a ``concurrent.futures.ThreadPoolExecutor``, the
+statements are instead invoked concurrently, and the results of each shard
+are delivered as soon as that shard has responded::
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    session = ShardedSession(
+        shard_chooser=shard_chooser,
+        id_chooser=id_chooser,
+        query_chooser=query_chooser,
+        shards=shards,
+        executor=ThreadPoolExecutor(max_workers=len(shards))
+    )
+
+Only the execution of the statement takes place within the executor;
+connections are acquired, and rows are processed into ORM objects, within
+the thread that invoked the query, as the :class:`.Session` itself is not
+threadsafe.  Shards which resolve to the same connection are invoked in
+turn within a single task.  The per-shard speedup is therefore greatest
+for DBAPIs which receive the full result set when the statement is
+executed, and the :class:`.Engine` for each shard must allow its
+connections to be used across threads.
+
+:meth:`.ShardedQuery.get` probes each shard returned by ``id_chooser``
+concurrently in the same way.
+
+As results from each shard are concatenated, the ordering given by
+:meth:`.Query.order_by` applies only within the rows of each shard.
+:meth:`.ShardedQuery.merge_sorted` combines the sorted per-shard results
+using a k-way merge so that the ordering is maintained overall.
+
 """
 
-from .. import util
+import heapq
+import sys
+
+from .. import util, exc
 from ..orm.session import Session
-from ..orm.query import Query
+from ..orm.query import Query, _MapperEntity, _ColumnEntity
+from ..sql import operators
+from ..util import queue
 
 __all__ = ['ShardedSession', 'ShardedQuery']
 
@@ -27,7 +70,10 @@ class ShardedQuery(Query):
         super(ShardedQuery, self).__init__(*args, **kwargs)
         self.id_chooser = self.session.id_chooser
         self.query_chooser = self.session.query_chooser
+        self.executor = self.session.executor
         self._shard_id = None
+        self._probe_shard_ids = None
+        self._merge_key = None
 
     def set_shard(self, shard_id):
         """return a new query, limited to a single shard ID.
@@ -40,43 +86,275 @@ class ShardedQuery(Query):
         q._shard_id = shard_id
         return q
 
+    def merge_sorted(self, key=None, reverse=False):
+        """return a new query which merges the sorted results of each shard
+        into a single sorted result.
+
+        Each shard is expected to return its rows already sorted, typically
+        as the result of :meth:`.Query.order_by`; the results of all shards
+        are then combined using a k-way merge, rather than being
+        concatenated shard by shard.
+
+        :param key: a callable which, given a row as returned by this
+          query, returns the value to be compared.  When omitted, the key
+          is derived from the ORDER BY criteria of the query, each of which
+          must refer to a column that's mapped by, or selected as, one of
+          the query's entities, and which must all be ascending or all
+          descending.  NULL values are placed as the database places
+          them, honoring :meth:`.ColumnElement.nullsfirst` and
+          :meth:`.ColumnElement.nullslast`.
+
+        :param reverse: when ``key`` is given, indicates that each shard's
+          rows are sorted in descending order.
+
+        """
+        if key is None:
+            order_by_keys, reverse = self._merge_key_from_order_by()
+        else:
+            order_by_keys = None
+
+        q = self._clone()
+        q._merge_key = (key, reverse, order_by_keys)
+        return q
+
+    def _merge_key_from_order_by(self):
+        if not self._order_by:
+            raise exc.InvalidRequestError(
+                "Query has no ORDER BY criteria from which to derive "
+                "a merge key; pass a key function to merge_sorted()")
+
+        single_entity = len(self._entities) == 1
+        getters = []
+        directions = set()
+        for criterion in self._order_by:
+            col = criterion
+            nulls = None
+            if getattr(col, 'modifier', None) in (
+                    operators.nullsfirst_op, operators.nullslast_op):
+                nulls = col.modifier
+                col = col.element
+            if getattr(col, 'modifier', None) in (
+                    operators.asc_op, operators.desc_op):
+                directions.add(col.modifier)
+                col = col.element
+            else:
+                directions.add(operators.asc_op)
+
+            getter = None
+            for idx, ent in enumerate(self._entities):
+                if isinstance(ent, _MapperEntity):
+                    prop = ent.mapper._columntoproperty.get(col)
+                    if prop is not None:
+                        getter = self._attr_getter(
+                            None if single_entity else idx, prop.key)
+                        break
+                elif isinstance(ent, _ColumnEntity) and \
+                        ent.column.shares_lineage(col):
+                    getter = self._attr_getter(idx, None)
+                    break
+            if getter is None:
+                raise exc.InvalidRequestError(
+                    "Can't derive a merge key from ORDER BY expression "
+                    "'%s'; pass a key function to merge_sorted()" % col)
+            getters.append((getter, nulls))
+
+        if len(directions) > 1:
+            raise exc.InvalidRequestError(
+                "Can't derive a merge key from ORDER BY criteria of "
+                "mixed ascending and descending direction; pass a key "
+                "function to merge_sorted()")
+
+        return getters, operators.desc_op in directions
+
+    @staticmethod
+    def _order_by_merge_key(order_by_keys, reverse, dialect):
+        """Return the merge key for getters derived from ORDER BY.
+
+        Each value is paired with a flag that places NULL either below
+        or above every other value, so that NULLs are merged where the
+        database put them, and are never compared to other values.
+
+        """
+        getters = []
+        for getter, nulls in order_by_keys:
+            if nulls is None:
+                nulls_high = dialect.name in _NULLS_SORT_HIGH
+            else:
+                # NULLS FIRST on a descending sort is the same as
+                # NULLs being the highest values
+                nulls_high = (nulls is operators.nullslast_op) != reverse
+            getters.append(_null_aware_getter(getter, nulls_high))
+
+        if len(getters) == 1:
+            return getters[0]
+        else:
+            def key(row):
+                return tuple(getter(row) for getter in getters)
+            return key
+
+    @staticmethod
+    def _attr_getter(idx, attrkey):
+        if idx is None:
+            def get(row):
+                return getattr(row, attrkey)
+        elif attrkey is None:
+            def get(row):
+                return row[idx]
+        else:
+            def get(row):
+                return getattr(row[idx], attrkey)
+        return get
+
     def _execute_and_instances(self, context):
         def iter_for_shard(shard_id):
             context.attributes['shard_id'] = shard_id
             result = self._connection_from_session(
                 mapper=self._mapper_zero(),
-                shard_id=shard_id).execute(
+                shard_id=shard_id,
+                close_with_result=True).execute(
                 context.statement,
                 self._params)
             return self.instances(result, context)
 
         if self._shard_id is not None:
             return iter_for_shard(self._shard_id)
+
+        if self._probe_shard_ids is not None:
+            return self._probe_shards(context, self._probe_shard_ids)
+
+        shard_ids = self.query_chooser(self)
+
+        if self.executor is not None and len(shard_ids) > 1:
+            results = self._execute_concurrently(context, shard_ids)
+            if self._merge_key is None:
+                return self._iter_results(context, results)
+            # rows which compare equal are merged in shard_ids order,
+            # regardless of the order in which the shards responded
+            partials = [
+                list(self._iter_results(context, [result]))
+                for result in sorted(
+                    results, key=lambda result: shard_ids.index(result[0]))
+            ]
         else:
-            partial = []
-            for shard_id in self.query_chooser(self):
-                partial.extend(iter_for_shard(shard_id))
+            partials = [
+                list(iter_for_shard(shard_id)) for shard_id in shard_ids]
+            if self._merge_key is None:
+                return iter(
+                    [row for partial in partials for row in partial])
+
+        key, reverse, order_by_keys = self._merge_key
+        if order_by_keys is not None:
+            dialect = self.session.get_bind(
+                self._mapper_zero(), shard_id=shard_ids[0]).dialect
+            key = self._order_by_merge_key(order_by_keys, reverse, dialect)
+        return _merge(partials, key, reverse)
+
+    def _iter_results(self, context, results):
+        results = iter(results)
+        result = None
+        try:
+            for shard_id, result in results:
+                context.attributes['shard_id'] = shard_id
+                for row in self.instances(result, context):
+                    yield row
+        finally:
+            # when iteration stops early, close out the result being
+            # consumed as well as those of the remaining shards
+            if result is not None:
+                result.close()
+            for shard_id, result in results:
+                result.close()
+
+    def _probe_shards(self, context, shard_ids):
+        """Invoke the statement against each shard concurrently, returning
+        the rows of the first shard in ``shard_ids`` which has any."""
+
+        results = dict(self._execute_concurrently(context, shard_ids))
+        rows = []
+        for shard_id in shard_ids:
+            result = results.pop(shard_id)
+            if rows:
+                result.close()
+            else:
+                rows = list(self._iter_results(context, [(shard_id, result)]))
+        return iter(rows)
+
+    def _execute_concurrently(self, context, shard_ids):
+        """Invoke the statement against each shard using the executor,
+        yielding ``(shard_id, result)`` tuples in the order in which
+        each shard responds."""
+
+        # connections are acquired here, as the Session isn't
+        # threadsafe; shards which share a connection are invoked
+        # one after the other in a single task.
+        tasks = util.OrderedDict()
+        mapper = self._mapper_zero()
+        for shard_id in shard_ids:
+            conn = self._connection_from_session(
+                mapper=mapper, shard_id=shard_id, close_with_result=True)
+            tasks.setdefault(conn, []).append(shard_id)
 
-            # if some kind of in memory 'sorting'
-            # were done, this is where it would happen
-            return iter(partial)
+        statement, params = context.statement, self._params
+        completed = queue.Queue()
+
+        def execute(conn, task_shard_ids):
+            outcome = None
+            try:
+                outcome = [
+                    (shard_id, conn.execute(statement, params))
+                    for shard_id in task_shard_ids]
+            except Exception:
+                outcome = sys.exc_info()
+            finally:
+                # None indicates the task was interrupted by a
+                # non-Exception, which stays within the worker
+                completed.put(outcome)
+
+        for conn, task_shard_ids in tasks.items():
+            self.executor.submit(execute, conn, task_shard_ids)
+
+        for remaining in range(len(tasks), 0, -1):
+            outcome = completed.get()
+            if not isinstance(outcome, list):
+                # close out the results of the other shards
+                # before propagating the error
+                for i in range(remaining - 1):
+                    other = completed.get()
+                    if isinstance(other, list):
+                        for shard_id, result in other:
+                            result.close()
+                if outcome is None:
+                    raise exc.InvalidRequestError(
+                        "Execution of the statement against a shard "
+                        "was interrupted")
+                util.reraise(*outcome)
+            for shard_result in outcome:
+                yield shard_result
 
     def get(self, ident, **kwargs):
-        if self._shard_id is not None:
+        if self._shard_id is not None or self._probe_shard_ids is not None:
             return super(ShardedQuery, self).get(ident)
+
+        ident = util.to_list(ident)
+        shard_ids = self.id_chooser(self, ident)
+        if self.executor is not None and len(shard_ids) > 1:
+            # the first shard in shard_ids order to have the identity
+            # wins, as when the shards are probed one at a time
+            q = self._clone()
+            q._probe_shard_ids = shard_ids
+            return q.get(ident, **kwargs)
+
+        for shard_id in shard_ids:
+            o = self.set_shard(shard_id).get(ident, **kwargs)
+            if o is not None:
+                return o
         else:
-            ident = util.to_list(ident)
-            for shard_id in self.id_chooser(self, ident):
-                o = self.set_shard(shard_id).get(ident, **kwargs)
-                if o is not None:
-                    return o
-            else:
-                return None
+            return None
 
 
 class ShardedSession(Session):
     def __init__(self, shard_chooser, id_chooser, query_chooser, shards=None,
-                 query_cls=ShardedQuery, **kwargs):
+                 query_cls=ShardedQuery, executor=None, **kwargs):
         """Construct a ShardedSession.
 
         :param shard_chooser: A callable which, passed a Mapper, a mapped
@@ -97,11 +375,19 @@ class ShardedSession(Session):
         :param shards: A dictionary of string shard names
           to :class:`~sqlalchemy.engine.Engine` objects.
 
+        :param executor: optional object with a ``submit(fn, *args)``
+          method, such as a ``concurrent.futures.Executor``, which when
+          present is used to invoke a query's statement against multiple
+          shards concurrently.  See :ref:`horizontal_shard_concurrent`.
+
+          .. versionadded:: 1.0.0
+
         """
         super(ShardedSession, self).__init__(query_cls=query_cls, **kwargs)
         self.shard_chooser = shard_chooser
         self.id_chooser = id_chooser
         self.query_chooser = query_chooser
+        self.executor = executor
         self.__binds = {}
         self.connection_callable = self.connection
         if shards is not None:
@@ -129,3 +415,64 @@ class ShardedSession(Session):
 
     def bind_shard(self, shard_id, bind):
         self.__binds[shard_id] = bind
+
+
+# dialects on which NULL sorts above all other values by default;
+# elsewhere it sorts below them
+_NULLS_SORT_HIGH = frozenset(['postgresql', 'oracle'])
+
+
+def _null_aware_getter(getter, nulls_high):
+    if nulls_high:
+        def get(row):
+            value = getter(row)
+            return (value is None, value)
+    else:
+        def get(row):
+            value = getter(row)
+            return (value is not None, value)
+    return get
+
+
+def _merge(partials, key, reverse):
+    """k-way merge of individually sorted lists."""
+
+    if reverse:
+        def sort_key(row):
+            return _Descending(key(row))
+    else:
+        sort_key = key
+
+    heap = [
+        (sort_key(partial[0]), idx, 0, partial)
+        for idx, partial in enumerate(partials) if partial
+    ]
+    heapq.heapify(heap)
+
+    while heap:
+        k, idx, pos, partial = heap[0]
+        yield partial[pos]
+        pos += 1
+        if pos < len(partial):
+            heapq.heapreplace(
+                heap, (sort_key(partial[pos]), idx, pos, partial))
+        else:
+            heapq.heappop(heap)
+
+
+class _Descending(object):
+    """Wraps a sort key so that it compares in reverse."""
+
+    __slots__ = 'value',
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __ne__(self, other):
+        return self.value != other.value
+
+    def __lt__(self, other):
+        return other.value < self.value
@@ -490,7 +490,7 @@ class AttributeImpl(object):
         msg = "This AttributeImpl is not configured to track parents."
         assert self.trackparent, msg
 
-        return state.parents.get(id(self.parent_token), optimistic) \
+        return state._parents.get(id(self.parent_token), optimistic) \
             is not False
 
     def sethasparent(self, state, parent_state, value):
@@ -504,10 +504,10 @@ class AttributeImpl(object):
 
         id_ = id(self.parent_token)
         if value:
-            state.parents[id_] = parent_state
+            state._set_parent(id_, parent_state)
         else:
-            if id_ in state.parents:
-                last_parent = state.parents[id_]
+            if id_ in state._parents:
+                last_parent = state._parents[id_]
 
                 if last_parent is not False and \
                         last_parent.key != parent_state.key:
@@ -525,7 +525,7 @@ class AttributeImpl(object):
 
                     return
 
-            state.parents[id_] = False
+            state._set_parent(id_, False)
 
     def get_history(self, state, dict_, passive=PASSIVE_OFF):
         raise NotImplementedError()
@@ -564,15 +564,15 @@ class AttributeImpl(object):
         else:
             # if history present, don't load
             key = self.key
-            if key not in state.committed_state or \
-                    state.committed_state[key] is NEVER_SET:
+            if key not in state._committed_state or \
+                    state._committed_state[key] is NEVER_SET:
                 if not passive & CALLABLES_OK:
                     return PASSIVE_NO_RESULT
 
-                if key in state.expired_attributes:
+                if key in state._expired_attributes:
                     value = state._load_expired(state, passive)
-                elif key in state.callables:
-                    callable_ = state.callables[key]
+                elif key in state._callables:
+                    callable_ = state._callables[key]
                     value = callable_(state, passive)
                 elif self.callable_:
                     value = self.callable_(state, passive)
@@ -617,8 +617,8 @@ class AttributeImpl(object):
     def get_committed_value(self, state, dict_, passive=PASSIVE_OFF):
         """return the unchanged value of this attribute"""
 
-        if self.key in state.committed_state:
-            value = state.committed_state[self.key]
+        if self.key in state._committed_state:
+            value = state._committed_state[self.key]
             if value is NO_VALUE:
                 return None
             else:
@@ -765,8 +765,8 @@ class ScalarObjectAttributeImpl(ScalarAttributeImpl):
         else:
             ret = [(None, None)]
 
-        if self.key in state.committed_state:
-            original = state.committed_state[self.key]
+        if self.key in state._committed_state:
+            original = state._committed_state[self.key]
             if original is not None and \
                     original is not PASSIVE_NO_RESULT and \
                     original is not NEVER_SET and \
@@ -906,8 +906,8 @@ class CollectionAttributeImpl(AttributeImpl):
         current = dict_[self.key]
         current = getattr(current, '_sa_adapter')
 
-        if self.key in state.committed_state:
-            original = state.committed_state[self.key]
+        if self.key in state._committed_state:
+            original = state._committed_state[self.key]
             if original not in (NO_VALUE, NEVER_SET):
                 current_states = [((c is not None) and
                                    instance_state(c) or None, c)
@@ -1302,7 +1302,7 @@ class History(History):
 
     @classmethod
     def from_scalar_attribute(cls, attribute, state, current):
-        original = state.committed_state.get(attribute.key, _NO_HISTORY)
+        original = state._committed_state.get(attribute.key, _NO_HISTORY)
 
         if original is _NO_HISTORY:
             if current is NEVER_SET:
@@ -1329,7 +1329,7 @@ class History(History):
 
     @classmethod
     def from_object_attribute(cls, attribute, state, current):
-        original = state.committed_state.get(attribute.key, _NO_HISTORY)
+        original = state._committed_state.get(attribute.key, _NO_HISTORY)
 
         if original is _NO_HISTORY:
             if current is NO_VALUE or current is NEVER_SET:
@@ -1355,7 +1355,7 @@ class History(History):
 
     @classmethod
     def from_collection(cls, attribute, state, current):
-        original = state.committed_state.get(attribute.key, _NO_HISTORY)
+        original = state._committed_state.get(attribute.key, _NO_HISTORY)
 
         if current is NO_VALUE or current is NEVER_SET:
             return cls((), (), ())
@@ -116,8 +116,9 @@ class DynamicAttributeImpl(attributes.AttributeImpl):
 
     def _modified_event(self, state, dict_):
 
-        if self.key not in state.committed_state:
-            state.committed_state[self.key] = CollectionHistory(self, state)
+        if self.key not in state._committed_state:
+            state._set_committed_state(
+                self.key, CollectionHistory(self, state))
 
         state._modified_event(dict_,
                               self,
@@ -126,7 +127,7 @@ class DynamicAttributeImpl(attributes.AttributeImpl):
         # this is a hack to allow the fixtures.ComparableEntity fixture
         # to work
         dict_[self.key] = True
-        return state.committed_state[self.key]
+        return state._committed_state[self.key]
 
     def set(self, state, dict_, value, initiator,
             passive=attributes.PASSIVE_OFF,
@@ -186,8 +187,8 @@ class DynamicAttributeImpl(attributes.AttributeImpl):
         ]
 
     def _get_collection_history(self, state, passive=attributes.PASSIVE_OFF):
-        if self.key in state.committed_state:
-            c = state.committed_state[self.key]
+        if self.key in state._committed_state:
+            c = state._committed_state[self.key]
         else:
             c = CollectionHistory(self, state)
 
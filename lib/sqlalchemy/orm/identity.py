@@ -7,6 +7,7 @@
 
 import weakref
 from . import attributes
+from .state import _none
 from .. import util
 
 
@@ -43,7 +44,7 @@ class IdentityMap(object):
             self._modified.add(state)
 
     def _manage_removed_state(self, state):
-        del state._instance_dict
+        state._instance_dict = _none
         if state.modified:
             self._modified.discard(state)
 
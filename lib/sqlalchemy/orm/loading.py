@@ -15,7 +15,7 @@ as well as some of the attribute loading strategies.
 from __future__ import absolute_import
 
 from .. import util
-from . import attributes, exc as orm_exc
+from . import attributes, exc as orm_exc, path_registry
 from ..sql import util as sql_util
 from .util import _none_set, state_str
 from .. import exc as sa_exc
@@ -73,6 +73,10 @@ def instances(query, cursor, context):
             if filtered:
                 rows = util.unique_list(rows, filter_fn)
 
+            if context.post_load_paths:
+                for path, post_load in context.post_load_paths.items():
+                    post_load.invoke(context, path)
+
             for row in rows:
                 yield row
 
@@ -249,9 +253,10 @@ def instance_processor(mapper, context, result, path, adapter,
             context, path, mapper, result, adapter, populators)
 
     propagate_options = context.propagate_options
-    if propagate_options:
-        load_path = context.query._current_path + path \
-            if context.query._current_path.path else path
+    load_path = context.query._current_path + path \
+        if context.query._current_path.path else path
+
+    post_load = PostLoad.for_context(context, load_path, only_load_props)
 
     session_identity_map = context.session.identity_map
 
@@ -363,6 +368,9 @@ def instance_processor(mapper, context, result, path, adapter,
                     else:
                         state._commit_all(dict_, session_identity_map)
 
+                if post_load:
+                    post_load.add_state(state, True)
+
         else:
             # partial population routines, for objects that were already
             # in the Session, but a row matches them; apply eager loaders
@@ -386,6 +394,9 @@ def instance_processor(mapper, context, result, path, adapter,
 
                     state._commit(dict_, to_load)
 
+            if post_load and isnew and context.invoke_all_eagers:
+                post_load.add_state(state, False)
+
         return instance
 
     if not _polymorphic_from and not refresh_state:
@@ -411,11 +422,11 @@ def _populate_full(
             for key, set_callable in populators["expire"]:
                 dict_.pop(key, None)
                 if set_callable:
-                    state.expired_attributes.add(key)
+                    state._add_expired(key)
         else:
             for key, set_callable in populators["expire"]:
                 if set_callable:
-                    state.expired_attributes.add(key)
+                    state._add_expired(key)
         for key, populator in populators["new"]:
             populator(state, dict_, row)
         for key, populator in populators["delayed"]:
@@ -445,7 +456,7 @@ def _populate_partial(
             if key in to_load:
                 dict_.pop(key, None)
                 if set_callable:
-                    state.expired_attributes.add(key)
+                    state._add_expired(key)
         for key, populator in populators["new"]:
             if key in to_load:
                 populator(state, dict_, row)
@@ -459,6 +470,65 @@ def _populate_partial(
     return to_load
 
 
+class PostLoad(object):
+    """Track loaders and states for "post load" operations.
+
+    A loader strategy which loads related data in a separate
+    statement for a batch of parent rows, such as the "selectin" loader,
+    registers a callable for its path using
+    :meth:`.PostLoad.callable_for_path`; states loaded along that path
+    are collected, and :func:`.instances` invokes the callables once
+    per batch of rows fetched.
+
+    """
+    __slots__ = 'loaders', 'states', 'load_keys'
+
+    def __init__(self):
+        self.loaders = {}
+        self.states = util.OrderedDict()
+        self.load_keys = None
+
+    def add_state(self, state, overwrite):
+        self.states[state] = overwrite
+
+    def invoke(self, context, path):
+        if not self.states:
+            return
+        path = path_registry.PathRegistry.coerce(path)
+        for token, limit_to_mapper, loader, arg, kw in \
+                self.loaders.values():
+            states = [
+                (state, overwrite)
+                for state, overwrite in self.states.items()
+                if state.manager.mapper.isa(limit_to_mapper)
+            ]
+            if states:
+                loader(context, path, states, self.load_keys, *arg, **kw)
+        self.states.clear()
+
+    @classmethod
+    def for_context(cls, context, path, only_load_props):
+        pl = context.post_load_paths.get(path.path)
+        if pl is not None and only_load_props:
+            pl.load_keys = only_load_props
+        return pl
+
+    @classmethod
+    def path_exists(cls, context, path, key):
+        return path.path in context.post_load_paths and \
+            key in context.post_load_paths[path.path].loaders
+
+    @classmethod
+    def callable_for_path(
+            cls, context, path, limit_to_mapper, token,
+            loader_callable, *arg, **kw):
+        if path.path in context.post_load_paths:
+            pl = context.post_load_paths[path.path]
+        else:
+            pl = context.post_load_paths[path.path] = PostLoad()
+        pl.loaders[token] = (token, limit_to_mapper, loader_callable, arg, kw)
+
+
 def _validate_version_id(mapper, state, dict_, row, adapter):
 
     version_id_col = mapper.version_id_col
@@ -556,7 +626,7 @@ def load_scalar_attributes(mapper, state, attribute_names):
             # check here to ensure we have the attrs we need.
             pk_attrs = [mapper._columntoproperty[col].key
                         for col in mapper.primary_key]
-            if state.expired_attributes.intersection(pk_attrs):
+            if state._expired_attributes.intersection(pk_attrs):
                 raise sa_exc.InvalidRequestError(
                     "Instance %s cannot be refreshed - it's not "
                     " persistent and does not "
@@ -24,7 +24,7 @@ from collections import deque
 from .. import sql, util, log, exc as sa_exc, event, schema, inspection
 from ..sql import expression, visitors, operators, util as sql_util
 from . import instrumentation, attributes, exc as orm_exc, loading
-from . import properties
+from . import properties, unitofwork
 from . import util as orm_util
 from .interfaces import MapperProperty, InspectionAttr, _MappedAttribute
 
@@ -1169,6 +1169,8 @@ class Mapper(InspectionAttr):
         if hasattr(self, '_configure_failed'):
             del self._configure_failed
 
+        unitofwork._flush_plans.clear()
+
         if not self.non_primary and \
             self.class_manager is not None and \
             self.class_manager.is_mapped and \
@@ -2687,6 +2689,7 @@ def configure_mappers():
                         raise
 
             Mapper._new_mappers = False
+            unitofwork._flush_plans.clear()
         finally:
             _already_compiling = False
     finally:
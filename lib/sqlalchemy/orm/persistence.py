@@ -84,7 +84,7 @@ def _bulk_update(mapper, mappings, session_transaction,
     def _changed_dict(mapper, state):
         return dict(
             (k, v)
-            for k, v in state.dict.items() if k in state.committed_state or k
+            for k, v in state.dict.items() if k in state._committed_state or k
             in mapper._primary_key_propkeys
         )
 
@@ -447,12 +447,12 @@ def _collect_update_commands(
         else:
             params = {}
             for propkey in set(propkey_to_col).intersection(
-                    state.committed_state):
+                    state._committed_state):
                 value = state_dict[propkey]
                 col = propkey_to_col[propkey]
 
                 if not state.manager[propkey].impl.is_equal(
-                        value, state.committed_state[propkey]):
+                        value, state._committed_state[propkey]):
                     if isinstance(value, sql.ClauseElement):
                         value_params[col] = value
                     else:
@@ -644,7 +644,16 @@ def _emit_update_statements(base_mapper, uowtransaction,
                 rows += c.rowcount
                 check_rowcount = True
         else:
-            if not allow_multirow:
+            if not allow_multirow and assert_singlerow and \
+                    len(records) > 1 and \
+                    connection.dialect.supports_update_from_select and \
+                    _can_update_from_select(base_mapper, mapper, table):
+                check_rowcount = True
+                rows += _emit_update_from_select_batches(
+                    base_mapper, uowtransaction, cached_connections,
+                    connection, mapper, table, paramkeys, records,
+                    bookkeeping)
+            elif not allow_multirow:
                 check_rowcount = assert_singlerow
                 for state, state_dict, params, mapper, \
                         connection, value_params in records:
@@ -672,8 +681,9 @@ def _emit_update_statements(base_mapper, uowtransaction,
                     execute(statement, multiparams)
 
                 rows += c.rowcount
-                for state, state_dict, params, mapper, \
-                        connection, value_params in records:
+                for (state, state_dict, params, mapper,
+                        connection, value_params), compiled_params in \
+                        zip(records, c.context.compiled_parameters):
                     _postfetch(
                         mapper,
                         uowtransaction,
@@ -681,7 +691,7 @@ def _emit_update_statements(base_mapper, uowtransaction,
                         state,
                         state_dict,
                         c,
-                        c.context.compiled_parameters[0],
+                        compiled_params,
                         value_params)
 
         if check_rowcount:
@@ -697,6 +707,124 @@ def _emit_update_statements(base_mapper, uowtransaction,
                       c.dialect.dialect_description)
 
 
+def _can_update_from_select(base_mapper, mapper, table):
+    """Return True if the UPDATEs for the given table may be emitted
+    using _emit_update_from_select_batches().
+
+    New version identifiers must be generated on the Python side, and
+    no columns may have Python-side "onupdate" defaults, as these
+    would be evaluated only once for each batch.
+
+    """
+
+    return mapper.version_id_generator is not False and \
+        not base_mapper.eager_defaults and \
+        base_mapper._memo(
+            ('update_from_select', table),
+            lambda: not any(col.onupdate is not None for col in table.c)
+        )
+
+
+def _update_from_select_stmt(mapper, table, paramkeys, num_rows):
+    """Return an UPDATE..FROM statement which UPDATEs ``num_rows``
+    rows of the given table against a UNION of SELECTs of bound
+    parameters, one for each row.
+
+    The bound parameters of each row are named <key>_<rownum>; those
+    of the first row are CAST to the type of their column so that the
+    types of the UNION's columns are established.
+
+    """
+
+    where_cols = list(mapper._pks_by_table[table]) + \
+        [mapper.version_id_col]
+    cols = dict((col._label, col) for col in where_cols)
+    set_keys = paramkeys.difference(cols)
+    cols.update((key, table.c[key]) for key in set_keys)
+    keys = sorted(paramkeys)
+
+    def bind(key, idx):
+        col = cols[key]
+        bind = sql.bindparam("%s_%d" % (key, idx), type_=col.type)
+        if idx == 0:
+            bind = sql.cast(bind, col.type)
+        return bind.label(key)
+
+    rows = sql.union_all(*[
+        sql.select([bind(key, idx) for key in keys])
+        for idx in range(num_rows)
+    ]).alias()
+
+    return table.update(
+        sql.and_(*[col == rows.c[col._label] for col in where_cols])
+    ).values(
+        dict((cols[key], rows.c[key]) for key in set_keys)
+    )
+
+
+def _emit_update_from_select_batches(
+        base_mapper, uowtransaction, cached_connections,
+        connection, mapper, table, paramkeys, records, bookkeeping):
+    """Emit versioned UPDATE statements for a group of records in
+    batches, using UPDATE..FROM against a SELECT of the parameters
+    of each row.
+
+    This is used for dialects that don't report a usable rowcount for
+    executemany(); as each batch is a single statement, the rowcount
+    returned for it may be used to detect stale versions.  Returns the
+    total number of rows matched.
+
+    """
+
+    batch_size = connection.dialect.max_update_from_select_rows
+    keys = frozenset(paramkeys)
+    rows = 0
+
+    for start in range(0, len(records), batch_size):
+        batch = records[start:start + batch_size]
+
+        if len(batch) == batch_size:
+            statement = base_mapper._memo(
+                ('update_from_select', table, keys, batch_size),
+                lambda: _update_from_select_stmt(
+                    mapper, table, keys, batch_size))
+            execute = cached_connections[connection].execute
+        else:
+            statement = _update_from_select_stmt(
+                mapper, table, keys, len(batch))
+            execute = connection.execute
+
+        multiparams = {}
+        for idx, rec in enumerate(batch):
+            for key, value in rec[2].items():
+                multiparams["%s_%d" % (key, idx)] = value
+
+        c = execute(statement, multiparams)
+        rows += c.rowcount
+
+        if bookkeeping:
+            # columns SET from the SELECT are reported as "postfetch",
+            # however their new values are those of the parameters
+            postfetch_cols = [
+                col for col in c.context.compiled.postfetch
+                if col.key not in keys]
+
+            for state, state_dict, params, mapper_rec, \
+                    conn, value_params in batch:
+                _postfetch(
+                    mapper_rec,
+                    uowtransaction,
+                    table,
+                    state,
+                    state_dict,
+                    c,
+                    params,
+                    value_params,
+                    postfetch_cols=postfetch_cols)
+
+    return rows
+
+
 def _emit_insert_statements(base_mapper, uowtransaction,
                             cached_connections, mapper, table, insert,
                             bookkeeping=True):
@@ -742,6 +870,14 @@ def _emit_insert_statements(base_mapper, uowtransaction,
                         last_inserted_params,
                         value_params)
 
+        elif not hasvalue and \
+                mapper.version_id_col is None and \
+                (has_all_defaults or not base_mapper.eager_defaults) and \
+                _autoincrement_prefetch_sql(connection, mapper, table):
+            _emit_insert_prefetched_pk_batches(
+                base_mapper, uowtransaction, cached_connections,
+                connection, mapper, table, list(records))
+
         else:
             if not has_all_defaults and base_mapper.eager_defaults:
                 statement = statement.return_defaults()
@@ -780,6 +916,77 @@ def _emit_insert_statements(base_mapper, uowtransaction,
                     value_params)
 
 
+def _autoincrement_prefetch_sql(connection, mapper, table):
+    """Return the dialect's SQL which generates new values for the
+    single autoincrement primary key column of the given table, or None.
+
+    """
+    pks = mapper._pks_by_table[table]
+    if len(pks) != 1:
+        return None
+    col, = pks
+    if col is not table._autoincrement_column:
+        return None
+    return connection.dialect._autoincrement_prefetch_sql(col)
+
+
+def _emit_insert_prefetched_pk_batches(base_mapper, uowtransaction,
+                                       cached_connections, connection,
+                                       mapper, table, records):
+    """Emit INSERT statements for rows whose primary keys are generated
+    by the database, by generating a batch of primary key values ahead
+    of time and then INSERTing the rows with those values using
+    executemany().
+
+    As each object is assigned its primary key before the INSERT,
+    nothing depends on the order in which the database returns or
+    generates rows.
+
+    """
+
+    statement = base_mapper._memo(('insert', table), table.insert)
+    pk_col, = mapper._pks_by_table[table]
+    prefetch_sql = _autoincrement_prefetch_sql(connection, mapper, table)
+    batch_size = connection.dialect.max_autoincrement_prefetch_rows
+
+    for start in range(0, len(records), batch_size):
+        batch = records[start:start + batch_size]
+
+        pk_values = [
+            row[0] for row in
+            connection.execute(prefetch_sql % len(batch)).fetchall()]
+        if len(pk_values) != len(batch):
+            raise orm_exc.FlushError(
+                "Generating primary key values for table %s returned "
+                "%d values; expected %d" %
+                (table, len(pk_values), len(batch)))
+
+        multiparams = []
+        for (state, state_dict, params, mapper_rec,
+                conn, value_params, has_all_pks, has_all_defaults), \
+                pk in zip(batch, pk_values):
+            state_dict[mapper_rec._columntoproperty[pk_col].key] = pk
+            params[pk_col.key] = pk
+            multiparams.append(params)
+
+        c = cached_connections[connection].\
+            execute(statement, multiparams)
+
+        for (state, state_dict, params, mapper_rec,
+                conn, value_params, has_all_pks, has_all_defaults), \
+                last_inserted_params in \
+                zip(batch, c.context.compiled_parameters):
+            _postfetch(
+                mapper_rec,
+                uowtransaction,
+                table,
+                state,
+                state_dict,
+                c,
+                last_inserted_params,
+                value_params)
+
+
 def _emit_post_update_statements(base_mapper, uowtransaction,
                                  cached_connections, mapper, table, update):
     """Emit UPDATE statements corresponding to value lists collected
@@ -849,7 +1056,21 @@ def _emit_delete_statements(base_mapper, uowtransaction, cached_connections,
         expected = len(del_objects)
         rows_matched = -1
         only_warn = False
-        if connection.dialect.supports_sane_multi_rowcount:
+        if expected > 1 and \
+                len(mapper._pks_by_table[table]) == 1 and \
+                (not need_version_id or
+                 connection.dialect.supports_sane_rowcount):
+            rows = _emit_delete_in_batches(
+                base_mapper, connection, mapper, table,
+                del_objects, need_version_id)
+
+            if not need_version_id:
+                only_warn = True
+
+            if connection.dialect.supports_sane_rowcount:
+                rows_matched = rows
+
+        elif connection.dialect.supports_sane_multi_rowcount:
             c = connection.execute(statement, del_objects)
 
             if not need_version_id:
@@ -895,6 +1116,82 @@ def _emit_delete_statements(base_mapper, uowtransaction, cached_connections,
                 )
 
 
+def _delete_in_stmt(mapper, table, num_rows, need_version_id):
+    """Return a DELETE statement for the given table which matches
+    ``num_rows`` primary key values, bound as <key>_<rownum>,
+    using an IN expression.
+
+    """
+
+    pk_col = mapper._pks_by_table[table][0]
+    clause = pk_col.in_([
+        sql.bindparam("%s_%d" % (pk_col.key, idx), type_=pk_col.type)
+        for idx in range(num_rows)
+    ])
+
+    if need_version_id:
+        clause = sql.and_(
+            clause,
+            mapper.version_id_col == sql.bindparam(
+                mapper.version_id_col.key,
+                type_=mapper.version_id_col.type
+            )
+        )
+
+    return table.delete(clause)
+
+
+def _emit_delete_in_batches(base_mapper, connection, mapper, table,
+                            del_objects, need_version_id):
+    """Emit DELETE statements for rows of a table with a single column
+    primary key, matching batches of up to ``max_in_list_size`` rows
+    using an IN expression.
+
+    For a versioned mapper, rows are grouped by their version identifier
+    so that each statement may match the version of all of its rows.
+    Returns the total number of rows matched.
+
+    """
+
+    pk_key = mapper._pks_by_table[table][0].key
+    batch_size = connection.dialect.max_in_list_size
+
+    if need_version_id:
+        version_key = mapper.version_id_col.key
+        by_version = util.OrderedDict()
+        for params in del_objects:
+            by_version.setdefault(
+                params[version_key], []).append(params[pk_key])
+        groups = list(by_version.items())
+    else:
+        groups = [(None, [params[pk_key] for params in del_objects])]
+
+    rows = 0
+    for version, pk_values in groups:
+        for start in range(0, len(pk_values), batch_size):
+            batch = pk_values[start:start + batch_size]
+
+            if len(batch) == batch_size:
+                statement = base_mapper._memo(
+                    ('delete_in', table, batch_size, need_version_id),
+                    lambda: _delete_in_stmt(
+                        mapper, table, batch_size, need_version_id))
+            else:
+                statement = _delete_in_stmt(
+                    mapper, table, len(batch), need_version_id)
+
+            params = dict(
+                ("%s_%d" % (pk_key, idx), value)
+                for idx, value in enumerate(batch)
+            )
+            if need_version_id:
+                params[version_key] = version
+
+            rows += connection.execute(statement, params).rowcount
+
+    return rows
+
+
 def _finalize_insert_update_commands(base_mapper, uowtransaction, states):
     """finalize state on states that have been inserted or updated,
     including calling after_insert/after_update events.
@@ -937,13 +1234,15 @@ def _finalize_insert_update_commands(base_mapper, uowtransaction, states):
 
 
 def _postfetch(mapper, uowtransaction, table,
-               state, dict_, result, params, value_params, bulk=False):
+               state, dict_, result, params, value_params, bulk=False,
+               postfetch_cols=None):
     """Expire attributes in need of newly persisted database state,
     after an INSERT or UPDATE statement has proceeded for that
     state."""
 
     prefetch_cols = result.context.compiled.prefetch
-    postfetch_cols = result.context.compiled.postfetch
+    if postfetch_cols is None:
+        postfetch_cols = result.context.compiled.postfetch
     returning_cols = result.context.compiled.returning
 
     if mapper.version_id_col is not None and \
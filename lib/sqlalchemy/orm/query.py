@@ -751,18 +751,26 @@ class Query(object):
             rows is fetched which generally defeats the purpose of
             :meth:`~sqlalchemy.orm.query.Query.yield_per`.
 
-            Also note that while
+            Also note that
             :meth:`~sqlalchemy.orm.query.Query.yield_per` will set the
-            ``stream_results`` execution option to True, currently
-            this is only understood by
-            :mod:`~sqlalchemy.dialects.postgresql.psycopg2` dialect
-            which will stream results using server side cursors
-            instead of pre-buffer all rows for this query. Other
+            ``stream_results`` execution option to True, which is
+            understood by dialects that support streaming, including
+            :mod:`~sqlalchemy.dialects.postgresql.psycopg2`,
+            :mod:`~sqlalchemy.dialects.mysql.mysqldb`,
+            :mod:`~sqlalchemy.dialects.mysql.pymysql`,
+            :mod:`~sqlalchemy.dialects.sqlite.pysqlite` and
+            :mod:`~sqlalchemy.dialects.oracle.cx_oracle`, which will
+            stream results using server side cursors or equivalent
+            instead of pre-buffering all rows for this query.  Other
             DBAPIs **pre-buffer all rows** before making them
             available.  The memory use of raw database rows is much less
             than that of an ORM-mapped object, but should still be taken into
             consideration when benchmarking.
 
+            The ``max_row_buffer`` execution option is also set to
+            ``count``, so that when results are streamed, no more than
+            ``count`` rows are fetched from the cursor at once.
+
         .. seealso::
 
             :meth:`.Query.enable_eagerloads`
@@ -770,7 +778,7 @@ class Query(object):
         """
         self._yield_per = count
         self._execution_options = self._execution_options.union(
-            {"stream_results": True})
+            {"stream_results": True, "max_row_buffer": count})
 
     def get(self, ident):
         """Return an instance based on the given primary key identifier,
@@ -830,6 +838,9 @@ class Query(object):
 
         """
 
+        return self._get_impl(ident, loading.load_on_ident)
+
+    def _get_impl(self, ident, fallback_fn):
         # convert composite types to individual args
         if hasattr(ident, '__composite_values__'):
             ident = ident.__composite_values__()
@@ -860,7 +871,7 @@ class Query(object):
                     return None
                 return instance
 
-        return loading.load_on_ident(self, key)
+        return fallback_fn(self, key)
 
     @_generative()
     def correlate(self, *args):
@@ -3703,6 +3714,7 @@ class QueryContext(object):
         self.query = query
         self.session = query.session
         self.populate_existing = query._populate_existing
+        self.autoflush = query._autoflush
         self.invoke_all_eagers = query._invoke_all_eagers
         self.version_check = query._version_check
         self.refresh_state = query._refresh_state
@@ -3714,6 +3726,7 @@ class QueryContext(object):
         self.propagate_options = set(o for o in query._with_options if
                                      o.propagate_to_loaders)
         self.attributes = query._attributes.copy()
+        self.post_load_paths = {}
 
 
 class AliasOption(interfaces.MapperOption):
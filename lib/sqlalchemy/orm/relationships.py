@@ -510,6 +510,13 @@ class RelationshipProperty(StrategizedProperty):
             a subquery of the original statement, for each collection
             requested.
 
+          * ``selectin`` - items should be loaded "eagerly" as the parents
+            are loaded, using one additional SQL statement for each batch
+            of parent rows, which selects the related rows using an IN
+            expression against the primary key values of the parents.
+
+            .. versionadded:: 1.0.0
+
           * ``noload`` - no loading should occur at any time.  This is to
             support "write-only" attributes, or attributes which are
             populated in some manner specific to the application.
@@ -275,7 +275,7 @@ class SessionTransaction(object):
         for s in set(self._new).union(self.session._new):
             self.session._expunge_state(s)
             if s.key:
-                del s.key
+                s.key = None
 
         for s, (oldkey, newkey) in self._key_switches.items():
             self.session.identity_map.safe_discard(s)
@@ -285,7 +285,7 @@ class SessionTransaction(object):
         for s in set(self._deleted).union(self.session._deleted):
             if s.deleted:
                 # assert s in self._deleted
-                del s.deleted
+                s.deleted = False
             self.session._update_impl(s, discard_existing=True)
 
         assert not self.session._deleted
@@ -2195,7 +2195,7 @@ class Session(_SessionClassMethods):
         """
         for (mapper, isupdate), states in itertools.groupby(
             (attributes.instance_state(obj) for obj in objects),
-            lambda state: (state.mapper, state.key is not None)
+            lambda state: (state.manager.mapper, state.key is not None)
         ):
             self._bulk_save_mappings(
                 mapper, states, isupdate, True,
@@ -2702,16 +2702,16 @@ def make_transient(instance):
         s._expunge_state(state)
 
     # remove expired state
-    state.expired_attributes.clear()
+    state._expired_attributes = util.EMPTY_SET
 
     # remove deferred callables
-    if state.callables:
-        del state.callables
+    if state._callables:
+        state._callables = statelib._EMPTY_DICT
 
     if state.key:
-        del state.key
+        state.key = None
     if state.deleted:
-        del state.deleted
+        state.deleted = False
 
 
 def make_transient_to_detached(instance):
@@ -2742,9 +2742,9 @@ def make_transient_to_detached(instance):
     if state.session_id or state.key:
         raise sa_exc.InvalidRequestError(
             "Given object must be transient")
-    state.key = state.mapper._identity_key_from_state(state)
+    state.key = state.manager.mapper._identity_key_from_state(state)
     if state.deleted:
-        del state.deleted
+        state.deleted = False
     state._commit_all(state.dict)
     state._expire_attributes(state.dict, state.unloaded)
 
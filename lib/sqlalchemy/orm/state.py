@@ -20,6 +20,47 @@ from .base import PASSIVE_NO_RESULT, SQL_OK, NEVER_SET, ATTR_WAS_SET, \
     NO_VALUE, PASSIVE_NO_INITIALIZE, INIT_OK, PASSIVE_OFF
 from . import base
 
+# placeholder for the per-state dictionaries, which are only
+# allocated once something is stored in them
+_EMPTY_DICT = util.immutabledict()
+
+
+def _none():
+    return None
+
+
+class _InstanceRef(weakref.ref):
+    """A weak reference to a mapped instance which carries its
+    :class:`.InstanceState`, so that the weakref callback need not be
+    a per-state bound method."""
+
+    __slots__ = 'state',
+
+
+def _cleanup_ref(ref):
+    """Weakref callback cleanup.
+
+    This callable cleans out the state when it is being garbage
+    collected.
+
+    this _cleanup_ref **assumes** that there are no strong refs to
+    the state!  Will not work otherwise!
+
+    """
+    state = ref.state
+    instance_dict = state._instance_dict()
+    if instance_dict is not None:
+        instance_dict._fast_discard(state)
+        state._instance_dict = _none
+
+        # we can't possibly be in instance_dict._modified
+        # b.c. this is weakref cleanup only, that set
+        # is strong referencing!
+        # assert state not in instance_dict._modified
+
+    state.session_id = state._strong_obj = None
+    state.obj = _none
+
 
 class InstanceState(interfaces.InspectionAttr):
     """tracks state information at the instance level.
@@ -47,48 +88,121 @@ class InstanceState(interfaces.InspectionAttr):
 
     """
 
-    session_id = None
-    key = None
-    runid = None
-    load_options = util.EMPTY_SET
-    load_path = ()
-    insert_order = None
-    _strong_obj = None
-    modified = False
-    expired = False
-    deleted = False
-    _load_pending = False
+    __slots__ = (
+        '__weakref__', 'class_', 'manager', 'obj', '_committed_state',
+        '_expired_attributes', '_callables', '_parents', '_pending_mutations',
+        '_instance_dict', 'session_id', 'key', 'runid', 'load_options',
+        'load_path', 'insert_order', '_strong_obj', 'modified', 'expired',
+        'deleted', '_load_pending'
+    )
+
     is_instance = True
 
-    callables = ()
-    """A namespace where a per-state loader callable can be associated.
+    def __init__(self, obj, manager):
+        self.class_ = obj.__class__
+        self.manager = manager
+        self.obj = ref = _InstanceRef(obj, _cleanup_ref)
+        ref.state = self
+
+        # the dictionaries and sets below start out as shared, immutable
+        # empty placeholders, so that states of unmodified objects carry
+        # no per-instance containers.  Internally they are read directly
+        # and written using the _set_committed_state(), _add_expired(),
+        # _set_callable() and _set_parent() methods, which swap in a
+        # mutable collection first; the public accessors allocate one
+        # when accessed.
+        self._committed_state = _EMPTY_DICT
+        self._expired_attributes = util.EMPTY_SET
+        self._callables = _EMPTY_DICT
+        self._parents = _EMPTY_DICT
+        self._pending_mutations = _EMPTY_DICT
+        self._instance_dict = _none
+        self.session_id = self.key = self.runid = None
+        self.load_options = util.EMPTY_SET
+        self.load_path = ()
+        self.insert_order = self._strong_obj = None
+        self.modified = self.expired = self.deleted = \
+            self._load_pending = False
 
-    In SQLAlchemy 1.0, this is only used for lazy loaders / deferred
-    loaders that were set up via query option.
+    @property
+    def committed_state(self):
+        """Dictionary of attribute key to value as of the last flush
+        or load, for each attribute modified since."""
 
-    Previously, callables was used also to indicate expired attributes
-    by storing a link to the InstanceState itself in this dictionary.
-    This role is now handled by the expired_attributes set.
+        if self._committed_state is _EMPTY_DICT:
+            self._committed_state = {}
+        return self._committed_state
 
-    """
+    @committed_state.setter
+    def committed_state(self, value):
+        self._committed_state = value
 
-    def __init__(self, obj, manager):
-        self.class_ = obj.__class__
-        self.manager = manager
-        self.obj = weakref.ref(obj, self._cleanup)
-        self.committed_state = {}
-        self.expired_attributes = set()
+    @property
+    def expired_attributes(self):
+        """The set of keys which are 'expired' to be loaded by
+        the manager's deferred scalar loader, assuming no pending
+        changes.
+
+        See also the ``unmodified`` collection which is intersected
+        against this set when a refresh operation occurs."""
+
+        if self._expired_attributes is util.EMPTY_SET:
+            self._expired_attributes = set()
+        return self._expired_attributes
+
+    @expired_attributes.setter
+    def expired_attributes(self, value):
+        self._expired_attributes = value
+
+    @property
+    def callables(self):
+        """A namespace where a per-state loader callable can be
+        associated.
+
+        In SQLAlchemy 1.0, this is only used for lazy loaders / deferred
+        loaders that were set up via query option; previously it also
+        indicated expired attributes, a role now handled by the
+        :attr:`.expired_attributes` set."""
 
-    expired_attributes = None
-    """The set of keys which are 'expired' to be loaded by
-       the manager's deferred scalar loader, assuming no pending
-       changes.
+        if self._callables is _EMPTY_DICT:
+            self._callables = {}
+        return self._callables
 
-       see also the ``unmodified`` collection which is intersected
-       against this set when a refresh operation occurs."""
+    @callables.setter
+    def callables(self, value):
+        self._callables = value
 
+    @property
+    def parents(self):
+        if self._parents is _EMPTY_DICT:
+            self._parents = {}
+        return self._parents
+
+    @parents.setter
+    def parents(self, value):
+        self._parents = value
+
+    def _set_committed_state(self, key, value):
+        if self._committed_state is _EMPTY_DICT:
+            self._committed_state = {}
+        self._committed_state[key] = value
+
+    def _add_expired(self, key):
+        if self._expired_attributes is util.EMPTY_SET:
+            self._expired_attributes = set()
+        self._expired_attributes.add(key)
+
+    def _set_callable(self, key, fn):
+        if self._callables is _EMPTY_DICT:
+            self._callables = {}
+        self._callables[key] = fn
+
+    def _set_parent(self, key, value):
+        if self._parents is _EMPTY_DICT:
+            self._parents = {}
+        self._parents[key] = value
 
-    @util.memoized_property
+    @property
     def attrs(self):
         """Return a namespace representing each attribute on
         the mapped object, including its current value
@@ -218,15 +332,7 @@ class InstanceState(interfaces.InspectionAttr):
         # the board ?  probably
         return self.key
 
-    @util.memoized_property
-    def parents(self):
-        return {}
-
-    @util.memoized_property
-    def _pending_mutations(self):
-        return {}
-
-    @util.memoized_property
+    @property
     def mapper(self):
         """Return the :class:`.Mapper` used for this mapepd object."""
         return self.manager.mapper
@@ -246,33 +352,7 @@ class InstanceState(interfaces.InspectionAttr):
 
     def _dispose(self):
         self._detach()
-        del self.obj
-
-    def _cleanup(self, ref):
-        """Weakref callback cleanup.
-
-        This callable cleans out the state when it is being garbage
-        collected.
-
-        this _cleanup **assumes** that there are no strong refs to us!
-        Will not work otherwise!
-
-        """
-        instance_dict = self._instance_dict()
-        if instance_dict is not None:
-            instance_dict._fast_discard(self)
-            del self._instance_dict
-
-            # we can't possibly be in instance_dict._modified
-            # b.c. this is weakref cleanup only, that set
-            # is strong referencing!
-            # assert self not in instance_dict._modified
-
-        self.session_id = self._strong_obj = None
-        del self.obj
-
-    def obj(self):
-        return None
+        self.obj = _none
 
     @property
     def dict(self):
@@ -312,19 +392,30 @@ class InstanceState(interfaces.InspectionAttr):
         return self.manager[key].impl
 
     def _get_pending_mutation(self, key):
-        if key not in self._pending_mutations:
-            self._pending_mutations[key] = PendingCollection()
-        return self._pending_mutations[key]
+        if self._pending_mutations is _EMPTY_DICT:
+            self._pending_mutations = {}
+        elif key in self._pending_mutations:
+            return self._pending_mutations[key]
+        pending = self._pending_mutations[key] = PendingCollection()
+        return pending
 
     def __getstate__(self):
-        state_dict = {'instance': self.obj()}
+        state_dict = {
+            'instance': self.obj(),
+            'class_': self.class_,
+            'committed_state': dict(self._committed_state),
+            'expired_attributes': set(self._expired_attributes),
+        }
         state_dict.update(
-            (k, self.__dict__[k]) for k in (
-                'committed_state', '_pending_mutations', 'modified',
-                'expired', 'callables', 'key', 'parents', 'load_options',
-                'class_', 'expired_attributes'
-            ) if k in self.__dict__
+            (k, getattr(self, k)) for k in (
+                '_pending_mutations', 'modified', 'expired',
+                'key', 'load_options',
+            ) if getattr(self, k)
         )
+        if self._callables:
+            state_dict['callables'] = self._callables
+        if self._parents:
+            state_dict['parents'] = self._parents
         if self.load_path:
             state_dict['load_path'] = self.load_path.serialize()
 
@@ -335,7 +426,8 @@ class InstanceState(interfaces.InspectionAttr):
     def __setstate__(self, state_dict):
         inst = state_dict['instance']
         if inst is not None:
-            self.obj = weakref.ref(inst, self._cleanup)
+            self.obj = ref = _InstanceRef(inst, _cleanup_ref)
+            ref.state = self
             self.class_ = inst.__class__
         else:
             # None being possible here generally new as of 0.7.4
@@ -344,33 +436,37 @@ class InstanceState(interfaces.InspectionAttr):
             self.obj = None
             self.class_ = state_dict['class_']
 
-        self.committed_state = state_dict.get('committed_state', {})
-        self._pending_mutations = state_dict.get('_pending_mutations', {})
-        self.parents = state_dict.get('parents', {})
+        self._committed_state = \
+            state_dict.get('committed_state') or _EMPTY_DICT
+        self._pending_mutations = \
+            state_dict.get('_pending_mutations') or _EMPTY_DICT
+        self._parents = state_dict.get('parents') or _EMPTY_DICT
+        self._callables = state_dict.get('callables') or _EMPTY_DICT
         self.modified = state_dict.get('modified', False)
         self.expired = state_dict.get('expired', False)
-        if 'callables' in state_dict:
-            self.callables = state_dict['callables']
+        self.key = state_dict.get('key')
+        self.load_options = state_dict.get('load_options') or \
+            util.EMPTY_SET
+        self._instance_dict = _none
+        self.session_id = self.runid = None
+        self.insert_order = self._strong_obj = None
+        self.deleted = self._load_pending = False
 
         try:
-            self.expired_attributes = state_dict['expired_attributes']
+            self._expired_attributes = state_dict['expired_attributes']
         except KeyError:
-            self.expired_attributes = set()
+            self._expired_attributes = set()
             # 0.9 and earlier compat
-            for k in list(self.callables):
-                if self.callables[k] is self:
-                    self.expired_attributes.add(k)
-                    del self.callables[k]
-
-        self.__dict__.update([
-            (k, state_dict[k]) for k in (
-                'key', 'load_options',
-            ) if k in state_dict
-        ])
+            for k in list(self._callables):
+                if self._callables[k] is self:
+                    self._expired_attributes.add(k)
+                    del self._callables[k]
 
         if 'load_path' in state_dict:
             self.load_path = PathRegistry.\
                 deserialize(state_dict['load_path'])
+        else:
+            self.load_path = ()
 
         state_dict['manager'](self, inst, state_dict)
 
@@ -387,26 +483,29 @@ class InstanceState(interfaces.InspectionAttr):
         old = dict_.pop(key, None)
         if old is not None and self.manager[key].impl.collection:
             self.manager[key].impl._invalidate_collection(old)
-        self.expired_attributes.discard(key)
-        if self.callables:
-            self.callables.pop(key, None)
+        if self._expired_attributes:
+            self._expired_attributes.discard(key)
+        if self._callables:
+            self._callables.pop(key, None)
 
     @classmethod
     def _instance_level_callable_processor(cls, manager, fn, key):
         impl = manager[key].impl
+        # these run once per row, so the allocate-on-write step of
+        # InstanceState._set_callable() is inlined
         if impl.collection:
             def _set_callable(state, dict_, row):
-                if 'callables' not in state.__dict__:
-                    state.callables = {}
                 old = dict_.pop(key, None)
                 if old is not None:
                     impl._invalidate_collection(old)
-                state.callables[key] = fn
+                if state._callables is _EMPTY_DICT:
+                    state._callables = {}
+                state._callables[key] = fn
         else:
             def _set_callable(state, dict_, row):
-                if 'callables' not in state.__dict__:
-                    state.callables = {}
-                state.callables[key] = fn
+                if state._callables is _EMPTY_DICT:
+                    state._callables = {}
+                state._callables[key] = fn
         return _set_callable
 
     def _expire(self, dict_, modified_set):
@@ -414,25 +513,23 @@ class InstanceState(interfaces.InspectionAttr):
 
         if self.modified:
             modified_set.discard(self)
-            self.committed_state.clear()
+            self._committed_state = _EMPTY_DICT
             self.modified = False
 
         self._strong_obj = None
+        self._pending_mutations = self._parents = _EMPTY_DICT
 
-        if '_pending_mutations' in self.__dict__:
-            del self.__dict__['_pending_mutations']
-
-        if 'parents' in self.__dict__:
-            del self.__dict__['parents']
-
-        self.expired_attributes.update(
-            [impl.key for impl in self.manager._scalar_loader_impls
-             if impl.expire_missing or impl.key in dict_]
-        )
+        expired = [impl.key for impl in self.manager._scalar_loader_impls
+                   if impl.expire_missing or impl.key in dict_]
+        if expired:
+            if self._expired_attributes is util.EMPTY_SET:
+                self._expired_attributes = set(expired)
+            else:
+                self._expired_attributes.update(expired)
 
-        if self.callables:
-            for k in self.expired_attributes.intersection(self.callables):
-                del self.callables[k]
+        if self._callables:
+            for k in self._expired_attributes.intersection(self._callables):
+                del self._callables[k]
 
         for k in self.manager._collection_impl_keys.intersection(dict_):
             collection = dict_.pop(k)
@@ -444,21 +541,22 @@ class InstanceState(interfaces.InspectionAttr):
         self.manager.dispatch.expire(self, None)
 
     def _expire_attributes(self, dict_, attribute_names):
-        pending = self.__dict__.get('_pending_mutations', None)
+        pending = self._pending_mutations
 
-        callables = self.callables
+        callables = self._callables
 
         for key in attribute_names:
             impl = self.manager[key].impl
             if impl.accepts_scalar_loader:
-                self.expired_attributes.add(key)
+                self._add_expired(key)
                 if callables and key in callables:
                     del callables[key]
             old = dict_.pop(key, None)
             if impl.collection and old is not None:
                 impl._invalidate_collection(old)
 
-            self.committed_state.pop(key, None)
+            if self._committed_state:
+                self._committed_state.pop(key, None)
             if pending:
                 pending.pop(key, None)
 
@@ -474,7 +572,7 @@ class InstanceState(interfaces.InspectionAttr):
         if not passive & SQL_OK:
             return PASSIVE_NO_RESULT
 
-        toload = self.expired_attributes.\
+        toload = self._expired_attributes.\
             intersection(self.unmodified)
 
         self.manager.deferred_scalar_loader(self, toload)
@@ -483,7 +581,7 @@ class InstanceState(interfaces.InspectionAttr):
         # instance state didn't have an identity,
         # the attributes still might be in the callables
         # dict.  ensure they are removed.
-        self.expired_attributes.clear()
+        self._expired_attributes = util.EMPTY_SET
 
         return ATTR_WAS_SET
 
@@ -491,13 +589,13 @@ class InstanceState(interfaces.InspectionAttr):
     def unmodified(self):
         """Return the set of keys which have no uncommitted changes"""
 
-        return set(self.manager).difference(self.committed_state)
+        return set(self.manager).difference(self._committed_state)
 
     def unmodified_intersection(self, keys):
         """Return self.unmodified.intersection(keys)."""
 
         return set(keys).intersection(self.manager).\
-            difference(self.committed_state)
+            difference(self._committed_state)
 
     @property
     def unloaded(self):
@@ -508,7 +606,7 @@ class InstanceState(interfaces.InspectionAttr):
 
         """
         return set(self.manager).\
-            difference(self.committed_state).\
+            difference(self._committed_state).\
             difference(self.dict)
 
     @property
@@ -518,14 +616,11 @@ class InstanceState(interfaces.InspectionAttr):
             if self.manager[attr].impl.accepts_scalar_loader
         )
 
-    def _instance_dict(self):
-        return None
-
     def _modified_event(
             self, dict_, attr, previous, collection=False, force=False):
         if not attr.send_modified_events:
             return
-        if attr.key not in self.committed_state or force:
+        if attr.key not in self._committed_state or force:
             if collection:
                 if previous is NEVER_SET:
                     if attr.key in dict_:
@@ -534,7 +629,7 @@ class InstanceState(interfaces.InspectionAttr):
                 if previous not in (None, NO_VALUE, NEVER_SET):
                     previous = attr.copy(previous)
 
-            self.committed_state[attr.key] = previous
+            self._set_committed_state(attr.key, previous)
 
         # assert self._strong_obj is None or self.modified
 
@@ -572,23 +667,25 @@ class InstanceState(interfaces.InspectionAttr):
         this step if a value was not populated in state.dict.
 
         """
-        for key in keys:
-            self.committed_state.pop(key, None)
+        if self._committed_state:
+            for key in keys:
+                self._committed_state.pop(key, None)
 
         self.expired = False
 
-        self.expired_attributes.difference_update(
-            set(keys).intersection(dict_))
+        if self._expired_attributes:
+            self._expired_attributes.difference_update(
+                set(keys).intersection(dict_))
 
         # the per-keys commit removes object-level callables,
         # while that of commit_all does not.  it's not clear
         # if this behavior has a clear rationale, however tests do
         # ensure this is what it does.
-        if self.callables:
-            for key in set(self.callables).\
+        if self._callables:
+            for key in set(self._callables).\
                 intersection(keys).\
                     intersection(dict_):
-                    del self.callables[key]
+                    del self._callables[key]
 
     def _commit_all(self, dict_, instance_dict=None):
         """commit all attributes unconditionally.
@@ -613,14 +710,10 @@ class InstanceState(interfaces.InspectionAttr):
         """Mass / highly inlined version of commit_all()."""
 
         for state, dict_ in iter:
-            state_dict = state.__dict__
-
-            state.committed_state.clear()
-
-            if '_pending_mutations' in state_dict:
-                del state_dict['_pending_mutations']
+            state._committed_state = state._pending_mutations = _EMPTY_DICT
 
-            state.expired_attributes.difference_update(dict_)
+            if state._expired_attributes:
+                state._expired_attributes.difference_update(dict_)
 
             if instance_dict and state.modified:
                 instance_dict._modified.discard(state)
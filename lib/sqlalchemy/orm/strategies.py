@@ -1081,6 +1081,156 @@ class SubqueryLoader(AbstractRelationshipLoader):
             populators["eager"].append((self.key, collections.loader))
 
 
+@log.class_logger
+@properties.RelationshipProperty.strategy_for(lazy="selectin")
+class SelectInLoader(AbstractRelationshipLoader):
+    """Provide loading behavior for a :class:`.RelationshipProperty`
+    using the "selectin" technique, which emits a second SELECT for
+    each batch of parent rows, restricted by an IN expression against
+    the parent primary key values.
+
+    """
+    __slots__ = 'join_depth',
+
+    def __init__(self, parent):
+        super(SelectInLoader, self).__init__(parent)
+        self.join_depth = self.parent_property.join_depth
+
+    def init_class_attribute(self, mapper):
+        self.parent_property.\
+            _get_strategy_by_cls(LazyLoader).\
+            init_class_attribute(mapper)
+
+    def create_row_processor(
+            self, context, path, loadopt,
+            mapper, result, adapter, populators):
+        if not self.parent.class_manager[self.key].impl.supports_population:
+            raise sa_exc.InvalidRequestError(
+                "'%s' does not support object "
+                "population - eager loading cannot be applied." %
+                self)
+
+        if not context.query._enable_eagerloads:
+            return
+
+        selectin_path = context.query._current_path + path \
+            if context.query._current_path.path else path
+
+        if loading.PostLoad.path_exists(
+                context, selectin_path, self.parent_property):
+            return
+
+        path_w_prop = path[self.parent_property]
+        selectin_path_w_prop = selectin_path[self.parent_property]
+
+        with_poly_info = path_w_prop.get(
+            context.attributes,
+            "path_with_polymorphic", None)
+        if with_poly_info is not None:
+            effective_entity = with_poly_info.entity
+        else:
+            effective_entity = self.mapper
+
+        # if not via query option, check for
+        # a cycle
+        if not path_w_prop.contains(context.attributes, "loader"):
+            if self.join_depth:
+                if selectin_path_w_prop.length / 2 > self.join_depth:
+                    return
+            elif selectin_path_w_prop.contains_mapper(self.mapper):
+                return
+
+        loading.PostLoad.callable_for_path(
+            context, selectin_path, self.parent, self.parent_property,
+            self._load_for_path, effective_entity)
+
+    def _load_for_path(
+            self, context, path, states, load_only, effective_entity):
+
+        if load_only and self.key not in load_only:
+            return
+
+        our_states = [
+            (state.key[1], state, overwrite)
+            for state, overwrite in states
+        ]
+
+        parent_alias = orm_util.AliasedClass(
+            self.parent, use_mapper_path=True)
+        pk_attrs = [
+            getattr(parent_alias, self.parent._columntoproperty[c].key)
+            for c in self.parent.primary_key
+        ]
+
+        if effective_entity is not self.mapper:
+            attr = getattr(parent_alias, self.key).of_type(effective_entity)
+        else:
+            attr = getattr(parent_alias, self.key)
+
+        orig_query = context.query
+
+        q = context.session.query(effective_entity, *pk_attrs)
+        q = q.select_from(parent_alias).join(attr).autoflush(False)
+
+        # propagate loader options etc. to the new query.
+        # these will fire relative to the path of this relationship.
+        q = q._with_current_path(path[self.parent_property])
+        q = q._conditional_options(*orig_query._with_options)
+        if orig_query._populate_existing:
+            q._populate_existing = orig_query._populate_existing
+
+        if self.parent_property.order_by:
+            eager_order_by = util.to_list(self.parent_property.order_by)
+            if effective_entity is not self.mapper:
+                insp = inspect(effective_entity)
+                eager_order_by = [
+                    insp._adapt_element(elem) for elem in eager_order_by]
+            q = q.order_by(*eager_order_by)
+
+        # size each IN expression to the dialect's limit on the
+        # number of bound parameters
+        dialect = context.session.get_bind(self.mapper).dialect
+        chunksize = max(1, dialect.max_in_list_size // len(pk_attrs))
+
+        while our_states:
+            chunk = our_states[0:chunksize]
+            our_states = our_states[chunksize:]
+
+            if len(pk_attrs) == 1:
+                crit = pk_attrs[0].in_([key[0] for key, state, ovr in chunk])
+            else:
+                crit = sql.or_(*[
+                    sql.and_(*[
+                        attr == value for attr, value in zip(pk_attrs, key)
+                    ])
+                    for key, state, ovr in chunk
+                ])
+
+            data = {}
+            for k, v in itertools.groupby(
+                    q.filter(crit),
+                    lambda x: tuple(x[1:])):
+                data.setdefault(k, []).extend(vv[0] for vv in v)
+
+            for key, state, overwrite in chunk:
+                if not overwrite and self.key in state.dict:
+                    continue
+
+                collection = data.get(key, ())
+                if self.uselist:
+                    state.get_impl(self.key).set_committed_value(
+                        state, state.dict, collection)
+                else:
+                    if len(collection) > 1:
+                        util.warn(
+                            "Multiple rows returned with "
+                            "uselist=False for eagerly-loaded attribute '%s' "
+                            % self)
+                    state.get_impl(self.key).set_committed_value(
+                        state, state.dict,
+                        collection[0] if collection else None)
+
+
 @log.class_logger
 @properties.RelationshipProperty.strategy_for(lazy="joined")
 @properties.RelationshipProperty.strategy_for(lazy=False)
@@ -18,6 +18,11 @@ from ..util import topological
 from . import attributes, persistence, util as orm_util
 import itertools
 
+# sorting plans for the mapper-level actions of a flush, keyed
+# on those actions and the dependencies between them; cleared
+# when mappers are configured or disposed.
+_flush_plans = util.LRUCache(100)
+
 
 def track_cascade_events(descriptor, prop):
     """Establish event listeners on object attributes which handle
@@ -314,9 +319,8 @@ class UOWTransaction(object):
                 break
 
         # see if the graph of mapper dependencies has cycles.
-        self.cycles = cycles = topological.find_cycles(
-            self.dependencies,
-            list(self.postsort_actions.values()))
+        cycles, sorted_actions = self._flush_plan()
+        self.cycles = cycles
 
         if cycles:
             # if yes, break the per-mapper actions into
@@ -343,11 +347,52 @@ class UOWTransaction(object):
                     for dep in convert[edge[1]]:
                         self.dependencies.add((edge[0], dep))
 
+        if sorted_actions is not None:
+            return sorted_actions
+
         return set([a for a in self.postsort_actions.values()
                     if not a.disabled
                     ]
                    ).difference(cycles)
 
+    def _flush_plan(self):
+        """Return the set of mapper-level actions which are involved in
+        cycles, as well as the list of all actions in sorted order
+        if there are no cycles.
+
+        Both depend only on the mapper-level actions and the dependencies
+        between them, so are cached in terms of the keys of those actions
+        and reused by subsequent flushes which produce the same graph.
+
+        """
+        actions = self.postsort_actions
+        keys = dict((rec, key) for key, rec in actions.items())
+        plan_key = (
+            frozenset(actions),
+            frozenset(
+                (keys.get(parent), keys.get(child))
+                for parent, child in self.dependencies)
+        )
+
+        plan = _flush_plans.get(plan_key)
+        if plan is None:
+            recs = list(actions.values())
+            cycles = topological.find_cycles(self.dependencies, recs)
+            if cycles:
+                sorted_keys = None
+            else:
+                sorted_keys = [
+                    keys[rec] for rec in
+                    topological.sort(self.dependencies, recs)]
+            plan = _flush_plans[plan_key] = (
+                [keys[rec] for rec in cycles], sorted_keys)
+
+        cycle_keys, sorted_keys = plan
+        if sorted_keys is None:
+            return set(actions[key] for key in cycle_keys), None
+        else:
+            return set(), [actions[key] for key in sorted_keys]
+
     def execute(self):
         postsort_actions = self._generate_actions()
 
@@ -367,9 +412,7 @@ class UOWTransaction(object):
                     n = set_.pop()
                     n.execute_aggregate(self, set_)
         else:
-            for rec in topological.sort(
-                    self.dependencies,
-                    postsort_actions):
+            for rec in postsort_actions:
                 rec.execute(self)
 
     def finalize_flush_changes(self):
@@ -995,3 +995,6 @@ def randomize_unitofwork():
     from sqlalchemy.testing.util import RandomSet
     topological.set = unitofwork.set = session.set = mapper.set = \
         dependency.set = RandomSet
+
+    # don't reuse the ordering established by a previous flush
+    unitofwork._flush_plans = util.LRUCache(0)
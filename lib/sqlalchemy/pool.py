@@ -20,6 +20,7 @@ SQLAlchemy connection pool.
 import time
 import traceback
 import weakref
+import bisect
 
 from . import exc, log, event, interfaces, util
 from .util import queue as sqla_queue
@@ -88,6 +89,42 @@ class _ConnDialect(object):
     def do_close(self, dbapi_connection):
         dbapi_connection.close()
 
+    def do_ping(self, dbapi_connection):
+        raise NotImplementedError(
+            "The ping feature requires that a dialect is "
+            "passed to the connection pool.")
+
+
+class _PoolStats(object):
+
+    """Running usage counters maintained by a :class:`.Pool`.
+
+    Counters are incremented without locking, so under heavy
+    concurrency they are approximate.
+
+    """
+
+    wait_buckets = (.001, .01, .1, 1, 10)
+    """Upper bounds, in seconds, of the buckets used for the
+    checkout wait time histogram; a final bucket collects all
+    waits longer than the last bound."""
+
+    def __init__(self, overflow=0):
+        self.reset(overflow)
+
+    def reset(self, overflow=0):
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.exhausted = 0
+        self.timeouts = 0
+        self.overflow_high_water = overflow
+        self.wait_histogram = [0] * (len(self.wait_buckets) + 1)
+
+    def record_wait(self, wait_time):
+        self.wait_histogram[
+            bisect.bisect_left(self.wait_buckets, wait_time)] += 1
+
 
 class Pool(log.Identified):
 
@@ -103,7 +140,8 @@ class Pool(log.Identified):
                  listeners=None,
                  events=None,
                  _dispatch=None,
-                 _dialect=None):
+                 _dialect=None,
+                 pre_ping=False):
         """
         Construct a Pool.
 
@@ -199,6 +237,16 @@ class Pool(log.Identified):
          can be assigned via :func:`.create_engine` before dialect-level
          listeners are applied.
 
+        :param pre_ping: if True, the pool will emit a "ping" (typically
+         "SELECT 1", but is dialect-specific) on the connection
+         upon checkout, to test if the connection is alive or not.   If not,
+         the connection is transparently re-connected and upon success, all
+         other pooled connections established prior to that timestamp are
+         invalidated.     Requires that a dialect is passed as well to
+         interpret the disconnection error.
+
+         .. versionadded:: 1.0.0
+
         :param listeners: Deprecated.  A list of
           :class:`~sqlalchemy.interfaces.PoolListener`-like objects or
           dictionaries of callables that receive events when DB-API
@@ -218,6 +266,8 @@ class Pool(log.Identified):
         self._recycle = recycle
         self._invalidate_time = 0
         self._use_threadlocal = use_threadlocal
+        self._pre_ping = pre_ping
+        self._stats = _PoolStats()
         if reset_on_return in ('rollback', True, reset_rollback):
             self._reset_on_return = reset_rollback
         elif reset_on_return in (None, False, reset_none):
@@ -283,7 +333,7 @@ class Pool(log.Identified):
 
         return _ConnectionRecord(self)
 
-    def _invalidate(self, connection, exception=None):
+    def _invalidate(self, connection, exception=None, _checkin=True):
         """Mark all connections established within the generation
         of the given connection as invalidated.
 
@@ -297,7 +347,7 @@ class Pool(log.Identified):
         rec = getattr(connection, "_connection_record", None)
         if not rec or self._invalidate_time < rec.starttime:
             self._invalidate_time = time.time()
-        if getattr(connection, 'is_valid', False):
+        if _checkin and getattr(connection, 'is_valid', False):
             connection.invalidate(exception)
 
     def recreate(self):
@@ -373,6 +423,42 @@ class Pool(log.Identified):
     def status(self):
         raise NotImplementedError()
 
+    def stats(self):
+        """Return a dictionary of usage statistics for this :class:`.Pool`.
+
+        The dictionary includes the following keys, each counting
+        events since the pool was created or since the last call to
+        :meth:`.Pool.reset_stats`:
+
+        * ``checkouts`` - connections checked out from the pool.
+        * ``checkins`` - connections returned to the pool.
+        * ``invalidations`` - connections invalidated, whether
+          explicitly or due to a disconnect condition.
+
+        Subclasses which limit the number of connections, such as
+        :class:`.QueuePool`, add further keys; see :meth:`.QueuePool.stats`.
+
+        Counters are maintained without locking, and may be
+        approximate when many threads use the pool concurrently.
+
+        .. versionadded:: 1.0.0
+
+        """
+        stats = self._stats
+        return {
+            "checkouts": stats.checkouts,
+            "checkins": stats.checkins,
+            "invalidations": stats.invalidations,
+        }
+
+    def reset_stats(self):
+        """Reset the counters reported by :meth:`.Pool.stats` to zero.
+
+        .. versionadded:: 1.0.0
+
+        """
+        self._stats.reset()
+
 
 class _ConnectionRecord(object):
 
@@ -452,6 +538,7 @@ class _ConnectionRecord(object):
                 rec, pool, ref, echo)
         )
         _refs.add(rec)
+        pool._stats.checkouts += 1
         if echo:
             pool.logger.debug("Connection %r checked out from pool",
                               dbapi_connection)
@@ -466,6 +553,7 @@ class _ConnectionRecord(object):
             finalizer(connection)
         if pool.dispatch.checkin:
             pool.dispatch.checkin(connection, self)
+        pool._stats.checkins += 1
         pool._return_conn(self)
 
     def close(self):
@@ -488,6 +576,7 @@ class _ConnectionRecord(object):
         # already invalidated
         if self.connection is None:
             return
+        self.__pool._stats.invalidations += 1
         self.__pool.dispatch.invalidate(self.connection, self, e)
         if e is not None:
             self.__pool.logger.info(
@@ -653,21 +742,52 @@ class _ConnectionFairy(object):
             raise exc.InvalidRequestError("This connection is closed")
         fairy._counter += 1
 
-        if not pool.dispatch.checkout or fairy._counter != 1:
+        if (not pool.dispatch.checkout and not pool._pre_ping) or \
+                fairy._counter != 1:
             return fairy
 
-        # Pool listeners can trigger a reconnection on checkout
+        # Pool listeners can trigger a reconnection on checkout, as well
+        # as the pre-pinger.
         attempts = 2
         while attempts > 0:
             try:
+                if pool._pre_ping:
+                    if fairy._echo:
+                        pool.logger.debug(
+                            "Pool pre-ping on connection %s",
+                            fairy.connection)
+
+                    try:
+                        result = pool._dialect.do_ping(fairy.connection)
+                    except:
+                        with util.safe_reraise():
+                            fairy._checkin()
+                    if not result:
+                        if fairy._echo:
+                            pool.logger.debug(
+                                "Pool pre-ping on connection %s failed, "
+                                "will invalidate pool", fairy.connection)
+                        raise exc.InvalidatePoolError()
+
                 pool.dispatch.checkout(fairy.connection,
                                        fairy._connection_record,
                                        fairy)
                 return fairy
             except exc.DisconnectionError as e:
-                pool.logger.info(
-                    "Disconnection detected on checkout: %s", e)
-                fairy._connection_record.invalidate(e)
+                if e.invalidate_pool:
+                    pool.logger.info(
+                        "Disconnection detected on checkout, "
+                        "invalidating all pooled connections prior to "
+                        "current timestamp (reason: %r)", e)
+                    fairy._connection_record.invalidate(e)
+                    pool._invalidate(fairy, e, _checkin=False)
+                else:
+                    pool.logger.info(
+                        "Disconnection detected on checkout, "
+                        "invalidating individual connection %s "
+                        "(reason: %r)",
+                        fairy.connection, e)
+                    fairy._connection_record.invalidate(e)
                 fairy.connection = fairy._connection_record.get_connection()
                 attempts -= 1
 
@@ -833,6 +953,7 @@ class SingletonThreadPool(Pool):
                               logging_name=self._orig_logging_name,
                               use_threadlocal=self._use_threadlocal,
                               reset_on_return=self._reset_on_return,
+                              pre_ping=self._pre_ping,
                               _dispatch=self.dispatch,
                               _dialect=self._dialect)
 
@@ -886,7 +1007,7 @@ class QueuePool(Pool):
     """
 
     def __init__(self, creator, pool_size=5, max_overflow=10, timeout=30,
-                 **kw):
+                 use_lifo=False, **kw):
         """
         Construct a QueuePool.
 
@@ -918,6 +1039,21 @@ class QueuePool(Pool):
         :param timeout: The number of seconds to wait before giving up
           on returning a connection. Defaults to 30.
 
+        :param use_lifo: use LIFO (last-in-first-out) when retrieving
+          connections instead of FIFO (first-in-first-out). Using LIFO, a
+          server-side timeout scheme can reduce the number of connections used
+          during non-peak periods of use.   When planning for server-side
+          timeouts, ensure that a recycle or pre-ping strategy is in use to
+          gracefully handle stale connections.
+
+          .. versionadded:: 1.0.0
+
+          .. seealso::
+
+            :ref:`pool_use_lifo`
+
+            :ref:`pool_disconnects`
+
         :param \**kw: Other keyword arguments including
           :paramref:`.Pool.recycle`, :paramref:`.Pool.echo`,
           :paramref:`.Pool.reset_on_return` and others are passed to the
@@ -925,11 +1061,12 @@ class QueuePool(Pool):
 
         """
         Pool.__init__(self, creator, **kw)
-        self._pool = sqla_queue.Queue(pool_size)
+        self._pool = sqla_queue.Queue(pool_size, use_lifo=use_lifo)
         self._overflow = 0 - pool_size
         self._max_overflow = max_overflow
         self._timeout = timeout
         self._overflow_lock = threading.Lock()
+        self._stats.reset(self._overflow)
 
     def _do_return_conn(self, conn):
         try:
@@ -945,12 +1082,18 @@ class QueuePool(Pool):
 
         try:
             wait = use_overflow and self._overflow >= self._max_overflow
-            return self._pool.get(wait, self._timeout)
+            try:
+                return self._pool.get(False)
+            except sqla_queue.Empty:
+                if not wait:
+                    raise
+            return self._wait_get()
         except sqla_queue.Empty:
             if use_overflow and self._overflow >= self._max_overflow:
                 if not wait:
                     return self._do_get()
                 else:
+                    self._stats.timeouts += 1
                     raise exc.TimeoutError(
                         "QueuePool limit of size %d overflow %d reached, "
                         "connection timed out, timeout %d" %
@@ -965,13 +1108,33 @@ class QueuePool(Pool):
             else:
                 return self._do_get()
 
+    def _wait_get(self):
+        """Wait for a connection to be returned to an exhausted pool."""
+
+        self._stats.exhausted += 1
+        if self.dispatch.exhausted:
+            self.dispatch.exhausted(self)
+
+        start = time.time()
+        rec = self._pool.get(True, self._timeout)
+        wait_time = time.time() - start
+
+        self._stats.record_wait(wait_time)
+        if self.dispatch.checkout_wait:
+            self.dispatch.checkout_wait(self, wait_time)
+        return rec
+
     def _inc_overflow(self):
         if self._max_overflow == -1:
             self._overflow += 1
+            if self._overflow > self._stats.overflow_high_water:
+                self._stats.overflow_high_water = self._overflow
             return True
         with self._overflow_lock:
             if self._overflow < self._max_overflow:
                 self._overflow += 1
+                if self._overflow > self._stats.overflow_high_water:
+                    self._stats.overflow_high_water = self._overflow
                 return True
             else:
                 return False
@@ -989,10 +1152,12 @@ class QueuePool(Pool):
         return self.__class__(self._creator, pool_size=self._pool.maxsize,
                               max_overflow=self._max_overflow,
                               timeout=self._timeout,
+                              use_lifo=self._pool.use_lifo,
                               recycle=self._recycle, echo=self.echo,
                               logging_name=self._orig_logging_name,
                               use_threadlocal=self._use_threadlocal,
                               reset_on_return=self._reset_on_return,
+                              pre_ping=self._pre_ping,
                               _dispatch=self.dispatch,
                               _dialect=self._dialect)
 
@@ -1015,6 +1180,52 @@ class QueuePool(Pool):
                                  self.overflow(),
                                  self.checkedout())
 
+    def stats(self):
+        """Return a dictionary of usage statistics for this
+        :class:`.QueuePool`.
+
+        In addition to the keys described at :meth:`.Pool.stats`,
+        the dictionary includes:
+
+        * ``size``, ``checkedin``, ``checkedout``, ``overflow`` - the
+          current values of :meth:`.QueuePool.size`,
+          :meth:`.QueuePool.checkedin`, :meth:`.QueuePool.checkedout`
+          and :meth:`.QueuePool.overflow`.
+        * ``overflow_high_water`` - the highest value
+          :meth:`.QueuePool.overflow` has reached.  As with
+          :meth:`.QueuePool.overflow`, this value is negative while the
+          number of connections opened is below ``pool_size``.
+        * ``exhausted`` - checkouts which found no connection available
+          and no overflow remaining, and had to wait.  The
+          :meth:`.PoolEvents.exhausted` event is emitted for each.
+        * ``timeouts`` - checkouts which gave up after waiting
+          ``timeout`` seconds, raising :class:`~sqlalchemy.exc.TimeoutError`.
+        * ``wait_histogram`` - a list of ``(upper_bound, count)`` tuples
+          counting the checkouts which waited for a connection by the
+          number of seconds waited; the final bucket has an upper bound of
+          ``None``.  Checkouts which did not wait are not included.
+
+        .. versionadded:: 1.0.0
+
+        """
+        d = Pool.stats(self)
+        stats = self._stats
+        d.update(
+            size=self.size(),
+            checkedin=self.checkedin(),
+            checkedout=self.checkedout(),
+            overflow=self.overflow(),
+            overflow_high_water=stats.overflow_high_water,
+            exhausted=stats.exhausted,
+            timeouts=stats.timeouts,
+            wait_histogram=list(zip(
+                stats.wait_buckets + (None, ), stats.wait_histogram))
+        )
+        return d
+
+    def reset_stats(self):
+        self._stats.reset(self._overflow)
+
     def size(self):
         return self._pool.maxsize
 
@@ -1063,6 +1274,7 @@ class NullPool(Pool):
                               logging_name=self._orig_logging_name,
                               use_threadlocal=self._use_threadlocal,
                               reset_on_return=self._reset_on_return,
+                              pre_ping=self._pre_ping,
                               _dispatch=self.dispatch,
                               _dialect=self._dialect)
 
@@ -1103,6 +1315,7 @@ class StaticPool(Pool):
                               recycle=self._recycle,
                               use_threadlocal=self._use_threadlocal,
                               reset_on_return=self._reset_on_return,
+                              pre_ping=self._pre_ping,
                               echo=self.echo,
                               logging_name=self._orig_logging_name,
                               _dispatch=self.dispatch,
@@ -49,13 +49,6 @@ def str_to_datetime_processor_factory(regexp, type_):
     return process
 
 
-def boolean_to_int(value):
-    if value is None:
-        return None
-    else:
-        return int(value)
-
-
 def py_fallback():
     def to_unicode_processor_factory(encoding, errors=None):
         decoder = codecs.getdecoder(encoding)
@@ -85,6 +78,16 @@ def py_fallback():
                 return decoder(value, errors)[0]
         return process
 
+    def unicode_bind_processor_factory(encoding, errors=None):
+        encoder = codecs.getencoder(encoding)
+
+        def process(value):
+            if isinstance(value, util.text_type):
+                return encoder(value, errors)[0]
+            else:
+                return value
+        return process
+
     def to_decimal_processor_factory(target_class, scale):
         fstring = "%%.%df" % scale
 
@@ -113,6 +116,47 @@ def py_fallback():
         else:
             return value and True or False
 
+    def boolean_to_int(value):
+        if value is None:
+            return None
+        else:
+            return int(value)
+
+    # string conversions of date and time values used by the
+    # default storage formats of the SQLite dialect
+    def datetime_to_str(value):
+        if value is None:
+            return None
+        elif isinstance(value, datetime.datetime):
+            return "%04d-%02d-%02d %02d:%02d:%02d.%06d" % (
+                value.year, value.month, value.day,
+                value.hour, value.minute, value.second, value.microsecond)
+        elif isinstance(value, datetime.date):
+            return "%04d-%02d-%02d 00:00:00.000000" % (
+                value.year, value.month, value.day)
+        else:
+            raise TypeError("SQLite DateTime type only accepts Python "
+                            "datetime and date objects as input.")
+
+    def date_to_str(value):
+        if value is None:
+            return None
+        elif isinstance(value, datetime.date):
+            return "%04d-%02d-%02d" % (value.year, value.month, value.day)
+        else:
+            raise TypeError("SQLite Date type only accepts Python "
+                            "date objects as input.")
+
+    def time_to_str(value):
+        if value is None:
+            return None
+        elif isinstance(value, datetime.time):
+            return "%02d:%02d:%02d.%06d" % (
+                value.hour, value.minute, value.second, value.microsecond)
+        else:
+            raise TypeError("SQLite Time type only accepts Python "
+                            "time objects as input.")
+
     DATETIME_RE = re.compile(
         "(\d+)-(\d+)-(\d+) (\d+):(\d+):(\d+)(?:\.(\d+))?")
     TIME_RE = re.compile("(\d+):(\d+):(\d+)(?:\.(\d+))?")
@@ -126,10 +170,10 @@ def py_fallback():
 
 try:
     from sqlalchemy.cprocessors import UnicodeResultProcessor, \
-        DecimalResultProcessor, \
-        to_float, to_str, int_to_boolean, \
+        DecimalResultProcessor, UnicodeBindProcessor, \
+        to_float, to_str, int_to_boolean, boolean_to_int, \
         str_to_datetime, str_to_time, \
-        str_to_date
+        str_to_date, datetime_to_str, date_to_str, time_to_str
 
     def to_unicode_processor_factory(encoding, errors=None):
         if errors is not None:
@@ -143,6 +187,12 @@ try:
         else:
             return UnicodeResultProcessor(encoding).conditional_process
 
+    def unicode_bind_processor_factory(encoding, errors=None):
+        if errors is not None:
+            return UnicodeBindProcessor(encoding, errors).process
+        else:
+            return UnicodeBindProcessor(encoding).process
+
     def to_decimal_processor_factory(target_class, scale):
         # Note that the scale argument is not taken into account for integer
         # values in the C implementation while it is in the Python one.
@@ -28,6 +28,7 @@ from . import schema, sqltypes, operators, functions, visitors, \
     elements, selectable, crud
 from .. import util, exc
 import itertools
+import operator
 
 RESERVED_WORDS = set([
     'all', 'analyse', 'analyze', 'and', 'any', 'array',
@@ -147,6 +148,55 @@ COMPOUND_KEYWORDS = {
 }
 
 
+def _tuple_getter(keys):
+    """Return a callable returning the values of the given keys from a
+    dictionary, as a tuple."""
+
+    if len(keys) == 1:
+        key = keys[0]
+        return lambda d: (d[key], )
+    elif keys:
+        return operator.itemgetter(*keys)
+    else:
+        return lambda d: ()
+
+
+def py_fallback():
+    def _construct_params(bind_plan, params, resolved, check):
+        """Given the (bindparam, key, name) tuples of a SQLCompiler, return
+        a dictionary of bind names and values, taken from the given
+        parameters by key or name, else from the bound parameter itself or
+        its replacement in ``resolved``.
+
+        Returns None if ``check`` is set and a required parameter is not
+        present.
+
+        """
+
+        pd = {}
+        for bindparam, key, name in bind_plan:
+            if params and key in params:
+                pd[name] = params[key]
+            elif params and name in params:
+                pd[name] = params[name]
+            elif check and bindparam.required:
+                return None
+            else:
+                value_param = resolved.get(bindparam, bindparam) \
+                    if resolved else bindparam
+                if value_param.callable:
+                    pd[name] = value_param.effective_value
+                else:
+                    pd[name] = value_param.value
+        return pd
+
+    return locals()
+try:
+    from sqlalchemy.cutils import _construct_params
+except ImportError:
+    globals().update(py_fallback())
+
+
 class Compiled(object):
 
     """Represent a compiled SQL or DDL expression.
@@ -161,6 +211,7 @@ class Compiled(object):
     defaults.
     """
 
+    # a (key, ResultMetaData) tuple memoized by ResultProxy
     _cached_metadata = None
 
     def __init__(self, dialect, statement, bind=None,
@@ -216,12 +267,50 @@ class Compiled(object):
 
         return self.string or ''
 
-    def construct_params(self, params=None):
+    @util.memoized_property
+    def _unicode_string(self):
+        """The string of this compiled object as a unicode object."""
+
+        return util.text_type(self.string)
+
+    @util.memoized_property
+    def _dbapi_statements(self):
+        return {}
+
+    def _dbapi_statement(self, suffix=''):
+        """Return the string of this compiled object with the given
+        suffix appended, encoded when the dialect does not accept unicode
+        statements.
+
+        The result is memoized per suffix, so that a compiled object
+        retrieved from a compiled cache pays for string concatenation
+        and encoding once, rather than on each execution.
+
+        """
+        try:
+            return self._dbapi_statements[suffix]
+        except KeyError:
+            statement = self._unicode_string + suffix
+            if not self.dialect.supports_unicode_statements:
+                statement = self.dialect._encoder(statement)[0]
+            self._dbapi_statements[suffix] = statement
+            return statement
+
+    def construct_params(self, params=None, extracted_parameters=None):
         """Return the bind params for this compiled object.
 
         :param params: a dict of string/object pairs whose values will
                        override bind values compiled in to the
                        statement.
+
+        :param extracted_parameters: a list of :class:`.BindParameter`
+         objects collected from the structural cache key of a statement
+         which is being executed using this compiled object in place of
+         its own; their values are used in place of the values compiled
+         in to the statement.
+
+         .. versionadded:: 1.0.0
+
         """
 
         raise NotImplementedError()
@@ -311,6 +400,12 @@ class SQLCompiler(Compiled):
     clauses before the VALUES or WHERE clause (i.e. MSSQL)
     """
 
+    insert_single_values_expr = None
+    """When an INSERT is compiled with a single set of parameters inside
+    a VALUES expression, the string is assigned here, where it can be
+    used for insert batching schemes to rewrite the VALUES expression.
+    """
+
     render_table_with_column_in_update_from = False
     """set to True classwide to indicate the SET clause
     in a multi-table UPDATE statement should qualify
@@ -325,6 +420,15 @@ class SQLCompiler(Compiled):
     driver/DB enforces this
     """
 
+    literal_binds_rendered = False
+    """set to True if the value of any bound parameter was rendered
+    inline into the SQL string.  Such a compiled object is specific
+    to the values of the statement it was compiled from, and can't be
+    shared with other statements having the same structural cache key.
+    """
+
+    _cache_key_bind_match = None
+
     def __init__(self, dialect, statement, column_keys=None,
                  inline=False, **kwargs):
         """Construct a new ``DefaultCompiler`` object.
@@ -419,6 +523,43 @@ class SQLCompiler(Compiled):
             if value is not None
         )
 
+    @util.memoized_property
+    def _bind_plan(self):
+        # (bindparam, bindparam.key, bind name) for each bound parameter,
+        # in the order of bind_names, iterated by construct_params()
+        return [
+            (bindparam, bindparam.key, name)
+            for bindparam, name in self.bind_names.items()
+        ]
+
+    @util.memoized_property
+    def _bind_key_getter(self):
+        # a callable returning the values of all bound parameters from
+        # a parameter dictionary keyed on bindparam.key, raising KeyError
+        # if any are missing; along with the corresponding bind names
+        keys = [key for bindparam, key, name in self._bind_plan]
+        names = [name for bindparam, key, name in self._bind_plan]
+        return (_tuple_getter(keys) if keys else None), names
+
+    @util.memoized_property
+    def _positional_bind_plan(self):
+        # a callable returning the values of the bind names in positiontup
+        # as a tuple, along with (index, processor) for each position
+        # having a bind processor; used to convert compiled parameters
+        # into a DBAPI sequence
+        processors = self._bind_processors
+        return _tuple_getter(self.positiontup), [
+            (idx, processors[name])
+            for idx, name in enumerate(self.positiontup)
+            if name in processors
+        ]
+
+    @util.memoized_property
+    def _keyword_bind_plan(self):
+        # (bind name, processor) for each bind having a bind processor;
+        # used to convert compiled parameters into a DBAPI dictionary
+        return list(self._bind_processors.items())
+
     def is_subquery(self):
         return len(self.stack) > 1
 
@@ -426,53 +567,66 @@ class SQLCompiler(Compiled):
     def sql_compiler(self):
         return self
 
-    def construct_params(self, params=None, _group_number=None, _check=True):
+    def _set_cache_key_bindparams(self, bindparams):
+        """Relate the bound parameters present in this compiled object
+        to their positions within the list of bound parameters collected
+        from the statement's structural cache key.
+
+        The parameters in :attr:`.bind_names` may be clones of those in the
+        original statement, so the cloned lineage of each is consulted.
+
+        """
+        positions = dict(
+            (bindparam, idx) for idx, bindparam in enumerate(bindparams))
+        bind_match = {}
+        for bindparam in self.bind_names:
+            for orig in bindparam._cloned_set:
+                if orig in positions:
+                    bind_match[bindparam] = positions[orig]
+                    break
+        self._cache_key_bind_match = bind_match
+
+    def construct_params(self, params=None, _group_number=None, _check=True,
+                         extracted_parameters=None):
         """return a dictionary of bind parameter keys and values"""
 
+        if extracted_parameters:
+            # the bound parameters of a statement that shares this
+            # compiled object's cache key supply the default values,
+            # in place of those of the statement originally compiled.
+            resolved = dict(
+                (bindparam, extracted_parameters[idx])
+                for bindparam, idx in self._cache_key_bind_match.items()
+            )
+        else:
+            resolved = None
+
         if params:
-            pd = {}
-            for bindparam in self.bind_names:
-                name = self.bind_names[bindparam]
-                if bindparam.key in params:
-                    pd[name] = params[bindparam.key]
-                elif name in params:
-                    pd[name] = params[name]
-
-                elif _check and bindparam.required:
-                    if _group_number:
-                        raise exc.InvalidRequestError(
-                            "A value is required for bind parameter %r, "
-                            "in parameter group %d" %
-                            (bindparam.key, _group_number))
-                    else:
-                        raise exc.InvalidRequestError(
-                            "A value is required for bind parameter %r"
-                            % bindparam.key)
-
-                elif bindparam.callable:
-                    pd[name] = bindparam.effective_value
-                else:
-                    pd[name] = bindparam.value
+            getter, names = self._bind_key_getter
+            if getter is not None:
+                # fast path, for when params supplies a value for
+                # every bound parameter
+                try:
+                    return dict(zip(names, getter(params)))
+                except KeyError:
+                    pass
+
+        pd = _construct_params(self._bind_plan, params, resolved, _check)
+        if pd is not None:
             return pd
-        else:
-            pd = {}
-            for bindparam in self.bind_names:
-                if _check and bindparam.required:
-                    if _group_number:
-                        raise exc.InvalidRequestError(
-                            "A value is required for bind parameter %r, "
-                            "in parameter group %d" %
-                            (bindparam.key, _group_number))
-                    else:
-                        raise exc.InvalidRequestError(
-                            "A value is required for bind parameter %r"
-                            % bindparam.key)
-
-                if bindparam.callable:
-                    pd[self.bind_names[bindparam]] = bindparam.effective_value
+
+        for bindparam, key, name in self._bind_plan:
+            if bindparam.required and not (
+                    params and (key in params or name in params)):
+                if _group_number:
+                    raise exc.InvalidRequestError(
+                        "A value is required for bind parameter %r, "
+                        "in parameter group %d" %
+                        (bindparam.key, _group_number))
                 else:
-                    pd[self.bind_names[bindparam]] = bindparam.value
-            return pd
+                    raise exc.InvalidRequestError(
+                        "A value is required for bind parameter %r"
+                        % bindparam.key)
 
     @property
     def params(self):
@@ -1061,6 +1215,7 @@ class SQLCompiler(Compiled):
         return self.bindparam_string(name, **kwargs)
 
     def render_literal_bindparam(self, bindparam, **kw):
+        self.literal_binds_rendered = True
         value = bindparam.effective_value
         return self.render_literal_value(value, bindparam.type)
 
@@ -1747,6 +1902,8 @@ class SQLCompiler(Compiled):
         )
 
     def visit_insert(self, insert_stmt, **kw):
+        toplevel = not self.stack
+
         self.stack.append(
             {'correlate_froms': set(),
              "iswrapper": False,
@@ -1830,8 +1987,11 @@ class SQLCompiler(Compiled):
                 )
             )
         else:
-            text += " VALUES (%s)" % \
-                ', '.join([c[1] for c in crud_params])
+            insert_single_values_expr = ', '.join(
+                [c[1] for c in crud_params])
+            text += " VALUES (%s)" % insert_single_values_expr
+            if toplevel:
+                self.insert_single_values_expr = insert_single_values_expr
 
         if self.returning and not self.returning_precedes_values:
             text += " " + returning_clause
@@ -2039,7 +2199,7 @@ class DDLCompiler(Compiled):
     def preparer(self):
         return self.dialect.identifier_preparer
 
-    def construct_params(self, params=None):
+    def construct_params(self, params=None, extracted_parameters=None):
         return None
 
     def visit_ddl(self, ddl, **kwargs):
@@ -325,6 +325,9 @@ class _multiparam_column(elements.ColumnElement):
             other.key == self.key and \
             other.original == self.original
 
+    def __hash__(self):
+        return hash((self.key, self.original))
+
 
 def _process_multiparam_default_bind(compiler, c, index, kw):
 
@@ -11,7 +11,8 @@ Provide :class:`.Insert`, :class:`.Update` and :class:`.Delete`.
 
 from .base import Executable, _generative, _from_objects, DialectKWArgs
 from .elements import ClauseElement, _literal_as_text, Null, and_, _clone
-from .selectable import _interpret_as_from, _interpret_as_select, HasPrefixes
+from .selectable import _interpret_as_from, _interpret_as_select, \
+    HasPrefixes, _prefix_cache_key
 from .. import util
 from .. import exc
 
@@ -63,6 +64,33 @@ class UpdateBase(DialectKWArgs, HasPrefixes, Executable, ClauseElement):
             " To set the values for an INSERT or UPDATE statement, use"
             " stmt.values(**parameters).")
 
+    def _update_base_cache_key(self, anon_map, bindparams):
+        if 'dialect_options' in self.__dict__:
+            dialect_kw = tuple(sorted(self.dialect_kwargs.items()))
+        else:
+            dialect_kw = ()
+
+        return_defaults = getattr(self, '_return_defaults', False)
+        if return_defaults not in (True, False):
+            return_defaults = tuple(
+                col._cache_key(anon_map, bindparams)
+                for col in return_defaults)
+
+        return (
+            self.table._cache_key_reference(anon_map, bindparams),
+            tuple(
+                col._cache_key(anon_map, bindparams)
+                for col in self._returning)
+            if self._returning else None,
+            return_defaults,
+            tuple(
+                (f._cache_key_reference(anon_map, bindparams),
+                 dialect_name, hint)
+                for (f, dialect_name), hint in self._hints.items()),
+            _prefix_cache_key(self._prefixes, anon_map, bindparams),
+            dialect_kw
+        )
+
     def bind(self):
         """Return a 'bind' linked to this :class:`.UpdateBase`
         or a :class:`.Table` associated with it.
@@ -186,6 +214,33 @@ class ValuesBase(UpdateBase):
         if prefixes:
             self._setup_prefixes(prefixes)
 
+    def _parameters_cache_key(self, anon_map, bindparams):
+        if not self.parameters:
+            return None
+        elif self._has_multi_parameters:
+            return tuple(
+                self._parameter_set_cache_key(
+                    parameter_set, anon_map, bindparams)
+                for parameter_set in self.parameters
+            )
+        else:
+            return self._parameter_set_cache_key(
+                self.parameters, anon_map, bindparams)
+
+    def _parameter_set_cache_key(self, parameters, anon_map, bindparams):
+        key = []
+        for k, value in parameters.items():
+            if not isinstance(value, ClauseElement):
+                # plain values are converted to bound parameters
+                # by the compiler, and so can't be related to the
+                # parameters of a cached statement.
+                raise NotImplementedError()
+            key.append((
+                getattr(k, 'key', k),
+                value._cache_key(anon_map, bindparams)
+            ))
+        return tuple(sorted(key, key=lambda elem: elem[0]))
+
     @_generative
     def values(self, *args, **kwargs):
         """specify a fixed VALUES clause for an INSERT statement, or the SET
@@ -493,6 +548,19 @@ class Insert(ValuesBase):
         else:
             return ()
 
+    def _cache_key(self, anon_map, bindparams):
+        return (
+            Insert,
+            self._update_base_cache_key(anon_map, bindparams),
+            self._parameters_cache_key(anon_map, bindparams),
+            self.inline,
+            self.select._cache_key(anon_map, bindparams)
+            if self.select is not None else None,
+            tuple(getattr(name, 'key', name) for name in self.select_names)
+            if self.select_names is not None else None,
+            self.include_insert_from_select_defaults
+        )
+
     @_generative
     def from_select(self, names, select, include_defaults=True):
         """Return a new :class:`.Insert` construct which represents
@@ -701,6 +769,16 @@ class Update(ValuesBase):
         self._whereclause = clone(self._whereclause, **kw)
         self.parameters = self.parameters.copy()
 
+    def _cache_key(self, anon_map, bindparams):
+        return (
+            Update,
+            self._update_base_cache_key(anon_map, bindparams),
+            self._parameters_cache_key(anon_map, bindparams),
+            self.inline,
+            self._whereclause._cache_key(anon_map, bindparams)
+            if self._whereclause is not None else None
+        )
+
     @_generative
     def where(self, whereclause):
         """return a new update() construct with the given expression added to
@@ -783,6 +861,14 @@ class Delete(UpdateBase):
         else:
             return ()
 
+    def _cache_key(self, anon_map, bindparams):
+        return (
+            Delete,
+            self._update_base_cache_key(anon_map, bindparams),
+            self._whereclause._cache_key(anon_map, bindparams)
+            if self._whereclause is not None else None
+        )
+
     @_generative
     def where(self, whereclause):
         """Add the given WHERE clause to a newly returned delete construct."""
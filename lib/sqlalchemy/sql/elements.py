@@ -30,6 +30,31 @@ def _clone(element, **kw):
     return element._clone()
 
 
+_anon_ident = re.compile(r'%\((\d+) ')
+
+
+def _cache_key_name(name, anon_map):
+    """Return the cache key representation of an identifier.
+
+    Anonymous names embed the ``id()`` of the object which produced them;
+    these ids are replaced with a counter local to the cache key being
+    generated, so that two structurally identical statements produce the
+    same key while distinct anonymous objects within a single statement
+    remain distinct.
+
+    """
+    quote = getattr(name, 'quote', None)
+    if isinstance(name, _anonymous_label):
+        name = _anon_ident.sub(
+            lambda m: '%%(%d ' % anon_map.setdefault(
+                m.group(1), len(anon_map)),
+            name)
+    if quote is not None:
+        return name, quote
+    else:
+        return name
+
+
 def collate(expression, collation):
     """Return the clause ``expression COLLATE collation``.
 
@@ -375,6 +400,58 @@ class ClauseElement(Visitable):
         """
         return self is other
 
+    def _generate_cache_key(self):
+        """Return a structural cache key for this element, or ``None``.
+
+        The return value is a tuple ``(key, bindparams)``, where ``key``
+        is a hashable value which is the same for any two statements that
+        would compile to the same SQL string and result typing, and
+        ``bindparams`` is the list of :class:`.BindParameter` objects
+        encountered while generating the key, in a deterministic order.
+        Values of bound parameters are **not** part of the key; a
+        :class:`.Compiled` object that was produced for one statement
+        may be used with the bound values of another statement having
+        the same key by relating the two ``bindparams`` lists
+        positionally.
+
+        ``None`` is returned if any element within the structure
+        does not support cache key generation.
+
+        .. versionadded:: 1.0.0
+
+        """
+        bindparams = []
+        try:
+            key = self._cache_key({}, bindparams)
+        except NotImplementedError:
+            return None
+
+        # a key which contains unhashable values, such as a list
+        # given as a literal value, isn't usable as a cache key
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        else:
+            return key, bindparams
+
+    def _cache_key(self, anon_map, bindparams):
+        """Return the cache key for this element.
+
+        Subclasses which support structural caching override this method
+        to return a hashable tuple that includes everything which affects
+        how the element is compiled, excluding the values of bound
+        parameters.  :class:`.BindParameter` objects append themselves to
+        the given ``bindparams`` list; ``anon_map`` is used to produce
+        stable representations of anonymous names.
+
+        The default implementation raises ``NotImplementedError``, which
+        indicates that the enclosing statement can't be cached
+        structurally.
+
+        """
+        raise NotImplementedError()
+
     def _copy_internals(self, clone=_clone, **kw):
         """Reassign internal elements to be clones of themselves.
 
@@ -1176,6 +1253,16 @@ class BindParameter(ColumnElement):
             self.key = _anonymous_label(
                 '%%(%d %s)s' % (id(self), self._orig_key or 'param'))
 
+    def _cache_key(self, anon_map, bindparams):
+        bindparams.append(self)
+        return (
+            BindParameter,
+            _cache_key_name(self.key, anon_map),
+            self.type._static_cache_key,
+            self.required,
+            self.isoutparam
+        )
+
     def compare(self, other, **kw):
         """Compare this :class:`BindParameter` to the given
         clause."""
@@ -1212,6 +1299,9 @@ class TypeClause(ClauseElement):
     def __init__(self, type):
         self.type = type
 
+    def _cache_key(self, anon_map, bindparams):
+        return (TypeClause, self.type._static_cache_key)
+
 
 class TextClause(Executable, ClauseElement):
     """Represent a literal SQL text fragment.
@@ -1601,6 +1691,16 @@ class TextClause(Executable, ClauseElement):
     def get_children(self, **kwargs):
         return list(self._bindparams.values())
 
+    def _cache_key(self, anon_map, bindparams):
+        return (
+            TextClause,
+            self.text,
+            tuple(
+                bind._cache_key(anon_map, bindparams)
+                for key, bind in sorted(self._bindparams.items())
+            )
+        )
+
     def compare(self, other):
         return isinstance(other, TextClause) and other.text == self.text
 
@@ -1628,6 +1728,9 @@ class Null(ColumnElement):
     def compare(self, other):
         return isinstance(other, Null)
 
+    def _cache_key(self, anon_map, bindparams):
+        return (Null, )
+
 
 class False_(ColumnElement):
     """Represent the ``false`` keyword, or equivalent, in a SQL statement.
@@ -1687,6 +1790,9 @@ class False_(ColumnElement):
     def compare(self, other):
         return isinstance(other, False_)
 
+    def _cache_key(self, anon_map, bindparams):
+        return (False_, )
+
 
 class True_(ColumnElement):
     """Represent the ``true`` keyword, or equivalent, in a SQL statement.
@@ -1753,6 +1859,9 @@ class True_(ColumnElement):
     def compare(self, other):
         return isinstance(other, True_)
 
+    def _cache_key(self, anon_map, bindparams):
+        return (True_, )
+
 
 class ClauseList(ClauseElement):
     """Describe a list of clauses, separated by an operator.
@@ -1801,6 +1910,17 @@ class ClauseList(ClauseElement):
     def get_children(self, **kwargs):
         return self.clauses
 
+    def _cache_key(self, anon_map, bindparams):
+        return (
+            self.__visit_name__,
+            self.operator,
+            self.group,
+            tuple(
+                clause._cache_key(anon_map, bindparams)
+                for clause in self.clauses
+            )
+        )
+
     @property
     def _from_objects(self):
         return list(itertools.chain(*[c._from_objects for c in self.clauses]))
@@ -2201,6 +2321,21 @@ class Case(ColumnElement):
         if self.else_ is not None:
             yield self.else_
 
+    def _cache_key(self, anon_map, bindparams):
+        return (
+            Case,
+            self.value._cache_key(anon_map, bindparams)
+            if self.value is not None else None,
+            tuple(
+                (x._cache_key(anon_map, bindparams),
+                 y._cache_key(anon_map, bindparams))
+                for x, y in self.whens
+            ),
+            self.else_._cache_key(anon_map, bindparams)
+            if self.else_ is not None else None,
+            self.type._static_cache_key
+        )
+
     @property
     def _from_objects(self):
         return list(itertools.chain(*[x._from_objects for x in
@@ -2322,6 +2457,13 @@ class Cast(ColumnElement):
     def get_children(self, **kwargs):
         return self.clause, self.typeclause
 
+    def _cache_key(self, anon_map, bindparams):
+        return (
+            Cast,
+            self.clause._cache_key(anon_map, bindparams),
+            self.type._static_cache_key
+        )
+
     @property
     def _from_objects(self):
         return self.clause._from_objects
@@ -2350,6 +2492,13 @@ class Extract(ColumnElement):
     def get_children(self, **kwargs):
         return self.expr,
 
+    def _cache_key(self, anon_map, bindparams):
+        return (
+            Extract,
+            self.field,
+            self.expr._cache_key(anon_map, bindparams)
+        )
+
     @property
     def _from_objects(self):
         return self.expr._from_objects
@@ -2375,6 +2524,12 @@ class _label_reference(ColumnElement):
     def _copy_internals(self, clone=_clone, **kw):
         self.element = clone(self.element, **kw)
 
+    def _cache_key(self, anon_map, bindparams):
+        return (
+            _label_reference,
+            self.element._cache_key(anon_map, bindparams)
+        )
+
     @property
     def _from_objects(self):
         return ()
@@ -2390,6 +2545,9 @@ class _textual_label_reference(ColumnElement):
     def _text_clause(self):
         return TextClause._create_text(self.element)
 
+    def _cache_key(self, anon_map, bindparams):
+        return (_textual_label_reference, self.element)
+
 
 class UnaryExpression(ColumnElement):
     """Define a 'unary' expression.
@@ -2630,6 +2788,15 @@ class UnaryExpression(ColumnElement):
     def get_children(self, **kwargs):
         return self.element,
 
+    def _cache_key(self, anon_map, bindparams):
+        return (
+            UnaryExpression,
+            self.operator,
+            self.modifier,
+            self.element._cache_key(anon_map, bindparams),
+            self.type._static_cache_key
+        )
+
     def compare(self, other, **kw):
         """Compare this :class:`UnaryExpression` against the given
         :class:`.ClauseElement`."""
@@ -2732,6 +2899,16 @@ class BinaryExpression(ColumnElement):
     def get_children(self, **kwargs):
         return self.left, self.right
 
+    def _cache_key(self, anon_map, bindparams):
+        return (
+            BinaryExpression,
+            self.operator,
+            self.left._cache_key(anon_map, bindparams),
+            self.right._cache_key(anon_map, bindparams),
+            tuple(sorted(self.modifiers.items())),
+            self.type._static_cache_key
+        )
+
     def compare(self, other, **kw):
         """Compare this :class:`BinaryExpression` against the
         given :class:`BinaryExpression`."""
@@ -2802,6 +2979,13 @@ class Grouping(ColumnElement):
     def __getattr__(self, attr):
         return getattr(self.element, attr)
 
+    def _cache_key(self, anon_map, bindparams):
+        return (
+            Grouping,
+            self.element._cache_key(anon_map, bindparams),
+            self.type._static_cache_key
+        )
+
     def __getstate__(self):
         return {'element': self.element, 'type': self.type}
 
@@ -2876,6 +3060,12 @@ class Over(ColumnElement):
                 (self.func, self.partition_by, self.order_by)
                 if c is not None]
 
+    def _cache_key(self, anon_map, bindparams):
+        return (Over,) + tuple(
+            c._cache_key(anon_map, bindparams) if c is not None else None
+            for c in (self.func, self.partition_by, self.order_by)
+        )
+
     def _copy_internals(self, clone=_clone, **kw):
         self.func = clone(self.func, **kw)
         if self.partition_by is not None:
@@ -2993,6 +3183,12 @@ class FunctionFilter(ColumnElement):
                 (self.func, self.criterion)
                 if c is not None]
 
+    def _cache_key(self, anon_map, bindparams):
+        return (FunctionFilter,) + tuple(
+            c._cache_key(anon_map, bindparams) if c is not None else None
+            for c in (self.func, self.criterion)
+        )
+
     def _copy_internals(self, clone=_clone, **kw):
         self.func = clone(self.func, **kw)
         if self.criterion is not None:
@@ -3090,6 +3286,17 @@ class Label(ColumnElement):
     def get_children(self, **kwargs):
         return self.element,
 
+    def _cache_key(self, anon_map, bindparams):
+        resolve_label = self.__dict__.get('_resolve_label')
+        return (
+            Label,
+            _cache_key_name(self.name, anon_map),
+            _cache_key_name(resolve_label, anon_map)
+            if resolve_label is not None else None,
+            self._element._cache_key(anon_map, bindparams),
+            self.type._static_cache_key
+        )
+
     def _copy_internals(self, clone=_clone, anonymize_labels=False, **kw):
         self.element = clone(self.element, **kw)
         self.__dict__.pop('_allow_label_resolve', None)
@@ -3256,6 +3463,17 @@ class ColumnClause(Immutable, ColumnElement):
         else:
             return other.proxy_set.intersection(self.proxy_set)
 
+    def _cache_key(self, anon_map, bindparams):
+        table = self.table
+        return (
+            ColumnClause,
+            _cache_key_name(self.name, anon_map),
+            self.is_literal,
+            table._cache_key_reference(anon_map, bindparams)
+            if table is not None else None,
+            self.type._static_cache_key
+        )
+
     def _get_table(self):
         return self.__dict__['table']
 
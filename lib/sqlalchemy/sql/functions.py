@@ -152,6 +152,15 @@ class FunctionElement(Executable, ColumnElement, FromClause):
     def get_children(self, **kwargs):
         return self.clause_expr,
 
+    def _cache_key(self, anon_map, bindparams):
+        return (
+            self._constructor,
+            getattr(self, 'name', None),
+            tuple(getattr(self, 'packagenames', ())),
+            self.clause_expr._cache_key(anon_map, bindparams),
+            self.type._static_cache_key
+        )
+
     def _copy_internals(self, clone=_clone, **kw):
         self.clause_expr = clone(self.clause_expr, **kw)
         self._reset_exported()
@@ -514,6 +523,9 @@ class next_value(GenericFunction):
         self._bind = kw.get('bind', None)
         self.sequence = seq
 
+    def _cache_key(self, anon_map, bindparams):
+        return (next_value, self.sequence)
+
     @property
     def _from_objects(self):
         return []
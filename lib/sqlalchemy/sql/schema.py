@@ -463,6 +463,7 @@ class Table(DialectKWArgs, SchemaItem, TableClause):
         # this argument is only used with _init_existing()
         kwargs.pop('autoload_replace', True)
         include_columns = kwargs.pop('include_columns', None)
+        _reflect_inspector = kwargs.pop('_reflect_inspector', None)
 
         self.implicit_returning = kwargs.pop('implicit_returning', True)
 
@@ -481,16 +482,23 @@ class Table(DialectKWArgs, SchemaItem, TableClause):
         # we do it after the table is in the singleton dictionary to support
         # circular foreign keys
         if autoload:
-            self._autoload(metadata, autoload_with, include_columns)
+            self._autoload(metadata, autoload_with, include_columns,
+                           _reflect_inspector=_reflect_inspector)
 
         # initialize all the column, etc. objects.  done after reflection to
         # allow user-overrides
         self._init_items(*args)
 
     def _autoload(self, metadata, autoload_with, include_columns,
-                  exclude_columns=()):
-
-        if autoload_with:
+                  exclude_columns=(), _reflect_inspector=None):
+
+        if _reflect_inspector is not None:
+            # an Inspector shared among a series of reflections, e.g.
+            # from MetaData.reflect(), so that its info_cache may be
+            # populated up front for many tables at once
+            _reflect_inspector.reflecttable(
+                self, include_columns, exclude_columns)
+        elif autoload_with:
             autoload_with.run_callable(
                 autoload_with.dialect.reflecttable,
                 self, include_columns, exclude_columns
@@ -533,6 +541,7 @@ class Table(DialectKWArgs, SchemaItem, TableClause):
         autoload_with = kwargs.pop('autoload_with', None)
         autoload = kwargs.pop('autoload', autoload_with is not None)
         autoload_replace = kwargs.pop('autoload_replace', True)
+        _reflect_inspector = kwargs.pop('_reflect_inspector', None)
         schema = kwargs.pop('schema', None)
         if schema and schema != self.schema:
             raise exc.ArgumentError(
@@ -561,7 +570,8 @@ class Table(DialectKWArgs, SchemaItem, TableClause):
                 exclude_columns = ()
             self._autoload(
                 self.metadata, autoload_with,
-                include_columns, exclude_columns)
+                include_columns, exclude_columns,
+                _reflect_inspector=_reflect_inspector)
 
         self._extra_kwargs(**kwargs)
         self._init_items(*args)
@@ -3427,6 +3437,7 @@ class MetaData(SchemaItem):
     def reflect(self, bind=None, schema=None, views=False, only=None,
                 extend_existing=False,
                 autoload_replace=True,
+                reflection_cache=None,
                 **dialect_kwargs):
         """Load all available table definitions from the database.
 
@@ -3472,6 +3483,15 @@ class MetaData(SchemaItem):
 
           .. versionadded:: 0.9.1
 
+        :param reflection_cache: Optional :class:`.ReflectionCache`, such
+          as a :class:`.FileReflectionCache`.  If the cache holds
+          information about the schema that is still current, as
+          determined by comparing the schema's fingerprint, the tables
+          are reflected from it without querying the database's catalog;
+          otherwise, the cache is updated with the information reflected.
+
+          .. versionadded:: 1.0.0
+
         :param \**dialect_kwargs: Additional keyword arguments not mentioned
          above are dialect specific, and passed in the form
          ``<dialectname>_<argname>``.  See the documentation regarding an
@@ -3504,12 +3524,20 @@ class MetaData(SchemaItem):
             if schema is not None:
                 reflect_opts['schema'] = schema
 
-            available = util.OrderedSet(
-                bind.engine.table_names(schema, connection=conn))
+            # a single Inspector is used for all tables, including those
+            # reflected on behalf of foreign keys, so that its info_cache
+            # may be populated up front, either from the
+            # reflection_cache or by fetching columns, constraints and
+            # indexes for all tables at once
+            reflect_opts['_reflect_inspector'] = insp = \
+                inspection.inspect(conn)
+            if reflection_cache is not None:
+                fingerprint = reflection_cache.load(insp, schema)
+                loaded = len(insp.info_cache)
+
+            available = util.OrderedSet(insp.get_table_names(schema))
             if views:
-                available.update(
-                    bind.dialect.get_view_names(conn, schema)
-                )
+                available.update(insp.get_view_names(schema))
 
             if schema is not None:
                 available_w_schema = util.OrderedSet(["%s.%s" % (schema, name)
@@ -3539,9 +3567,16 @@ class MetaData(SchemaItem):
                 load = [name for name in only if extend_existing or
                         name not in current]
 
+            if load:
+                insp._prefetch_tables(schema, load, **dialect_kwargs)
+
             for name in load:
                 Table(name, self, **reflect_opts)
 
+            if reflection_cache is not None and \
+                    len(insp.info_cache) != loaded:
+                reflection_cache.save(insp, fingerprint, schema)
+
     def append_ddl_listener(self, event_name, listener):
         """Append a DDL event listener to this ``MetaData``.
 
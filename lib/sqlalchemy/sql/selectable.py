@@ -16,7 +16,7 @@ from .elements import _clone, \
     _literal_as_text, _interpret_as_column_or_from, _expand_cloned,\
     _select_iterables, _anonymous_label, _clause_element_as_expr,\
     _cloned_intersection, _cloned_difference, True_, \
-    _literal_as_label_reference
+    _literal_as_label_reference, _cache_key_name
 from .base import Immutable, Executable, _generative, \
     ColumnCollection, ColumnSet, _from_objects, Generative
 from . import type_api
@@ -160,6 +160,13 @@ def alias(selectable, name=None, flat=False):
     return selectable.alias(name=name, flat=flat)
 
 
+def _prefix_cache_key(prefixes, anon_map, bindparams):
+    return tuple(
+        (clause._cache_key(anon_map, bindparams), dialect_name)
+        for clause, dialect_name in prefixes
+    )
+
+
 class Selectable(ClauseElement):
     """mark a class as being selectable"""
     __visit_name__ = 'selectable'
@@ -285,6 +292,40 @@ class FromClause(Selectable):
 
     _memoized_property = util.group_expirable_memoized_property(["_columns"])
 
+    def _cache_key_reference(self, anon_map, bindparams):
+        """Return the cache key for this FROM clause as referenced from
+        a column or from the FROM list of an enclosing statement.
+
+        The full key is generated the first time a particular FROM clause
+        is encountered within a single cache key generation; subsequent
+        references are keyed on the order in which the FROM was first seen.
+
+        A FROM clause which is a clone of, or shares a cloned ancestor
+        with, a FROM clause seen earlier also refers to that FROM in its
+        key, as clones are considered to be the same FROM when
+        correlating and when hiding the FROM clauses within a join.
+
+        """
+        ident = ('from', id(self))
+        if ident in anon_map:
+            return ('fromref', anon_map[ident])
+        anon_map[ident] = idx = len(anon_map)
+
+        cloned_from = None
+        for elem in self._cloned_set:
+            lineage = ('lineage', id(elem))
+            if lineage in anon_map:
+                if cloned_from is None or anon_map[lineage] < cloned_from:
+                    cloned_from = anon_map[lineage]
+            else:
+                anon_map[lineage] = idx
+
+        key = self._cache_key(anon_map, bindparams)
+        if cloned_from is not None:
+            return ('fromclone', cloned_from, key)
+        else:
+            return key
+
     @util.dependencies("sqlalchemy.sql.functions")
     def count(self, functions, whereclause=None, **params):
         """return a SELECT COUNT generated against this
@@ -782,6 +823,15 @@ class Join(FromClause):
     def get_children(self, **kwargs):
         return self.left, self.right, self.onclause
 
+    def _cache_key(self, anon_map, bindparams):
+        return (
+            Join,
+            self.left._cache_key_reference(anon_map, bindparams),
+            self.right._cache_key_reference(anon_map, bindparams),
+            self.onclause._cache_key(anon_map, bindparams),
+            self.isouter
+        )
+
     def _match_primaries(self, left, right):
         if isinstance(left, Join):
             left_right = left.right
@@ -1152,6 +1202,13 @@ class Alias(FromClause):
                 yield c
         yield self.element
 
+    def _cache_key(self, anon_map, bindparams):
+        return (
+            Alias,
+            _cache_key_name(self.name, anon_map),
+            self.element._cache_key_reference(anon_map, bindparams)
+        )
+
     @property
     def _from_objects(self):
         return [self]
@@ -1213,6 +1270,21 @@ class CTE(Generative, HasSuffixes, Alias):
             _suffixes=self._suffixes
         )
 
+    def _cache_key(self, anon_map, bindparams):
+        if self._restates:
+            # relationships between restated CTEs are resolved by
+            # identity within the compiler
+            raise NotImplementedError()
+        return (
+            CTE,
+            _cache_key_name(self.name, anon_map),
+            self.recursive,
+            self.element._cache_key_reference(anon_map, bindparams),
+            self._cte_alias._cache_key_reference(anon_map, bindparams)
+            if self._cte_alias is not None else None,
+            _prefix_cache_key(self._suffixes, anon_map, bindparams)
+        )
+
 
 class FromGrouping(FromClause):
     """Represent a grouping of a FROM clause"""
@@ -1259,6 +1331,12 @@ class FromGrouping(FromClause):
     def __getattr__(self, attr):
         return getattr(self.element, attr)
 
+    def _cache_key(self, anon_map, bindparams):
+        return (
+            FromGrouping,
+            self.element._cache_key_reference(anon_map, bindparams)
+        )
+
     def __getstate__(self):
         return {'element': self.element}
 
@@ -1352,6 +1430,11 @@ class TableClause(Immutable, FromClause):
         else:
             return []
 
+    def _cache_key(self, anon_map, bindparams):
+        # tables are keyed on identity; result rows are matched to
+        # the columns of the table which was originally compiled
+        return (TableClause, self)
+
     @util.dependencies("sqlalchemy.sql.functions")
     def count(self, functions, whereclause=None, **params):
         """return a SELECT COUNT generated against this
@@ -1473,6 +1556,15 @@ class ForUpdateArg(ClauseElement):
         if self.of is not None:
             self.of = [clone(col, **kw) for col in self.of]
 
+    def _cache_key(self, anon_map, bindparams):
+        return (
+            ForUpdateArg,
+            self.nowait,
+            self.read,
+            tuple(elem._cache_key(anon_map, bindparams) for elem in self.of)
+            if self.of is not None else None
+        )
+
     def __init__(self, nowait=False, read=False, of=None):
         """Represents arguments specified to :meth:`.Select.for_update`.
 
@@ -1935,6 +2027,24 @@ class GenerativeSelect(SelectBase):
     def _label_resolve_dict(self):
         raise NotImplementedError()
 
+    def _generative_cache_key(self, anon_map, bindparams):
+        # LIMIT / OFFSET integer values are part of the key, as
+        # several dialects render them inline rather than as
+        # bound parameters
+        return (
+            self.use_labels,
+            self._order_by_clause._cache_key(anon_map, bindparams),
+            self._group_by_clause._cache_key(anon_map, bindparams),
+            self._limit_clause._cache_key(anon_map, bindparams)
+            if self._limit_clause is not None else None,
+            self._limit if self._simple_int_limit else None,
+            self._offset_clause._cache_key(anon_map, bindparams)
+            if self._offset_clause is not None else None,
+            self._offset if self._simple_int_offset else None,
+            self._for_update_arg._cache_key(anon_map, bindparams)
+            if self._for_update_arg is not None else None
+        )
+
     def _copy_internals(self, clone=_clone, **kw):
         if self._limit_clause is not None:
             self._limit_clause = clone(self._limit_clause, **kw)
@@ -2182,6 +2292,14 @@ class CompoundSelect(GenerativeSelect):
             + [self._order_by_clause, self._group_by_clause] \
             + list(self.selects)
 
+    def _cache_key(self, anon_map, bindparams):
+        return (
+            CompoundSelect,
+            self.keyword,
+            tuple(s._cache_key(anon_map, bindparams) for s in self.selects),
+            self._generative_cache_key(anon_map, bindparams)
+        )
+
     def bind(self):
         if self._bind:
             return self._bind
@@ -2748,6 +2866,46 @@ class Select(HasPrefixes, HasSuffixes, GenerativeSelect):
                     self._order_by_clause, self._group_by_clause)
              if x is not None]
 
+    def _cache_key(self, anon_map, bindparams):
+        distinct = self._distinct
+        if isinstance(distinct, list):
+            distinct = tuple(
+                expr._cache_key(anon_map, bindparams) for expr in distinct)
+
+        correlate_except = self._correlate_except
+        if correlate_except is not None:
+            correlate_except = tuple(
+                f._cache_key_reference(anon_map, bindparams)
+                for f in correlate_except)
+
+        return (
+            Select,
+            tuple(
+                c._cache_key(anon_map, bindparams)
+                for c in self._raw_columns),
+            tuple(
+                f._cache_key_reference(anon_map, bindparams)
+                for f in self._from_obj),
+            self._whereclause._cache_key(anon_map, bindparams)
+            if self._whereclause is not None else None,
+            self._having._cache_key(anon_map, bindparams)
+            if self._having is not None else None,
+            distinct,
+            tuple(
+                f._cache_key_reference(anon_map, bindparams)
+                for f in self._correlate),
+            correlate_except,
+            self._auto_correlate,
+            tuple(
+                (f._cache_key_reference(anon_map, bindparams),
+                 dialect_name, hint)
+                for (f, dialect_name), hint in self._hints.items()),
+            self._statement_hints,
+            _prefix_cache_key(self._prefixes, anon_map, bindparams),
+            _prefix_cache_key(self._suffixes, anon_map, bindparams),
+            self._generative_cache_key(anon_map, bindparams)
+        )
+
     @_generative
     def column(self, column):
         """return a new select() construct with the given column expression
@@ -3424,6 +3582,14 @@ class TextAsFrom(SelectBase):
     def _scalar_type(self):
         return self.column_args[0].type
 
+    def _cache_key(self, anon_map, bindparams):
+        return (
+            TextAsFrom,
+            self.element._cache_key(anon_map, bindparams),
+            tuple(c._cache_key(anon_map, bindparams)
+                  for c in self.column_args)
+        )
+
 
 class AnnotatedFromClause(Annotated):
     def __init__(self, element, values):
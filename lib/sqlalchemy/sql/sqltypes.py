@@ -88,6 +88,8 @@ class String(Concatenable, TypeEngine):
     """
 
     __visit_name__ = 'string'
+    _cache_key_attrs = ('length', 'collation', 'convert_unicode',
+                        'unicode_error', '_warn_on_bytestring')
 
     def __init__(self, length=None, collation=None,
                  convert_unicode=False,
@@ -187,19 +189,21 @@ class String(Concatenable, TypeEngine):
                     return process
                 else:
                     return None
-            else:
+            elif self._warn_on_bytestring:
                 encoder = codecs.getencoder(dialect.encoding)
-                warn_on_bytestring = self._warn_on_bytestring
 
                 def process(value):
                     if isinstance(value, util.text_type):
                         return encoder(value, self.unicode_error)[0]
-                    elif warn_on_bytestring and value is not None:
+                    elif value is not None:
                         util.warn_limited(
                             "Unicode type received non-unicode bind "
                             "param value %r.",
                             (util.ellipses_string(value),))
                     return value
+            else:
+                return processors.unicode_bind_processor_factory(
+                    dialect.encoding, self.unicode_error)
             return process
         else:
             return None
@@ -250,6 +254,8 @@ class Text(String):
 
     """
     __visit_name__ = 'text'
+    _cache_key_attrs = ('length', 'collation', 'convert_unicode',
+                        'unicode_error', '_warn_on_bytestring')
 
 
 class Unicode(String):
@@ -309,6 +315,8 @@ class Unicode(String):
     """
 
     __visit_name__ = 'unicode'
+    _cache_key_attrs = ('length', 'collation', 'convert_unicode',
+                        'unicode_error', '_warn_on_bytestring')
 
     def __init__(self, length=None, **kwargs):
         """
@@ -338,6 +346,8 @@ class UnicodeText(Text):
     """
 
     __visit_name__ = 'unicode_text'
+    _cache_key_attrs = ('length', 'collation', 'convert_unicode',
+                        'unicode_error', '_warn_on_bytestring')
 
     def __init__(self, length=None, **kwargs):
         """
@@ -358,6 +368,7 @@ class Integer(_DateAffinity, TypeEngine):
     """A type for ``int`` integers."""
 
     __visit_name__ = 'integer'
+    _cache_key_attrs = ()
 
     def get_dbapi_type(self, dbapi):
         return dbapi.NUMBER
@@ -411,6 +422,7 @@ class SmallInteger(Integer):
     """
 
     __visit_name__ = 'small_integer'
+    _cache_key_attrs = ()
 
 
 class BigInteger(Integer):
@@ -423,6 +435,7 @@ class BigInteger(Integer):
     """
 
     __visit_name__ = 'big_integer'
+    _cache_key_attrs = ()
 
 
 class Numeric(_DateAffinity, TypeEngine):
@@ -466,6 +479,8 @@ class Numeric(_DateAffinity, TypeEngine):
     """
 
     __visit_name__ = 'numeric'
+    _cache_key_attrs = ('precision', 'scale', 'decimal_return_scale',
+                        'asdecimal')
 
     _default_decimal_return_scale = 10
 
@@ -624,6 +639,8 @@ class Float(Numeric):
     """
 
     __visit_name__ = 'float'
+    _cache_key_attrs = ('precision', 'scale', 'decimal_return_scale',
+                        'asdecimal')
 
     scale = None
 
@@ -707,6 +724,7 @@ class DateTime(_DateAffinity, TypeEngine):
     """
 
     __visit_name__ = 'datetime'
+    _cache_key_attrs = ('timezone',)
 
     def __init__(self, timezone=False):
         """Construct a new :class:`.DateTime`.
@@ -744,6 +762,7 @@ class Date(_DateAffinity, TypeEngine):
     """A type for ``datetime.date()`` objects."""
 
     __visit_name__ = 'date'
+    _cache_key_attrs = ()
 
     def get_dbapi_type(self, dbapi):
         return dbapi.DATETIME
@@ -782,6 +801,7 @@ class Time(_DateAffinity, TypeEngine):
     """A type for ``datetime.time()`` objects."""
 
     __visit_name__ = 'time'
+    _cache_key_attrs = ('timezone',)
 
     def __init__(self, timezone=False):
         self.timezone = timezone
@@ -886,6 +906,7 @@ class LargeBinary(_Binary):
     """
 
     __visit_name__ = 'large_binary'
+    _cache_key_attrs = ('length',)
 
     def __init__(self, length=None):
         """
@@ -908,6 +929,8 @@ class Binary(LargeBinary):
 
     """Deprecated.  Renamed to LargeBinary."""
 
+    _cache_key_attrs = ('length',)
+
     def __init__(self, *arg, **kw):
         util.warn_deprecated('The Binary type has been renamed to '
                              'LargeBinary.')
@@ -1275,6 +1298,7 @@ class Boolean(TypeEngine, SchemaType):
     """
 
     __visit_name__ = 'boolean'
+    _cache_key_attrs = ('create_constraint', 'name')
 
     def __init__(self, create_constraint=True, name=None):
         """Construct a Boolean.
@@ -1461,6 +1485,8 @@ class REAL(Float):
     """The SQL REAL type."""
 
     __visit_name__ = 'REAL'
+    _cache_key_attrs = ('precision', 'scale', 'decimal_return_scale',
+                        'asdecimal')
 
 
 class FLOAT(Float):
@@ -1468,6 +1494,8 @@ class FLOAT(Float):
     """The SQL FLOAT type."""
 
     __visit_name__ = 'FLOAT'
+    _cache_key_attrs = ('precision', 'scale', 'decimal_return_scale',
+                        'asdecimal')
 
 
 class NUMERIC(Numeric):
@@ -1475,6 +1503,8 @@ class NUMERIC(Numeric):
     """The SQL NUMERIC type."""
 
     __visit_name__ = 'NUMERIC'
+    _cache_key_attrs = ('precision', 'scale', 'decimal_return_scale',
+                        'asdecimal')
 
 
 class DECIMAL(Numeric):
@@ -1482,6 +1512,8 @@ class DECIMAL(Numeric):
     """The SQL DECIMAL type."""
 
     __visit_name__ = 'DECIMAL'
+    _cache_key_attrs = ('precision', 'scale', 'decimal_return_scale',
+                        'asdecimal')
 
 
 class INTEGER(Integer):
@@ -1489,6 +1521,7 @@ class INTEGER(Integer):
     """The SQL INT or INTEGER type."""
 
     __visit_name__ = 'INTEGER'
+    _cache_key_attrs = ()
 INT = INTEGER
 
 
@@ -1497,6 +1530,7 @@ class SMALLINT(SmallInteger):
     """The SQL SMALLINT type."""
 
     __visit_name__ = 'SMALLINT'
+    _cache_key_attrs = ()
 
 
 class BIGINT(BigInteger):
@@ -1504,6 +1538,7 @@ class BIGINT(BigInteger):
     """The SQL BIGINT type."""
 
     __visit_name__ = 'BIGINT'
+    _cache_key_attrs = ()
 
 
 class TIMESTAMP(DateTime):
@@ -1511,6 +1546,7 @@ class TIMESTAMP(DateTime):
     """The SQL TIMESTAMP type."""
 
     __visit_name__ = 'TIMESTAMP'
+    _cache_key_attrs = ('timezone',)
 
     def get_dbapi_type(self, dbapi):
         return dbapi.TIMESTAMP
@@ -1521,6 +1557,7 @@ class DATETIME(DateTime):
     """The SQL DATETIME type."""
 
     __visit_name__ = 'DATETIME'
+    _cache_key_attrs = ('timezone',)
 
 
 class DATE(Date):
@@ -1528,6 +1565,7 @@ class DATE(Date):
     """The SQL DATE type."""
 
     __visit_name__ = 'DATE'
+    _cache_key_attrs = ()
 
 
 class TIME(Time):
@@ -1535,6 +1573,7 @@ class TIME(Time):
     """The SQL TIME type."""
 
     __visit_name__ = 'TIME'
+    _cache_key_attrs = ('timezone',)
 
 
 class TEXT(Text):
@@ -1542,6 +1581,8 @@ class TEXT(Text):
     """The SQL TEXT type."""
 
     __visit_name__ = 'TEXT'
+    _cache_key_attrs = ('length', 'collation', 'convert_unicode',
+                        'unicode_error', '_warn_on_bytestring')
 
 
 class CLOB(Text):
@@ -1552,6 +1593,8 @@ class CLOB(Text):
     """
 
     __visit_name__ = 'CLOB'
+    _cache_key_attrs = ('length', 'collation', 'convert_unicode',
+                        'unicode_error', '_warn_on_bytestring')
 
 
 class VARCHAR(String):
@@ -1559,6 +1602,8 @@ class VARCHAR(String):
     """The SQL VARCHAR type."""
 
     __visit_name__ = 'VARCHAR'
+    _cache_key_attrs = ('length', 'collation', 'convert_unicode',
+                        'unicode_error', '_warn_on_bytestring')
 
 
 class NVARCHAR(Unicode):
@@ -1566,6 +1611,8 @@ class NVARCHAR(Unicode):
     """The SQL NVARCHAR type."""
 
     __visit_name__ = 'NVARCHAR'
+    _cache_key_attrs = ('length', 'collation', 'convert_unicode',
+                        'unicode_error', '_warn_on_bytestring')
 
 
 class CHAR(String):
@@ -1573,6 +1620,8 @@ class CHAR(String):
     """The SQL CHAR type."""
 
     __visit_name__ = 'CHAR'
+    _cache_key_attrs = ('length', 'collation', 'convert_unicode',
+                        'unicode_error', '_warn_on_bytestring')
 
 
 class NCHAR(Unicode):
@@ -1580,6 +1629,8 @@ class NCHAR(Unicode):
     """The SQL NCHAR type."""
 
     __visit_name__ = 'NCHAR'
+    _cache_key_attrs = ('length', 'collation', 'convert_unicode',
+                        'unicode_error', '_warn_on_bytestring')
 
 
 class BLOB(LargeBinary):
@@ -1587,6 +1638,7 @@ class BLOB(LargeBinary):
     """The SQL BLOB type."""
 
     __visit_name__ = 'BLOB'
+    _cache_key_attrs = ('length',)
 
 
 class BINARY(_Binary):
@@ -1594,6 +1646,7 @@ class BINARY(_Binary):
     """The SQL BINARY type."""
 
     __visit_name__ = 'BINARY'
+    _cache_key_attrs = ('length',)
 
 
 class VARBINARY(_Binary):
@@ -1601,6 +1654,7 @@ class VARBINARY(_Binary):
     """The SQL VARBINARY type."""
 
     __visit_name__ = 'VARBINARY'
+    _cache_key_attrs = ('length',)
 
 
 class BOOLEAN(Boolean):
@@ -1608,6 +1662,7 @@ class BOOLEAN(Boolean):
     """The SQL BOOLEAN type."""
 
     __visit_name__ = 'BOOLEAN'
+    _cache_key_attrs = ('create_constraint', 'name')
 
 
 class NullType(TypeEngine):
@@ -1635,6 +1690,7 @@ class NullType(TypeEngine):
 
     """
     __visit_name__ = 'null'
+    _cache_key_attrs = ()
 
     _isnull = True
 
@@ -1669,6 +1725,8 @@ class MatchType(Boolean):
 
     """
 
+    _cache_key_attrs = ('create_constraint', 'name')
+
 NULLTYPE = NullType()
 BOOLEANTYPE = Boolean()
 STRINGTYPE = String()
@@ -323,6 +323,42 @@ class TypeEngine(Visitable):
         else:
             return self.__class__
 
+    _cache_key_attrs = None
+    """The names of the attributes which, along with the class, determine
+    how this type renders and processes values.
+
+    The attribute is only consulted on the class which defines it
+    directly, as a subclass may add state of its own; a type class which
+    doesn't declare it is keyed on the identity of the type object.
+
+    """
+
+    @property
+    def _static_cache_key(self):
+        """Return a hashable value representing the configuration of
+        this type, for use within the structural cache key of a SQL
+        expression.
+
+        Two types of the same class which declares ``_cache_key_attrs``
+        produce equal keys when those attributes are equal.  Otherwise,
+        including when an attribute value can't be hashed, the type
+        object itself is returned, so that it is keyed on identity.
+
+        """
+        attrs = self.__class__.__dict__.get('_cache_key_attrs')
+        if attrs is None:
+            return self
+        key = (self.__class__, ) + tuple(
+            (name, _static_cache_key_value(getattr(self, name)))
+            for name in attrs
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return self
+        else:
+            return key
+
     def dialect_impl(self, dialect):
         """Return a dialect-specific implementation for this
         :class:`.TypeEngine`.
@@ -514,6 +550,12 @@ class UserDefinedType(util.with_metaclass(VisitableCheckKWArg, TypeEngine)):
 
     ensure_kwarg = 'get_col_spec'
 
+    @property
+    def _static_cache_key(self):
+        # behavior here is defined by arbitrary user code and
+        # state; always key on identity
+        return self
+
     class Comparator(TypeEngine.Comparator):
         __slots__ = ()
 
@@ -633,6 +675,12 @@ class TypeDecorator(TypeEngine):
 
     __visit_name__ = "type_decorator"
 
+    @property
+    def _static_cache_key(self):
+        # behavior here is defined by arbitrary user code and
+        # state; always key on identity
+        return self
+
     def __init__(self, *args, **kwargs):
         """Construct a :class:`.TypeDecorator`.
 
@@ -1107,6 +1155,19 @@ def _reconstitute_comparator(expression):
     return expression.comparator
 
 
+def _static_cache_key_value(value):
+    if isinstance(value, TypeEngine):
+        return value._static_cache_key
+    elif isinstance(value, list):
+        return tuple(_static_cache_key_value(elem) for elem in value)
+    elif isinstance(value, dict):
+        return tuple(
+            (k, _static_cache_key_value(v))
+            for k, v in sorted(value.items()))
+    else:
+        return value
+
+
 def to_instance(typeobj, *arg, **kw):
     if typeobj is None:
         return NULLTYPE
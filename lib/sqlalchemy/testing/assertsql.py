@@ -80,7 +80,7 @@ class CompiledSQL(SQLMatchRule):
                 context.compiled.statement.compile(dialect=compare_dialect)
         else:
             compiled = (
-                context.compiled.statement.compile(
+                context.invoked_statement.compile(
                     dialect=compare_dialect,
                     column_keys=context.compiled.column_keys,
                     inline=context.compiled.inline)
@@ -182,6 +182,16 @@ class SuiteRequirements(Requirements):
 
         return exclusions.open()
 
+    @property
+    def server_side_cursors(self):
+        """Target dialect honors the "stream_results" execution option
+        using a cursor which doesn't buffer the full result."""
+
+        return exclusions.only_if(
+            lambda config: config.db.dialect.supports_server_side_cursors,
+            "%(database)s %(does_support)s 'server side cursors'"
+        )
+
     @property
     def returning(self):
         """target platform supports RETURNING."""
@@ -608,6 +608,78 @@ class ComponentReflectionTest(fixtures.TablesTest):
     def test_get_table_oid_with_schema(self):
         self._test_get_table_oid('users', schema=testing.config.test_schema)
 
+    def _normalize_reflected(self, value):
+        # TypeEngine objects don't compare by value; lists are ordered
+        # by name, as the order of indexes and constraints is not
+        # significant
+        if isinstance(value, dict):
+            return dict(
+                (k, repr(v) if k == 'type'
+                 else self._normalize_reflected(v))
+                for k, v in value.items())
+        elif isinstance(value, list):
+            return sorted(
+                (self._normalize_reflected(v) for v in value),
+                key=lambda v: str(v.get('name'))
+                if isinstance(v, dict) else v)
+        else:
+            return value
+
+    def _test_get_multi(self, kind, schema=None):
+        insp = inspect(testing.db)
+        table_names = insp.get_table_names(schema)
+        multi = getattr(insp, 'get_multi_%s' % kind)(schema)
+        eq_(sorted(multi), sorted(table_names))
+
+        # a subset of tables; the results are also cached per-table
+        subset = getattr(insp, 'get_multi_%s' % kind)(
+            schema, table_names=['users', 'dingalings'])
+        eq_(sorted(subset), ['dingalings', 'users'])
+
+        single_insp = inspect(testing.db)
+        for name in table_names:
+            single = getattr(single_insp, 'get_%s' % kind)(name, schema)
+            eq_(
+                self._normalize_reflected(multi[name]),
+                self._normalize_reflected(single)
+            )
+            eq_(
+                self._normalize_reflected(
+                    getattr(insp, 'get_%s' % kind)(name, schema)),
+                self._normalize_reflected(single)
+            )
+
+    @testing.requires.table_reflection
+    def test_get_multi_columns(self):
+        self._test_get_multi('columns')
+
+    @testing.requires.primary_key_constraint_reflection
+    def test_get_multi_pk_constraint(self):
+        self._test_get_multi('pk_constraint')
+
+    @testing.requires.foreign_key_constraint_reflection
+    def test_get_multi_foreign_keys(self):
+        self._test_get_multi('foreign_keys')
+
+    @testing.requires.index_reflection
+    def test_get_multi_indexes(self):
+        self._test_get_multi('indexes')
+
+    @testing.requires.unique_constraint_reflection
+    def test_get_multi_unique_constraints(self):
+        self._test_get_multi('unique_constraints')
+
+    @testing.requires.table_reflection
+    @testing.requires.schemas
+    def test_get_multi_columns_with_schema(self):
+        self._test_get_multi('columns', schema=testing.config.test_schema)
+
+    @testing.requires.foreign_key_constraint_reflection
+    @testing.requires.schemas
+    def test_get_multi_foreign_keys_with_schema(self):
+        self._test_get_multi(
+            'foreign_keys', schema=testing.config.test_schema)
+
     @testing.requires.table_reflection
     @testing.provide_metadata
     def test_autoincrement_col(self):
@@ -865,6 +865,14 @@ class LRUCache(dict):
         item[2] = self._inc_counter()
         return item[1]
 
+    def get(self, key, default=None):
+        item = dict.get(self, key, default)
+        if item is not default:
+            item[2] = self._inc_counter()
+            return item[1]
+        else:
+            return default
+
     def values(self):
         return [i[1] for i in dict.values(self)]
 
@@ -21,12 +21,26 @@ def sort_as_subsets(tuples, allitems):
 
     todo = set(allitems)
 
-    while todo:
-        output = set()
-        for node in list(todo):
-            if not todo.intersection(edges[node]):
-                output.add(node)
+    # Kahn's algorithm; each item counts its parents which are
+    # themselves to be sorted, and is emitted in the subset following
+    # that of the last of those parents.  Each edge is visited once.
+    children = {}
+    remaining = {}
+    output = set()
+    for node in todo:
+        parents = todo.intersection(edges[node]) \
+            if node in edges else None
+        if parents:
+            remaining[node] = len(parents)
+            for parent in parents:
+                if parent in children:
+                    children[parent].append(node)
+                else:
+                    children[parent] = [node]
+        else:
+            output.add(node)
 
+    while todo:
         if not output:
             raise CircularDependencyError(
                 "Circular dependency detected.",
@@ -35,7 +49,19 @@ def sort_as_subsets(tuples, allitems):
             )
 
         todo.difference_update(output)
+
+        # determine the next subset before yielding, as the caller
+        # may consume the members of this one
+        next_output = set()
+        for node in output:
+            if node in children:
+                for child in children[node]:
+                    remaining[child] -= 1
+                    if not remaining[child]:
+                        next_output.add(child)
+
         yield output
+        output = next_output
 
 
 def sort(tuples, allitems):
@@ -89,6 +89,11 @@ def status_msgs(*msgs):
     print('*' * 75)
 
 
+# packages which use syntax only available in newer Pythons, and
+# would otherwise fail to byte-compile when installed elsewhere
+py35_packages = ['sqlalchemy.ext.asyncio']
+
+
 def find_packages(location):
     packages = []
     for pkg in ['sqlalchemy']:
@@ -97,6 +102,8 @@ def find_packages(location):
             if '__init__.py' in files:
                 tokens = _dir.split(os.sep)[len(location.split(os.sep)):]
                 packages.append(".".join(tokens))
+    if sys.version_info < (3, 5):
+        packages = [pkg for pkg in packages if pkg not in py35_packages]
     return packages
 
 v_file = open(os.path.join(os.path.dirname(__file__),
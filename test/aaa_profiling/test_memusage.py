@@ -4,6 +4,7 @@ from sqlalchemy.orm import mapper, relationship, create_session, \
     Session, subqueryload
 from sqlalchemy.orm.mapper import _mapper_registry
 from sqlalchemy.orm.session import _sessions
+from sqlalchemy.orm.state import _EMPTY_DICT
 from sqlalchemy import testing
 from sqlalchemy.testing import engines
 from sqlalchemy import MetaData, Integer, String, ForeignKey, \
@@ -16,6 +17,7 @@ from sqlalchemy.processors import to_decimal_processor_factory, \
 from sqlalchemy.testing.util import gc_collect
 import decimal
 import gc
+import sys
 from sqlalchemy.testing import fixtures
 from sqlalchemy import util
 import weakref
@@ -763,3 +765,92 @@ class MemUsageTest(EnsureZeroed):
         def go():
             to_unicode_processor_factory('utf8')
         go()
+
+
+class InstanceStateFootprintTest(EnsureZeroed):
+    """Per-instance memory used by the ORM to track a loaded object.
+
+    The figure is printed under ``-s``; the assertion guards against
+    regressions such as InstanceState regaining a ``__dict__`` or
+    allocating its side collections for objects which don't use them.
+
+    """
+
+    __requires__ = 'cpython',
+
+    def _state_footprint(self, state):
+        size = sys.getsizeof(state) + sys.getsizeof(state.obj)
+        for coll in (
+            state._committed_state, state._expired_attributes,
+            state._callables, state._parents, state._pending_mutations
+        ):
+            if coll is not _EMPTY_DICT and coll is not util.EMPTY_SET:
+                size += sys.getsizeof(coll)
+        return size
+
+    def _fixture(self, num):
+        metadata = MetaData(self.engine)
+        table1 = Table("mytable", metadata,
+                       Column('col1', Integer, primary_key=True,
+                              test_needs_autoincrement=True),
+                       Column('col2', String(30)))
+        metadata.create_all()
+        self.engine.execute(
+            table1.insert(),
+            [{"col2": "a%d" % i} for i in range(num)])
+        mapper(A, table1)
+        return metadata
+
+    def test_loaded_instance_footprint(self):
+        metadata = self._fixture(1000)
+        try:
+            sess = Session(self.engine)
+            alist = sess.query(A).all()
+            states = [sa.inspect(a) for a in alist]
+
+            for state in states:
+                assert not hasattr(state, '__dict__')
+                assert state._committed_state is _EMPTY_DICT
+                assert state._expired_attributes is util.EMPTY_SET
+                assert state._callables is _EMPTY_DICT
+                assert state._parents is _EMPTY_DICT
+
+            per_instance = sum(
+                self._state_footprint(state)
+                for state in states) // len(states)
+            print("InstanceState bytes per loaded instance: %d" %
+                  per_instance)
+            assert per_instance <= 400, per_instance
+            sess.close()
+        finally:
+            metadata.drop_all()
+            assert_no_mappers()
+
+    def test_side_structures_on_demand(self):
+        metadata = self._fixture(1)
+        try:
+            sess = Session(self.engine)
+            a1 = sess.query(A).first()
+            state = sa.inspect(a1)
+
+            a1.col2 = 'modified'
+            assert state._committed_state is not _EMPTY_DICT
+            eq_(list(state._committed_state), ['col2'])
+            sess.flush()
+            assert state._committed_state is _EMPTY_DICT
+
+            sess.expire(a1, ['col2'])
+            eq_(state._expired_attributes, set(['col2']))
+            eq_(a1.col2, 'modified')
+            assert state._expired_attributes is util.EMPTY_SET
+
+            # the public accessors allocate a collection on access, so
+            # that outside callers may write to them directly
+            state.expired_attributes.add('col2')
+            eq_(state._expired_attributes, set(['col2']))
+            state.committed_state['col2'] = 'x'
+            eq_(state._committed_state, {'col2': 'x'})
+            sess.close()
+        finally:
+            metadata.drop_all()
+            assert_no_mappers()
@@ -0,0 +1,27 @@
+from sqlalchemy.testing import fixtures, profiling
+from sqlalchemy.util import topological
+
+
+class TopologicalSortTest(fixtures.TestBase):
+    __requires__ = 'cpython',
+
+    @classmethod
+    def setup_class(cls):
+        # 100 layers of 100 nodes each, with every node depending
+        # on three nodes of the layer preceding it
+        cls.tuples = [
+            (layer * 100 + i, (layer + 1) * 100 + (i * 7 + j) % 100)
+            for layer in range(99) for i in range(100) for j in range(3)
+        ]
+        cls.allitems = list(range(10000))
+
+    @profiling.function_call_count()
+    def test_sort_10k(self):
+        for node in topological.sort(self.tuples, self.allitems):
+            pass
+
+    @profiling.function_call_count()
+    def test_sort_as_subsets_10k(self):
+        for subset in topological.sort_as_subsets(
+                self.tuples, self.allitems):
+            pass
@@ -1,5 +1,5 @@
 from sqlalchemy import MetaData, Table, Column, String, Unicode, Integer, \
-    create_engine
+    create_engine, bindparam, select, func
 from sqlalchemy.testing import fixtures, AssertsExecutionResults, profiling
 from sqlalchemy import testing
 from sqlalchemy.testing import eq_
@@ -88,6 +88,63 @@ class ExecutionTest(fixtures.TestBase):
             e.execute("select 1")
         go()
 
+    def _point_query_fixture(self):
+        # create an engine without any instrumentation.
+        e = create_engine('sqlite://')
+        m = MetaData()
+        t = Table('t', m,
+                  Column('id', Integer, primary_key=True),
+                  Column('data', String(50)))
+        m.create_all(e)
+        e.execute(t.insert(), [
+            {'id': i, 'data': 'd%d' % i} for i in range(1, 11)])
+        return e, t.select().where(t.c.id == bindparam('id'))
+
+    def test_compiled_point_query(self):
+        e, stmt = self._point_query_fixture()
+        compiled = stmt.compile(e)
+        c = e.connect()
+        # ensure result metadata for the compiled statement is memoized
+        c.execute(compiled, id=1).fetchall()
+
+        @profiling.function_call_count()
+        def go():
+            c.execute(compiled, id=5).fetchall()
+        go()
+
+    def test_compiled_cache_point_query(self):
+        e, stmt = self._point_query_fixture()
+        c = e.connect().execution_options(compiled_cache={})
+        c.execute(stmt, id=1).fetchall()
+
+        @profiling.function_call_count()
+        def go():
+            c.execute(stmt, id=5).fetchall()
+        go()
+
+    def test_compiled_select_execute(self):
+        # a run of plain SELECTs in the style of the zoomark
+        # "expressions" and "aggregates" steps, against precompiled
+        # statements so that execution context setup dominates
+        e, stmt = self._point_query_fixture()
+        t = stmt.froms[0]
+        statements = [
+            t.select().compile(e),
+            stmt.compile(e),
+            select([func.count(t.c.id)]).compile(e),
+            select([t.c.data]).where(t.c.id > bindparam('id')).
+            order_by(t.c.id).compile(e),
+        ]
+        c = e.connect()
+        for compiled in statements:
+            c.execute(compiled, id=1).fetchall()
+
+        @profiling.function_call_count()
+        def go():
+            for compiled in statements:
+                c.execute(compiled, id=5).fetchall()
+        go()
+
 
 class RowProxyTest(fixtures.TestBase):
     __requires__ = 'cpython',
@@ -134,6 +134,53 @@ class DependencySortTest(fixtures.TestBase):
         tuples = [(i, i + 1) for i in range(0, 1500, 2)]
         self.assert_sort(tuples)
 
+    def test_sort_as_subsets(self):
+        tuples = [
+            ('a', 'c'), ('b', 'c'), ('c', 'd'), ('a', 'd'), ('d', 'e')
+        ]
+        eq_(
+            list(topological.sort_as_subsets(
+                tuples, ['a', 'b', 'c', 'd', 'e', 'f'])),
+            [set(['a', 'b', 'f']), set(['c']), set(['d']), set(['e'])]
+        )
+
+    def test_sort_as_subsets_ignores_outside_items(self):
+        tuples = [('x', 'a'), ('a', 'b'), ('b', 'y')]
+        eq_(
+            list(topological.sort_as_subsets(tuples, ['a', 'b'])),
+            [set(['a']), set(['b'])]
+        )
+
+    def test_sort_as_subsets_consumed(self):
+        # the caller may empty each subset as it's received
+        tuples = [('a', 'b'), ('b', 'c')]
+        result = []
+        for subset in topological.sort_as_subsets(tuples, ['a', 'b', 'c']):
+            while subset:
+                result.append(subset.pop())
+        eq_(result, ['a', 'b', 'c'])
+
+    def test_raise_on_cycle_partial(self):
+        tuples = [('a', 'b'), ('b', 'c'), ('c', 'b'), ('c', 'd')]
+        gen = topological.sort_as_subsets(tuples, ['a', 'b', 'c', 'd'])
+        eq_(next(gen), set(['a']))
+        assert_raises(exc.CircularDependencyError, next, gen)
+
+    def test_large_layered_sort(self):
+        tuples = [
+            (layer * 100 + i, (layer + 1) * 100 + (i * 7 + j) % 100)
+            for layer in range(99) for i in range(100) for j in range(3)
+        ]
+        allitems = range(10000)
+        subsets = list(topological.sort_as_subsets(tuples, allitems))
+        eq_(
+            subsets,
+            [set(range(layer * 100, (layer + 1) * 100))
+             for layer in range(100)]
+        )
+        assert conforms_partial_ordering(
+            tuples, list(topological.sort(tuples, allitems)))
+
     def test_ticket_1380(self):
 
         # ticket:1380 regression: would raise a KeyError
@@ -1,6 +1,7 @@
 # coding: utf-8
 
-from sqlalchemy.testing import eq_
+from sqlalchemy.testing import eq_, is_
+from sqlalchemy.testing.mock import Mock
 from sqlalchemy import *
 from sqlalchemy.engine.url import make_url
 from sqlalchemy.testing import fixtures
@@ -75,6 +76,17 @@ class DialectTest(fixtures.TestBase):
             )[1]
         assert "raise_on_warnings" not in kw
 
+    def test_mysqldb_server_side_cursors_arg(self):
+        from sqlalchemy.dialects.mysql import mysqldb
+        dbapi = Mock()
+        dialect = mysqldb.dialect(dbapi=dbapi)
+        assert dialect.supports_server_side_cursors
+        assert not dialect.server_side_cursors
+        is_(dialect._sscursor, dbapi.cursors.SSCursor)
+
+        dialect = mysqldb.dialect(dbapi=dbapi, server_side_cursors=True)
+        assert dialect.server_side_cursors
+
     @testing.only_on('mysql')
     def test_random_arg(self):
         dialect = testing.db.dialect
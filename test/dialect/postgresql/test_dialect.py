@@ -2,18 +2,19 @@
 
 from sqlalchemy.testing.assertions import (
     eq_, assert_raises, assert_raises_message, AssertsExecutionResults,
-    AssertsCompiledSQL)
+    AssertsCompiledSQL, expect_warnings)
 from sqlalchemy.testing import engines, fixtures
 from sqlalchemy import testing
 import datetime
 from sqlalchemy import (
     Table, Column, select, MetaData, text, Integer, String, Sequence, Numeric,
-    DateTime, BigInteger, func, extract, SmallInteger)
+    DateTime, BigInteger, func, extract, SmallInteger, bindparam)
 from sqlalchemy import exc, schema
 from sqlalchemy.dialects.postgresql import base as postgresql
 import logging
 import logging.handlers
-from sqlalchemy.testing.mock import Mock
+from sqlalchemy.testing import mock
+from sqlalchemy.testing.mock import Mock, call
 
 
 class MiscTest(fixtures.TestBase, AssertsExecutionResults, AssertsCompiledSQL):
@@ -249,3 +250,188 @@ class MiscTest(fixtures.TestBase, AssertsExecutionResults, AssertsCompiledSQL):
                 ddl_compiler.get_column_specification(t.c.c),
                 "c %s NOT NULL" % expected
             )
+
+
+class ExecutemanyModeTest(fixtures.TestBase):
+
+    def setup(self):
+        self.table = Table(
+            'data', MetaData(),
+            Column('id', Integer, primary_key=True),
+            Column('x', String),
+            Column('y', String)
+        )
+
+    def _dialect_fixture(self, **kw):
+        from sqlalchemy.dialects.postgresql import psycopg2
+        dbapi = Mock(__version__='2.7.3', paramstyle='pyformat')
+        dialect = psycopg2.dialect(dbapi=dbapi, **kw)
+        dialect._psycopg2_extras = Mock()
+        return dialect
+
+    def _executemany_fixture(self, dialect, stmt):
+        compiled = stmt.compile(
+            dialect=dialect, column_keys=['x', 'y'], inline=True)
+        context = Mock(isinsert=compiled.isinsert, compiled=compiled)
+        cursor = Mock()
+        parameters = [{'x': 'x1', 'y': 'y1'}, {'x': 'x2', 'y': 'y2'}]
+        dialect.do_executemany(
+            cursor, compiled.string, parameters, context)
+        return cursor, compiled.string, parameters
+
+    def test_default(self):
+        dialect = self._dialect_fixture()
+        cursor, statement, parameters = self._executemany_fixture(
+            dialect, self.table.insert())
+        eq_(
+            cursor.mock_calls,
+            [call.executemany(statement, parameters)]
+        )
+        eq_(dialect._psycopg2_extras.mock_calls, [])
+
+    def test_batch(self):
+        dialect = self._dialect_fixture(
+            executemany_mode='batch', executemany_batch_page_size=50)
+        cursor, statement, parameters = self._executemany_fixture(
+            dialect, self.table.insert())
+        eq_(cursor.mock_calls, [])
+        eq_(
+            dialect._psycopg2_extras.mock_calls,
+            [
+                call(),
+                call().execute_batch(
+                    cursor, statement, parameters, page_size=50)
+            ]
+        )
+
+    def test_values_insert(self):
+        dialect = self._dialect_fixture(
+            executemany_mode='values', executemany_values_page_size=500)
+        cursor, statement, parameters = self._executemany_fixture(
+            dialect, self.table.insert())
+        eq_(
+            dialect._psycopg2_extras.mock_calls,
+            [
+                call(),
+                call().execute_values(
+                    cursor,
+                    "INSERT INTO data (x, y) VALUES %s",
+                    parameters,
+                    template="(%(x)s, %(y)s)",
+                    page_size=500)
+            ]
+        )
+
+    def test_values_update(self):
+        dialect = self._dialect_fixture(executemany_mode='values')
+        cursor, statement, parameters = self._executemany_fixture(
+            dialect,
+            self.table.update().where(self.table.c.x == bindparam('q')))
+        eq_(
+            dialect._psycopg2_extras.mock_calls,
+            [
+                call(),
+                call().execute_batch(
+                    cursor, statement, parameters, page_size=100)
+            ]
+        )
+
+    def test_values_insert_from_select(self):
+        dialect = self._dialect_fixture(executemany_mode='values')
+        stmt = self.table.insert().from_select(
+            ['x', 'y'],
+            select([self.table.c.x, self.table.c.y]).where(
+                self.table.c.id == bindparam('q')))
+        cursor, statement, parameters = self._executemany_fixture(
+            dialect, stmt)
+        eq_(
+            dialect._psycopg2_extras.mock_calls,
+            [
+                call(),
+                call().execute_batch(
+                    cursor, statement, parameters, page_size=100)
+            ]
+        )
+
+    def test_invalid_mode(self):
+        from sqlalchemy.dialects.postgresql import psycopg2
+        assert_raises_message(
+            exc.ArgumentError,
+            "Invalid value for 'executemany_mode': 'foo'",
+            psycopg2.dialect, executemany_mode='foo'
+        )
+
+    def test_sane_multi_rowcount(self):
+        for mode, expected in [
+            (None, True),
+            ('batch', False),
+            ('values', False),
+        ]:
+            dialect = self._dialect_fixture(executemany_mode=mode)
+            dialect._hstore_oids = Mock(return_value=None)
+            with mock.patch(
+                    "sqlalchemy.dialects.postgresql.base."
+                    "PGDialect.initialize"):
+                dialect.initialize(Mock())
+            eq_(dialect.supports_sane_multi_rowcount, expected)
+
+    def test_old_psycopg2_warns(self):
+        dialect = self._dialect_fixture(executemany_mode='values')
+        dialect.psycopg2_version = (2, 6, 1)
+        dialect._hstore_oids = Mock(return_value=None)
+        with mock.patch(
+                "sqlalchemy.dialects.postgresql.base.PGDialect.initialize"):
+            with expect_warnings(
+                    "executemany_mode 'values' requires psycopg2 2.7"):
+                dialect.initialize(Mock())
+        eq_(dialect.executemany_mode, None)
+        assert dialect.supports_sane_multi_rowcount
+
+
+class ExecutemanyModeRoundTripTest(fixtures.TablesTest):
+    __only_on__ = 'postgresql+psycopg2'
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            'data', metadata,
+            Column('id', Integer, primary_key=True),
+            Column('x', String(50)),
+            Column('y', String(50))
+        )
+
+    def _test_insert(self, mode):
+        engine = engines.testing_engine(
+            options={"executemany_mode": mode,
+                     "executemany_values_page_size": 3,
+                     "executemany_batch_page_size": 3})
+        data = self.tables.data
+        with engine.connect() as conn:
+            conn.execute(
+                data.insert(),
+                [{"x": "x%d" % i, "y": "y%d" % i} for i in range(10)])
+            eq_(
+                conn.execute(
+                    select([data.c.x, data.c.y]).order_by(data.c.id)
+                ).fetchall(),
+                [("x%d" % i, "y%d" % i) for i in range(10)]
+            )
+            conn.execute(
+                data.update().where(data.c.x == bindparam('xval')).
+                values(y=bindparam('yval')),
+                [{"xval": "x1", "yval": "new1"},
+                 {"xval": "x3", "yval": "new3"}])
+            eq_(
+                conn.execute(
+                    select([data.c.y]).where(
+                        data.c.x.in_(["x1", "x3"])).order_by(data.c.id)
+                ).fetchall(),
+                [("new1", ), ("new3", )]
+            )
+
+    def test_batch(self):
+        self._test_insert('batch')
+
+    def test_values(self):
+        self._test_insert('values')
@@ -129,6 +129,27 @@ class TestTypes(fixtures.TestBase, AssertsExecutionResults):
                 (datetime.datetime(2010, 10, 15, 12, 37),)]
         )
 
+    @testing.provide_metadata
+    def test_custom_date_compiled_cache(self):
+        t = Table('t', self.metadata, Column('d', String(20)))
+        self.metadata.create_all(testing.db)
+
+        conn = testing.db.connect().execution_options(compiled_cache={})
+        for fmt in (
+            "%(year)04d-%(month)02d-%(day)02d",
+            "%(day)02d/%(month)02d/%(year)04d"
+        ):
+            conn.execute(
+                t.insert().values(
+                    d=bindparam(
+                        'd', type_=sqlite.DATE(storage_format=fmt))),
+                d=datetime.date(2020, 1, 2))
+        eq_(
+            conn.execute("select d from t").fetchall(),
+            [('2020-01-02',), ('02/01/2020',)]
+        )
+        conn.close()
+
     @testing.provide_metadata
     def test_custom_datetime_text_affinity(self):
         sqlite_date = sqlite.DATETIME(
@@ -596,6 +617,27 @@ class AttachedMemoryDBTest(fixtures.TestBase):
         c2 = Table('created', m2, autoload=True, autoload_with=self.conn)
         eq_(len(c2.c), 2)
 
+    def test_reflect_all_schema(self):
+        self._fixture()
+
+        m2 = MetaData()
+        m2.reflect(self.conn, schema='test_schema')
+        eq_(list(m2.tables), ['test_schema.created'])
+        eq_(m2.tables['test_schema.created'].c.keys(), ['id', 'name'])
+
+    def test_get_multi_columns_schema(self):
+        self._fixture()
+
+        insp = inspect(self.conn)
+        eq_(list(insp.get_multi_columns()), [])
+        eq_(
+            dict(
+                (tname, [col['name'] for col in cols])
+                for tname, cols in
+                insp.get_multi_columns('test_schema').items()),
+            {'created': ['id', 'name']}
+        )
+
     def test_crud(self):
         ct = self._fixture()
 
@@ -1288,6 +1330,66 @@ class ConstraintReflectionTest(fixtures.TestBase):
             [{'column_names': ['x'], 'name': None}]
         )
 
+    def _assert_multi_matches_single(self):
+        kinds = ('pk_constraint', 'foreign_keys',
+                 'indexes', 'unique_constraints')
+        inspector = Inspector(testing.db)
+        table_names = inspector.get_table_names()
+        for kind in kinds:
+            multi = getattr(inspector, 'get_multi_%s' % kind)()
+            eq_(sorted(multi), table_names)
+            for name in table_names:
+                eq_(
+                    multi[name],
+                    getattr(Inspector(testing.db), 'get_%s' % kind)(name)
+                )
+
+        # temporary tables are included, nonexistent ones omitted
+        multi = inspector.get_multi_columns(
+            table_names=['b', 'e', 'g', 'nonexistent'])
+        eq_(sorted(multi), ['b', 'e', 'g'])
+        for name in ('b', 'e', 'g'):
+            eq_(
+                [(col['name'], repr(col['type'])) for col in multi[name]],
+                [(col['name'], repr(col['type'])) for col in
+                 Inspector(testing.db).get_columns(name)]
+            )
+
+    def test_multi_matches_single(self):
+        self._assert_multi_matches_single()
+
+    def test_multi_matches_single_no_pragma_functions(self):
+        with mock.patch.object(
+                testing.db.dialect, "_supports_pragma_functions", False):
+            self._assert_multi_matches_single()
+
+    def test_reflect_statement_count(self):
+        stmts = []
+
+        def before_cursor_execute(conn, cursor, statement, *arg):
+            stmts.append(statement)
+
+        with testing.db.connect() as conn:
+            event.listen(conn, "before_cursor_execute", before_cursor_execute)
+            m = MetaData()
+            m.reflect(conn)
+
+        # table names, then one statement each for columns,
+        # foreign keys, table DDL and indexes
+        assert len(m.tables) > 10
+        eq_(len(stmts), 5)
+        eq_(
+            sorted(
+                (c.name, c.referred_table.name)
+                for c in m.tables['k'].foreign_key_constraints),
+            [('my_fk', 'i')]
+        )
+        eq_(
+            set(c.name for c in m.tables['h'].constraints
+                if isinstance(c, UniqueConstraint)),
+            set(['foo_hx'])
+        )
+
 
 class SavepointTest(fixtures.TablesTest):
 
@@ -1,12 +1,13 @@
 # coding: utf-8
 
 from sqlalchemy.testing import eq_, assert_raises, assert_raises_message, \
-    config, is_
+    config, is_, is_not_
 import re
 from sqlalchemy.testing.util import picklers
 from sqlalchemy.interfaces import ConnectionProxy
 from sqlalchemy import MetaData, Integer, String, INT, VARCHAR, func, \
-    bindparam, select, event, TypeDecorator, create_engine, Sequence
+    bindparam, select, event, TypeDecorator, create_engine, Sequence, \
+    Float, cast, text
 from sqlalchemy.sql import column, literal
 from sqlalchemy.testing.schema import Table, Column
 import sqlalchemy as tsa
@@ -779,6 +780,195 @@ class CompiledCacheTest(fixtures.TestBase):
         eq_(compile_mock.call_count, 1)
         eq_(len(cache), 1)
 
+    def test_structural_cache_new_statements(self):
+        conn = testing.db.connect()
+        conn.execute(
+            users.insert(),
+            [{"user_id": 1, "user_name": "u1"},
+             {"user_id": 2, "user_name": "u2"},
+             {"user_id": 3, "user_name": "u3"}])
+        cache = {}
+        cached_conn = conn.execution_options(compiled_cache=cache)
+
+        for user_id, user_name in [(1, "u1"), (2, "u2"), (3, "u3")]:
+            stmt = select([users.c.user_name]).\
+                where(users.c.user_id == user_id)
+            eq_(cached_conn.execute(stmt).scalar(), user_name)
+            eq_(
+                cached_conn.execute(stmt).first()[users.c.user_name],
+                user_name)
+        eq_(len(cache), 1)
+
+    def test_structural_cache_distinct_structures(self):
+        conn = testing.db.connect()
+        conn.execute(
+            users.insert(),
+            [{"user_id": 1, "user_name": "u1"},
+             {"user_id": 2, "user_name": "u2"}])
+        cache = {}
+        cached_conn = conn.execution_options(compiled_cache=cache)
+
+        eq_(
+            cached_conn.execute(
+                select([users.c.user_id]).where(
+                    users.c.user_id.in_([1, 2])).
+                order_by(users.c.user_id)).fetchall(),
+            [(1, ), (2, )]
+        )
+        eq_(
+            cached_conn.execute(
+                select([users.c.user_id]).where(
+                    users.c.user_id.in_([2])).
+                order_by(users.c.user_id)).fetchall(),
+            [(2, )]
+        )
+        eq_(len(cache), 2)
+
+    def test_structural_cache_update_values(self):
+        conn = testing.db.connect()
+        conn.execute(
+            users.insert(), {"user_id": 1, "user_name": "u1"})
+        cache = {}
+        cached_conn = conn.execution_options(compiled_cache=cache)
+
+        for suffix in ("a", "b"):
+            cached_conn.execute(
+                users.update().
+                where(users.c.user_id == 1).
+                values(user_name=users.c.user_name + suffix))
+        eq_(len(cache), 1)
+        eq_(
+            conn.execute(select([users.c.user_name])).scalar(),
+            "u1ab"
+        )
+
+        # plain literal values are rendered as bound parameters
+        # by the compiler and can't be cached structurally
+        for name in ("x1", "x2"):
+            cached_conn.execute(
+                users.update().
+                where(users.c.user_id == 1).values(user_name=name))
+            eq_(
+                conn.execute(select([users.c.user_name])).scalar(),
+                name
+            )
+        eq_(len(cache), 3)
+
+
+class BindProcessingTest(fixtures.TestBase):
+    __requires__ = ('sqlite', )
+
+    def _test_round_trip(self, paramstyle):
+        class Prefixed(TypeDecorator):
+            impl = String
+
+            def process_bind_param(self, value, dialect):
+                return "p_" + value
+
+        engine = testing_engine(
+            'sqlite://', options={"paramstyle": paramstyle})
+        m = MetaData()
+        t = Table('test', m,
+                  Column('x', Integer, primary_key=True),
+                  Column('y', Prefixed(50)),
+                  Column('z', String(50))
+                  )
+        m.create_all(engine)
+        r = engine.execute(t.insert(), x=1, y="y1", z="z1")
+        eq_(r.context.compiled_parameters, [{"x": 1, "y": "y1", "z": "z1"}])
+        r = engine.execute(t.insert(), [
+            {'x': i, 'y': "y%d" % i, 'z': "z%d" % i} for i in range(2, 5)
+        ])
+        eq_(len(r.context.parameters), 3)
+        r = engine.execute(t.insert(), x=5, y="y5")
+        eq_(
+            engine.execute(
+                select([t]).where(t.c.y != "y3").order_by(t.c.x)
+            ).fetchall(),
+            [(1, "p_y1", "z1"), (2, "p_y2", "z2"),
+             (4, "p_y4", "z4"), (5, "p_y5", None)]
+        )
+
+    def test_positional(self):
+        self._test_round_trip("qmark")
+
+    def test_named(self):
+        self._test_round_trip("named")
+
+
+class ResultMetaDataCacheTest(fixtures.TestBase):
+    __requires__ = ('sqlite', )
+
+    def setup(self):
+        self.engine = engine = testing_engine('sqlite://')
+        m = MetaData()
+        self.table = t = Table('test', m,
+                               Column('x', Integer, primary_key=True),
+                               Column('y', String(50))
+                               )
+        m.create_all(engine)
+        engine.execute(t.insert(), [
+            {'x': i, 'y': "t_%d" % i} for i in range(1, 4)
+        ])
+
+    def test_compiled_reuses_metadata(self):
+        compiled = select([self.table]).compile(self.engine)
+        with self.engine.connect() as conn:
+            r1 = conn.execute(compiled)
+            r2 = conn.execute(compiled)
+            is_(r1._metadata, r2._metadata)
+            eq_(r2.fetchall(), [(1, "t_1"), (2, "t_2"), (3, "t_3")])
+
+    def test_compiled_cache_reuses_metadata(self):
+        stmt = select([self.table]).where(self.table.c.x == bindparam('x'))
+        with self.engine.connect() as conn:
+            conn = conn.execution_options(compiled_cache={})
+            r1 = conn.execute(stmt, x=1)
+            r2 = conn.execute(stmt, x=2)
+            is_(r1._metadata, r2._metadata)
+            eq_(r1.fetchall(), [(1, "t_1")])
+            eq_(r2.fetchall(), [(2, "t_2")])
+
+    def test_description_change(self):
+        compiled = text("select * from test").compile(self.engine)
+        with self.engine.connect() as conn:
+            r1 = conn.execute(compiled)
+            eq_(r1.keys(), ["x", "y"])
+            r1.close()
+            conn.execute("alter table test add column z integer")
+            r2 = conn.execute(compiled)
+            is_not_(r1._metadata, r2._metadata)
+            eq_(r2.keys(), ["x", "y", "z"])
+            eq_(r2.first(), (1, "t_1", None))
+
+    def test_variant_not_shared(self):
+        compiled = select([self.table]).compile(self.engine)
+        with self.engine.connect() as conn:
+            r1 = conn.execute(compiled)
+            r2 = conn.execution_options(sqlite_raw_colnames=True).\
+                execute(compiled)
+            is_not_(r1._metadata, r2._metadata)
+
+    def test_buffered_column_doesnt_alter_shared(self):
+        compiled = select([self.table]).compile(self.engine)
+
+        class ExcCtx(self.engine.dialect.execution_ctx_cls):
+            def get_result_proxy(self):
+                return _result.BufferedColumnResultProxy(self)
+
+        with self.engine.connect() as conn:
+            r1 = conn.execute(compiled)
+            processors = r1._metadata._processors
+            with patch.object(conn.dialect, "execution_ctx_cls", ExcCtx):
+                r2 = conn.execute(compiled)
+            is_not_(r1._metadata, r2._metadata)
+            eq_(r2.fetchall(), [(1, "t_1"), (2, "t_2"), (3, "t_3")])
+
+            r3 = conn.execute(compiled)
+            is_(r3._metadata, r1._metadata)
+            is_(r3._metadata._processors, processors)
+            eq_(r3.fetchall(), [(1, "t_1"), (2, "t_2"), (3, "t_3")])
+
 
 class MockStrategyTest(fixtures.TestBase):
 
@@ -1070,6 +1260,14 @@ class AlternateResultProxyTest(fixtures.TestBase):
         rows = r.fetchmany(6)
         eq_(rows, [(i, "t_%d" % i) for i in range(1, 6)])
 
+        r = self.engine.execute(select([self.table]))
+        chunk = r.fetchcolumns(4)
+        eq_(chunk.num_rows, 4)
+        eq_(list(chunk['x']), [1, 2, 3, 4])
+        eq_(chunk[self.table.c.y], ["t_1", "t_2", "t_3", "t_4"])
+        eq_([c.num_rows for c in r.iter_columns(4)], [4, 3])
+        assert r.closed
+
     def test_plain(self):
         self._test_proxy(_result.ResultProxy)
 
@@ -1083,6 +1281,300 @@ class AlternateResultProxyTest(fixtures.TestBase):
         self._test_proxy(_result.BufferedColumnResultProxy)
 
 
+class BufferedRowResultProxyTest(fixtures.TestBase):
+    __requires__ = ('sqlite', )
+
+    @classmethod
+    def setup_class(cls):
+        cls.engine = engine = testing_engine('sqlite://')
+        m = MetaData()
+        cls.table = t = Table('test', m,
+                              Column('x', Integer, primary_key=True),
+                              Column('y', String(50))
+                              )
+        m.create_all(engine)
+        engine.execute(t.insert(), [
+            {'x': i, 'y': "t"} for i in range(1, 301)
+        ])
+
+    def _fetch_sizes(self, **opts):
+        sizes = []
+
+        class CursorProxy(object):
+            def __init__(self, cursor):
+                self.cursor = cursor
+
+            def __getattr__(self, key):
+                return getattr(self.cursor, key)
+
+            def fetchmany(self, size):
+                sizes.append(size)
+                return self.cursor.fetchmany(size)
+
+        class ExcCtx(default.DefaultExecutionContext):
+            def create_cursor(self):
+                return CursorProxy(self._dbapi_connection.cursor())
+
+            def get_result_proxy(self):
+                return _result.BufferedRowResultProxy(self)
+
+        with patch.object(self.engine.dialect, "execution_ctx_cls", ExcCtx):
+            r = self.engine.execution_options(**opts).execute(
+                select([self.table]).order_by(self.table.c.x))
+            eq_(
+                [row.x for row in r],
+                list(range(1, 301))
+            )
+        return sizes
+
+    def test_default_growth(self):
+        eq_(
+            self._fetch_sizes(),
+            [1, 5, 10, 20, 50, 100, 250, 500]
+        )
+
+    def test_max_row_buffer(self):
+        eq_(
+            self._fetch_sizes(max_row_buffer=40),
+            [1, 5, 10, 20, 40, 40, 40, 40, 40, 40, 40, 40]
+        )
+
+    def test_initial_row_buffer(self):
+        eq_(
+            self._fetch_sizes(initial_row_buffer=3, max_row_buffer=40),
+            [3, 6, 12, 24, 40, 40, 40, 40, 40, 40, 40, 40]
+        )
+
+    def test_max_row_buffer_past_growth_chart(self):
+        eq_(
+            self._fetch_sizes(initial_row_buffer=1000, max_row_buffer=5000),
+            [1000, 2000]
+        )
+
+    def test_row_buffer_bytes(self):
+        row_size = _result.BufferedRowResultProxy._row_size((1, u"t"))
+        eq_(
+            self._fetch_sizes(row_buffer_bytes=row_size * 75),
+            [1, 75, 75, 75, 75, 75]
+        )
+
+    def test_row_buffer_bytes_max_row_buffer(self):
+        row_size = _result.BufferedRowResultProxy._row_size((1, u"t"))
+        eq_(
+            self._fetch_sizes(
+                row_buffer_bytes=row_size * 75, max_row_buffer=50),
+            [1, 50, 50, 50, 50, 50, 50, 50]
+        )
+
+
+class ServerSideCursorsTest(fixtures.TestBase):
+    __requires__ = ('server_side_cursors', )
+
+    @classmethod
+    def setup_class(cls):
+        cls.engine = engine = testing_engine()
+        m = MetaData()
+        cls.table = t = Table('test', m,
+                              Column('x', Integer, primary_key=True),
+                              Column('y', String(50))
+                              )
+        m.create_all(engine)
+        engine.execute(t.insert(), [
+            {'x': i, 'y': "t_%d" % i} for i in range(1, 12)
+        ])
+
+    @classmethod
+    def teardown_class(cls):
+        cls.table.drop(cls.engine)
+        cls.engine.dispose()
+
+    def test_stream_results(self):
+        with self.engine.connect() as conn:
+            r = conn.execution_options(stream_results=True).\
+                execute(select([self.table]).order_by(self.table.c.x))
+            assert r.context._is_server_side
+            assert isinstance(r, _result.BufferedRowResultProxy)
+            eq_(r.fetchone(), (1, "t_1"))
+            eq_(r.fetchmany(3), [(i, "t_%d" % i) for i in range(2, 5)])
+            eq_(r.fetchall(), [(i, "t_%d" % i) for i in range(5, 12)])
+
+    def test_stream_results_off(self):
+        with self.engine.connect() as conn:
+            for opts in ({}, {"stream_results": False}):
+                r = conn.execution_options(**opts).\
+                    execute(select([self.table]))
+                assert not r.context._is_server_side
+                eq_(len(r.fetchall()), 11)
+
+    def test_server_side_cursors_dialect_flag(self):
+        with self.engine.connect() as conn:
+            with patch.object(conn.dialect, "server_side_cursors", True):
+                r = conn.execute(select([self.table]))
+                assert r.context._is_server_side
+                eq_(len(r.fetchall()), 11)
+
+                r = conn.execute("select x from test")
+                assert r.context._is_server_side
+                eq_(len(r.fetchall()), 11)
+
+                r = conn.execution_options(stream_results=False).\
+                    execute(select([self.table]))
+                assert not r.context._is_server_side
+                eq_(len(r.fetchall()), 11)
+
+                r = conn.execute(
+                    self.table.update().where(self.table.c.x == 0),
+                    y='q')
+                assert not r.context._is_server_side
+
+    def test_not_supported_ignored(self):
+        with self.engine.connect() as conn:
+            with patch.object(
+                    conn.dialect, "supports_server_side_cursors", False):
+                r = conn.execution_options(stream_results=True).\
+                    execute(select([self.table]))
+                assert not r.context._is_server_side
+                eq_(len(r.fetchall()), 11)
+
+
+class ColumnarFetchTest(fixtures.TablesTest):
+    __backend__ = True
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            'data', metadata,
+            Column('id', Integer, primary_key=True),
+            Column('x', Integer),
+            Column('y', String(50)),
+            Column('z', Float)
+        )
+
+    @classmethod
+    def insert_data(cls):
+        cls.tables.data.insert().execute([
+            {'id': i, 'x': i * 10,
+             'y': 'y%d' % i if i % 2 else None, 'z': i / 4.0}
+            for i in range(1, 11)
+        ])
+
+    def _stmt(self):
+        data = self.tables.data
+        return select([data.c.id, data.c.x, data.c.y, data.c.z]).\
+            order_by(data.c.id)
+
+    def test_fetchcolumns(self):
+        result = testing.db.execute(self._stmt())
+        chunk = result.fetchcolumns()
+        assert result.closed
+
+        eq_(chunk.num_rows, 10)
+        eq_(chunk.keys(), ['id', 'x', 'y', 'z'])
+        eq_(len(chunk), 4)
+
+        ids, xs, ys, zs = chunk
+        eq_(list(ids), list(range(1, 11)))
+        eq_(list(xs), [i * 10 for i in range(1, 11)])
+        eq_(ys, ['y%d' % i if i % 2 else None for i in range(1, 11)])
+        eq_(list(zs), [i / 4.0 for i in range(1, 11)])
+
+    def test_array_types(self):
+        chunk = testing.db.execute(self._stmt()).fetchcolumns()
+        eq_(chunk['id'].typecode, 'l')
+        eq_(chunk['z'].typecode, 'd')
+        # NULL present
+        assert isinstance(chunk['y'], list)
+
+    def test_list(self):
+        chunk = testing.db.execute(
+            self._stmt().execution_options(columnar='list')).fetchcolumns()
+        for col in chunk:
+            assert isinstance(col, list)
+
+    def test_key_access(self):
+        data = self.tables.data
+        chunk = testing.db.execute(self._stmt()).fetchcolumns()
+        is_(chunk[data.c.x], chunk.columns[1])
+        is_(chunk['x'], chunk.columns[1])
+        is_(chunk[-1], chunk.columns[3])
+        eq_(chunk[0:2], chunk.columns[0:2])
+        assert_raises(
+            tsa.exc.NoSuchColumnError,
+            lambda: chunk['nonexistent']
+        )
+
+    def test_result_processors(self):
+        class MyType(TypeDecorator):
+            impl = String(50)
+
+            def process_result_value(self, value, dialect):
+                return "processed:%s" % value
+
+        data = self.tables.data
+        stmt = select([data.c.id, cast(data.c.y, MyType)]).\
+            where(data.c.id < 4).order_by(data.c.id)
+        chunk = testing.db.execute(stmt).fetchcolumns()
+        eq_(
+            chunk[1],
+            ["processed:y1", "processed:None", "processed:y3"]
+        )
+
+    def test_chunks(self):
+        result = testing.db.execute(self._stmt())
+        chunks = list(result.iter_columns(4))
+        eq_([c.num_rows for c in chunks], [4, 4, 2])
+        eq_(
+            [list(c['id']) for c in chunks],
+            [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10]]
+        )
+        assert result.closed
+
+    def test_fetchcolumns_empty(self):
+        data = self.tables.data
+        result = testing.db.execute(self._stmt().where(data.c.id > 10))
+        chunk = result.fetchcolumns(5)
+        eq_(chunk.num_rows, 0)
+        eq_([list(c) for c in chunk], [[], [], [], []])
+        assert result.closed
+
+    def test_interleave_with_rows(self):
+        result = testing.db.execute(self._stmt())
+        eq_(result.fetchone()['id'], 1)
+        eq_(list(result.fetchcolumns(2)['id']), [2, 3])
+        eq_(result.fetchone()['id'], 4)
+        eq_(list(result.fetchcolumns()['id']), [5, 6, 7, 8, 9, 10])
+
+    def test_invalid_option(self):
+        result = testing.db.execute(
+            self._stmt().execution_options(columnar='foo'))
+        assert_raises_message(
+            tsa.exc.ArgumentError,
+            "Invalid value for 'columnar' execution option: 'foo'",
+            result.fetchcolumns
+        )
+        result.close()
+
+    def test_non_result(self):
+        data = self.tables.data
+        result = testing.db.execute(data.update().where(data.c.id == 0).values(x=5))
+        assert_raises(
+            tsa.exc.ResourceClosedError,
+            result.fetchcolumns
+        )
+
+    @testing.requires.numpy
+    def test_numpy(self):
+        import numpy
+        chunk = testing.db.execute(
+            self._stmt().execution_options(columnar='numpy')).fetchcolumns()
+        for col in chunk:
+            assert isinstance(col, numpy.ndarray)
+        eq_(chunk['id'].dtype.kind, 'i')
+        eq_(chunk['z'].dtype.kind, 'f')
+        eq_(chunk['y'].dtype, object)
+        eq_(chunk['id'].tolist(), list(range(1, 11)))
+
+
 class EngineEventsTest(fixtures.TestBase):
     __requires__ = 'ad_hoc_engines',
     __backend__ = True
@@ -316,6 +316,42 @@ class PoolEventsTest(PoolTestBase):
 
         return p, canary
 
+    def test_exhausted_event(self):
+        p = self._queuepool_fixture(pool_size=1, max_overflow=0, timeout=.1)
+        canary = Mock()
+        wait_canary = Mock()
+        event.listen(p, 'exhausted', canary)
+        event.listen(p, 'checkout_wait', wait_canary)
+
+        c1 = p.connect()
+        eq_(canary.mock_calls, [])
+
+        assert_raises(tsa.exc.TimeoutError, p.connect)
+        eq_(canary.mock_calls, [call(p)])
+        eq_(wait_canary.mock_calls, [])
+
+    @testing.requires.threading_with_mock
+    def test_checkout_wait_event(self):
+        p = self._queuepool_fixture(pool_size=1, max_overflow=0, timeout=10)
+        canary = Mock()
+        event.listen(p, 'checkout_wait', canary)
+
+        c1 = p.connect()
+
+        def return_conn():
+            time.sleep(.2)
+            c1.close()
+        t = threading.Thread(target=return_conn)
+        t.start()
+
+        c2 = p.connect()
+        t.join(join_timeout)
+
+        eq_(len(canary.mock_calls), 1)
+        pool_arg, wait_time = canary.mock_calls[0][1]
+        assert pool_arg is p
+        assert wait_time >= .1
+
     def test_first_connect_event(self):
         p, canary = self._first_connect_event_fixture()
 
@@ -1406,6 +1442,120 @@ class QueuePoolTest(PoolTestBase):
         assert p2._use_threadlocal is False
         assert p2._max_overflow == 0
 
+    def test_recreate_use_lifo(self):
+        p = self._queuepool_fixture(pool_size=1, use_lifo=True)
+        p2 = p.recreate()
+        assert p2._pool.use_lifo is True
+
+    def test_fifo_checkout_order(self):
+        p = self._queuepool_fixture(pool_size=3, max_overflow=0)
+        conns = [p.connect() for i in range(3)]
+        dbapi_conns = [c.connection for c in conns]
+        for c in conns:
+            c.close()
+
+        conns = [p.connect() for i in range(3)]
+        eq_(
+            [c.connection for c in conns],
+            dbapi_conns
+        )
+
+    def test_lifo_checkout_order(self):
+        p = self._queuepool_fixture(pool_size=3, max_overflow=0, use_lifo=True)
+        conns = [p.connect() for i in range(3)]
+        dbapi_conns = [c.connection for c in conns]
+        for c in conns:
+            c.close()
+
+        conns = [p.connect() for i in range(3)]
+        eq_(
+            [c.connection for c in conns],
+            list(reversed(dbapi_conns))
+        )
+
+    def test_lifo_reuses_hot_connection(self):
+        p = self._queuepool_fixture(pool_size=3, max_overflow=0, use_lifo=True)
+        conns = [p.connect() for i in range(3)]
+        hot = conns[-1].connection
+        for c in conns:
+            c.close()
+
+        for i in range(5):
+            c = p.connect()
+            assert c.connection is hot
+            c.close()
+
+    def test_stats(self):
+        p = self._queuepool_fixture(pool_size=2, max_overflow=1)
+        c1, c2, c3 = p.connect(), p.connect(), p.connect()
+        c3.invalidate()
+        c1.close()
+        c2.close()
+        c3.close()
+        c1 = p.connect()
+
+        eq_(
+            p.stats(),
+            {
+                "checkouts": 4, "checkins": 3, "invalidations": 1,
+                "size": 2, "checkedin": 1, "checkedout": 1, "overflow": 0,
+                "overflow_high_water": 1, "exhausted": 0, "timeouts": 0,
+                "wait_histogram": [
+                    (.001, 0), (.01, 0), (.1, 0), (1, 0), (10, 0), (None, 0)
+                ]
+            }
+        )
+
+    def test_stats_overflow_high_water_below_size(self):
+        p = self._queuepool_fixture(pool_size=5, max_overflow=10)
+        c1 = p.connect()
+        eq_(p.stats()["overflow_high_water"], -4)
+
+    def test_reset_stats(self):
+        p = self._queuepool_fixture(pool_size=2, max_overflow=0)
+        c1 = p.connect()
+        c1.close()
+        c1 = p.connect()
+        p.reset_stats()
+
+        stats = p.stats()
+        eq_(stats["checkouts"], 0)
+        eq_(stats["checkins"], 0)
+        eq_(stats["checkedout"], 1)
+        eq_(stats["overflow_high_water"], -1)
+
+    def test_stats_timeout(self):
+        p = self._queuepool_fixture(pool_size=1, max_overflow=0, timeout=.1)
+        c1 = p.connect()
+        assert_raises(tsa.exc.TimeoutError, p.connect)
+
+        stats = p.stats()
+        eq_(stats["exhausted"], 1)
+        eq_(stats["timeouts"], 1)
+        eq_(sum(count for bound, count in stats["wait_histogram"]), 0)
+
+    @testing.requires.threading_with_mock
+    def test_stats_wait(self):
+        p = self._queuepool_fixture(pool_size=1, max_overflow=0, timeout=10)
+        c1 = p.connect()
+
+        def return_conn():
+            time.sleep(.2)
+            c1.close()
+        t = threading.Thread(target=return_conn)
+        t.start()
+
+        c2 = p.connect()
+        t.join(join_timeout)
+
+        stats = p.stats()
+        eq_(stats["exhausted"], 1)
+        eq_(stats["timeouts"], 0)
+        eq_(
+            [count for bound, count in stats["wait_histogram"]],
+            [0, 0, 0, 1, 0, 0]
+        )
+
     def test_reconnect(self):
         """tests reconnect operations at the pool level.  SA's
         engine/dialect includes another layer of reconnect support for
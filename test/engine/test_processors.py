@@ -1,5 +1,9 @@
+# coding: utf-8
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing import assert_raises_message, eq_
+from sqlalchemy import bindparam
+from sqlalchemy.util import u, b
+import datetime
 
 
 class _DateProcessorTest(fixtures.TestBase):
@@ -65,6 +69,190 @@ class CDateProcessorTest(_DateProcessorTest):
         cls.module = cprocessors
 
 
+class _BindProcessorTest(fixtures.TestBase):
+    def test_boolean_to_int(self):
+        eq_(self.module.boolean_to_int(None), None)
+        eq_(self.module.boolean_to_int(True), 1)
+        eq_(self.module.boolean_to_int(False), 0)
+        eq_(self.module.boolean_to_int(5), 5)
+
+    def test_datetime_to_str(self):
+        eq_(self.module.datetime_to_str(None), None)
+        eq_(
+            self.module.datetime_to_str(
+                datetime.datetime(2012, 10, 15, 12, 57, 18, 536)),
+            "2012-10-15 12:57:18.000536"
+        )
+        eq_(
+            self.module.datetime_to_str(datetime.date(2012, 10, 15)),
+            "2012-10-15 00:00:00.000000"
+        )
+        assert_raises_message(
+            TypeError,
+            "SQLite DateTime type only accepts Python datetime and date "
+            "objects as input.",
+            self.module.datetime_to_str, "2012-10-15"
+        )
+
+    def test_date_to_str(self):
+        eq_(self.module.date_to_str(None), None)
+        eq_(
+            self.module.date_to_str(datetime.date(812, 1, 5)),
+            "0812-01-05"
+        )
+        assert_raises_message(
+            TypeError,
+            "SQLite Date type only accepts Python date objects as input.",
+            self.module.date_to_str, 5
+        )
+
+    def test_time_to_str(self):
+        eq_(self.module.time_to_str(None), None)
+        eq_(
+            self.module.time_to_str(datetime.time(8, 5, 9, 10)),
+            "08:05:09.000010"
+        )
+        assert_raises_message(
+            TypeError,
+            "SQLite Time type only accepts Python time objects as input.",
+            self.module.time_to_str, datetime.date(2012, 10, 15)
+        )
+
+    def test_unicode_bind(self):
+        process = self._unicode_bind_processor("utf-8")
+        eq_(process(None), None)
+        eq_(process(u("méil")), b("m\xc3\xa9il"))
+        eq_(process(b("m\xc3\xa9il")), b("m\xc3\xa9il"))
+        eq_(process(5), 5)
+
+    def test_unicode_bind_errors(self):
+        process = self._unicode_bind_processor("ascii")
+        assert_raises_message(
+            UnicodeEncodeError,
+            "ascii",
+            process, u("méil")
+        )
+        process = self._unicode_bind_processor("ascii", "replace")
+        eq_(process(u("méil")), b("m?il"))
+
+
+class PyBindProcessorTest(_BindProcessorTest):
+    @classmethod
+    def setup_class(cls):
+        from sqlalchemy import processors
+        cls.module = type("util", (object,),
+                          dict(
+                              (k, staticmethod(v))
+                              for k, v in list(
+                                  processors.py_fallback().items())
+                          )
+                          )
+
+    def _unicode_bind_processor(self, encoding, errors=None):
+        return self.module.unicode_bind_processor_factory(encoding, errors)
+
+
+class CBindProcessorTest(_BindProcessorTest):
+    __requires__ = ('cextensions',)
+
+    @classmethod
+    def setup_class(cls):
+        from sqlalchemy import cprocessors
+        cls.module = cprocessors
+
+    def _unicode_bind_processor(self, encoding, errors=None):
+        if errors is not None:
+            return self.module.UnicodeBindProcessor(encoding, errors).process
+        else:
+            return self.module.UnicodeBindProcessor(encoding).process
+
+
+class _ConstructParamsTest(fixtures.TestBase):
+    def _plan(self, *binds):
+        return [(bind, bind.key, "%s_name" % bind.key) for bind in binds]
+
+    def test_by_key_and_name(self):
+        plan = self._plan(bindparam("x"), bindparam("y"), bindparam("z"))
+        eq_(
+            self.module._construct_params(
+                plan, {"x": 1, "y_name": 2, "z": 3, "z_name": 4}, None, True),
+            {"x_name": 1, "y_name": 2, "z_name": 3}
+        )
+
+    def test_defaults(self):
+        plan = self._plan(
+            bindparam("x", 5),
+            bindparam("y", callable_=lambda: 10),
+            bindparam("z", required=False))
+        eq_(
+            self.module._construct_params(plan, None, None, True),
+            {"x_name": 5, "y_name": 10, "z_name": None}
+        )
+        eq_(
+            self.module._construct_params(plan, {"x": 7}, None, True),
+            {"x_name": 7, "y_name": 10, "z_name": None}
+        )
+
+    def test_resolved(self):
+        x, y = bindparam("x", 5), bindparam("y", 6)
+        eq_(
+            self.module._construct_params(
+                self._plan(x, y), {}, {x: bindparam("q", 12)}, True),
+            {"x_name": 12, "y_name": 6}
+        )
+
+    def test_required_missing(self):
+        plan = self._plan(bindparam("x", 5), bindparam("y"))
+        eq_(
+            self.module._construct_params(plan, {"x": 7}, None, True),
+            None
+        )
+        eq_(
+            self.module._construct_params(plan, {"x": 7}, None, False),
+            {"x_name": 7, "y_name": None}
+        )
+
+    def test_non_dict_params(self):
+        class Params(object):
+            def __init__(self, d):
+                self.d = d
+
+            def __contains__(self, key):
+                return key in self.d
+
+            def __getitem__(self, key):
+                return self.d[key]
+
+        plan = self._plan(bindparam("x", 5), bindparam("y", 6))
+        eq_(
+            self.module._construct_params(
+                plan, Params({"y_name": 8}), None, True),
+            {"x_name": 5, "y_name": 8}
+        )
+
+
+class PyConstructParamsTest(_ConstructParamsTest):
+    @classmethod
+    def setup_class(cls):
+        from sqlalchemy.sql import compiler
+        cls.module = type("util", (object,),
+                          dict(
+                              (k, staticmethod(v))
+                              for k, v in list(
+                                  compiler.py_fallback().items())
+                          )
+                          )
+
+
+class CConstructParamsTest(_ConstructParamsTest):
+    __requires__ = ('cextensions', )
+
+    @classmethod
+    def setup_class(cls):
+        from sqlalchemy import cutils
+        cls.module = cutils
+
+
 class _DistillArgsTest(fixtures.TestBase):
     def test_distill_none(self):
         eq_(
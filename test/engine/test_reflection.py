@@ -1,5 +1,8 @@
 import operator
 
+import os
+import shutil
+import tempfile
 import unicodedata
 import sqlalchemy as sa
 from sqlalchemy import schema, events, event, inspect
@@ -1649,3 +1652,142 @@ class ColumnEventsTest(fixtures.RemovesEvents, fixtures.TestBase):
             "x", {"info": {"a": "b"}},
             lambda table: eq_(table.c.x.info, {"a": "b"})
         )
+
+
+class ReflectionCacheTest(fixtures.RemovesEvents, fixtures.TestBase):
+    __only_on__ = 'sqlite', 'postgresql'
+    __backend__ = True
+
+    def setup(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'reflection.cache')
+        self.metadata = MetaData(testing.db)
+        Table('rc_parent', self.metadata,
+              Column('id', Integer, primary_key=True),
+              Column('data', String(30)))
+        Table('rc_child', self.metadata,
+              Column('id', Integer, primary_key=True),
+              Column('parent_id', Integer, sa.ForeignKey('rc_parent.id')),
+              sa.Index('rc_ix', 'parent_id'))
+        self.metadata.create_all()
+
+    def teardown(self):
+        self.metadata.drop_all()
+        shutil.rmtree(self.dir)
+        super(ReflectionCacheTest, self).teardown()
+
+    def _statements(self):
+        stmts = []
+
+        def before_cursor_execute(conn, cursor, statement, *arg):
+            stmts.append(statement)
+        self.event_listen(
+            testing.db, 'before_cursor_execute', before_cursor_execute)
+        return stmts
+
+    def _reflect(self, cache):
+        m = MetaData()
+        m.reflect(
+            testing.db, only=['rc_parent', 'rc_child'],
+            reflection_cache=cache)
+        return m
+
+    def _assert_tables(self, m):
+        parent, child = m.tables['rc_parent'], m.tables['rc_child']
+        eq_(parent.c.keys(), ['id', 'data'])
+        eq_(child.c.keys(), ['id', 'parent_id'])
+        eq_([c.name for c in parent.primary_key], ['id'])
+        assert child.c.parent_id.references(parent.c.id)
+        eq_([idx.name for idx in child.indexes], ['rc_ix'])
+
+    def test_file_round_trip(self):
+        self._assert_tables(self._reflect(
+            sa.engine.reflection.FileReflectionCache(self.path)))
+        assert os.path.exists(self.path)
+
+        # a new cache, as would be used by another process
+        stmts = self._statements()
+        m = self._reflect(
+            sa.engine.reflection.FileReflectionCache(self.path))
+        self._assert_tables(m)
+
+        # only the fingerprint was fetched from the database
+        fingerprint_stmts = len(stmts)
+        del stmts[:]
+        inspect(testing.db).get_schema_fingerprint()
+        eq_(fingerprint_stmts, len(stmts))
+
+    @testing.skip_if(lambda: sa.util.win32, "POSIX file permissions")
+    def test_file_mode(self):
+        umask = os.umask(0o022)
+        try:
+            self._reflect(
+                sa.engine.reflection.FileReflectionCache(self.path))
+            eq_(os.stat(self.path).st_mode & 0o777, 0o644)
+
+            os.chmod(self.path, 0o640)
+            cache = sa.engine.reflection.FileReflectionCache(self.path)
+            cache.set(('x', ), 'y')
+            eq_(os.stat(self.path).st_mode & 0o777, 0o640)
+        finally:
+            os.umask(umask)
+
+    def test_schema_change_invalidates(self):
+        cache = sa.engine.reflection.FileReflectionCache(self.path)
+        self._reflect(cache)
+
+        testing.db.execute("ALTER TABLE rc_parent ADD COLUMN extra INTEGER")
+
+        m = self._reflect(
+            sa.engine.reflection.FileReflectionCache(self.path))
+        eq_(m.tables['rc_parent'].c.keys(), ['id', 'data', 'extra'])
+
+        m = self._reflect(
+            sa.engine.reflection.FileReflectionCache(self.path))
+        eq_(m.tables['rc_parent'].c.keys(), ['id', 'data', 'extra'])
+
+    def test_custom_fingerprint(self):
+        fingerprints = []
+
+        def fingerprint(conn, schema):
+            fingerprints.append(schema)
+            return 'v1'
+        cache = sa.engine.reflection.ReflectionCache(fingerprint=fingerprint)
+        self._reflect(cache)
+
+        stmts = self._statements()
+        self._assert_tables(self._reflect(cache))
+        eq_(stmts, [])
+        eq_(fingerprints, [None, None])
+
+    def test_no_fingerprint(self):
+        cache = sa.engine.reflection.ReflectionCache(
+            fingerprint=lambda conn, schema: None)
+        self._assert_tables(self._reflect(cache))
+        eq_(cache._entries, {})
+
+    def test_unreadable_file(self):
+        with open(self.path, 'wb') as file_:
+            file_.write(b'not a pickle')
+
+        cache = sa.engine.reflection.FileReflectionCache(self.path)
+        with testing.expect_warnings("Could not read reflection cache file"):
+            self._assert_tables(self._reflect(cache))
+
+        self._assert_tables(self._reflect(
+            sa.engine.reflection.FileReflectionCache(self.path)))
+
+    def test_column_reflect_not_cached(self):
+        cache = sa.engine.reflection.ReflectionCache()
+
+        def column_reflect(insp, table, column_info):
+            column_info['key'] = column_info['name'] + '_key'
+        event.listen(schema.Table, 'column_reflect', column_reflect)
+        try:
+            m = self._reflect(cache)
+        finally:
+            event.remove(schema.Table, 'column_reflect', column_reflect)
+        eq_(m.tables['rc_parent'].c.keys(), ['id_key', 'data_key'])
+
+        m = self._reflect(cache)
+        eq_(m.tables['rc_parent'].c.keys(), ['id', 'data'])
@@ -5,8 +5,10 @@ from sqlalchemy.orm import relationship, interfaces, configure_mappers
 from sqlalchemy.ext.automap import generate_relationship
 from sqlalchemy.testing.mock import Mock
 from sqlalchemy import String, Integer, ForeignKey
-from sqlalchemy import testing
+from sqlalchemy import testing, event
+from sqlalchemy.testing import eq_
 from sqlalchemy.testing.schema import Table, Column
+from sqlalchemy.engine.reflection import ReflectionCache
 
 
 class AutomapTest(fixtures.MappedTest):
@@ -156,6 +158,33 @@ class AutomapTest(fixtures.MappedTest):
             (Base, interfaces.ONETOMANY, "addresses_collection"),
         ])
 
+    def test_reflection_cache(self):
+        cache = ReflectionCache(fingerprint=lambda conn, schema: 'v1')
+
+        Base = automap_base()
+        Base.prepare(testing.db, reflect=True, reflection_cache=cache)
+        assert cache._entries
+
+        stmts = []
+
+        def before_cursor_execute(conn, cursor, statement, *arg):
+            stmts.append(statement)
+        event.listen(testing.db, 'before_cursor_execute',
+                     before_cursor_execute)
+        try:
+            Base = automap_base()
+            Base.prepare(testing.db, reflect=True, reflection_cache=cache)
+        finally:
+            event.remove(testing.db, 'before_cursor_execute',
+                         before_cursor_execute)
+        eq_(stmts, [])
+
+        User = Base.classes.users
+        Address = Base.classes.addresses
+        a1 = Address(email_address='e1')
+        u1 = User(name='u1', addresses_collection=[a1])
+        assert a1.users is u1
+
 
 class CascadeTest(fixtures.MappedTest):
     @classmethod
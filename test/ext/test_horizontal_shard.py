@@ -1,5 +1,6 @@
 import datetime
 import os
+import threading
 from sqlalchemy import *
 from sqlalchemy import event
 from sqlalchemy import sql, util
@@ -8,11 +9,25 @@ from sqlalchemy.ext.horizontal_shard import ShardedSession
 from sqlalchemy.sql import operators
 from sqlalchemy.testing import fixtures
 from sqlalchemy.testing.engines import testing_engine
-from sqlalchemy.testing import eq_
+from sqlalchemy.testing import eq_, assert_raises_message
+from sqlalchemy import exc as sa_exc
 
 # TODO: ShardTest can be turned into a base for further subclasses
 
 
+class InlineExecutor(object):
+    def submit(self, fn, *args):
+        fn(*args)
+
+
+class ThreadExecutor(object):
+    def __init__(self):
+        self.threads = []
+
+    def submit(self, fn, *args):
+        t = threading.Thread(target=fn, args=args)
+        self.threads.append(t)
+        t.start()
 
 
 class ShardTest(object):
@@ -210,17 +225,186 @@ class ShardTest(object):
             'south_america']
         )
 
+    def test_roundtrip_executor(self):
+        create_session.configure(executor=InlineExecutor())
+        self.test_roundtrip()
+
+    def test_shard_id_event_executor(self):
+        create_session.configure(executor=InlineExecutor())
+        self.test_shard_id_event()
+
+    def test_get_executor(self):
+        create_session.configure(executor=InlineExecutor())
+        canary = []
+
+        def load(instance, ctx):
+            canary.append(ctx.attributes["shard_id"])
+
+        event.listen(WeatherLocation, "load", load)
+        sess = self._fixture_data()
+
+        london = sess.query(WeatherLocation).get(4)
+        eq_(london.continent, 'Europe')
+        eq_(canary, ['europe'])
+        assert sess.query(WeatherLocation).get(12) is None
+
+    def test_get_executor_first_shard_wins(self):
+        create_session.configure(executor=InlineExecutor())
+        canary = []
+
+        def load(instance, ctx):
+            canary.append(ctx.attributes["shard_id"])
+
+        event.listen(WeatherLocation, "load", load)
+        sess = self._fixture_data()
+
+        # id 4 is London on 'europe'; 'asia' precedes it in id_chooser
+        db2.execute(weather_locations.insert(),
+                    id=4, continent='Asia', city='Osaka')
+        loc = sess.query(WeatherLocation).get(4)
+        eq_(loc.continent, 'Asia')
+        eq_(canary, ['asia'])
+
+    def _test_merge_sorted(self, sess):
+        q = sess.query(WeatherLocation).order_by(WeatherLocation.id)
+        eq_(sorted(loc.id for loc in q), [1, 2, 3, 4, 5, 6, 7])
+        eq_([loc.id for loc in q.merge_sorted()], [1, 2, 3, 4, 5, 6, 7])
+
+        q = sess.query(WeatherLocation).\
+            order_by(WeatherLocation.id.desc()).merge_sorted()
+        eq_([loc.id for loc in q], [7, 6, 5, 4, 3, 2, 1])
+
+        q = sess.query(WeatherLocation.continent, WeatherLocation.id).\
+            order_by(WeatherLocation.continent, WeatherLocation.id).\
+            merge_sorted()
+        eq_(
+            [tuple(row) for row in q],
+            [('Asia', 1), ('Europe', 4), ('Europe', 5),
+             ('North America', 2), ('North America', 3),
+             ('South America', 6), ('South America', 7)]
+        )
+
+        q = sess.query(WeatherLocation).\
+            order_by(WeatherLocation.id.desc()).\
+            merge_sorted(key=lambda loc: loc.id % 4, reverse=True)
+        eq_([loc.id for loc in q], [3, 7, 2, 6, 1, 5, 4])
+
+    def test_merge_sorted(self):
+        self._test_merge_sorted(self._fixture_data())
+
+    def test_merge_sorted_executor(self):
+        create_session.configure(executor=InlineExecutor())
+        self._test_merge_sorted(self._fixture_data())
+
+    def _test_merge_sorted_nulls(self):
+        sess = self._fixture_data()
+        # NULL temperatures on 'europe' and 'south_america', which
+        # also has an 85
+        db3.execute(weather_reports.insert(), location_id=4)
+        db4.execute(weather_reports.insert(), location_id=6)
+
+        q = sess.query(Report.temperature).\
+            order_by(Report.temperature).merge_sorted()
+        eq_([row.temperature for row in q], [None, None, 75, 80, 85])
+
+        q = sess.query(Report.temperature).\
+            order_by(Report.temperature.desc()).merge_sorted()
+        eq_([row.temperature for row in q], [85, 80, 75, None, None])
+
+        q = sess.query(Report.temperature).\
+            order_by(Report.temperature.nullslast()).merge_sorted()
+        eq_([row.temperature for row in q], [75, 80, 85, None, None])
+
+        q = sess.query(Report.temperature).\
+            order_by(Report.temperature.desc().nullsfirst()).merge_sorted()
+        eq_([row.temperature for row in q], [None, None, 85, 80, 75])
+
+    def test_merge_sorted_nulls(self):
+        self._test_merge_sorted_nulls()
+
+    def test_merge_sorted_nulls_executor(self):
+        create_session.configure(executor=InlineExecutor())
+        self._test_merge_sorted_nulls()
+
+    def test_merge_sorted_no_key(self):
+        sess = create_session()
+        q = sess.query(WeatherLocation)
+        assert_raises_message(
+            sa_exc.InvalidRequestError,
+            "Query has no ORDER BY criteria",
+            q.merge_sorted
+        )
+        assert_raises_message(
+            sa_exc.InvalidRequestError,
+            "Can't derive a merge key from ORDER BY expression",
+            q.order_by(func.abs(WeatherLocation.id)).merge_sorted
+        )
+        assert_raises_message(
+            sa_exc.InvalidRequestError,
+            "Can't derive a merge key from ORDER BY expression",
+            sess.query(Bundle('b', WeatherLocation.id)).
+            order_by(WeatherLocation.id).merge_sorted
+        )
+        assert_raises_message(
+            sa_exc.InvalidRequestError,
+            "Can't derive a merge key from ORDER BY criteria of mixed",
+            q.order_by(
+                WeatherLocation.continent, WeatherLocation.id.desc()
+            ).merge_sorted
+        )
+
+    def test_executor_stop_early(self):
+        create_session.configure(executor=InlineExecutor())
+        self._fixture_data()
+        checkedout = set()
+        checkouts = []
+        for pool in set(db.pool for db in (db1, db2, db3, db4)):
+            event.listen(pool, "checkout",
+                         lambda dbapi_conn, rec, proxy:
+                         (checkedout.add(rec), checkouts.append(rec)))
+            event.listen(pool, "checkin",
+                         lambda dbapi_conn, rec: checkedout.discard(rec))
+
+        sess = create_session(autocommit=True)
+        rows = iter(sess.query(WeatherLocation))
+        next(rows)
+        assert checkouts
+        rows.close()
+        eq_(checkedout, set())
+
+    def test_executor_error(self):
+        create_session.configure(executor=InlineExecutor())
+        sess = create_session()
+        q = sess.query(WeatherLocation).\
+            filter(text("nonexistent_column = 5"))
+        assert_raises_message(
+            sa_exc.OperationalError,
+            "no such column",
+            q.all
+        )
+
+
 class DistinctEngineShardTest(ShardTest, fixtures.TestBase):
 
     def _init_dbs(self):
+        options = dict(connect_args={'check_same_thread': False})
         db1 = testing_engine('sqlite:///shard1.db',
-                            options=dict(pool_threadlocal=True))
-        db2 = testing_engine('sqlite:///shard2.db')
-        db3 = testing_engine('sqlite:///shard3.db')
-        db4 = testing_engine('sqlite:///shard4.db')
+                             options=dict(pool_threadlocal=True, **options))
+        db2 = testing_engine('sqlite:///shard2.db', options=options)
+        db3 = testing_engine('sqlite:///shard3.db', options=options)
+        db4 = testing_engine('sqlite:///shard4.db', options=options)
 
         return db1, db2, db3, db4
 
+    def test_roundtrip_threaded(self):
+        executor = ThreadExecutor()
+        create_session.configure(executor=executor)
+        self.test_roundtrip()
+        self._test_merge_sorted(create_session())
+        for t in executor.threads:
+            t.join()
+        assert len(executor.threads) > 4
+
     def tearDown(self):
         clear_mappers()
 
@@ -670,7 +670,8 @@ class OneToManyManyToOneTest(fixtures.MappedTest):
             CompiledSQL("UPDATE person SET favorite_ball_id=:favorite_ball_id "
                 "WHERE person.id = :person_id",
                 lambda ctx: {'person_id': p.id, 'favorite_ball_id': None}),
-            CompiledSQL("DELETE FROM ball WHERE ball.id = :id", None), # lambda ctx:[{'id': 1L}, {'id': 4L}, {'id': 3L}, {'id': 2L}])
+            CompiledSQL("DELETE FROM ball WHERE ball.id IN "
+                "(:id_0, :id_1, :id_2, :id_3)", None),
             CompiledSQL("DELETE FROM person WHERE person.id = :id", lambda ctx:[{'id': p.id}])
         )
 
@@ -809,11 +810,12 @@ class OneToManyManyToOneTest(fixtures.MappedTest):
             CompiledSQL("DELETE FROM person WHERE person.id = :id",
              lambda ctx:[{'id':p.id}]),
 
-            CompiledSQL("DELETE FROM ball WHERE ball.id = :id",
-             lambda ctx:[{'id': b.id},
-                         {'id': b2.id},
-                         {'id': b3.id},
-                         {'id': b4.id}])
+            CompiledSQL("DELETE FROM ball WHERE ball.id IN "
+                "(:id_0, :id_1, :id_2, :id_3)",
+             lambda ctx: {'id_0': b.id,
+                          'id_1': b2.id,
+                          'id_2': b3.id,
+                          'id_3': b4.id})
         )
 
 
@@ -2557,7 +2557,9 @@ class YieldTest(_fixtures.FixtureTest):
         q = sess.query(User).yield_per(1)
         q = q.execution_options(foo='bar')
         assert q._yield_per
-        eq_(q._execution_options, {"stream_results": True, "foo": "bar"})
+        eq_(
+            q._execution_options,
+            {"stream_results": True, "max_row_buffer": 1, "foo": "bar"})
 
     def test_no_joinedload_opt(self):
         self._eagerload_mappings()
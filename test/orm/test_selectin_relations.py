@@ -0,0 +1,532 @@
+from sqlalchemy.testing import eq_, is_, is_not_
+from sqlalchemy import testing
+from sqlalchemy.testing.schema import Table, Column
+from sqlalchemy import Integer, String, ForeignKey, bindparam
+from sqlalchemy.orm import selectinload, selectinload_all, \
+    mapper, relationship, create_session, aliased, deferred, Session
+from sqlalchemy.testing import assert_raises, \
+    assert_raises_message
+from sqlalchemy.testing import fixtures
+from sqlalchemy.testing.mock import patch
+from test.orm import _fixtures
+import sqlalchemy as sa
+
+
+class EagerTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
+    run_inserts = 'once'
+    run_deletes = None
+
+    def test_basic(self):
+        users, Address, addresses, User = (self.tables.users,
+                                           self.classes.Address,
+                                           self.tables.addresses,
+                                           self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(
+                mapper(Address, addresses),
+                order_by=Address.id)
+        })
+        sess = create_session()
+
+        q = sess.query(User).options(selectinload(User.addresses))
+
+        def go():
+            eq_(
+                [User(id=7, addresses=[
+                    Address(id=1, email_address='jack@bean.com')])],
+                q.filter(User.id == 7).all()
+            )
+
+        self.assert_sql_count(testing.db, go, 2)
+
+        def go():
+            eq_(
+                self.static.user_address_result,
+                q.order_by(User.id).all()
+            )
+        self.assert_sql_count(testing.db, go, 2)
+
+    def test_from_aliased(self):
+        users, Dingaling, User, dingalings, Address, addresses = (
+            self.tables.users,
+            self.classes.Dingaling,
+            self.classes.User,
+            self.tables.dingalings,
+            self.classes.Address,
+            self.tables.addresses)
+
+        mapper(Dingaling, dingalings)
+        mapper(Address, addresses, properties={
+            'dingalings': relationship(Dingaling, order_by=Dingaling.id)
+        })
+        mapper(User, users, properties={
+            'addresses': relationship(
+                Address,
+                order_by=Address.id)
+        })
+        sess = create_session()
+
+        u = aliased(User)
+
+        q = sess.query(u).options(selectinload(u.addresses))
+
+        def go():
+            eq_(
+                [User(id=7, addresses=[
+                    Address(id=1, email_address='jack@bean.com')])],
+                q.filter(u.id == 7).all()
+            )
+
+        self.assert_sql_count(testing.db, go, 2)
+
+        q = sess.query(u).\
+            options(selectinload_all(u.addresses, Address.dingalings))
+
+        def go():
+            eq_(
+                [
+                    User(id=8, addresses=[
+                        Address(id=2, email_address='ed@wood.com',
+                                dingalings=[Dingaling()]),
+                        Address(id=3, email_address='ed@bettyboop.com'),
+                        Address(id=4, email_address='ed@lala.com'),
+                    ]),
+                    User(id=9, addresses=[
+                        Address(id=5, dingalings=[Dingaling()])
+                    ]),
+                ],
+                q.filter(u.id.in_([8, 9])).order_by(u.id).all()
+            )
+        self.assert_sql_count(testing.db, go, 3)
+
+    def test_from_get(self):
+        users, Address, addresses, User = (self.tables.users,
+                                           self.classes.Address,
+                                           self.tables.addresses,
+                                           self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(
+                mapper(Address, addresses),
+                order_by=Address.id)
+        })
+        sess = create_session()
+
+        q = sess.query(User).options(selectinload(User.addresses))
+
+        def go():
+            eq_(
+                User(id=7, addresses=[
+                    Address(id=1, email_address='jack@bean.com')]),
+                q.get(7)
+            )
+
+        self.assert_sql_count(testing.db, go, 2)
+
+    def test_from_params(self):
+        users, Address, addresses, User = (self.tables.users,
+                                           self.classes.Address,
+                                           self.tables.addresses,
+                                           self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(
+                mapper(Address, addresses),
+                order_by=Address.id)
+        })
+        sess = create_session()
+
+        q = sess.query(User).options(selectinload(User.addresses))
+
+        def go():
+            eq_(
+                User(id=7, addresses=[
+                    Address(id=1, email_address='jack@bean.com')]),
+                q.filter(User.id == bindparam('foo')).params(foo=7).one()
+            )
+
+        self.assert_sql_count(testing.db, go, 2)
+
+    def test_disable_dynamic(self):
+        """test no selectin option on a dynamic."""
+
+        users, Address, addresses, User = (self.tables.users,
+                                           self.classes.Address,
+                                           self.tables.addresses,
+                                           self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(Address, lazy="dynamic")
+        })
+        mapper(Address, addresses)
+        sess = create_session()
+
+        assert_raises_message(
+            sa.exc.InvalidRequestError,
+            "User.addresses' does not support object population - "
+            "eager loading cannot be applied.",
+            sess.query(User).options(selectinload(User.addresses)).first,
+        )
+
+    def test_many_to_many_plain(self):
+        keywords, items, item_keywords, Keyword, Item = (
+            self.tables.keywords,
+            self.tables.items,
+            self.tables.item_keywords,
+            self.classes.Keyword,
+            self.classes.Item)
+
+        mapper(Keyword, keywords)
+        mapper(Item, items, properties=dict(
+            keywords=relationship(Keyword, secondary=item_keywords,
+                                  lazy='selectin', order_by=keywords.c.id)))
+
+        q = create_session().query(Item).order_by(Item.id)
+
+        def go():
+            eq_(self.static.item_keyword_result, q.all())
+        self.assert_sql_count(testing.db, go, 2)
+
+    def test_many_to_many_with_join(self):
+        keywords, items, item_keywords, Keyword, Item = (
+            self.tables.keywords,
+            self.tables.items,
+            self.tables.item_keywords,
+            self.classes.Keyword,
+            self.classes.Item)
+
+        mapper(Keyword, keywords)
+        mapper(Item, items, properties=dict(
+            keywords=relationship(Keyword, secondary=item_keywords,
+                                  lazy='selectin', order_by=keywords.c.id)))
+
+        q = create_session().query(Item).order_by(Item.id)
+
+        def go():
+            eq_(self.static.item_keyword_result[0:2],
+                q.join('keywords').filter(Keyword.name == 'red').all())
+        self.assert_sql_count(testing.db, go, 2)
+
+    def test_cyclical(self):
+        """A circular eager relationship breaks the cycle with a lazy loader"""
+
+        Address, addresses, users, User = (self.classes.Address,
+                                           self.tables.addresses,
+                                           self.tables.users,
+                                           self.classes.User)
+
+        mapper(Address, addresses)
+        mapper(User, users, properties=dict(
+            addresses=relationship(
+                Address, lazy='selectin',
+                backref=sa.orm.backref('user', lazy='selectin'),
+                order_by=Address.id)
+        ))
+        is_(sa.orm.class_mapper(User).get_property('addresses').lazy,
+            'selectin')
+        is_(sa.orm.class_mapper(Address).get_property('user').lazy,
+            'selectin')
+
+        sess = create_session()
+        eq_(self.static.user_address_result,
+            sess.query(User).order_by(User.id).all())
+
+    def test_limit(self):
+        """Limit operations combined with selectin-load relationships."""
+
+        users, items, order_items, orders, Item, User, Address, \
+            Order, addresses = (self.tables.users,
+                                self.tables.items,
+                                self.tables.order_items,
+                                self.tables.orders,
+                                self.classes.Item,
+                                self.classes.User,
+                                self.classes.Address,
+                                self.classes.Order,
+                                self.tables.addresses)
+
+        mapper(Item, items)
+        mapper(Order, orders, properties={
+            'items': relationship(Item, secondary=order_items,
+                                  lazy='selectin', order_by=items.c.id)
+        })
+        mapper(User, users, properties={
+            'addresses': relationship(mapper(Address, addresses),
+                                      lazy='selectin',
+                                      order_by=addresses.c.id),
+            'orders': relationship(Order, lazy='select',
+                                   order_by=orders.c.id)
+        })
+
+        sess = create_session()
+        q = sess.query(User)
+
+        l = q.order_by(User.id).limit(2).offset(1).all()
+        eq_(self.static.user_all_result[1:3], l)
+
+        sess = create_session()
+        l = q.order_by(sa.desc(User.id)).limit(2).offset(2).all()
+        eq_(list(reversed(self.static.user_all_result[0:2])), l)
+
+    def test_one_to_many_scalar(self):
+        Address, addresses, users, User = (self.classes.Address,
+                                           self.tables.addresses,
+                                           self.tables.users,
+                                           self.classes.User)
+
+        mapper(User, users, properties=dict(
+            address=relationship(mapper(Address, addresses),
+                                 lazy='selectin', uselist=False)
+        ))
+        q = create_session().query(User)
+
+        def go():
+            l = q.filter(users.c.id == 7).all()
+            eq_([User(id=7, address=Address(id=1))], l)
+        self.assert_sql_count(testing.db, go, 2)
+
+    def test_many_to_one(self):
+        users, Address, addresses, User = (self.tables.users,
+                                           self.classes.Address,
+                                           self.tables.addresses,
+                                           self.classes.User)
+
+        mapper(Address, addresses, properties=dict(
+            user=relationship(mapper(User, users), lazy='selectin')
+        ))
+        sess = create_session()
+        q = sess.query(Address)
+
+        def go():
+            a = q.filter(addresses.c.id == 1).one()
+            is_not_(a.user, None)
+            u1 = sess.query(User).get(7)
+            is_(a.user, u1)
+        self.assert_sql_count(testing.db, go, 2)
+
+    def test_yield_per(self):
+        users, Address, addresses, User = (self.tables.users,
+                                           self.classes.Address,
+                                           self.tables.addresses,
+                                           self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(
+                mapper(Address, addresses),
+                lazy='selectin',
+                order_by=Address.id)
+        })
+        sess = create_session()
+
+        q = sess.query(User).order_by(User.id).yield_per(2)
+
+        def go():
+            eq_(
+                self.static.user_address_result,
+                list(q)
+            )
+        # two batches of parent rows, one SELECT IN each
+        self.assert_sql_count(testing.db, go, 3)
+
+    def test_chunked_by_dialect_limit(self):
+        users, Address, addresses, User = (self.tables.users,
+                                           self.classes.Address,
+                                           self.tables.addresses,
+                                           self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(
+                mapper(Address, addresses),
+                lazy='selectin',
+                order_by=Address.id)
+        })
+        sess = create_session()
+
+        q = sess.query(User).order_by(User.id)
+
+        def go():
+            eq_(
+                self.static.user_address_result,
+                q.all()
+            )
+
+        with patch.object(testing.db.dialect, "max_in_list_size", 3):
+            self.assert_sql_count(testing.db, go, 3)
+
+    def test_uselist_false_warning(self):
+        """test that multiple rows received by a
+        uselist=False raises a warning."""
+
+        User, users, orders, Order = (self.classes.User,
+                                      self.tables.users,
+                                      self.tables.orders,
+                                      self.classes.Order)
+
+        mapper(User, users, properties={
+            'order': relationship(Order, uselist=False)
+        })
+        mapper(Order, orders)
+        s = create_session()
+        assert_raises(sa.exc.SAWarning,
+                      s.query(User).options(selectinload(User.order)).all)
+
+
+class LoadOnExistingTest(_fixtures.FixtureTest):
+    """test that loaders from a base Query fully populate."""
+
+    run_inserts = 'once'
+    run_deletes = None
+
+    def _collection_to_scalar_fixture(self):
+        User, Address, Dingaling = self.classes.User, \
+            self.classes.Address, self.classes.Dingaling
+        mapper(User, self.tables.users, properties={
+            'addresses': relationship(Address),
+        })
+        mapper(Address, self.tables.addresses, properties={
+            'dingaling': relationship(Dingaling)
+        })
+        mapper(Dingaling, self.tables.dingalings)
+
+        sess = Session(autoflush=False)
+        return User, Address, Dingaling, sess
+
+    def _eager_config_fixture(self):
+        User, Address = self.classes.User, self.classes.Address
+        mapper(User, self.tables.users, properties={
+            'addresses': relationship(Address, lazy="selectin",
+                                      order_by=self.tables.addresses.c.id),
+        })
+        mapper(Address, self.tables.addresses)
+        sess = Session(autoflush=False)
+        return User, Address, sess
+
+    def _deferred_config_fixture(self):
+        User, Address = self.classes.User, self.classes.Address
+        mapper(User, self.tables.users, properties={
+            'name': deferred(self.tables.users.c.name),
+            'addresses': relationship(Address, lazy="selectin"),
+        })
+        mapper(Address, self.tables.addresses)
+        sess = Session(autoflush=False)
+        return User, Address, sess
+
+    def test_no_query_on_refresh(self):
+        User, Address, sess = self._eager_config_fixture()
+
+        u1 = sess.query(User).get(8)
+        assert 'addresses' in u1.__dict__
+        sess.expire(u1)
+
+        def go():
+            eq_(u1.id, 8)
+        self.assert_sql_count(testing.db, go, 1)
+        assert 'addresses' not in u1.__dict__
+
+    def test_no_query_on_deferred(self):
+        User, Address, sess = self._deferred_config_fixture()
+        u1 = sess.query(User).get(8)
+        assert 'addresses' in u1.__dict__
+        sess.expire(u1, ['addresses'])
+
+        def go():
+            eq_(u1.name, 'ed')
+        self.assert_sql_count(testing.db, go, 1)
+        assert 'addresses' not in u1.__dict__
+
+    def test_populate_existing_propagate(self):
+        User, Address, sess = self._eager_config_fixture()
+        u1 = sess.query(User).get(8)
+        u1.addresses[2].email_address = "foofoo"
+        del u1.addresses[1]
+        u1 = sess.query(User).populate_existing().filter_by(id=8).one()
+        # collection is reverted
+        eq_(len(u1.addresses), 3)
+
+        # attributes on related items reverted
+        eq_(u1.addresses[2].email_address, "ed@lala.com")
+
+    def test_loads_second_level_collection_to_scalar(self):
+        User, Address, Dingaling, sess = self._collection_to_scalar_fixture()
+
+        u1 = sess.query(User).get(8)
+        a1 = Address()
+        u1.addresses.append(a1)
+        a2 = u1.addresses[0]
+        a2.email_address = 'foo'
+        sess.query(User).options(selectinload_all("addresses.dingaling")).\
+            filter_by(id=8).all()
+        assert u1.addresses[-1] is a1
+        for a in u1.addresses:
+            if a is not a1:
+                assert 'dingaling' in a.__dict__
+            else:
+                assert 'dingaling' not in a.__dict__
+            if a is a2:
+                eq_(a2.email_address, 'foo')
+
+    def test_load_two_levels_collection_to_scalar(self):
+        User, Address, Dingaling, sess = self._collection_to_scalar_fixture()
+
+        u1 = sess.query(User).filter_by(id=8).options(
+            selectinload("addresses")).one()
+        sess.query(User).filter_by(id=8).options(
+            selectinload_all("addresses.dingaling")).first()
+        assert 'dingaling' in u1.addresses[0].__dict__
+
+
+class CompositePKTest(fixtures.MappedTest):
+    @classmethod
+    def define_tables(cls, metadata):
+        Table('parent', metadata,
+              Column('id1', Integer, primary_key=True),
+              Column('id2', String(10), primary_key=True))
+        Table('child', metadata,
+              Column('id', Integer, primary_key=True,
+                     test_needs_autoincrement=True),
+              Column('parent_id1', Integer),
+              Column('parent_id2', String(10)),
+              sa.ForeignKeyConstraint(
+                  ['parent_id1', 'parent_id2'],
+                  ['parent.id1', 'parent.id2']))
+
+    @classmethod
+    def setup_classes(cls):
+        class Parent(cls.Comparable):
+            pass
+
+        class Child(cls.Comparable):
+            pass
+
+    @classmethod
+    def setup_mappers(cls):
+        Parent, Child = cls.classes.Parent, cls.classes.Child
+        mapper(Parent, cls.tables.parent, properties={
+            'children': relationship(
+                Child, lazy='selectin', order_by=cls.tables.child.c.id)
+        })
+        mapper(Child, cls.tables.child)
+
+    @classmethod
+    def insert_data(cls):
+        Parent, Child = cls.classes.Parent, cls.classes.Child
+        sess = Session()
+        sess.add_all([
+            Parent(id1=1, id2='a', children=[Child(), Child()]),
+            Parent(id1=1, id2='b', children=[Child()]),
+            Parent(id1=2, id2='a'),
+        ])
+        sess.commit()
+
+    def test_load(self):
+        Parent, Child = self.classes.Parent, self.classes.Child
+        sess = Session()
+
+        def go():
+            eq_(
+                [(p.id1, p.id2, len(p.children)) for p in
+                 sess.query(Parent).order_by(Parent.id1, Parent.id2)],
+                [(1, 'a', 2), (1, 'b', 1), (2, 'a', 0)]
+            )
+        self.assert_sql_count(testing.db, go, 2)
@@ -3,14 +3,14 @@ from sqlalchemy import testing
 from sqlalchemy.testing import engines
 from sqlalchemy.testing.schema import Table, Column
 from test.orm import _fixtures
-from sqlalchemy import exc, util
+from sqlalchemy import exc, util, schema
 from sqlalchemy.testing import fixtures, config
 from sqlalchemy import Integer, String, ForeignKey, func, literal
 from sqlalchemy.orm import mapper, relationship, backref, \
     create_session, unitofwork, attributes,\
-    Session, exc as orm_exc
+    Session, exc as orm_exc, configure_mappers
 from sqlalchemy.testing.mock import Mock, patch
-from sqlalchemy.testing.assertsql import AllOf, CompiledSQL
+from sqlalchemy.testing.assertsql import AllOf, CompiledSQL, CursorSQL
 from sqlalchemy import event
 
 
@@ -100,8 +100,8 @@ class RudimentaryFlushTest(UOWTest):
             testing.db,
             sess.flush,
             CompiledSQL(
-                "DELETE FROM addresses WHERE addresses.id = :id",
-                [{'id': a1.id}, {'id': a2.id}]
+                "DELETE FROM addresses WHERE addresses.id IN (:id_0, :id_1)",
+                {'id_0': a1.id, 'id_1': a2.id}
             ),
             CompiledSQL(
                 "DELETE FROM users WHERE users.id = :id",
@@ -204,8 +204,8 @@ class RudimentaryFlushTest(UOWTest):
             testing.db,
             sess.flush,
             CompiledSQL(
-                "DELETE FROM addresses WHERE addresses.id = :id",
-                [{'id': a1.id}, {'id': a2.id}]
+                "DELETE FROM addresses WHERE addresses.id IN (:id_0, :id_1)",
+                {'id_0': a1.id, 'id_1': a2.id}
             ),
             CompiledSQL(
                 "DELETE FROM users WHERE users.id = :id",
@@ -319,8 +319,9 @@ class RudimentaryFlushTest(UOWTest):
                     lambda ctx: {'param_1': pid}
                 ),
                 CompiledSQL(
-                    "DELETE FROM addresses WHERE addresses.id = :id",
-                    lambda ctx: [{'id': c1id}, {'id': c2id}]
+                    "DELETE FROM addresses WHERE "
+                    "addresses.id IN (:id_0, :id_1)",
+                    lambda ctx: {'id_0': c1id, 'id_1': c2id}
                 ),
                 CompiledSQL(
                     "DELETE FROM users WHERE users.id = :id",
@@ -387,8 +388,8 @@ class RudimentaryFlushTest(UOWTest):
                 ),
             ),
             CompiledSQL(
-                "DELETE FROM addresses WHERE addresses.id = :id",
-                lambda ctx: [{'id': c1id}, {'id': c2id}]
+                "DELETE FROM addresses WHERE addresses.id IN (:id_0, :id_1)",
+                lambda ctx: {'id_0': c1id, 'id_1': c2id}
             ),
         )
 
@@ -449,8 +450,8 @@ class RudimentaryFlushTest(UOWTest):
                 ),
             ),
             CompiledSQL(
-                "DELETE FROM addresses WHERE addresses.id = :id",
-                lambda ctx: [{'id': c1id}, {'id': c2id}]
+                "DELETE FROM addresses WHERE addresses.id IN (:id_0, :id_1)",
+                lambda ctx: {'id_0': c1id, 'id_1': c2id}
             ),
         )
 
@@ -635,6 +636,93 @@ class RudimentaryFlushTest(UOWTest):
         u1.addresses
         self._assert_uow_size(sess, 6)
 
+    def test_delete_in_batches(self):
+        users, Address, addresses, User = (self.tables.users,
+                                           self.classes.Address,
+                                           self.tables.addresses,
+                                           self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(Address, cascade="all, delete-orphan"),
+        })
+        mapper(Address, addresses)
+        sess = create_session()
+        u1 = User(name='u1', addresses=[
+            Address(email_address='a%d' % i) for i in range(5)])
+        sess.add(u1)
+        sess.flush()
+
+        a_ids = sorted(a.id for a in u1.addresses)
+        sess.delete(u1)
+        with patch.object(testing.db.dialect, "max_in_list_size", 2):
+            self.assert_sql_execution(
+                testing.db,
+                sess.flush,
+                CompiledSQL(
+                    "DELETE FROM addresses WHERE "
+                    "addresses.id IN (:id_0, :id_1)",
+                    lambda ctx: {'id_0': a_ids[0], 'id_1': a_ids[1]}
+                ),
+                CompiledSQL(
+                    "DELETE FROM addresses WHERE "
+                    "addresses.id IN (:id_0, :id_1)",
+                    lambda ctx: {'id_0': a_ids[2], 'id_1': a_ids[3]}
+                ),
+                CompiledSQL(
+                    "DELETE FROM addresses WHERE addresses.id IN (:id_0)",
+                    lambda ctx: {'id_0': a_ids[4]}
+                ),
+                CompiledSQL(
+                    "DELETE FROM users WHERE users.id = :id",
+                    lambda ctx: {'id': u1.id}
+                ),
+            )
+        eq_(sess.query(Address).count(), 0)
+
+    def test_flush_plan_cached(self):
+        users, Address, addresses, User = (self.tables.users,
+                                           self.classes.Address,
+                                           self.tables.addresses,
+                                           self.classes.User)
+
+        mapper(User, users, properties={
+            'addresses': relationship(Address),
+        })
+        mapper(Address, addresses)
+
+        sess = create_session()
+        find_cycles = Mock(wraps=unitofwork.topological.find_cycles)
+        with patch.object(unitofwork.topological, "find_cycles", find_cycles):
+            for name in ('u1', 'u2', 'u3'):
+                sess.add(User(
+                    name=name, addresses=[Address(email_address=name)]))
+                sess.flush()
+            eq_(find_cycles.call_count, 1)
+
+            # a different set of actions gets its own plan
+            sess.add(User(name='u4'))
+            sess.flush()
+            eq_(find_cycles.call_count, 2)
+
+        eq_(
+            [(u.name, len(u.addresses))
+             for u in sess.query(User).order_by(User.id)],
+            [('u1', 1), ('u2', 1), ('u3', 1), ('u4', 0)]
+        )
+
+    def test_flush_plan_cleared_on_configure(self):
+        users, User = self.tables.users, self.classes.User
+
+        mapper(User, users)
+        sess = create_session()
+        sess.add(User(name='u1'))
+        sess.flush()
+        assert unitofwork._flush_plans
+
+        mapper(self.classes.Address, self.tables.addresses)
+        configure_mappers()
+        assert not unitofwork._flush_plans
+
 
 class SingleCycleTest(UOWTest):
 
@@ -704,8 +792,8 @@ class SingleCycleTest(UOWTest):
         self.assert_sql_execution(
             testing.db,
             sess.flush,
-            CompiledSQL("DELETE FROM nodes WHERE nodes.id = :id",
-                        lambda ctx: [{'id': n2.id}, {'id': n3.id}]),
+            CompiledSQL("DELETE FROM nodes WHERE nodes.id IN (:id_0, :id_1)",
+                        lambda ctx: {'id_0': n2.id, 'id_1': n3.id}),
             CompiledSQL("DELETE FROM nodes WHERE nodes.id = :id",
                         lambda ctx: {'id': n1.id})
         )
@@ -795,8 +883,8 @@ class SingleCycleTest(UOWTest):
         self.assert_sql_execution(
             testing.db,
             sess.flush,
-            CompiledSQL("DELETE FROM nodes WHERE nodes.id = :id",
-                        lambda ctx: [{'id': n2.id}, {'id': n3.id}]),
+            CompiledSQL("DELETE FROM nodes WHERE nodes.id IN (:id_0, :id_1)",
+                        lambda ctx: {'id_0': n2.id, 'id_1': n3.id}),
             CompiledSQL("DELETE FROM nodes WHERE nodes.id = :id",
                         lambda ctx: {'id': n1.id})
         )
@@ -964,6 +1052,28 @@ class SingleCycleTest(UOWTest):
         n1.children
         self._assert_uow_size(sess, 2)
 
+    def test_flush_plan_cached(self):
+        Node, nodes = self.classes.Node, self.tables.nodes
+
+        mapper(Node, nodes, properties={
+            'children': relationship(Node)
+        })
+        sess = create_session()
+        find_cycles = Mock(wraps=unitofwork.topological.find_cycles)
+        with patch.object(unitofwork.topological, "find_cycles", find_cycles):
+            for data in ('n1', 'n2', 'n3'):
+                sess.add(Node(data=data, children=[Node(data=data + 'c')]))
+                sess.flush()
+            eq_(find_cycles.call_count, 1)
+
+        eq_(
+            sorted(
+                (n.data, [c.data for c in n.children])
+                for n in sess.query(Node).filter(Node.parent_id == None)
+            ),
+            [('n1', ['n1c']), ('n2', ['n2c']), ('n3', ['n3c'])]
+        )
+
     def test_delete_unloaded_m2o(self):
         Node, nodes = self.classes.Node, self.tables.nodes
 
@@ -1025,8 +1135,8 @@ class SingleCycleTest(UOWTest):
                 ),
                 AllOf(
                     CompiledSQL(
-                        "DELETE FROM nodes WHERE nodes.id = :id",
-                        lambda ctx: [{'id': c1id}, {'id': c2id}]
+                        "DELETE FROM nodes WHERE nodes.id IN (:id_0, :id_1)",
+                        lambda ctx: {'id_0': c1id, 'id_1': c2id}
                     ),
                     CompiledSQL(
                         "DELETE FROM nodes WHERE nodes.id = :id",
@@ -1221,12 +1331,14 @@ class SingleCycleM2MTest(fixtures.MappedTest,
                 ]
             ),
             CompiledSQL(
-                "DELETE FROM nodes WHERE nodes.id = :id",
-                lambda ctx: [{'id': n4.id}, {'id': n5.id}]
+                "DELETE FROM nodes WHERE nodes.id IN (:id_0, :id_1)",
+                lambda ctx: dict(zip(
+                    ['id_0', 'id_1'], sorted([n4.id, n5.id])))
             ),
             CompiledSQL(
-                "DELETE FROM nodes WHERE nodes.id = :id",
-                lambda ctx: [{'id': n2.id}, {'id': n3.id}]
+                "DELETE FROM nodes WHERE nodes.id IN (:id_0, :id_1)",
+                lambda ctx: dict(zip(
+                    ['id_0', 'id_1'], sorted([n2.id, n3.id])))
             ),
         )
 
@@ -1609,6 +1721,7 @@ class BatchInsertsTest(fixtures.MappedTest, testing.AssertsExecutionResults):
               Column('def_', String(50), server_default='def1')
               )
 
+    @testing.requires.autoincrement_prefetch.not_()
     def test_batch_interaction(self):
         """test batching groups same-structured, primary
         key present statements together.
@@ -1671,6 +1784,97 @@ class BatchInsertsTest(fixtures.MappedTest, testing.AssertsExecutionResults):
             ),
         )
 
+    @testing.requires.autoincrement_prefetch
+    def test_batch_interaction_prefetch(self):
+        """test batching of statements lacking a primary key
+        using primary key values generated ahead of the INSERT.
+
+        """
+
+        t = self.tables.t
+
+        class T(fixtures.ComparableEntity):
+            pass
+        mapper(T, t)
+        sess = Session()
+        objs = [
+            T(data='t1'),
+            T(data='t2'),
+            T(data='t3'),
+            T(id=4, data='t4'),
+            T(data=func.lower('t5')),
+            T(data='t6', def_='def2'),
+            T(data='t7', def_='def3'),
+        ]
+        sess.add_all(objs)
+
+        prefetch_sql = testing.db.dialect._autoincrement_prefetch_sql(t.c.id)
+
+        self.assert_sql_execution(
+            testing.db,
+            sess.flush,
+            CursorSQL(prefetch_sql % 3),
+            CompiledSQL(
+                "INSERT INTO t (id, data) VALUES (:id, :data)",
+                [{'data': 't1'}, {'data': 't2'}, {'data': 't3'}]
+            ),
+            CompiledSQL(
+                "INSERT INTO t (id, data) VALUES (:id, :data)",
+                {'data': 't4', 'id': 4}
+            ),
+            CompiledSQL(
+                "INSERT INTO t (data) VALUES (lower(:lower_1)) "
+                "RETURNING t.id",
+                {'lower_1': 't5'}
+            ),
+            CursorSQL(prefetch_sql % 2),
+            CompiledSQL(
+                "INSERT INTO t (id, data, def_) VALUES (:id, :data, :def_)",
+                [{'data': 't6', 'def_': 'def2'},
+                 {'data': 't7', 'def_': 'def3'}]
+            ),
+        )
+
+        ids = [obj.id for obj in objs]
+        eq_(len(set(ids)), 7)
+        sess.expunge_all()
+        eq_(
+            [(obj.id, obj.data, obj.def_)
+             for obj in sess.query(T).order_by(T.id)],
+            sorted(zip(ids,
+                       ['t1', 't2', 't3', 't4', 't5', 't6', 't7'],
+                       ['def1'] * 5 + ['def2', 'def3']))
+        )
+
+    @testing.requires.autoincrement_prefetch
+    def test_batch_prefetch_python_defaults(self):
+        t = self.tables.t
+
+        class T(fixtures.ComparableEntity):
+            pass
+        mapper(T, t)
+
+        counter = iter(range(1, 100))
+        t.c.def_.default = schema.ColumnDefault(
+            lambda ctx: "pydef%d" % next(counter))
+        try:
+            sess = Session()
+            objs = [T(data='t%d' % i) for i in range(1, 4)]
+            sess.add_all(objs)
+            sess.flush()
+            eq_(
+                [obj.__dict__['def_'] for obj in objs],
+                ["pydef1", "pydef2", "pydef3"]
+            )
+            sess.expunge_all()
+            eq_(
+                [(obj.data, obj.def_)
+                 for obj in sess.query(T).order_by(T.id)],
+                [("t1", "pydef1"), ("t2", "pydef2"), ("t3", "pydef3")]
+            )
+        finally:
+            t.c.def_.default = None
+
 
 class LoadersUsingCommittedTest(UOWTest):
 
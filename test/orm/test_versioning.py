@@ -1,3 +1,4 @@
+import contextlib
 import datetime
 import sqlalchemy as sa
 from sqlalchemy.testing import engines, config
@@ -249,6 +250,149 @@ class VersioningTest(fixtures.MappedTest):
                 s1.flush()
                 eq_(f1s1.version_id, 2)
 
+    def test_update_multi_distinct_versions(self):
+        Foo = self.classes.Foo
+        s1 = self._fixture()
+        f1, f2, f3 = Foo(value='f1'), Foo(value='f2'), Foo(value='f3')
+        s1.add_all([f1, f2, f3])
+        s1.commit()
+
+        f2.value = 'f2rev2'
+        s1.commit()
+
+        f1.value, f2.value, f3.value = 'f1rev2', 'f2rev3', 'f3rev2'
+        s1.flush()
+
+        # the new version of each row is established
+        # without being expired
+        eq_(
+            [f.__dict__['version_id'] for f in (f1, f2, f3)],
+            [2, 3, 2]
+        )
+        s1.commit()
+        eq_(
+            s1.query(Foo.value, Foo.version_id).order_by(Foo.id).all(),
+            [('f1rev2', 2), ('f2rev3', 3), ('f3rev2', 2)]
+        )
+
+    def test_delete_multi_in_batches(self):
+        Foo = self.classes.Foo
+        s1 = self._fixture()
+        foos = [Foo(value='f%d' % i) for i in range(4)]
+        s1.add_all(foos)
+        s1.commit()
+
+        foos[1].value = 'f1rev2'
+        s1.commit()
+
+        ids = [foo.id for foo in foos]
+        for foo in foos:
+            s1.delete(foo)
+
+        # rows are grouped by version
+        self.assert_sql_execution(
+            testing.db,
+            s1.flush,
+            CompiledSQL(
+                "DELETE FROM version_table WHERE version_table.id IN "
+                "(:id_0, :id_1, :id_2) AND "
+                "version_table.version_id = :version_id",
+                lambda ctx: {
+                    'id_0': ids[0], 'id_1': ids[2], 'id_2': ids[3],
+                    'version_id': 1}
+            ),
+            CompiledSQL(
+                "DELETE FROM version_table WHERE version_table.id IN "
+                "(:id_0) AND version_table.version_id = :version_id",
+                lambda ctx: {'id_0': ids[1], 'version_id': 2}
+            ),
+        )
+        s1.commit()
+        eq_(s1.query(Foo).count(), 0)
+
+    def test_delete_multi_in_batches_stale(self):
+        Foo = self.classes.Foo
+        s1 = self._fixture()
+        foos = [Foo(value='f%d' % i) for i in range(3)]
+        s1.add_all(foos)
+        s1.commit()
+
+        s2 = create_session(autocommit=False)
+        s2.query(Foo).get(foos[1].id).value = 'f1 other'
+        s2.commit()
+
+        for foo in foos:
+            s1.delete(foo)
+        assert_raises_message(
+            sa.orm.exc.StaleDataError,
+            r"DELETE statement on table 'version_table' expected "
+            r"to delete 3 row\(s\); 2 were matched.",
+            s1.flush
+        )
+
+    @contextlib.contextmanager
+    def _update_from_select_fixture(self):
+        with patch.object(
+                config.db.dialect, "supports_sane_multi_rowcount", False), \
+            patch.object(
+                config.db.dialect, "supports_update_from_select", True), \
+            patch.object(
+                config.db.dialect, "max_update_from_select_rows", 2):
+            yield
+
+    @testing.requires.update_from_select
+    def test_update_from_select(self):
+        Foo = self.classes.Foo
+        s1 = self._fixture()
+        foos = [Foo(value='f%d' % i) for i in range(5)]
+        s1.add_all(foos)
+        s1.commit()
+
+        foos[0].value = 'f0rev2'
+        s1.commit()
+
+        with self._update_from_select_fixture():
+            for foo in foos:
+                foo.value += 'rev'
+            self.assert_sql_count(testing.db, s1.flush, 3)
+
+        eq_(
+            [foo.__dict__['value'] for foo in foos],
+            ['f0rev2rev', 'f1rev', 'f2rev', 'f3rev', 'f4rev']
+        )
+        eq_(
+            [foo.__dict__['version_id'] for foo in foos],
+            [3, 2, 2, 2, 2]
+        )
+        s1.commit()
+        eq_(
+            s1.query(Foo.value, Foo.version_id).order_by(Foo.id).all(),
+            [('f0rev2rev', 3), ('f1rev', 2), ('f2rev', 2),
+             ('f3rev', 2), ('f4rev', 2)]
+        )
+
+    @testing.requires.update_from_select
+    def test_update_from_select_stale(self):
+        Foo = self.classes.Foo
+        s1 = self._fixture()
+        foos = [Foo(value='f%d' % i) for i in range(3)]
+        s1.add_all(foos)
+        s1.commit()
+
+        s2 = create_session(autocommit=False)
+        s2.query(Foo).get(foos[2].id).value = 'f2 other'
+        s2.commit()
+
+        with self._update_from_select_fixture():
+            for foo in foos:
+                foo.value += 'rev'
+            assert_raises_message(
+                sa.orm.exc.StaleDataError,
+                r"UPDATE statement on table 'version_table' expected "
+                r"to update 3 row\(s\); 2 were matched.",
+                s1.flush
+            )
+
     @testing.emits_warning(r'.*does not support updated rowcount')
     @engines.close_open_connections
     def test_noversioncheck(self):
@@ -259,6 +259,16 @@ class DefaultRequirements(SuiteRequirements):
         return only_on(['postgresql', 'mssql', 'mysql'],
                 "Backend does not support UPDATE..FROM")
 
+    @property
+    def update_from_select(self):
+        """Target must support UPDATE..FROM against a UNION of SELECTs,
+        as used by the unit of work for batched versioned UPDATEs."""
+
+        return only_on(['postgresql', 'sqlite'],
+                "Backend does not support UPDATE..FROM") + \
+            skip_if(exclude('sqlite', '<', (3, 33, 0),
+                    'UPDATE..FROM requires SQLite 3.33'))
+
 
     @property
     def update_where_target_in_subquery(self):
@@ -682,12 +692,48 @@ class DefaultRequirements(SuiteRequirements):
                 "Python version 3.xx is required."
                 )
 
+    @property
+    def python35(self):
+        return skip_if(
+                lambda: sys.version_info < (3, 5),
+                "Python version 3.5 or greater is required."
+                )
+
     @property
     def cpython(self):
         return only_if(lambda: util.cpython,
                "cPython interpreter needed"
              )
 
+    @property
+    def autoincrement_prefetch(self):
+        """target dialect can generate autoincrement primary key values
+        ahead of an INSERT, allowing the ORM to batch INSERTs of rows
+        with database-generated primary keys."""
+
+        def check(config):
+            from sqlalchemy import Table, Column, Integer, MetaData
+            t = Table('t', MetaData(), Column('id', Integer, primary_key=True))
+            return config.db.dialect._autoincrement_prefetch_sql(t.c.id) \
+                is not None
+
+        return only_if(
+            check,
+            "dialect can't generate autoincrement primary key values "
+            "ahead of an INSERT"
+        )
+
+    @property
+    def numpy(self):
+        def has_numpy():
+            try:
+                import numpy
+            except ImportError:
+                return False
+            else:
+                return True
+        return only_if(has_numpy, "numpy is not installed")
+
 
     @property
     def non_broken_pickle(self):
@@ -0,0 +1,151 @@
+from sqlalchemy.testing import fixtures, eq_, is_, ne_
+from sqlalchemy import (
+    MetaData, Table, Column, Integer, String, select, bindparam,
+    func, text, literal_column, and_, case, cast, exists)
+from sqlalchemy.sql import column, table
+
+
+class CacheKeyTest(fixtures.TestBase):
+
+    @classmethod
+    def setup_class(cls):
+        m = MetaData()
+        cls.t1 = Table(
+            't1', m,
+            Column('a', Integer), Column('b', String(20)))
+        cls.t2 = Table(
+            't2', m,
+            Column('a', Integer), Column('c', String(20)))
+
+    def _assert_same(self, fn):
+        k1, b1 = fn()._generate_cache_key()
+        k2, b2 = fn()._generate_cache_key()
+        eq_(k1, k2)
+        eq_(hash(k1), hash(k2))
+        eq_(len(b1), len(b2))
+        return b1, b2
+
+    def _assert_distinct(self, *stmts):
+        keys = [stmt._generate_cache_key()[0] for stmt in stmts]
+        eq_(len(set(keys)), len(keys))
+
+    def test_same_structure(self):
+        t1, t2 = self.t1, self.t2
+        for fn in [
+            lambda: select([t1]).where(t1.c.a == 5),
+            lambda: select([t1.c.a, func.count(t1.c.b)]).
+            group_by(t1.c.a).order_by(t1.c.a.desc()).limit(5),
+            lambda: select([t1]).select_from(
+                t1.join(t2, t1.c.a == t2.c.a)).where(
+                and_(t2.c.c.like('x%'), t1.c.b != None)),
+            lambda: select([t1.alias()]).apply_labels(),
+            lambda: select([
+                case([(t1.c.a > 5, 'x')], else_='y'),
+                cast(t1.c.b, Integer)]),
+            lambda: select([t1]).where(
+                exists().where(t2.c.a == t1.c.a)),
+            lambda: t1.update().where(t1.c.a == 5).values(b=t1.c.b + 'x'),
+            lambda: t1.insert().values(a=bindparam('a')),
+            lambda: t1.delete().where(t1.c.b.in_(['x', 'y'])),
+        ]:
+            self._assert_same(fn)
+
+    def test_bind_values_extracted(self):
+        b1, b2 = self._assert_same(
+            lambda: select([self.t1]).where(
+                self.t1.c.a == 5).where(self.t1.c.b == 'q'))
+        eq_([b.value for b in b1], [5, 'q'])
+
+    def test_distinct_structures(self):
+        t1, t2 = self.t1, self.t2
+        self._assert_distinct(
+            select([t1]),
+            select([t2]),
+            select([t1]).where(t1.c.a == 5),
+            select([t1]).where(t1.c.a != 5),
+            select([t1]).where(t1.c.a.in_([1, 2])),
+            select([t1]).where(t1.c.a.in_([1, 2, 3])),
+            select([t1]).limit(5),
+            select([t1]).limit(6),
+            select([t1]).order_by(t1.c.a),
+            select([t1]).order_by(t1.c.b),
+            select([t1]).apply_labels(),
+            select([t1.c.a.label('x')]),
+            select([t1.c.a.label('y')]),
+            select([cast(t1.c.a, String(10))]),
+            select([cast(t1.c.a, String(20))]),
+            select([t1]).with_for_update(),
+            select([t1.alias('x')]),
+            select([column('a')]).select_from(table('t1')),
+        )
+
+    def test_distinct_aliases(self):
+        a1, a2 = self.t1.alias(), self.t1.alias()
+        s1 = select([a1.c.a, a2.c.a]).where(a1.c.a == a2.c.a)
+        s2 = select([a1.c.a, a1.c.a]).where(a1.c.a == a1.c.a)
+        self._assert_distinct(s1, s2)
+
+    def test_correlation_distinct(self):
+        t1, t2 = self.t1, self.t2
+
+        def subq():
+            return select([t2.c.c]).where(t2.c.a == t1.c.a)
+
+        self._assert_distinct(
+            select([t1.c.a, subq().as_scalar()]),
+            select([t1.c.a, subq().correlate(None).as_scalar()]),
+            select([t1.c.a, subq().correlate(t1).as_scalar()]),
+            select([t1.c.a, subq().correlate_except(t2).as_scalar()]),
+        )
+
+    def test_cloned_from_distinct(self):
+        t1, t2 = self.t1, self.t2
+        a1, a2 = t1.alias('x'), t1.alias('x')
+        a1_clone = a1._clone()
+
+        # the clone of a1 is correlated to a1; a2 is not
+        s1 = select([
+            a1.c.a,
+            select([t2.c.c]).where(t2.c.a == a1_clone.c.a).as_scalar()])
+        s2 = select([
+            a1.c.a,
+            select([t2.c.c]).where(t2.c.a == a2.c.a).as_scalar()])
+        self._assert_distinct(s1, s2)
+
+    def test_text_distinct(self):
+        self._assert_distinct(
+            text("select 1"), text("select 2"),
+            select([literal_column("q")]),
+            select([literal_column("p")]),
+        )
+
+    def test_type_keys(self):
+        from sqlalchemy.dialects import sqlite
+        from sqlalchemy.types import TypeDecorator
+
+        class Prefixed(TypeDecorator):
+            impl = String
+
+            def __init__(self, prefix):
+                TypeDecorator.__init__(self)
+                self._prefix = prefix
+
+        eq_(String(10)._static_cache_key, String(10)._static_cache_key)
+        ne_(String(10)._static_cache_key, String(20)._static_cache_key)
+
+        for type_ in (
+            sqlite.DATE(storage_format="%(year)04d"),
+            Prefixed('A'),
+        ):
+            is_(type_._static_cache_key, type_)
+
+        self._assert_distinct(
+            select([cast(self.t1.c.a, Prefixed('A'))]),
+            select([cast(self.t1.c.a, Prefixed('B'))]),
+        )
+
+    def test_plain_values_not_cacheable(self):
+        is_(self.t1.insert().values(a=5)._generate_cache_key(), None)
+        is_(
+            self.t1.update().values(b='x')._generate_cache_key(), None)
+        ne_(self.t1.insert()._generate_cache_key(), None)
@@ -1990,6 +1990,52 @@ class SelectTest(fixtures.TestBase, AssertsCompiledSQL):
                     required=True)).compile().construct_params,
             _group_number=2)
 
+    def test_construct_params_all_keys(self):
+        c = select([table1]).where(
+            and_(
+                table1.c.myid == bindparam("x"),
+                table1.c.name == bindparam("y", value="d")
+            )
+        ).compile()
+        eq_(c.construct_params(dict(x=1, y="q", z=5)), {"x": 1, "y": "q"})
+        eq_(c.construct_params(dict(x=1)), {"x": 1, "y": "d"})
+        eq_(c.construct_params(_check=False), {"x": None, "y": "d"})
+
+        c = select([table1]).where(table1.c.myid == bindparam("x")).compile()
+        eq_(c.construct_params(dict(x=1, z=5)), {"x": 1})
+
+    def test_construct_params_by_name(self):
+        c = select([table1]).where(table1.c.myid == 5).compile()
+        eq_(c.construct_params(), {"myid_1": 5})
+        eq_(c.construct_params(dict(myid_1=7)), {"myid_1": 7})
+
+    def test_dbapi_statement_unicode(self):
+        dialect = default.DefaultDialect()
+        dialect.supports_unicode_statements = True
+        c = select([table1.c.myid]).compile(dialect=dialect)
+        stmt = c._dbapi_statement()
+        eq_(stmt, c.string)
+        is_(c._dbapi_statement(), stmt)
+
+        assert isinstance(stmt, util.text_type)
+
+        suffixed = c._dbapi_statement("; select 1")
+        eq_(suffixed, c.string + "; select 1")
+        assert isinstance(suffixed, util.text_type)
+        is_(c._dbapi_statement("; select 1"), suffixed)
+
+    def test_dbapi_statement_encoded(self):
+        dialect = default.DefaultDialect()
+        dialect.supports_unicode_statements = False
+        c = select([table1.c.myid]).compile(dialect=dialect)
+        stmt = c._dbapi_statement()
+        eq_(stmt, c.string.encode("utf-8"))
+        is_(c._dbapi_statement(), stmt)
+        eq_(
+            c._dbapi_statement("; select 1"),
+            (c.string + "; select 1").encode("utf-8")
+        )
+
     def test_tuple(self):
         self.assert_compile(
             tuple_(table1.c.myid, table1.c.name).in_(